@@ -0,0 +1,25 @@
+"""
+Asyncio version of the IG client (httpx.AsyncClient).
+
+Clients mirror api_gateway.ig_client.clients method for method and share
+its models, validators and error mapping.
+"""
+
+from .accounts import AsyncAccountsClient
+from .client import AsyncIGClient
+from .dealing import AsyncDealingClient
+from .markets import AsyncMarketsClient
+from .rest import AsyncIGRest
+from .snapshots import MAX_EPICS_PER_REQUEST, MarketSnapshotPoller
+from .watchlists import AsyncWatchlistsClient
+
+__all__ = [
+    "AsyncAccountsClient",
+    "AsyncDealingClient",
+    "AsyncIGClient",
+    "AsyncIGRest",
+    "AsyncMarketsClient",
+    "AsyncWatchlistsClient",
+    "MAX_EPICS_PER_REQUEST",
+    "MarketSnapshotPoller",
+]
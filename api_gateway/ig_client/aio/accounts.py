@@ -0,0 +1,103 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any
+
+from api_gateway.ig_client.aio.rest import AsyncIGRest
+from api_gateway.ig_client.error_handling import (
+    handle_api_errors,
+    handle_validation_errors,
+    handle_response_parsing,
+)
+from api_gateway.ig_client.core.models.account.ig_responses import (
+    Accounts,
+    AccountPreferences,
+    UpdatePreferences,
+    Activities,
+    ActivitiesByDateRange,
+    Transactions,
+)
+from api_gateway.ig_client.core.models.account.request_bodies import (
+    UpdateAccountPreferencesRequest,
+)
+from api_gateway.ig_client.core.models.account.query_params import (
+    TransactionHistoryQueryParams,
+)
+from api_gateway.ig_client.core.validators import PathValidators
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAccountsClient:
+    def __init__(self, rest: AsyncIGRest):
+        self.rest = rest
+
+    @handle_api_errors("get_accounts")
+    @handle_response_parsing("get_accounts")
+    async def get_accounts(self) -> Accounts:
+        json = await self.rest.get(endpoint="/accounts", version="1")
+        return Accounts(**json)
+
+    @handle_api_errors("get_preferences")
+    @handle_response_parsing("get_preferences")
+    async def get_preferences(self) -> AccountPreferences:
+        json = await self.rest.get(endpoint="/accounts/preferences", version="1")
+        return AccountPreferences(**json)
+
+    @handle_api_errors("update_preferences")
+    @handle_validation_errors("update_preferences")
+    @handle_response_parsing("update_preferences")
+    async def update_preferences(self, body_data: Dict[str, Any]) -> UpdatePreferences:
+        validated_request = UpdateAccountPreferencesRequest(**body_data)
+
+        json = await self.rest.put(
+            endpoint="/accounts/preferences",
+            version="1",
+            data=validated_request.model_dump(exclude_none=True),
+        )
+        return UpdatePreferences(**json)
+
+    @handle_api_errors("get_activities")
+    @handle_response_parsing("get_activities")
+    async def get_activities(self, query_params: Dict[str, Any] = None) -> Activities:
+        if query_params is None:
+            query_params = {}
+
+        if "from" not in query_params:
+            seven_days_ago = datetime.now() - timedelta(days=7)
+            query_params["from"] = seven_days_ago.strftime("%Y-%m-%dT%H:%M:%S")
+
+        json = await self.rest.get(
+            endpoint="/history/activity", version="3", params=query_params
+        )
+        return Activities(**json)
+
+    @handle_api_errors("get_activities_by_date_range")
+    @handle_response_parsing("get_activities_by_date_range")
+    async def get_activities_by_date_range(
+        self, from_date: str, to_date: str
+    ) -> ActivitiesByDateRange:
+        # Validate path parameters
+        PathValidators.validate_date_format(from_date)
+        PathValidators.validate_date_format(to_date)
+
+        json = await self.rest.get(
+            endpoint=f"/history/activity/{from_date}/{to_date}", version="1"
+        )
+        return ActivitiesByDateRange(**json)
+
+    @handle_api_errors("get_transactions")
+    @handle_validation_errors("get_transactions")
+    @handle_response_parsing("get_transactions")
+    async def get_transactions(
+        self, query_params: Dict[str, Any] = None
+    ) -> Transactions:
+        if query_params is None:
+            query_params = {}
+
+        validated_params = TransactionHistoryQueryParams(**query_params)
+        params_dict = validated_params.model_dump(by_alias=True, exclude_none=True)
+
+        json = await self.rest.get(
+            endpoint="/history/transactions", version="2", params=params_dict
+        )
+        return Transactions(**json)
@@ -0,0 +1,74 @@
+from typing import Optional, TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from common.resilience import AsyncRateLimiter
+
+from api_gateway.ig_client.auth import IGAuthenticator
+from api_gateway.ig_client.session_store import SessionTokenStore
+from api_gateway.ig_client.aio.accounts import AsyncAccountsClient
+from api_gateway.ig_client.aio.dealing import AsyncDealingClient
+from api_gateway.ig_client.aio.markets import AsyncMarketsClient
+from api_gateway.ig_client.aio.rest import AsyncIGRest
+from api_gateway.ig_client.aio.watchlists import AsyncWatchlistsClient
+
+
+class AsyncIGClient:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        identifier: str,
+        password: str,
+        rate_limiter: Optional["AsyncRateLimiter"] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        token_store: Optional[SessionTokenStore] = None,
+    ):
+        """
+        Initialize async IG client.
+
+        Same clients and methods as IGClient, as coroutines sharing one
+        connection pool, e.g. to fetch many epics concurrently:
+
+            async with AsyncIGClient(...) as ig:
+                prices = await asyncio.gather(
+                    *(ig.markets.get_prices_by_points(e, "DAY", 10) for e in epics)
+                )
+
+        Args:
+            base_url: Base URL for IG API
+            api_key: API key
+            identifier: User identifier
+            password: User password
+            rate_limiter: Optional AsyncRateLimiter instance (from common.resilience)
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+            token_store: Optional on-disk session cache, shared with other
+                processes and runs
+        """
+        self.auth_session = IGAuthenticator(
+            base_url=base_url,
+            api_key=api_key,
+            identifier=identifier,
+            password=password,
+            token_store=token_store,
+        )
+        self.rest = AsyncIGRest(
+            base_url=base_url,
+            auth_session=self.auth_session,
+            rate_limiter=rate_limiter,
+            transport=transport,
+        )
+        self.accounts = AsyncAccountsClient(rest=self.rest)
+        self.markets = AsyncMarketsClient(rest=self.rest)
+        self.dealing = AsyncDealingClient(rest=self.rest)
+        self.watchlists = AsyncWatchlistsClient(rest=self.rest)
+
+    async def aclose(self) -> None:
+        await self.rest.aclose()
+
+    async def __aenter__(self) -> "AsyncIGClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
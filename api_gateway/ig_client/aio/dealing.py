@@ -0,0 +1,135 @@
+from typing import Dict, Any
+
+from api_gateway.ig_client.aio.rest import AsyncIGRest
+from api_gateway.ig_client.error_handling import (
+    handle_api_errors,
+    handle_validation_errors,
+    handle_response_parsing,
+)
+from api_gateway.ig_client.core.validators import PathValidators
+from api_gateway.ig_client.core.models.dealing.ig_responses import (
+    Positions,
+    Position,
+    DealConfirmation,
+    WorkingOrders,
+    PendingDeal,
+)
+from api_gateway.ig_client.core.models.dealing.request_bodies import (
+    CreateOtcPositionRequest,
+    CloseOtcPositionRequest,
+    UpdateOtcPositionRequest,
+    CreateWorkingOrderRequest,
+    UpdateWorkingOrderRequest,
+)
+
+
+class AsyncDealingClient:
+    def __init__(self, rest: AsyncIGRest):
+        self.rest = rest
+
+    @handle_api_errors("get_positions")
+    @handle_response_parsing("get_positions")
+    async def get_positions(self) -> Positions:
+        json = await self.rest.get(endpoint="/positions", version="2")
+        return Positions(**json)
+
+    @handle_api_errors("get_position")
+    @handle_response_parsing("get_position")
+    async def get_position(self, deal_id: str) -> Position:
+        PathValidators.validate_deal_id(deal_id)
+
+        json = await self.rest.get(endpoint=f"/positions/{deal_id}", version="2")
+        return Position(**json)
+
+    @handle_api_errors("create_position_otc")
+    @handle_validation_errors("create_position_otc")
+    @handle_response_parsing("create_position_otc")
+    async def create_position_otc(self, body_data: Dict[str, Any]) -> PendingDeal:
+        validated_request = CreateOtcPositionRequest(**body_data)
+        json = await self.rest.post(
+            endpoint="/positions/otc",
+            version="2",
+            data=validated_request.model_dump(exclude_none=True),
+        )
+        return PendingDeal(**json)
+
+    @handle_api_errors("get_deal_confirmation")
+    @handle_response_parsing("get_deal_confirmation")
+    async def get_deal_confirmation(self, deal_reference: str) -> DealConfirmation:
+        PathValidators.validate_deal_id(deal_reference)
+
+        json = await self.rest.get(endpoint=f"/confirms/{deal_reference}", version="1")
+        return DealConfirmation(**json)
+
+    @handle_api_errors("close_position_otc")
+    @handle_validation_errors("close_position_otc")
+    @handle_response_parsing("close_position_otc")
+    async def close_position_otc(self, body_data: Dict[str, Any]) -> PendingDeal:
+        validated_request = CloseOtcPositionRequest(**body_data)
+        json = await self.rest.post(
+            endpoint="/positions/otc",
+            version="1",
+            data=validated_request.model_dump(exclude_none=True),
+            override_method="DELETE",
+        )
+        return PendingDeal(**json)
+
+    @handle_api_errors("update_position_otc")
+    @handle_validation_errors("update_position_otc")
+    @handle_response_parsing("update_position_otc")
+    async def update_position_otc(
+        self, deal_id: str, body_data: Dict[str, Any]
+    ) -> PendingDeal:
+        PathValidators.validate_deal_id(deal_id)
+
+        validated_request = UpdateOtcPositionRequest(**body_data)
+        json = await self.rest.put(
+            endpoint=f"/positions/otc/{deal_id}",
+            version="2",
+            data=validated_request.model_dump(exclude_none=True),
+        )
+        return PendingDeal(**json)
+
+    @handle_api_errors("create_working_order_otc")
+    @handle_validation_errors("create_working_order_otc")
+    @handle_response_parsing("create_working_order_otc")
+    async def create_working_order_otc(self, body_data: Dict[str, Any]) -> PendingDeal:
+        validated_request = CreateWorkingOrderRequest(**body_data)
+        json = await self.rest.post(
+            endpoint="/workingorders/otc",
+            version="2",
+            data=validated_request.model_dump(exclude_none=True),
+        )
+        return PendingDeal(**json)
+
+    @handle_api_errors("get_working_orders")
+    @handle_response_parsing("get_working_orders")
+    async def get_working_orders(self) -> WorkingOrders:
+        json = await self.rest.get(endpoint="/workingorders", version="2")
+        return WorkingOrders(**json)
+
+    @handle_api_errors("delete_working_order_otc")
+    @handle_response_parsing("delete_working_order_otc")
+    async def delete_working_order_otc(self, deal_id: str) -> PendingDeal:
+        PathValidators.validate_deal_id(deal_id)
+
+        json = await self.rest.delete(
+            endpoint=f"/workingorders/otc/{deal_id}", version="2"
+        )
+        return PendingDeal(**json)
+
+    @handle_api_errors("update_working_order_otc")
+    @handle_validation_errors("update_working_order_otc")
+    @handle_response_parsing("update_working_order_otc")
+    async def update_working_order_otc(
+        self, deal_id: str, body_data: Dict[str, Any]
+    ) -> PendingDeal:
+        PathValidators.validate_deal_id(deal_id)
+
+        validated_request = UpdateWorkingOrderRequest(**body_data)
+        json = await self.rest.put(
+            endpoint=f"/workingorders/otc/{deal_id}",
+            version="2",
+            data=validated_request.model_dump(exclude_none=True),
+        )
+        return PendingDeal(**json)
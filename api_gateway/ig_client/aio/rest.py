@@ -0,0 +1,122 @@
+import asyncio
+import httpx
+import logging
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from common.resilience import AsyncRateLimiter
+
+from api_gateway.ig_client.auth import IGAuthenticator
+from api_gateway.ig_client.core.exceptions import IGAuthenticationError
+from api_gateway.ig_client.rest import BaseIGRest
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncIGRest(BaseIGRest):
+    def __init__(
+        self,
+        base_url: str,
+        auth_session: IGAuthenticator,
+        rate_limiter: Optional["AsyncRateLimiter"] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize async IG REST client.
+
+        The session is opened on the first request (once, however many
+        requests are started concurrently).
+
+        Args:
+            base_url: Base URL for IG API
+            auth_session: Authentication session
+            rate_limiter: Optional AsyncRateLimiter instance (from common.resilience)
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+        """
+        self.auth_session = auth_session
+        self.rate_limiter = rate_limiter
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            transport=transport,
+        )
+        self._login_lock = asyncio.Lock()
+
+    async def get(self, endpoint: str, version: str, **kwargs):
+        return await self._request(
+            method="GET", endpoint=endpoint, version=version, **kwargs
+        )
+
+    async def post(self, endpoint: str, version: str, data=None, **kwargs):
+        return await self._request(
+            method="POST", endpoint=endpoint, version=version, json=data, **kwargs
+        )
+
+    async def put(self, endpoint: str, version: str, data=None, **kwargs):
+        return await self._request(
+            method="PUT", endpoint=endpoint, version=version, json=data, **kwargs
+        )
+
+    async def delete(self, endpoint: str, version: str, data=None, **kwargs):
+        return await self._request(
+            method="DELETE", endpoint=endpoint, version=version, json=data, **kwargs
+        )
+
+    async def _auth_headers(self):
+        if self.auth_session.needs_login():
+            async with self._login_lock:
+                if self.auth_session.needs_login():
+                    try:
+                        await self.auth_session.alogin(self.client)
+                    except Exception as e:
+                        error = self._translate_error("POST", "/session", e)
+                        if error is e:
+                            raise
+                        raise error
+        return self.auth_session.tokens
+
+    async def _request(self, method: str, endpoint: str, version: str, **kwargs):
+        override_method = kwargs.pop("override_method", "")  # Remove from kwargs
+
+        tokens = await self._auth_headers()
+        try:
+            return await self._send(
+                method, endpoint, version, tokens, override_method, kwargs
+            )
+        except IGAuthenticationError:
+            # The session expired or was revoked: log in again and replay once
+            logger.info(f"Session rejected for {method} {endpoint}, logging in again")
+            self.auth_session.invalidate(tokens)
+            tokens = await self._auth_headers()
+            return await self._send(
+                method, endpoint, version, tokens, override_method, kwargs
+            )
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        version: str,
+        tokens: Dict[str, str],
+        override_method: str,
+        kwargs: Dict[str, Any],
+    ):
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            headers = self._build_headers(tokens, version, override_method)
+            self._log_request(method, endpoint, version, headers)
+
+            response = await self.client.request(
+                method=method, url=endpoint, headers=headers, **kwargs
+            )
+            return self._handle_response(response)
+        except Exception as e:
+            error = self._translate_error(method, endpoint, e)
+            if error is e:
+                raise
+            raise error
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
@@ -1,17 +1,66 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
 import httpx
 
 from api_gateway.ig_client.core.exceptions import IGAuthenticationError
+from api_gateway.ig_client.session_store import SessionTokenStore
+
+logger = logging.getLogger(__name__)
+
+# IG sessions last at least 6 hours from login (activity extends them)
+SESSION_TTL = 6 * 60 * 60
+# A session this close to expiry is replaced by a new login when next used
+REFRESH_MARGIN = 5 * 60
 
 
 class IGAuthenticator:
-    def __init__(self, base_url: str, api_key: str, identifier: str, password: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        identifier: str,
+        password: str,
+        token_store: Optional[SessionTokenStore] = None,
+        session_ttl: float = SESSION_TTL,
+        refresh_margin: float = REFRESH_MARGIN,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """
+        Initialize authenticator.
+
+        Args:
+            base_url: Base URL for IG API
+            api_key: API key
+            identifier: User identifier
+            password: User password
+            token_store: Optional on-disk token cache shared across processes
+            session_ttl: Assumed session lifetime from login (seconds)
+            refresh_margin: Log in again on the first request made within
+                this long of expiry (seconds)
+            transport: Optional httpx transport of login requests (alogin
+                without a client needs it to also be an AsyncBaseTransport,
+                e.g. httpx.MockTransport or a CassetteTransport)
+        """
         self.base_url = base_url
         self.api_key = api_key
         self.identifier = identifier
         self.password = password
+        self.token_store = token_store
+        self.session_ttl = session_ttl
+        self.refresh_margin = refresh_margin
+        self.transport = transport
         self.tokens = {}
+        self.expires_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    @property
+    def _store_key(self) -> str:
+        return SessionTokenStore.account_key(self.base_url, self.identifier)
 
-    def login(self):
+    def _login_request(self):
         body = {
             "identifier": self.identifier,
             "password": self.password,
@@ -22,10 +71,9 @@ class IGAuthenticator:
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        return body, headers
 
-        with httpx.Client(base_url=self.base_url, headers=headers) as client:
-            response = client.post("/session", json=body)
-
+    def _store_tokens(self, response: httpx.Response):
         if response.status_code != 200:
             raise IGAuthenticationError(response.text)
 
@@ -34,10 +82,114 @@ class IGAuthenticator:
             "CST": response.headers.get("CST"),
             "X-SECURITY-TOKEN": response.headers.get("X-SECURITY-TOKEN"),
         }
+        self.expires_at = time.time() + self.session_ttl
+        if self.token_store is not None:
+            self.token_store.save(self._store_key, self.tokens, self.expires_at)
 
         return self.tokens
 
+    def login(self, client: httpx.Client = None):
+        """
+        Open a new session
+
+        Args:
+            client: Client to post with (a temporary one if None)
+        """
+        body, headers = self._login_request()
+
+        with self._lock:
+            if client is not None:
+                response = client.post("/session", json=body, headers=headers)
+            else:
+                with httpx.Client(
+                    base_url=self.base_url, headers=headers, transport=self.transport
+                ) as client:
+                    response = client.post("/session", json=body)
+
+            return self._store_tokens(response)
+
+    async def alogin(self, client: httpx.AsyncClient = None):
+        """
+        Log in without blocking the event loop
+
+        Args:
+            client: Async client to post with (a temporary one if None)
+
+        Raises:
+            TypeError: If a temporary client is needed and the configured
+                transport cannot send async requests
+        """
+        body, headers = self._login_request()
+
+        if client is None and not (
+            self.transport is None
+            or isinstance(self.transport, httpx.AsyncBaseTransport)
+        ):
+            raise TypeError(
+                f"{type(self.transport).__name__} cannot send async requests; "
+                "pass an async client to alogin"
+            )
+
+        if client is not None:
+            response = await client.post("/session", json=body, headers=headers)
+        else:
+            async with httpx.AsyncClient(
+                base_url=self.base_url, headers=headers, transport=self.transport
+            ) as client:
+                response = await client.post("/session", json=body)
+
+        return self._store_tokens(response)
+
+    def _load_stored(self) -> None:
+        if self.token_store is None:
+            return
+        stored = self.token_store.load(self._store_key)
+        if stored is not None:
+            tokens, expires_at = stored
+            self.tokens = {"X-IG-API-KEY": self.api_key, **tokens}
+            self.expires_at = expires_at
+            logger.debug("Reusing stored IG session")
+
+    def _expiring(self) -> bool:
+        return (
+            self.expires_at is not None
+            and time.time() >= self.expires_at - self.refresh_margin
+        )
+
+    def needs_login(self) -> bool:
+        """
+        Whether there is no session, or it is about to expire
+
+        Sessions are not refreshed in the background: one within
+        refresh_margin of expiry is replaced by logging in again on the next
+        request. A usable session in the token store is adopted first.
+        """
+        with self._lock:
+            if not self.tokens or self._expiring():
+                self._load_stored()
+            return not self.tokens or self._expiring()
+
+    def invalidate(self, tokens: Optional[Dict[str, str]] = None) -> None:
+        """
+        Drop a session the API rejected
+
+        Args:
+            tokens: The rejected session headers; nothing is dropped if a
+                newer session has replaced them in the meantime
+        """
+        with self._lock:
+            if tokens is not None and tokens.get("CST") != self.tokens.get("CST"):
+                return
+            rejected = self.tokens
+            self.tokens = {}
+            self.expires_at = None
+            if self.token_store is not None:
+                self.token_store.delete(self._store_key, rejected)
+
     def get_headers(self):
-        if not self.tokens:
-            return self.login()
-        return self.tokens
+        with self._lock:
+            if self.needs_login():
+                if self.tokens:
+                    logger.info("IG session about to expire, logging in again")
+                return self.login()
+            return self.tokens
@@ -0,0 +1,187 @@
+"""
+httpx transport recording IG requests to a Cassette and replaying them.
+
+Only GET requests are recorded; dealing and other writes always go to the
+API. Requests are matched on host, path, query and VERSION header. Session
+tokens and the API key are not part of the match, so recordings replay
+under any session. Rate-limit, expired-session and server errors are passed
+through without recording.
+
+Logins (POST /session) and relative price windows (the latest N bars, or
+prices without both from and to) change over time, so they are fetched and
+recorded again unless the cassette is replay-only. A login is recorded with
+placeholder session tokens and without its body (the password); replayed
+placeholders are only sent in replay-only mode, where nothing goes out.
+"""
+
+from typing import Any, Optional, Tuple
+
+import httpx
+
+from common.cassette import Cassette
+
+# Response headers not recorded: tokens, and framing httpx recomputes for
+# the decoded body it replays
+_REDACTED_HEADERS = ("CST", "X-SECURITY-TOKEN")
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+_UNRECORDED_STATUSES = (401, 429)
+
+Recording = Tuple[int, Tuple[Tuple[str, str], ...], bytes]
+
+
+def _method(request: httpx.Request) -> str:
+    return (request.headers.get("_method") or request.method).upper()
+
+
+def _is_login(request: httpx.Request) -> bool:
+    return _method(request) == "POST" and request.url.path.endswith("/session")
+
+
+def _is_relative_window(request: httpx.Request) -> bool:
+    """Whether a price request asks for bars relative to now"""
+    segments = request.url.path.strip("/").split("/")
+    if "prices" not in segments:
+        return False
+    after = segments[segments.index("prices") + 1 :]
+    if len(after) == 1:
+        # /prices/{epic}: the latest max bars unless from and to are given
+        params = request.url.params
+        return not ("from" in params and "to" in params)
+    # /prices/{epic}/{resolution}/{num_points}
+    return len(after) == 3
+
+
+def is_recorded(request: httpx.Request) -> bool:
+    """Whether a request goes through the cassette (GETs and logins)"""
+    return _method(request) == "GET" or _is_login(request)
+
+
+def is_refreshed(request: httpx.Request) -> bool:
+    """Whether a request is fetched again unless the cassette is replay-only"""
+    return _is_login(request) or _is_relative_window(request)
+
+
+def request_key(request: httpx.Request) -> Tuple[str, str]:
+    """
+    Cassette key and description of a request (bodies are not matched: GETs
+    have none and a login's is the password)
+
+    Args:
+        request: Request with its body read
+
+    Returns:
+        (key, "METHOD url")
+    """
+    method = _method(request)
+    key = Cassette.key(
+        request.url.host,
+        method,
+        request.url.path,
+        tuple(sorted(request.url.params.multi_items())),
+        request.headers.get("VERSION", ""),
+    )
+    return key, f"{method} {request.url}"
+
+
+def _recording(response: httpx.Response) -> Recording:
+    headers = tuple(
+        (name, value)
+        for name, value in response.headers.items()
+        if name.lower() not in _DROPPED_HEADERS
+    )
+    return response.status_code, headers, response.content
+
+
+def _to_record(recording: Recording) -> Optional[Recording]:
+    status, headers, content = recording
+    if status in _UNRECORDED_STATUSES or status >= 500:
+        return None
+    headers = tuple(
+        (name, "recorded" if name.upper() in _REDACTED_HEADERS else value)
+        for name, value in headers
+    )
+    return status, headers, content
+
+
+def _response(recording: Recording, request: httpx.Request) -> httpx.Response:
+    status, headers, content = recording
+    return httpx.Response(status, headers=headers, content=content, request=request)
+
+
+class CassetteTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Replays recorded IG responses, fetching the rest as the cassette allows"""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the transport (usable by sync and async clients)
+
+        Args:
+            cassette: Recordings to replay and record into
+            transport: Transport of sync requests not replayed (HTTP by default)
+            async_transport: Transport of async requests not replayed (HTTP
+                by default)
+        """
+        self.cassette = cassette
+        self._transport = transport
+        self._async_transport = async_transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+
+        def fetch() -> Recording:
+            if self._transport is None:
+                self._transport = httpx.HTTPTransport()
+            response = self._transport.handle_request(request)
+            try:
+                response.read()
+            finally:
+                response.close()
+            return _recording(response)
+
+        if not is_recorded(request):
+            return _response(fetch(), request)
+        key, description = request_key(request)
+        recording = self.cassette.play(
+            key, fetch, description, _to_record, refresh=is_refreshed(request)
+        )
+        return _response(recording, request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+
+        async def fetch() -> Recording:
+            if self._async_transport is None:
+                self._async_transport = httpx.AsyncHTTPTransport()
+            response = await self._async_transport.handle_async_request(request)
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            return _recording(response)
+
+        if not is_recorded(request):
+            return _response(await fetch(), request)
+        key, description = request_key(request)
+        recording = await self.cassette.aplay(
+            key, fetch, description, _to_record, refresh=is_refreshed(request)
+        )
+        return _response(recording, request)
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+
+    def __enter__(self) -> "CassetteTransport":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
 from api_gateway.ig_client.rest import IGRest
 from api_gateway.ig_client.error_handling import (
@@ -7,6 +7,14 @@ from api_gateway.ig_client.error_handling import (
     handle_response_parsing,
 )
 from api_gateway.ig_client.core.validators import PathValidators
+from api_gateway.ig_client.core.price_columns import (
+    PriceColumns,
+    parse_price_columns,
+)
+from api_gateway.ig_client.core.snapshot_columns import (
+    SnapshotColumns,
+    parse_snapshot_columns,
+)
 from api_gateway.ig_client.core.models.markets.ig_responses import (
     Markets,
     SingleMarketDetails,
@@ -28,12 +36,16 @@ class MarketsClient:
     @handle_api_errors("get_markets")
     @handle_validation_errors("get_markets")
     @handle_response_parsing("get_markets")
-    def get_markets(self, epics: str, filter_type: str = "ALL") -> Markets:
+    def get_markets(
+        self, epics: str, filter_type: str = "ALL", raw: bool = False
+    ) -> Union[Markets, SnapshotColumns]:
         # Validate query parameters with Pydantic
         query_params = GetMarketsQueryParams(epics=epics, filter=filter_type)
         params = query_params.model_dump(by_alias=True, exclude_none=True)
 
         json = self.rest.get(endpoint="/markets", version="2", params=params)
+        if raw:
+            return parse_snapshot_columns(json)
         return Markets(**json)
 
     @handle_api_errors("search_markets")
@@ -73,22 +85,29 @@ class MarketsClient:
     @handle_validation_errors("get_prices_by_points")
     @handle_response_parsing("get_prices_by_points")
     def get_prices_by_points(
-        self, epic: str, resolution: str, num_points: int
-    ) -> SimpleHistoricalPrices:
+        self, epic: str, resolution: str, num_points: int, raw: bool = False
+    ) -> Union[SimpleHistoricalPrices, PriceColumns]:
         PathValidators.validate_epic(epic)
         PathValidators.validate_resolution(resolution)
         PathValidators.validate_num_points(num_points)
         json = self.rest.get(
             endpoint=f"/prices/{epic}/{resolution}/{num_points}", version="2"
         )
+        if raw:
+            return parse_price_columns(json)
         return SimpleHistoricalPrices(**json)
 
     @handle_api_errors("get_prices_by_date_range")
     @handle_validation_errors("get_prices_by_date_range")
     @handle_response_parsing("get_prices_by_date_range")
     def get_prices_by_date_range(
-        self, epic: str, resolution: str, start_date: str, end_date: str
-    ) -> SimpleHistoricalPrices:
+        self,
+        epic: str,
+        resolution: str,
+        start_date: str,
+        end_date: str,
+        raw: bool = False,
+    ) -> Union[SimpleHistoricalPrices, PriceColumns]:
         PathValidators.validate_epic(epic)
         PathValidators.validate_resolution(resolution)
         PathValidators.validate_date_format(start_date)
@@ -96,4 +115,6 @@ class MarketsClient:
         json = self.rest.get(
             endpoint=f"/prices/{epic}/{resolution}/{start_date}/{end_date}", version="2"
         )
+        if raw:
+            return parse_price_columns(json)
         return SimpleHistoricalPrices(**json)
@@ -0,0 +1,112 @@
+"""
+Columnar parsing of IG historical price responses.
+
+The raw mode of the price endpoints turns the JSON body straight into one
+float64 array per OHLC field and side (bid/ask/lastTraded) plus volume,
+without building a pydantic model and Decimal per bar. Missing values are
+NaN. Malformed bodies raise IGValidationError like the validated mode.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from api_gateway.ig_client.core.exceptions import IGValidationError
+
+PRICE_FIELDS = ("openPrice", "highPrice", "lowPrice", "closePrice")
+PRICE_SIDES = ("bid", "ask", "lastTraded")
+SNAPSHOT_TIME_FORMAT = "%Y/%m/%d %H:%M:%S"
+
+
+@dataclass
+class PriceColumns:
+    """Historical prices as arrays, one entry per bar"""
+
+    snapshot_time: np.ndarray  # IG snapshotTime strings (None if missing)
+    timestamps: np.ndarray  # datetime64[ns] parsed from snapshotTime, NaT if invalid
+    prices: Dict[Tuple[str, str], np.ndarray]  # (field, side) -> float64
+    volume: np.ndarray  # float64 lastTradedVolume
+    instrument_type: Optional[str] = None
+    allowance: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.snapshot_time)
+
+    def price(self, field_name: str, side: str) -> np.ndarray:
+        """Prices of one field (e.g. "closePrice") and side (e.g. "bid")"""
+        return self.prices[(field_name, side)]
+
+    def mid(self, field_name: str) -> np.ndarray:
+        """Average of bid and ask (NaN where either is missing)"""
+        return (self.price(field_name, "bid") + self.price(field_name, "ask")) / 2
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        DataFrame with a timestamp column, one "<field>.<side>" column per
+        price array and lastTradedVolume
+        """
+        columns = {"timestamp": self.timestamps}
+        columns.update(
+            {f"{name}.{side}": values for (name, side), values in self.prices.items()}
+        )
+        columns["lastTradedVolume"] = self.volume
+        return pd.DataFrame(columns)
+
+
+def parse_price_columns(json: Dict[str, Any]) -> PriceColumns:
+    """
+    Parse a /prices response body into columns
+
+    Args:
+        json: Decoded response of a /prices request
+
+    Returns:
+        PriceColumns
+
+    Raises:
+        IGValidationError: If the body has no list of prices or a price is
+            not a number
+    """
+    bars = json.get("prices") if isinstance(json, dict) else None
+    if not isinstance(bars, list):
+        raise IGValidationError("Invalid prices response format: no list of prices")
+
+    empty: Dict[str, Any] = {}
+    try:
+        # One row per bar: every field/side followed by the volume; None
+        # becomes NaN
+        values = np.array(
+            [
+                [
+                    (bar.get(name) or empty).get(side)
+                    for name in PRICE_FIELDS
+                    for side in PRICE_SIDES
+                ]
+                + [bar.get("lastTradedVolume")]
+                for bar in bars
+            ],
+            dtype=np.float64,
+        ).reshape(len(bars), len(PRICE_FIELDS) * len(PRICE_SIDES) + 1)
+        snapshot_time = np.array(
+            [bar.get("snapshotTime") for bar in bars], dtype=object
+        )
+    except (AttributeError, TypeError, ValueError) as e:
+        raise IGValidationError(f"Invalid prices response format: {e}")
+
+    timestamps = pd.to_datetime(
+        pd.Series(snapshot_time, dtype=object),
+        format=SNAPSHOT_TIME_FORMAT,
+        errors="coerce",
+    ).to_numpy(dtype="datetime64[ns]")
+
+    keys = [(name, side) for name in PRICE_FIELDS for side in PRICE_SIDES]
+    return PriceColumns(
+        snapshot_time=snapshot_time,
+        timestamps=timestamps,
+        prices={key: values[:, i].copy() for i, key in enumerate(keys)},
+        volume=values[:, -1].copy(),
+        instrument_type=json.get("instrumentType"),
+        allowance=dict(json.get("allowance") or {}),
+    )
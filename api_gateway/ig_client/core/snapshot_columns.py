@@ -0,0 +1,132 @@
+"""
+Columnar parsing of IG multi-epic market snapshots.
+
+The raw mode of GET /markets turns the marketDetails list straight into one
+array per snapshot field, without building the (large) MarketDetails model
+per market. Missing prices are NaN. Malformed bodies raise
+IGValidationError like the validated mode.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from api_gateway.ig_client.core.exceptions import IGValidationError
+
+SNAPSHOT_PRICE_FIELDS = (
+    "bid",
+    "offer",
+    "high",
+    "low",
+    "netChange",
+    "percentageChange",
+)
+SNAPSHOT_TEXT_FIELDS = ("marketStatus", "updateTime")
+
+
+@dataclass
+class SnapshotColumns:
+    """Market snapshots as arrays, one entry per epic"""
+
+    epics: np.ndarray  # object
+    instrument_names: np.ndarray  # object
+    prices: Dict[str, np.ndarray]  # SNAPSHOT_PRICE_FIELDS -> float64
+    text: Dict[str, np.ndarray]  # SNAPSHOT_TEXT_FIELDS -> object
+
+    def __len__(self) -> int:
+        return len(self.epics)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name in self.prices:
+            return self.prices[name]
+        return self.text[name]
+
+    def take(self, indices: Sequence[int]) -> "SnapshotColumns":
+        """Rows at the given positions"""
+        indices = np.asarray(indices, dtype=np.intp)
+        return SnapshotColumns(
+            epics=self.epics[indices],
+            instrument_names=self.instrument_names[indices],
+            prices={name: values[indices] for name, values in self.prices.items()},
+            text={name: values[indices] for name, values in self.text.items()},
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["SnapshotColumns"]) -> "SnapshotColumns":
+        """Stack several tables (e.g. one per request chunk)"""
+        if not parts:
+            return parse_snapshot_columns({"marketDetails": []})
+        return cls(
+            epics=np.concatenate([part.epics for part in parts]),
+            instrument_names=np.concatenate([part.instrument_names for part in parts]),
+            prices={
+                name: np.concatenate([part.prices[name] for part in parts])
+                for name in SNAPSHOT_PRICE_FIELDS
+            },
+            text={
+                name: np.concatenate([part.text[name] for part in parts])
+                for name in SNAPSHOT_TEXT_FIELDS
+            },
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame indexed by epic with the instrument name and every field"""
+        columns = {"instrumentName": self.instrument_names}
+        columns.update(self.prices)
+        columns.update(self.text)
+        return pd.DataFrame(columns, index=pd.Index(self.epics, name="epic"))
+
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def parse_snapshot_columns(json: Dict[str, Any]) -> SnapshotColumns:
+    """
+    Parse a GET /markets?epics=... response body into columns
+
+    Args:
+        json: Decoded response of a multi-epic /markets request
+
+    Returns:
+        SnapshotColumns in response order
+
+    Raises:
+        IGValidationError: If the body has no list of market details or a
+            price is not a number
+    """
+    details = json.get("marketDetails") if isinstance(json, dict) else None
+    if not isinstance(details, list):
+        raise IGValidationError("Invalid markets response format: no marketDetails")
+
+    try:
+        instruments = [market["instrument"] for market in details]
+        snapshots = [market["snapshot"] for market in details]
+        epics = [instrument["epic"] for instrument in instruments]
+        names = [instrument.get("name") for instrument in instruments]
+        values = np.array(
+            [
+                [snapshot.get(name) for name in SNAPSHOT_PRICE_FIELDS]
+                for snapshot in snapshots
+            ],
+            dtype=np.float64,
+        ).reshape(len(details), len(SNAPSHOT_PRICE_FIELDS))
+        text = {
+            name: _object_array([snapshot.get(name) for snapshot in snapshots])
+            for name in SNAPSHOT_TEXT_FIELDS
+        }
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise IGValidationError(f"Invalid markets response format: {e}")
+
+    return SnapshotColumns(
+        epics=_object_array(epics),
+        instrument_names=_object_array(names),
+        prices={
+            name: values[:, i].copy() for i, name in enumerate(SNAPSHOT_PRICE_FIELDS)
+        },
+        text=text,
+    )
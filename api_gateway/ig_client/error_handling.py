@@ -1,7 +1,11 @@
 """
 DRY error handling decorators for API client methods.
+
+The decorators wrap both plain functions and coroutine functions, so the
+async clients share the error mapping of the sync ones.
 """
 
+import inspect
 import logging
 from functools import wraps
 from typing import Callable, Type, Tuple, Any
@@ -22,46 +26,85 @@ from api_gateway.ig_client.core.exceptions import (
 logger = logging.getLogger(__name__)
 
 
-def handle_api_errors(operation_name: str = None):
+def _wrap(func: Callable, op_name: str, translate: Callable, log: bool = False):
     """
-    Decorator to handle common API errors.
-
-    Args:
-        operation_name: Name of the operation for logging (defaults to function name)
+    Wrap a function or coroutine function so that exceptions are passed
+    through translate(op_name, error), which returns the exception to raise
+    (the error itself to re-raise it unchanged)
     """
 
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            op_name = operation_name or func.__name__
+    def reraise(e: Exception):
+        error = translate(op_name, e)
+        if error is e:
+            raise
+        raise error
 
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
             try:
+                if log:
+                    logger.debug(f"Starting {op_name}")
+                result = await func(*args, **kwargs)
+                if log:
+                    logger.info(f"Successfully completed {op_name}")
+                return result
+            except Exception as e:
+                reraise(e)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            if log:
                 logger.debug(f"Starting {op_name}")
-                result = func(*args, **kwargs)
+            result = func(*args, **kwargs)
+            if log:
                 logger.info(f"Successfully completed {op_name}")
-                return result
+            return result
+        except Exception as e:
+            reraise(e)
 
-            except ValidationError as e:
-                logger.error(f"Validation error in {op_name}: {e}")
-                raise IGValidationError(f"Invalid {op_name} request/response: {str(e)}")
-
-            except (
-                IGAuthenticationError,
-                IGAuthorizationError,
-                IGValidationError,
-                IGRateLimitError,
-                IGNotFoundError,
-                IGServerError,
-                IGNetworkError,
-                IGTimeoutError,
-            ):
-                raise
+    return wrapper
 
-            except Exception as e:
-                logger.error(f"Unexpected error in {op_name}: {e}")
-                raise IGAPIError(f"Failed to {op_name}: {str(e)}")
 
-        return wrapper
+def _translate_api_error(op_name: str, e: Exception) -> Exception:
+    if isinstance(e, ValidationError):
+        logger.error(f"Validation error in {op_name}: {e}")
+        return IGValidationError(f"Invalid {op_name} request/response: {str(e)}")
+
+    if isinstance(
+        e,
+        (
+            IGAuthenticationError,
+            IGAuthorizationError,
+            IGValidationError,
+            IGRateLimitError,
+            IGNotFoundError,
+            IGServerError,
+            IGNetworkError,
+            IGTimeoutError,
+        ),
+    ):
+        return e
+
+    logger.error(f"Unexpected error in {op_name}: {e}")
+    return IGAPIError(f"Failed to {op_name}: {str(e)}")
+
+
+def handle_api_errors(operation_name: str = None):
+    """
+    Decorator to handle common API errors.
+
+    Args:
+        operation_name: Name of the operation for logging (defaults to function name)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        op_name = operation_name or func.__name__
+        return _wrap(func, op_name, _translate_api_error, log=True)
 
     return decorator
 
@@ -71,18 +114,14 @@ def handle_validation_errors(operation_name: str = None):
     Decorator specifically for handling validation errors.
     """
 
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            op_name = operation_name or func.__name__
-
-            try:
-                return func(*args, **kwargs)
-            except ValidationError as e:
-                logger.error(f"Validation error in {op_name}: {e}")
-                raise IGValidationError(f"Invalid {op_name} request: {str(e)}")
+    def translate(op_name: str, e: Exception) -> Exception:
+        if isinstance(e, ValidationError):
+            logger.error(f"Validation error in {op_name}: {e}")
+            return IGValidationError(f"Invalid {op_name} request: {str(e)}")
+        return e
 
-        return wrapper
+    def decorator(func: Callable) -> Callable:
+        return _wrap(func, operation_name or func.__name__, translate)
 
     return decorator
 
@@ -92,17 +131,13 @@ def handle_response_parsing(operation_name: str = None):
     Decorator for handling response parsing errors.
     """
 
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            op_name = operation_name or func.__name__
-
-            try:
-                return func(*args, **kwargs)
-            except ValidationError as e:
-                logger.error(f"Response parsing error in {op_name}: {e}")
-                raise IGValidationError(f"Invalid {op_name} response format: {str(e)}")
+    def translate(op_name: str, e: Exception) -> Exception:
+        if isinstance(e, ValidationError):
+            logger.error(f"Response parsing error in {op_name}: {e}")
+            return IGValidationError(f"Invalid {op_name} response format: {str(e)}")
+        return e
 
-        return wrapper
+    def decorator(func: Callable) -> Callable:
+        return _wrap(func, operation_name or func.__name__, translate)
 
     return decorator
@@ -1,9 +1,14 @@
 from typing import Optional, TYPE_CHECKING
 
+import httpx
+
 if TYPE_CHECKING:
     from common.resilience import RateLimiter
 
 from api_gateway.ig_client.auth import IGAuthenticator
+from api_gateway.ig_client.rate_limits import IGRateLimits
+from api_gateway.ig_client.response_cache import IGResponseCache
+from api_gateway.ig_client.session_store import SessionTokenStore
 from api_gateway.ig_client.clients import (
     AccountsClient,
     DealingClient,
@@ -21,6 +26,10 @@ class IGClient:
         identifier: str,
         password: str,
         rate_limiter: Optional["RateLimiter"] = None,
+        rate_limits: Optional[IGRateLimits] = None,
+        token_store: Optional[SessionTokenStore] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        response_cache: Optional[IGResponseCache] = None,
     ):
         """
         Initialize IG client.
@@ -31,12 +40,30 @@ class IGClient:
             identifier: User identifier
             password: User password
             rate_limiter: Optional rate limiter instance (from common.resilience)
+            rate_limits: Optional per-endpoint-class rate limits (take
+                precedence over rate_limiter)
+            token_store: Optional on-disk session cache, shared with other
+                processes and runs
+            transport: Optional httpx transport of all requests, including
+                logins (e.g. a CassetteTransport to record and replay them)
+            response_cache: Optional cache of reference-data GET responses
+                (accounts, market details, watchlists, ...)
         """
         self.auth_session = IGAuthenticator(
-            base_url=base_url, api_key=api_key, identifier=identifier, password=password
+            base_url=base_url,
+            api_key=api_key,
+            identifier=identifier,
+            password=password,
+            token_store=token_store,
+            transport=transport,
         )
         self.rest = IGRest(
-            base_url=base_url, auth_session=self.auth_session, rate_limiter=rate_limiter
+            base_url=base_url,
+            auth_session=self.auth_session,
+            rate_limiter=rate_limiter,
+            rate_limits=rate_limits,
+            transport=transport,
+            response_cache=response_cache,
         )
         self.accounts = AccountsClient(rest=self.rest)
         self.markets = MarketsClient(rest=self.rest)
@@ -0,0 +1,112 @@
+"""
+Per-endpoint-class rate limits for IG requests.
+
+IG counts trading requests (opening, amending and closing positions and
+working orders) separately from non-trading requests (everything else,
+including confirmations and prices). IGRateLimits keeps one bucket per class
+plus a historical bucket that price requests draw from as well as the
+non-trading one, so data pulls leave headroom for account and confirmation
+calls. Requests in the dealing lane (positions, working orders and
+confirmations) are served before data requests waiting on the same bucket.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from common.resilience import PriorityRateLimiter
+
+TRADING = "trading"
+NON_TRADING = "non_trading"
+HISTORICAL = "historical"
+
+# Priority lanes (lower is served first)
+DEALING_LANE = 0
+DATA_LANE = 1
+
+# (calls, period seconds) per account; the historical bucket reserves a third
+# of the non-trading allowance for other calls
+TRADING_LIMIT = (100, 60)
+NON_TRADING_LIMIT = (30, 60)
+HISTORICAL_LIMIT = (20, 60)
+
+_DEALING_RESOURCES = ("positions", "workingorders", "confirms")
+_HISTORICAL_RESOURCES = ("prices",)
+
+
+def _resource(endpoint: str) -> str:
+    return endpoint.split("?", 1)[0].strip("/").split("/", 1)[0]
+
+
+def endpoint_class(method: str, endpoint: str) -> str:
+    """
+    Rate-limit class of a request
+
+    Args:
+        method: Effective HTTP method (after any _method override)
+        endpoint: Request path, e.g. /positions/otc
+
+    Returns:
+        TRADING, NON_TRADING or HISTORICAL
+    """
+    resource = _resource(endpoint)
+    if resource in _HISTORICAL_RESOURCES:
+        return HISTORICAL
+    if method.upper() != "GET" and resource in ("positions", "workingorders"):
+        return TRADING
+    return NON_TRADING
+
+
+def request_lane(endpoint: str) -> int:
+    """Priority lane of a request: DEALING_LANE or DATA_LANE"""
+    return DEALING_LANE if _resource(endpoint) in _DEALING_RESOURCES else DATA_LANE
+
+
+class IGRateLimits:
+    """Rate-limit buckets per IG endpoint class"""
+
+    def __init__(
+        self,
+        trading: Tuple[int, float] = TRADING_LIMIT,
+        non_trading: Tuple[int, float] = NON_TRADING_LIMIT,
+        historical: Tuple[int, float] = HISTORICAL_LIMIT,
+    ):
+        """
+        Initialize the buckets
+
+        Args:
+            trading: (calls, period seconds) of trading requests
+            non_trading: (calls, period seconds) of all non-trading requests
+            historical: (calls, period seconds) of price requests (also
+                counted as non-trading)
+        """
+        self.buckets = {
+            TRADING: PriorityRateLimiter(*trading, name=TRADING),
+            NON_TRADING: PriorityRateLimiter(*non_trading, name=NON_TRADING),
+            HISTORICAL: PriorityRateLimiter(*historical, name=HISTORICAL),
+        }
+
+    def buckets_for(self, method: str, endpoint: str) -> List[PriorityRateLimiter]:
+        """Buckets a request draws from, in acquisition order"""
+        cls = endpoint_class(method, endpoint)
+        if cls == HISTORICAL:
+            return [self.buckets[HISTORICAL], self.buckets[NON_TRADING]]
+        return [self.buckets[cls]]
+
+    def acquire(self, method: str, endpoint: str) -> float:
+        """
+        Wait until a request may be sent
+
+        Args:
+            method: Effective HTTP method
+            endpoint: Request path
+
+        Returns:
+            Seconds spent waiting
+        """
+        lane = request_lane(endpoint)
+        return sum(
+            bucket.acquire(lane) for bucket in self.buckets_for(method, endpoint)
+        )
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Bucket name -> PriorityRateLimiter.metrics()"""
+        return {name: bucket.metrics() for name, bucket in self.buckets.items()}
@@ -0,0 +1,272 @@
+"""
+Opt-in cache of IG GET responses.
+
+Reference data (accounts, preferences, market details and search,
+navigation, watchlists) changes slowly but is requested on every run and
+connect. IGResponseCache keeps the parsed responses of GET requests that
+match a CachePolicy for the policy's TTL, in a bounded LRU:
+
+- Concurrent misses of one request share a single fetch
+- Within a policy's stale window an expired entry is served at once while
+  one background fetch refreshes it (a failed refresh keeps the stale entry)
+- Requests matching no policy (prices, positions, confirmations, /markets
+  snapshots by epic) are never cached
+- A non-GET request drops the cached entries of its resource, and dealing
+  and session requests drop /accounts
+
+The snapshot section of a cached /markets/{epic} response ages with the
+entry; use get_markets or streaming for live prices.
+"""
+
+import copy
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Cache lifetime of GET requests whose target matches pattern"""
+
+    # Regular expression matched against the whole request target (path,
+    # plus "?" and the sorted query string if there are parameters)
+    pattern: str
+    # Seconds a response is served without refetching
+    ttl: float
+    # Further seconds an expired response is served while it is refreshed
+    stale_ttl: float = 0.0
+
+    def matches(self, target: str) -> bool:
+        return re.fullmatch(self.pattern, target) is not None
+
+
+DEFAULT_POLICIES = (
+    CachePolicy(r"/accounts", ttl=60, stale_ttl=600),
+    CachePolicy(r"/accounts/preferences", ttl=3600, stale_ttl=86400),
+    CachePolicy(r"/markets/[^/?]+", ttl=60, stale_ttl=600),
+    CachePolicy(r"/markets\?searchTerm=.*", ttl=3600, stale_ttl=86400),
+    CachePolicy(r"/marketnavigation(/[^/?]+)?", ttl=3600, stale_ttl=86400),
+    CachePolicy(r"/watchlists(/[^/?]+)?", ttl=300, stale_ttl=3600),
+)
+
+# Resources whose writes also change account balances
+_ACCOUNT_WRITERS = ("positions", "workingorders", "session")
+
+
+def request_target(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Target string policies are matched against
+
+    Args:
+        endpoint: Request path, e.g. /markets
+        params: Query parameters
+
+    Returns:
+        The path, with the sorted query string appended if there is one
+    """
+    if not params:
+        return endpoint
+    separator = "&" if "?" in endpoint else "?"
+    return f"{endpoint}{separator}{urlencode(sorted(params.items()))}"
+
+
+def _resource(target: str) -> str:
+    return target.split("?", 1)[0].strip("/").split("/", 1)[0]
+
+
+@dataclass
+class _Entry:
+    target: str
+    value: Any
+    fetched_at: float
+
+
+@dataclass
+class ResponseCacheStats:
+    """Cache usage counters"""
+
+    hits: int = 0
+    stale_hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class IGResponseCache:
+    """
+    TTL cache of GET responses with single-flight and stale-while-revalidate
+
+    Thread-safe; values are returned as deep copies, so callers never see
+    each other's mutations.
+    """
+
+    def __init__(
+        self,
+        policies: Iterable[CachePolicy] = DEFAULT_POLICIES,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            policies: Cacheable request targets; the first match applies
+            max_entries: Maximum number of cached responses
+            clock: Monotonic time source (seconds)
+        """
+        self.policies = tuple(policies)
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = ResponseCacheStats()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        # Running fetches with the generation they started in
+        self._inflight: Dict[Hashable, Tuple[Future, int]] = {}
+        # Bumped on invalidation so fetches started earlier are not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def policy_for(self, target: str) -> Optional[CachePolicy]:
+        """First policy matching a request target, or None if not cacheable"""
+        for policy in self.policies:
+            if policy.matches(target):
+                return policy
+        return None
+
+    def get(self, key: Hashable, target: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Cached response of a request, fetching it as needed
+
+        Args:
+            key: Identity of the request (account, version and target)
+            target: Request target (see request_target) matched to policies
+            fetch: Sends the request and returns the parsed response
+
+        Returns:
+            The response
+        """
+        policy = self.policy_for(target)
+        if policy is None:
+            return fetch()
+
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry.fetched_at
+                if age < policy.ttl + policy.stale_ttl:
+                    self._entries.move_to_end(key)
+                    if age < policy.ttl:
+                        self.stats.hits += 1
+                    else:
+                        self.stats.stale_hits += 1
+                        self._refresh(key, target, fetch)
+                    return copy.deepcopy(entry.value)
+            if key in self._inflight:
+                self.stats.coalesced += 1
+                future, leader = self._inflight[key][0], False
+            else:
+                self.stats.misses += 1
+                future, leader = self._start(key), True
+
+        if leader:
+            self._fill(key, target, fetch, future)
+        return copy.deepcopy(future.result())
+
+    def _start(self, key: Hashable) -> Future:
+        future: Future = Future()
+        self._inflight[key] = (future, self._generation)
+        return future
+
+    def _refresh(self, key: Hashable, target: str, fetch: Callable[[], Any]) -> None:
+        """Start a background refresh unless one is running (lock held)"""
+        if key in self._inflight:
+            return
+        self.stats.refreshes += 1
+        future = self._start(key)
+        threading.Thread(
+            target=self._fill,
+            args=(key, target, fetch, future),
+            name=f"ig-cache-refresh-{target}",
+            daemon=True,
+        ).start()
+
+    def _fill(
+        self, key: Hashable, target: str, fetch: Callable[[], Any], future: Future
+    ) -> None:
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if key in self._entries:
+                    self.stats.refresh_errors += 1
+                    logger.warning(f"Could not refresh cached {target}: {e}")
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            _, generation = self._inflight.pop(key)
+            if generation == self._generation:
+                self._entries[key] = _Entry(target, value, self.clock())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats.evictions += 1
+        future.set_result(value)
+
+    def _drop(self, predicate: Callable[[_Entry], bool]) -> int:
+        with self._lock:
+            self._generation += 1
+            keys = [key for key, entry in self._entries.items() if predicate(entry)]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+            return len(keys)
+
+    def invalidate(self, pattern: Optional[str] = None) -> int:
+        """
+        Drop cached responses
+
+        Args:
+            pattern: Regular expression matched against whole targets (all
+                entries if None)
+
+        Returns:
+            Number of entries dropped
+        """
+        return self._drop(
+            lambda entry: pattern is None
+            or re.fullmatch(pattern, entry.target) is not None
+        )
+
+    def invalidate_for(self, method: str, endpoint: str) -> int:
+        """
+        Drop the responses a request may have changed
+
+        Args:
+            method: Effective HTTP method (GET requests change nothing)
+            endpoint: Request path
+
+        Returns:
+            Number of entries dropped
+        """
+        if method.upper() == "GET":
+            return 0
+        resources = {_resource(endpoint)}
+        if resources & set(_ACCOUNT_WRITERS):
+            resources.add("accounts")
+        return self._drop(lambda entry: _resource(entry.target) in resources)
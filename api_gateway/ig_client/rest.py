@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from common.resilience import RateLimiter
 
 from api_gateway.ig_client.auth import IGAuthenticator
+from api_gateway.ig_client.rate_limits import IGRateLimits
+from api_gateway.ig_client.response_cache import IGResponseCache, request_target
 from api_gateway.ig_client.core.exceptions import (
     IGAPIError,
     IGAuthenticationError,
@@ -22,58 +24,38 @@ from api_gateway.ig_client.core.exceptions import (
 logger = logging.getLogger(__name__)
 
 
-class IGRest:
-    def __init__(
-        self,
-        base_url: str,
-        auth_session: IGAuthenticator,
-        rate_limiter: Optional["RateLimiter"] = None,
-    ):
-        """
-        Initialize IG REST client.
-
-        Args:
-            base_url: Base URL for IG API
-            auth_session: Authentication session
-            rate_limiter: Optional rate limiter instance (from common.resilience)
-        """
-        self.auth_session = auth_session
-        self.rate_limiter = rate_limiter
-        self.client = httpx.Client(
-            base_url=base_url,
-            headers=auth_session.get_headers(),
-            timeout=30.0,
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
-        )
-
-    def get(self, endpoint: str, version: str, **kwargs):
-        return self._request(method="GET", endpoint=endpoint, version=version, **kwargs)
-
-    def post(self, endpoint: str, version: str, data=None, **kwargs):
-        return self._request(
-            method="POST", endpoint=endpoint, version=version, json=data, **kwargs
-        )
-
-    def put(self, endpoint: str, version: str, data=None, **kwargs):
-        return self._request(
-            method="PUT", endpoint=endpoint, version=version, json=data, **kwargs
-        )
+# IG errors raised by response handling, passed through unchanged
+IG_ERRORS = (
+    IGAPIError,
+    IGAuthenticationError,
+    IGAuthorizationError,
+    IGValidationError,
+    IGRateLimitError,
+    IGNotFoundError,
+    IGServerError,
+    IGNetworkError,
+    IGTimeoutError,
+)
 
-    def delete(self, endpoint: str, version: str, data=None, **kwargs):
-        return self._request(
-            method="DELETE", endpoint=endpoint, version=version, json=data, **kwargs
-        )
 
-    def _request(self, method: str, endpoint: str, version: str, **kwargs):
-        if self.rate_limiter:
-            self.rate_limiter.acquire()
+class BaseIGRest:
+    """
+    Request headers and response/error mapping shared by the sync and async
+    REST clients
+    """
 
-        override_method = kwargs.pop("override_method", "")  # Remove from kwargs
-        headers = self.auth_session.get_headers()
+    def _build_headers(
+        self, auth_headers: Dict[str, str], version: str, override_method: str = ""
+    ) -> Dict[str, str]:
+        headers = dict(auth_headers)
         headers["VERSION"] = version
         if override_method:
             headers["_method"] = override_method
+        return headers
 
+    def _log_request(
+        self, method: str, endpoint: str, version: str, headers: Dict[str, str]
+    ) -> None:
         logger.debug(
             f"Making API request: {method} {endpoint} (v{version})",
             extra={
@@ -84,45 +66,29 @@ class IGRest:
             },
         )
 
-        try:
-            response = self.client.request(
-                method=method, url=endpoint, headers=headers, **kwargs
-            )
-            return self._handle_response(response)
-
-        except httpx.TimeoutException as e:
+    def _translate_error(self, method: str, endpoint: str, e: Exception) -> Exception:
+        """Map an exception raised while sending a request to an IG error"""
+        if isinstance(e, httpx.TimeoutException):
             logger.error(f"Request timeout for {method} {endpoint}: {str(e)}")
-            raise IGTimeoutError(f"Request timeout: {str(e)}")
-
-        except httpx.NetworkError as e:
+            return IGTimeoutError(f"Request timeout: {str(e)}")
+        if isinstance(e, httpx.NetworkError):
             logger.error(f"Network error for {method} {endpoint}: {str(e)}")
-            raise IGNetworkError(f"Network error: {str(e)}")
-
-        except (
-            IGAPIError,
-            IGAuthenticationError,
-            IGAuthorizationError,
-            IGValidationError,
-            IGRateLimitError,
-            IGNotFoundError,
-            IGServerError,
-            IGNetworkError,
-            IGTimeoutError,
-        ):
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in request {method} {endpoint}: {str(e)}")
-            raise IGAPIError(f"Unexpected error: {str(e)}")
+            return IGNetworkError(f"Network error: {str(e)}")
+        if isinstance(e, IG_ERRORS):
+            return e
+        logger.error(f"Unexpected error in request {method} {endpoint}: {str(e)}")
+        return IGAPIError(f"Unexpected error: {str(e)}")
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         request_id = response.headers.get("X-Request-ID", "unknown")
 
         logger.debug(
             "API Response received",
-            status_code=response.status_code,
-            request_id=request_id,
-            response_time=response.elapsed.total_seconds(),
-            content_length=len(response.content) if response.content else 0,
+            extra={
+                "status_code": response.status_code,
+                "request_id": request_id,
+                "content_length": len(response.content) if response.content else 0,
+            },
         )
 
         if response.status_code == 200:
@@ -208,3 +174,133 @@ class IGRest:
         except (ValueError, json.JSONDecodeError) as e:
             logger.warning(f"Failed to parse JSON response: {str(e)}")
             return {"raw_response": response.text}
+
+
+class IGRest(BaseIGRest):
+    def __init__(
+        self,
+        base_url: str,
+        auth_session: IGAuthenticator,
+        rate_limiter: Optional["RateLimiter"] = None,
+        rate_limits: Optional[IGRateLimits] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        response_cache: Optional[IGResponseCache] = None,
+    ):
+        """
+        Initialize IG REST client.
+
+        Args:
+            base_url: Base URL for IG API
+            auth_session: Authentication session
+            rate_limiter: Optional rate limiter instance (from common.resilience)
+                shared by all requests
+            rate_limits: Optional per-endpoint-class buckets; takes precedence
+                over rate_limiter
+            transport: Optional httpx transport (e.g. a CassetteTransport)
+            response_cache: Optional cache of reference-data GET responses
+                (may be shared by clients of several accounts)
+        """
+        self.auth_session = auth_session
+        self.rate_limiter = rate_limiter
+        self.rate_limits = rate_limits
+        self.response_cache = response_cache
+        self.client = httpx.Client(
+            base_url=base_url,
+            headers=auth_session.get_headers(),
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            transport=transport,
+        )
+
+    def rate_limit_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Levels of the per-endpoint-class buckets (empty without rate_limits)"""
+        return self.rate_limits.metrics() if self.rate_limits is not None else {}
+
+    def get(self, endpoint: str, version: str, **kwargs):
+        return self._request(method="GET", endpoint=endpoint, version=version, **kwargs)
+
+    def post(self, endpoint: str, version: str, data=None, **kwargs):
+        return self._request(
+            method="POST", endpoint=endpoint, version=version, json=data, **kwargs
+        )
+
+    def put(self, endpoint: str, version: str, data=None, **kwargs):
+        return self._request(
+            method="PUT", endpoint=endpoint, version=version, json=data, **kwargs
+        )
+
+    def delete(self, endpoint: str, version: str, data=None, **kwargs):
+        return self._request(
+            method="DELETE", endpoint=endpoint, version=version, json=data, **kwargs
+        )
+
+    def _request(self, method: str, endpoint: str, version: str, **kwargs):
+        override_method = kwargs.pop("override_method", "")  # Remove from kwargs
+
+        if self.response_cache is None:
+            return self._authorized(method, endpoint, version, override_method, kwargs)
+        if method == "GET" and not override_method:
+            # Keyed by account too, so one cache can serve several clients
+            target = request_target(endpoint, kwargs.get("params"))
+            account = (str(self.client.base_url), self.auth_session.identifier)
+            return self.response_cache.get(
+                (*account, version, target),
+                target,
+                lambda: self._authorized(
+                    method, endpoint, version, override_method, kwargs
+                ),
+            )
+        try:
+            return self._authorized(method, endpoint, version, override_method, kwargs)
+        finally:
+            self.response_cache.invalidate_for(override_method or method, endpoint)
+
+    def _authorized(
+        self,
+        method: str,
+        endpoint: str,
+        version: str,
+        override_method: str,
+        kwargs: Dict[str, Any],
+    ):
+        tokens = self.auth_session.get_headers()
+        try:
+            return self._send(
+                method, endpoint, version, tokens, override_method, kwargs
+            )
+        except IGAuthenticationError:
+            # The session expired or was revoked: log in again and replay once
+            logger.info(f"Session rejected for {method} {endpoint}, logging in again")
+            self.auth_session.invalidate(tokens)
+            tokens = self.auth_session.get_headers()
+            return self._send(
+                method, endpoint, version, tokens, override_method, kwargs
+            )
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        version: str,
+        tokens: Dict[str, str],
+        override_method: str,
+        kwargs: Dict[str, Any],
+    ):
+        if self.rate_limits is not None:
+            self.rate_limits.acquire(override_method or method, endpoint)
+        elif self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        headers = self._build_headers(tokens, version, override_method)
+        self._log_request(method, endpoint, version, headers)
+
+        try:
+            response = self.client.request(
+                method=method, url=endpoint, headers=headers, **kwargs
+            )
+            return self._handle_response(response)
+        except Exception as e:
+            error = self._translate_error(method, endpoint, e)
+            if error is e:
+                raise
+            raise error
@@ -0,0 +1,109 @@
+"""
+On-disk cache of IG session tokens.
+
+One JSON file per account (keyed by a hash of base URL and identifier)
+holding the CST and X-SECURITY-TOKEN with their expiry, so processes and
+later runs reuse a session instead of logging in again. The directory is
+created with mode 0700 and files are written with mode 0600 via a
+temporary file and rename. Passwords and API keys are never written.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Tokens kept on disk (the API key header is added back from configuration)
+SESSION_TOKENS = ("CST", "X-SECURITY-TOKEN")
+
+
+class SessionTokenStore:
+    """File-per-account store of session tokens with their expiry"""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) a token store
+
+        Args:
+            path: Directory holding the token files
+        """
+        self.path = Path(path).expanduser()
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    @staticmethod
+    def account_key(base_url: str, identifier: str) -> str:
+        """Key of an account's session (demo and live do not collide)"""
+        payload = f"{base_url.rstrip('/')}\0{identifier}"
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, str], float]]:
+        """
+        Stored tokens of an account
+
+        Args:
+            key: Account key (see account_key)
+
+        Returns:
+            (tokens, expiry as a Unix timestamp), or None if nothing usable
+            is stored
+        """
+        try:
+            with open(self._file(key)) as f:
+                entry = json.load(f)
+            tokens = {name: entry["tokens"][name] for name in SESSION_TOKENS}
+            return tokens, float(entry["expires_at"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable session token file: {e}")
+            return None
+
+    def save(self, key: str, tokens: Dict[str, str], expires_at: float) -> None:
+        """
+        Store an account's tokens
+
+        Args:
+            key: Account key
+            tokens: Session headers (only SESSION_TOKENS are written)
+            expires_at: Expiry as a Unix timestamp
+        """
+        entry = {
+            "tokens": {name: tokens.get(name) for name in SESSION_TOKENS},
+            "expires_at": expires_at,
+            "saved_at": time.time(),
+        }
+        path = self._file(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not store session tokens: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def delete(self, key: str, tokens: Optional[Dict[str, str]] = None) -> None:
+        """
+        Remove an account's tokens
+
+        Args:
+            key: Account key
+            tokens: Remove only if these are the stored tokens (another
+                process may already have stored a newer session)
+        """
+        if tokens is not None:
+            stored = self.load(key)
+            if stored is None or any(
+                stored[0].get(name) != tokens.get(name) for name in SESSION_TOKENS
+            ):
+                return
+        self._file(key).unlink(missing_ok=True)
@@ -0,0 +1,7 @@
+"""
+Test doubles for the IG REST API.
+"""
+
+from .fake_server import FakeIG, FakeIGConfig, FakeIGServer, Latency
+
+__all__ = ["FakeIG", "FakeIGConfig", "FakeIGServer", "Latency"]
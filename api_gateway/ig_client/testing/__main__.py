@@ -0,0 +1,3 @@
+from api_gateway.ig_client.testing.fake_server import main
+
+main()
@@ -0,0 +1,1098 @@
+"""
+Local stand-in for the IG REST API.
+
+FakeIG implements the endpoints the gateway uses (/session, /accounts,
+/markets, /prices, /positions, /confirms and /workingorders) on in-memory
+state with synthetic, deterministic prices. Every response can be delayed by
+a configurable latency distribution (per resource if needed), errors are
+injected at random (429 and 5xx), trading and non-trading requests are
+counted against per-minute limits like IG's, and price requests are charged
+against a weekly historical data allowance reported in the responses.
+
+It can be served:
+
+- in-process without sockets, as an httpx.MockTransport handler
+  (FakeIG.handler, or FakeIG.async_handler for async clients);
+- over HTTP from a background thread (FakeIGServer);
+- as a subprocess: python -m api_gateway.ig_client.testing
+
+Responses follow IG's shapes closely enough to pass the client's response
+models. Market orders fill at the current synthetic quote, positions are
+never netted, working orders never trigger, and a repeated dealReference is
+not dealt again.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+
+from api_gateway.ig_client.rate_limits import (
+    HISTORICAL,
+    NON_TRADING,
+    NON_TRADING_LIMIT,
+    TRADING,
+    TRADING_LIMIT,
+    endpoint_class,
+)
+
+logger = logging.getLogger(__name__)
+
+# Path prefix of IG's REST API (https://api.ig.com/gateway/deal)
+BASE_PATH = "/gateway/deal"
+
+ACCOUNT_ID = "FAKE01"
+HISTORICAL_ALLOWANCE = 10_000
+ALLOWANCE_PERIOD = 7 * 24 * 3600
+
+SNAPSHOT_TIME_FORMAT = "%Y/%m/%d %H:%M:%S"
+UTC_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+_DATE_FORMATS = (
+    "%d-%m-%Y",
+    "%Y-%m-%d %H:%M:%S",
+    UTC_TIME_FORMAT,
+    SNAPSHOT_TIME_FORMAT,
+    "%Y-%m-%d",
+)
+
+RESOLUTIONS = {
+    "SECOND": timedelta(seconds=1),
+    "MINUTE": timedelta(minutes=1),
+    "MINUTE_2": timedelta(minutes=2),
+    "MINUTE_3": timedelta(minutes=3),
+    "MINUTE_5": timedelta(minutes=5),
+    "MINUTE_10": timedelta(minutes=10),
+    "MINUTE_15": timedelta(minutes=15),
+    "MINUTE_30": timedelta(minutes=30),
+    "HOUR": timedelta(hours=1),
+    "HOUR_2": timedelta(hours=2),
+    "HOUR_3": timedelta(hours=3),
+    "HOUR_4": timedelta(hours=4),
+    "DAY": timedelta(days=1),
+    "WEEK": timedelta(weeks=1),
+    "MONTH": timedelta(days=30),
+}
+
+# epic -> (instrument name, instrument type, reference price)
+DEFAULT_MARKETS = {
+    "CS.D.GBPUSD.TODAY.IP": ("GBP/USD", "CURRENCIES", 1.27),
+    "CS.D.EURUSD.TODAY.IP": ("EUR/USD", "CURRENCIES", 1.09),
+    "IX.D.NASDAQ.IFD.IP": ("US Tech 100", "INDICES", 17500.0),
+    "IX.D.FTSE.DAILY.IP": ("FTSE 100", "INDICES", 7600.0),
+    "CC.D.LCO.USS.IP": ("Oil - Brent Crude", "COMMODITIES", 82.0),
+}
+
+
+@dataclass
+class Latency:
+    """
+    Response delay distribution in seconds
+
+    distribution is "fixed" (always mean), "uniform" (mean +/- spread),
+    "exponential" (with the given mean) or "lognormal" (median mean, log
+    standard deviation spread).
+    """
+
+    mean: float = 0.0
+    spread: float = 0.0
+    distribution: str = "fixed"
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one delay"""
+        if self.distribution == "fixed":
+            return self.mean
+        if self.distribution == "uniform":
+            return max(
+                0.0, rng.uniform(self.mean - self.spread, self.mean + self.spread)
+            )
+        if self.distribution == "exponential":
+            return rng.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+        if self.distribution == "lognormal":
+            return self.mean * math.exp(rng.gauss(0.0, self.spread))
+        raise ValueError(f"Unknown latency distribution: {self.distribution}")
+
+
+@dataclass
+class FakeIGConfig:
+    """Behaviour of a FakeIG"""
+
+    # Delay of every response, and overrides per resource (e.g. "prices")
+    latency: Latency = field(default_factory=Latency)
+    endpoint_latency: Dict[str, Latency] = field(default_factory=dict)
+    # Probabilities of answering an authenticated request with 429 or 5xx
+    rate_limit_error_rate: float = 0.0
+    server_error_rate: float = 0.0
+    # (calls, period seconds) per account; None disables the limit
+    trading_limit: Optional[Tuple[int, float]] = TRADING_LIMIT
+    non_trading_limit: Optional[Tuple[int, float]] = NON_TRADING_LIMIT
+    # Price data points per allowance period
+    historical_allowance: int = HISTORICAL_ALLOWANCE
+    allowance_period: float = ALLOWANCE_PERIOD
+    # Seconds before a deal's confirmation is available
+    confirm_delay: float = 0.0
+    markets: Dict[str, Tuple[str, str, float]] = field(
+        default_factory=lambda: dict(DEFAULT_MARKETS)
+    )
+    seed: Optional[int] = None
+
+
+class FakeIGError(Exception):
+    """Error response of a route"""
+
+    def __init__(self, status: int, error_code: str):
+        super().__init__(error_code)
+        self.status = status
+        self.error_code = error_code
+
+
+Response = Tuple[int, Dict[str, str], Any]
+
+
+def _parse_date(value: str) -> datetime:
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise FakeIGError(400, "validation.date.format")
+
+
+def _noise(epic: str, seconds: int) -> float:
+    """Deterministic value in [-1, 1) for an epic and time"""
+    digest = hashlib.blake2b(f"{epic}:{seconds}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**63 - 1.0
+
+
+class FakeIG:
+    """In-memory IG REST API"""
+
+    def __init__(self, config: Optional[FakeIGConfig] = None):
+        """
+        Initialize the fake
+
+        Args:
+            config: Behaviour (defaults: no latency or injected errors,
+                IG's request limits and historical allowance)
+        """
+        self.config = config or FakeIGConfig()
+        self.stats: Counter = Counter()
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.working_orders: Dict[str, Dict[str, Any]] = {}
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, str] = {}
+        self._windows: Dict[str, Deque[float]] = {
+            TRADING: deque(),
+            NON_TRADING: deque(),
+        }
+        self._allowance_used = 0
+        self._allowance_reset = time.time() + self.config.allowance_period
+        # deal reference -> (available from, confirmation)
+        self._confirms: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._ids = itertools.count(1)
+        self._routes: List[Tuple[str, re.Pattern, Callable[..., Any]]] = [
+            ("GET", re.compile(r"accounts"), self._accounts),
+            ("GET", re.compile(r"accounts/preferences"), self._preferences),
+            ("PUT", re.compile(r"accounts/preferences"), self._update_preferences),
+            ("GET", re.compile(r"markets"), self._markets),
+            ("GET", re.compile(r"markets/(?P<epic>[^/]+)"), self._market),
+            ("GET", re.compile(r"prices/(?P<epic>[^/]+)"), self._prices),
+            (
+                "GET",
+                re.compile(r"prices/(?P<epic>[^/]+)/(?P<resolution>\w+)/(?P<n>\d+)"),
+                self._prices_by_points,
+            ),
+            (
+                "GET",
+                re.compile(
+                    r"prices/(?P<epic>[^/]+)/(?P<resolution>\w+)"
+                    r"/(?P<start>[^/]+)/(?P<end>[^/]+)"
+                ),
+                self._prices_by_range,
+            ),
+            ("GET", re.compile(r"positions"), self._positions),
+            ("GET", re.compile(r"positions/(?P<deal_id>[^/]+)"), self._position),
+            ("POST", re.compile(r"positions/otc"), self._open_position),
+            ("DELETE", re.compile(r"positions/otc"), self._close_position),
+            ("PUT", re.compile(r"positions/otc/(?P<deal_id>[^/]+)"), self._amend),
+            ("GET", re.compile(r"confirms/(?P<ref>[^/]+)"), self._confirm),
+            ("GET", re.compile(r"workingorders"), self._working_orders),
+            ("POST", re.compile(r"workingorders/otc"), self._create_order),
+            (
+                "DELETE",
+                re.compile(r"workingorders/otc/(?P<deal_id>[^/]+)"),
+                self._delete_order,
+            ),
+            (
+                "PUT",
+                re.compile(r"workingorders/otc/(?P<deal_id>[^/]+)"),
+                self._amend_order,
+            ),
+        ]
+
+    # -- request handling --------------------------------------------------
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """httpx.MockTransport handler (blocks for the sampled latency)"""
+        delay, response = self._respond_to(request)
+        time.sleep(delay)
+        return response
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        """httpx.MockTransport handler for async clients"""
+        delay, response = self._respond_to(request)
+        await asyncio.sleep(delay)
+        return response
+
+    def _respond_to(self, request: httpx.Request) -> Tuple[float, httpx.Response]:
+        request.read()
+        delay, (status, headers, body) = self.respond(
+            request.method,
+            request.url.path,
+            dict(request.url.params),
+            request.headers,
+            request.content,
+        )
+        return delay, httpx.Response(status, headers=headers, json=body)
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        headers: Mapping[str, str],
+        body: bytes = b"",
+    ) -> Tuple[float, Response]:
+        """
+        Answer one request
+
+        Args:
+            method: HTTP method
+            path: URL path (with or without BASE_PATH)
+            query: Query parameters
+            headers: Request headers
+            body: Raw request body
+
+        Returns:
+            (delay in seconds to apply before sending, (status, headers,
+            JSON body))
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        path = path[len(BASE_PATH) :] if path.startswith(BASE_PATH) else path
+        path = path.strip("/")
+        method = (headers.get("_method") or method).upper()
+        resource = path.split("/", 1)[0]
+        latency = self.config.endpoint_latency.get(resource, self.config.latency)
+        with self._lock:
+            delay = latency.sample(self._rng)
+            try:
+                payload = json.loads(body) if body else {}
+            except ValueError:
+                payload = None
+            try:
+                if payload is None:
+                    raise FakeIGError(400, "validation.request.body.invalid")
+                response = self._dispatch(
+                    method, path, resource, query, headers, payload
+                )
+            except FakeIGError as e:
+                response = (e.status, {}, {"errorCode": e.error_code})
+            status = response[0]
+            self.stats[(resource, status)] += 1
+        response[1].setdefault("X-Request-ID", uuid.uuid4().hex)
+        logger.debug(f"{method} /{path} -> {status} after {delay * 1e3:.1f}ms")
+        return delay, response
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        resource: str,
+        query: Mapping[str, str],
+        headers: Mapping[str, str],
+        payload: Dict[str, Any],
+    ) -> Response:
+        if resource == "session":
+            return self._session(method, headers, payload)
+        if not headers.get("x-ig-api-key"):
+            raise FakeIGError(403, "error.security.api-key-missing")
+        if headers.get("cst") not in self._sessions:
+            raise FakeIGError(401, "error.security.client-token-invalid")
+
+        draw = self._rng.random()
+        if draw < self.config.rate_limit_error_rate:
+            raise FakeIGError(429, "error.public-api.exceeded-api-key-allowance")
+        if draw < self.config.rate_limit_error_rate + self.config.server_error_rate:
+            raise FakeIGError(self._rng.choice([500, 502, 503]), "system.error")
+        self._count_request(method, path)
+
+        for route_method, pattern, route in self._routes:
+            if route_method != method:
+                continue
+            match = pattern.fullmatch(path)
+            if match is not None:
+                result = route(query=query, body=payload, **match.groupdict())
+                return 200, {}, result
+        raise FakeIGError(404, "error.request.endpoint-not-found")
+
+    def _count_request(self, method: str, path: str) -> None:
+        windows = {
+            TRADING: (self._windows[TRADING], self.config.trading_limit),
+            NON_TRADING: (self._windows[NON_TRADING], self.config.non_trading_limit),
+        }
+        cls = endpoint_class(method, path)
+        window, limit = windows[NON_TRADING if cls == HISTORICAL else cls]
+        if limit is None:
+            return
+        max_calls, period = limit
+        now = time.monotonic()
+        while window and window[0] <= now - period:
+            window.popleft()
+        if len(window) >= max_calls:
+            code = (
+                "error.public-api.exceeded-account-trading-allowance"
+                if cls == TRADING
+                else "error.public-api.exceeded-account-allowance"
+            )
+            raise FakeIGError(429, code)
+        window.append(now)
+
+    # -- session and accounts ----------------------------------------------
+
+    def _session(
+        self, method: str, headers: Mapping[str, str], payload: Dict[str, Any]
+    ) -> Response:
+        if method == "DELETE":
+            self._sessions.pop(headers.get("cst"), None)
+            return 204, {}, None
+        if method != "POST":
+            raise FakeIGError(404, "error.request.endpoint-not-found")
+        if not headers.get("x-ig-api-key"):
+            raise FakeIGError(403, "error.security.api-key-missing")
+        if not payload.get("identifier") or not payload.get("password"):
+            raise FakeIGError(401, "error.security.invalid-details")
+        cst = uuid.uuid4().hex
+        self._sessions[cst] = uuid.uuid4().hex
+        body = {
+            "accountType": "SPREADBET",
+            "currencyIsoCode": "GBP",
+            "currentAccountId": ACCOUNT_ID,
+            "lightstreamerEndpoint": "https://localhost",
+            "accounts": [{"accountId": ACCOUNT_ID, "accountName": "Fake"}],
+        }
+        return 200, {"CST": cst, "X-SECURITY-TOKEN": self._sessions[cst]}, body
+
+    def _accounts(self, **_) -> Dict[str, Any]:
+        profit = sum(self._profit(position) for position in self.positions.values())
+        return {
+            "accounts": [
+                {
+                    "accountId": ACCOUNT_ID,
+                    "accountName": "Fake",
+                    "accountAlias": None,
+                    "accountType": "SPREADBET",
+                    "balance": {
+                        "available": 10_000.0 + profit,
+                        "balance": 10_000.0,
+                        "deposit": 0.0,
+                        "profitLoss": profit,
+                    },
+                    "canTransferFrom": True,
+                    "canTransferTo": True,
+                    "currency": "GBP",
+                    "preferred": True,
+                    "status": "ENABLED",
+                }
+            ]
+        }
+
+    def _preferences(self, **_) -> Dict[str, Any]:
+        return {"trailingStopsEnabled": False}
+
+    def _update_preferences(self, **_) -> Dict[str, Any]:
+        return {"status": "SUCCESS"}
+
+    # -- markets and prices ------------------------------------------------
+
+    def _market_info(self, epic: str) -> Tuple[str, str, float]:
+        info = self.config.markets.get(epic)
+        if info is None:
+            raise FakeIGError(
+                404, "error.service.marketdata.instrument.epic.unavailable"
+            )
+        return info
+
+    def _mid(self, epic: str, at: datetime) -> float:
+        reference = self._market_info(epic)[2]
+        seconds = int(at.timestamp())
+        cycle = math.sin(2 * math.pi * seconds / (5 * 86400))
+        return reference * (1 + 0.02 * cycle + 0.002 * _noise(epic, seconds))
+
+    def _round(self, epic: str, value: float) -> float:
+        return round(value, 5 if self._market_info(epic)[2] < 10 else 1)
+
+    def _quote(self, epic: str, at: Optional[datetime] = None) -> Tuple[float, float]:
+        """(bid, offer) at a time"""
+        mid = self._mid(epic, at or datetime.now())
+        half_spread = self._market_info(epic)[2] * 0.00005
+        return self._round(epic, mid - half_spread), self._round(
+            epic, mid + half_spread
+        )
+
+    def _snapshot(self, epic: str) -> Dict[str, Any]:
+        now = datetime.now()
+        bid, offer = self._quote(epic, now)
+        day_ago = self._mid(epic, now - timedelta(days=1))
+        mid = (bid + offer) / 2
+        return {
+            "bid": bid,
+            "offer": offer,
+            "high": self._round(epic, max(mid, day_ago) * 1.001),
+            "low": self._round(epic, min(mid, day_ago) * 0.999),
+            "netChange": self._round(epic, mid - day_ago),
+            "percentageChange": round((mid / day_ago - 1) * 100, 2),
+            "marketStatus": "TRADEABLE",
+            "updateTime": now.strftime("%H:%M:%S"),
+            "delayTime": 0,
+            "scalingFactor": 1,
+            "decimalPlacesFactor": 5 if self._market_info(epic)[2] < 10 else 1,
+        }
+
+    def _market_data(self, epic: str) -> Dict[str, Any]:
+        name, instrument_type, _ = self._market_info(epic)
+        snapshot = self._snapshot(epic)
+        return {
+            "epic": epic,
+            "instrumentName": name,
+            "instrumentType": instrument_type,
+            "expiry": "DFB",
+            "lotSize": 1.0,
+            "bid": snapshot["bid"],
+            "offer": snapshot["offer"],
+            "high": snapshot["high"],
+            "low": snapshot["low"],
+            "netChange": snapshot["netChange"],
+            "percentageChange": snapshot["percentageChange"],
+            "marketStatus": snapshot["marketStatus"],
+            "updateTime": snapshot["updateTime"],
+            "delayTime": 0,
+            "scalingFactor": 1,
+            "streamingPricesAvailable": True,
+        }
+
+    def _dealing_rules(self) -> Dict[str, Any]:
+        return {
+            "minDealSize": {"unit": "POINTS", "value": 0.1},
+            "minNormalStopOrLimitDistance": {"unit": "POINTS", "value": 2.0},
+            "maxStopOrLimitDistance": {"unit": "PERCENTAGE", "value": 75.0},
+            "minStepDistance": {"unit": "POINTS", "value": 1.0},
+            "marketOrderPreference": "AVAILABLE_DEFAULT_ON",
+            "trailingStopsPreference": "AVAILABLE",
+        }
+
+    def _instrument(self, epic: str) -> Dict[str, Any]:
+        name, instrument_type, _ = self._market_info(epic)
+        return {
+            "epic": epic,
+            "name": name,
+            "type": instrument_type,
+            "expiry": "DFB",
+            "lotSize": 1.0,
+            "unit": "AMOUNT",
+            "streamingPricesAvailable": True,
+            "currencies": [
+                {"code": "GBP", "symbol": "£", "isDefault": True, "exchangeRate": 1.0}
+            ],
+        }
+
+    def _markets(self, query: Mapping[str, str], **_) -> Dict[str, Any]:
+        if "searchTerm" in query:
+            term = query["searchTerm"].lower()
+            return {
+                "markets": [
+                    self._market_data(epic)
+                    for epic, (name, _, _) in self.config.markets.items()
+                    if term in epic.lower() or term in name.lower()
+                ]
+            }
+        epics = [epic for epic in query.get("epics", "").split(",") if epic]
+        known = [epic for epic in epics if epic in self.config.markets]
+        if not known:
+            raise FakeIGError(
+                404, "error.service.marketdata.instrument.epic.unavailable"
+            )
+        snapshot_only = query.get("filter") == "SNAPSHOT_ONLY"
+        details = []
+        for epic in known:
+            detail = {"snapshot": self._snapshot(epic)}
+            detail["instrument"] = (
+                {"epic": epic, "name": self._market_info(epic)[0]}
+                if snapshot_only
+                else self._instrument(epic)
+            )
+            if not snapshot_only:
+                detail["dealingRules"] = self._dealing_rules()
+            details.append(detail)
+        return {"marketDetails": details}
+
+    def _market(self, epic: str, **_) -> Dict[str, Any]:
+        snapshot = self._snapshot(epic)
+        for key in ("bid", "offer", "updateTime"):
+            snapshot.pop(key)
+        snapshot["updateTimestampUTC"] = int(time.time() * 1000)
+        return {
+            "instrument": self._instrument(epic),
+            "snapshot": snapshot,
+            "dealingRules": self._dealing_rules(),
+        }
+
+    def _charge_allowance(self, points: int) -> Dict[str, int]:
+        now = time.time()
+        if now >= self._allowance_reset:
+            self._allowance_used = 0
+            self._allowance_reset = now + self.config.allowance_period
+        total = self.config.historical_allowance
+        if self._allowance_used + points > total:
+            raise FakeIGError(
+                403, "error.public-api.exceeded-account-historical-data-allowance"
+            )
+        self._allowance_used += points
+        return {
+            "remainingAllowance": total - self._allowance_used,
+            "totalAllowance": total,
+            "allowanceExpiry": int(self._allowance_reset - now),
+        }
+
+    def _step(self, resolution: str) -> timedelta:
+        step = RESOLUTIONS.get(resolution)
+        if step is None:
+            raise FakeIGError(400, "validation.resolution.invalid")
+        return step
+
+    def _bar_times_by_points(self, resolution: str, n: int) -> List[datetime]:
+        step = self._step(resolution).total_seconds()
+        last = math.floor(time.time() / step) * step
+        return [datetime.fromtimestamp(last - step * i) for i in range(n - 1, -1, -1)]
+
+    def _bar_times_by_range(
+        self, resolution: str, start: datetime, end: datetime
+    ) -> List[datetime]:
+        step = self._step(resolution).total_seconds()
+        first = math.ceil(start.timestamp() / step) * step
+        count = max(0, math.floor((end.timestamp() - first) / step) + 1)
+        return [datetime.fromtimestamp(first + step * i) for i in range(count)]
+
+    def _bars(self, epic: str, resolution: str, times: List[datetime]) -> List[dict]:
+        self._market_info(epic)
+        step = self._step(resolution)
+        half_spread = self._market_info(epic)[2] * 0.00005
+        bars = []
+        for at in times:
+            open_mid = self._mid(epic, at)
+            close_mid = self._mid(epic, at + step)
+            swing = abs(_noise(epic, int(at.timestamp()) + 1)) * 0.001 * open_mid
+            mids = {
+                "openPrice": open_mid,
+                "closePrice": close_mid,
+                "highPrice": max(open_mid, close_mid) + swing,
+                "lowPrice": min(open_mid, close_mid) - swing,
+            }
+            bar = {
+                name: {
+                    "bid": self._round(epic, mid - half_spread),
+                    "ask": self._round(epic, mid + half_spread),
+                    "lastTraded": None,
+                }
+                for name, mid in mids.items()
+            }
+            bar["snapshotTime"] = at.strftime(SNAPSHOT_TIME_FORMAT)
+            bar["snapshotTimeUTC"] = at.strftime(UTC_TIME_FORMAT)
+            bar["lastTradedVolume"] = int(
+                abs(_noise(epic, -int(at.timestamp()))) * 5000
+            )
+            bars.append(bar)
+        return bars
+
+    def _simple_prices(self, epic: str, resolution: str, times: List[datetime]):
+        bars = self._bars(epic, resolution, times)
+        return {
+            "prices": bars,
+            "instrumentType": self._market_info(epic)[1],
+            "allowance": self._charge_allowance(len(bars)),
+        }
+
+    def _prices_by_points(self, epic: str, resolution: str, n: str, **_):
+        times = self._bar_times_by_points(resolution, int(n))
+        return self._simple_prices(epic, resolution, times)
+
+    def _prices_by_range(self, epic: str, resolution: str, start: str, end: str, **_):
+        times = self._bar_times_by_range(
+            resolution, _parse_date(start), _parse_date(end)
+        )
+        return self._simple_prices(epic, resolution, times)
+
+    def _prices(self, epic: str, query: Mapping[str, str], **_) -> Dict[str, Any]:
+        resolution = query.get("resolution", "MINUTE")
+        if "from" in query or "to" in query:
+            end = _parse_date(query["to"]) if "to" in query else datetime.now()
+            start = (
+                _parse_date(query["from"])
+                if "from" in query
+                else end - self._step(resolution) * 9
+            )
+            times = self._bar_times_by_range(resolution, start, end)
+            if "max" in query:
+                times = times[-int(query["max"]) :]
+        else:
+            times = self._bar_times_by_points(resolution, int(query.get("max", 10)))
+        page_size = int(query.get("pageSize", 20))
+        page_number = int(query.get("pageNumber", 1))
+        total_pages = max(1, math.ceil(len(times) / page_size)) if page_size else 1
+        if page_size:
+            times = times[(page_number - 1) * page_size : page_number * page_size]
+        bars = self._bars(epic, resolution, times)
+        return {
+            "prices": bars,
+            "instrumentType": self._market_info(epic)[1],
+            "metadata": {
+                "allowance": self._charge_allowance(len(bars)),
+                "size": len(bars),
+                "pageData": {
+                    "pageSize": page_size,
+                    "pageNumber": page_number,
+                    "totalPages": total_pages,
+                },
+            },
+        }
+
+    # -- dealing -----------------------------------------------------------
+
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}{next(self._ids):08d}"
+
+    def _confirmation(
+        self,
+        deal_reference: str,
+        deal_id: str,
+        epic: Optional[str],
+        direction: str,
+        status: Optional[str],
+        affected: Optional[str],
+        reason: str = "SUCCESS",
+        **fields: Any,
+    ) -> None:
+        confirmation = {
+            "affectedDeals": (
+                [{"dealId": deal_id, "status": affected}] if affected else []
+            ),
+            "date": datetime.now().strftime(UTC_TIME_FORMAT),
+            "dealId": deal_id,
+            "dealReference": deal_reference,
+            "dealStatus": "ACCEPTED" if reason == "SUCCESS" else "REJECTED",
+            "direction": direction,
+            "epic": epic or "",
+            "expiry": "DFB",
+            "guaranteedStop": False,
+            "reason": reason,
+            "status": status,
+            "trailingStop": False,
+            **fields,
+        }
+        available = time.monotonic() + self.config.confirm_delay
+        self._confirms[deal_reference] = (available, confirmation)
+
+    def _deal_reference(self, body: Dict[str, Any]) -> str:
+        return body.get("dealReference") or self._new_id("FAKEREF")
+
+    def _open_position(self, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        for name in ("epic", "direction", "size", "orderType"):
+            if body.get(name) is None:
+                raise FakeIGError(400, f"validation.null-not-allowed.request.{name}")
+        deal_reference = self._deal_reference(body)
+        if deal_reference in self._confirms:
+            return {"dealReference": deal_reference}
+        epic, direction = body["epic"], body["direction"]
+        deal_id = self._new_id("DIAAAAFAKE")
+        if epic not in self.config.markets:
+            self._confirmation(
+                deal_reference, deal_id, epic, direction, None, None, "UNKNOWN"
+            )
+            return {"dealReference": deal_reference}
+        bid, offer = self._quote(epic)
+        level = offer if direction == "BUY" else bid
+        now = datetime.now()
+        self.positions[deal_id] = {
+            "contractSize": 1.0,
+            "controlledRisk": False,
+            "createdDate": now.strftime(SNAPSHOT_TIME_FORMAT),
+            "createdDateUTC": now.strftime(UTC_TIME_FORMAT),
+            "currency": body.get("currencyCode", "GBP"),
+            "dealId": deal_id,
+            "dealReference": deal_reference,
+            "direction": direction,
+            "epic": epic,
+            "level": level,
+            "limitLevel": body.get("limitLevel"),
+            "size": float(body["size"]),
+            "stopLevel": body.get("stopLevel"),
+        }
+        self._confirmation(
+            deal_reference,
+            deal_id,
+            epic,
+            direction,
+            "OPEN",
+            "OPENED",
+            level=level,
+            size=float(body["size"]),
+            limitLevel=body.get("limitLevel"),
+            stopLevel=body.get("stopLevel"),
+        )
+        return {"dealReference": deal_reference}
+
+    def _profit(self, position: Dict[str, Any], level: Optional[float] = None) -> float:
+        if level is None:
+            bid, offer = self._quote(position["epic"])
+            level = bid if position["direction"] == "BUY" else offer
+        sign = 1 if position["direction"] == "BUY" else -1
+        return round(sign * (level - position["level"]) * position["size"], 2)
+
+    def _close_position(self, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        deal_reference = self._deal_reference(body)
+        direction = body.get("direction", "SELL")
+        position = self.positions.get(body.get("dealId") or "")
+        if position is None and body.get("epic"):
+            position = next(
+                (
+                    p
+                    for p in self.positions.values()
+                    if p["epic"] == body["epic"] and p["direction"] != direction
+                ),
+                None,
+            )
+        if position is None or position["direction"] == direction:
+            self._confirmation(
+                deal_reference,
+                body.get("dealId") or "",
+                body.get("epic"),
+                direction,
+                None,
+                None,
+                "POSITION_NOT_AVAILABLE_TO_CLOSE",
+            )
+            return {"dealReference": deal_reference}
+
+        bid, offer = self._quote(position["epic"])
+        level = bid if position["direction"] == "BUY" else offer
+        size = min(float(body.get("size", position["size"])), position["size"])
+        profit = self._profit({**position, "size": size}, level)
+        if size >= position["size"]:
+            del self.positions[position["dealId"]]
+            status, affected = "CLOSED", "FULLY_CLOSED"
+        else:
+            position["size"] -= size
+            status, affected = "PARTIALLY_CLOSED", "PARTIALLY_CLOSED"
+        self._confirmation(
+            deal_reference,
+            position["dealId"],
+            position["epic"],
+            direction,
+            status,
+            affected,
+            level=level,
+            size=size,
+            profit=profit,
+            profitCurrency=position["currency"],
+        )
+        return {"dealReference": deal_reference}
+
+    def _amend(self, deal_id: str, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        position = self.positions.get(deal_id)
+        if position is None:
+            raise FakeIGError(404, "error.position.notfound")
+        for name in ("limitLevel", "stopLevel"):
+            if name in body:
+                position[name] = body[name]
+        deal_reference = self._new_id("FAKEREF")
+        self._confirmation(
+            deal_reference,
+            deal_id,
+            position["epic"],
+            position["direction"],
+            "AMENDED",
+            "AMENDED",
+            level=position["level"],
+            size=position["size"],
+            limitLevel=position["limitLevel"],
+            stopLevel=position["stopLevel"],
+        )
+        return {"dealReference": deal_reference}
+
+    def _position_entry(self, position: Dict[str, Any]) -> Dict[str, Any]:
+        detail = {k: v for k, v in position.items() if k != "epic"}
+        return {"position": detail, "market": self._market_data(position["epic"])}
+
+    def _positions(self, **_) -> Dict[str, Any]:
+        return {"positions": [self._position_entry(p) for p in self.positions.values()]}
+
+    def _position(self, deal_id: str, **_) -> Dict[str, Any]:
+        position = self.positions.get(deal_id)
+        if position is None:
+            raise FakeIGError(404, "error.position.notfound")
+        return self._position_entry(position)
+
+    def _confirm(self, ref: str, **_) -> Dict[str, Any]:
+        entry = self._confirms.get(ref)
+        if entry is None or time.monotonic() < entry[0]:
+            raise FakeIGError(404, "error.confirms.deal-not-found")
+        return entry[1]
+
+    # -- working orders ----------------------------------------------------
+
+    def _create_order(self, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        for name in ("epic", "direction", "size", "level", "type"):
+            if body.get(name) is None:
+                raise FakeIGError(400, f"validation.null-not-allowed.request.{name}")
+        deal_reference = self._deal_reference(body)
+        if deal_reference in self._confirms:
+            return {"dealReference": deal_reference}
+        self._market_info(body["epic"])
+        deal_id = self._new_id("DIAAAAFAKEWO")
+        now = datetime.now()
+        self.working_orders[deal_id] = {
+            "createdDate": now.strftime(SNAPSHOT_TIME_FORMAT),
+            "createdDateUTC": now.strftime(UTC_TIME_FORMAT),
+            "currencyCode": body.get("currencyCode", "GBP"),
+            "dealId": deal_id,
+            "direction": body["direction"],
+            "epic": body["epic"],
+            "goodTillDate": body.get("goodTillDate"),
+            "guaranteedStop": bool(body.get("guaranteedStop")),
+            "orderLevel": float(body["level"]),
+            "orderSize": float(body["size"]),
+            "orderType": body["type"],
+            "timeInForce": body.get("timeInForce", "GOOD_TILL_CANCELLED"),
+        }
+        self._confirmation(
+            deal_reference,
+            deal_id,
+            body["epic"],
+            body["direction"],
+            "OPEN",
+            "OPENED",
+            level=float(body["level"]),
+            size=float(body["size"]),
+        )
+        return {"dealReference": deal_reference}
+
+    def _working_order(self, deal_id: str) -> Dict[str, Any]:
+        order = self.working_orders.get(deal_id)
+        if order is None:
+            raise FakeIGError(404, "error.workingorder.notfound")
+        return order
+
+    def _working_orders(self, **_) -> Dict[str, Any]:
+        return {
+            "workingOrders": [
+                {
+                    "workingOrderData": order,
+                    "marketData": self._market_data(order["epic"]),
+                }
+                for order in self.working_orders.values()
+            ]
+        }
+
+    def _delete_order(self, deal_id: str, **_) -> Dict[str, Any]:
+        order = self._working_order(deal_id)
+        del self.working_orders[deal_id]
+        deal_reference = self._new_id("FAKEREF")
+        self._confirmation(
+            deal_reference,
+            deal_id,
+            order["epic"],
+            order["direction"],
+            "DELETED",
+            "DELETED",
+        )
+        return {"dealReference": deal_reference}
+
+    def _amend_order(self, deal_id: str, body: Dict[str, Any], **_) -> Dict[str, Any]:
+        order = self._working_order(deal_id)
+        if body.get("level") is not None:
+            order["orderLevel"] = float(body["level"])
+        for name in ("goodTillDate", "timeInForce"):
+            if name in body:
+                order[name] = body[name]
+        deal_reference = self._new_id("FAKEREF")
+        self._confirmation(
+            deal_reference,
+            deal_id,
+            order["epic"],
+            order["direction"],
+            "AMENDED",
+            "AMENDED",
+            level=order["orderLevel"],
+        )
+        return {"dealReference": deal_reference}
+
+
+def _request_handler(fake: FakeIG) -> type:
+    class RequestHandler(BaseHTTPRequestHandler):
+        # Keep connections alive, as IG does, without Nagle delaying the body
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _serve(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            url = urlsplit(self.path)
+            delay, (status, headers, payload) = fake.respond(
+                self.command,
+                url.path,
+                dict(parse_qsl(url.query)),
+                dict(self.headers.items()),
+                body,
+            )
+            time.sleep(delay)
+            data = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format % args)
+
+    return RequestHandler
+
+
+class FakeIGServer:
+    """Serves a FakeIG over HTTP from a background thread"""
+
+    def __init__(
+        self, fake: Optional[FakeIG] = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        """
+        Initialize the server (call start(), or use it as a context manager)
+
+        Args:
+            fake: Fake API to serve (a default FakeIG if None)
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        self.fake = fake or FakeIG()
+        self._httpd = ThreadingHTTPServer((host, port), _request_handler(self.fake))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to give IG clients"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    def start(self) -> "FakeIGServer":
+        """Start serving in a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="fake-ig-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted"""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeIGServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a FakeIGServer in the foreground"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--latency",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        default="fixed",
+        help="Latency distribution",
+    )
+    parser.add_argument(
+        "--latency-mean", type=float, default=0.0, help="Mean (median) latency (s)"
+    )
+    parser.add_argument(
+        "--latency-spread", type=float, default=0.0, help="Latency spread"
+    )
+    parser.add_argument("--rate-limit-error-rate", type=float, default=0.0)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--no-limits",
+        action="store_true",
+        help="Do not enforce the trading/non-trading request limits",
+    )
+    parser.add_argument(
+        "--historical-allowance", type=int, default=HISTORICAL_ALLOWANCE
+    )
+    parser.add_argument("--confirm-delay", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    config = FakeIGConfig(
+        latency=Latency(args.latency_mean, args.latency_spread, args.latency),
+        rate_limit_error_rate=args.rate_limit_error_rate,
+        server_error_rate=args.server_error_rate,
+        trading_limit=None if args.no_limits else TRADING_LIMIT,
+        non_trading_limit=None if args.no_limits else NON_TRADING_LIMIT,
+        historical_allowance=args.historical_allowance,
+        confirm_delay=args.confirm_delay,
+        seed=args.seed,
+    )
+    server = FakeIGServer(FakeIG(config), host=args.host, port=args.port)
+    print(f"Fake IG API listening on {server.base_url}", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
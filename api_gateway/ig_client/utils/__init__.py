@@ -5,14 +5,22 @@ This module contains helper functions for common operations like deal confirmati
 position management, and other business logic that extends beyond simple API calls.
 """
 
+from .confirmations import DealConfirmationPoller, confirmation_delays
 from .deal_helpers import (
     wait_for_deal_confirmation,
     create_position_and_wait_for_confirmation,
     DEAL_CONFIRMATION_ATTEMPTS,
     DEAL_CONFIRMATION_DELAY,
 )
+from .execution import ExecutionReport, Order, OrderExecutionEngine, OrderReport
 
 __all__ = [
+    "DealConfirmationPoller",
+    "confirmation_delays",
+    "ExecutionReport",
+    "Order",
+    "OrderExecutionEngine",
+    "OrderReport",
     "wait_for_deal_confirmation",
     "create_position_and_wait_for_confirmation",
     "DEAL_CONFIRMATION_ATTEMPTS",
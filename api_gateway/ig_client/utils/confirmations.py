@@ -0,0 +1,268 @@
+"""
+Adaptive deal-confirmation polling.
+
+Confirmations usually land within tens of milliseconds of a dealing call, so
+polling starts after a few milliseconds and backs off geometrically up to a
+cap. DealConfirmationPoller tracks many deal references at once from one
+scheduler thread: each reference gets a Future that resolves with its
+DealConfirmation (or None on timeout), and optional callbacks.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from api_gateway.ig_client.clients.dealing import DealingClient
+from api_gateway.ig_client.core.exceptions import IGNotFoundError
+from api_gateway.ig_client.core.models.dealing.ig_responses import (
+    DealConfirmation,
+)
+
+logger = logging.getLogger(__name__)
+
+CONFIRMATION_INITIAL_DELAY = 0.02
+CONFIRMATION_BACKOFF = 2.0
+CONFIRMATION_MAX_DELAY = 1.0
+CONFIRMATION_TIMEOUT = 10.0
+
+ConfirmationCallback = Callable[[str, Optional[DealConfirmation]], None]
+
+
+def confirmation_delays(
+    initial_delay: float = CONFIRMATION_INITIAL_DELAY,
+    backoff: float = CONFIRMATION_BACKOFF,
+    max_delay: float = CONFIRMATION_MAX_DELAY,
+) -> Iterator[float]:
+    """
+    Delays between confirmation polls: initial_delay, growing by backoff
+    up to max_delay (endless)
+    """
+    delay = initial_delay
+    while True:
+        yield min(delay, max_delay)
+        delay *= backoff
+
+
+def check_deal_confirmation(
+    dealing_client: DealingClient, deal_reference: str
+) -> Optional[DealConfirmation]:
+    """
+    One confirmation poll
+
+    Returns:
+        DealConfirmation, or None if it is not available yet (or the poll
+        failed; the error is logged)
+    """
+    try:
+        return dealing_client.get_deal_confirmation(deal_reference) or None
+    except IGNotFoundError:
+        logger.debug(f"Deal confirmation for {deal_reference} not available yet")
+    except Exception as e:
+        logger.warning(f"Error checking deal confirmation for {deal_reference}: {e}")
+    return None
+
+
+@dataclass(order=True)
+class _Tracked:
+    due: float
+    seq: int
+    deal_reference: str = field(compare=False)
+    deadline: float = field(compare=False)
+    delays: Iterator[float] = field(compare=False)
+    future: Future = field(compare=False)
+    attempts: int = field(default=0, compare=False)
+
+
+class DealConfirmationPoller:
+    """Polls the confirmations of many deal references concurrently"""
+
+    def __init__(
+        self,
+        dealing_client: DealingClient,
+        initial_delay: float = CONFIRMATION_INITIAL_DELAY,
+        backoff: float = CONFIRMATION_BACKOFF,
+        max_delay: float = CONFIRMATION_MAX_DELAY,
+        timeout: float = CONFIRMATION_TIMEOUT,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize the poller
+
+        Args:
+            dealing_client: Dealing client (its rate limiter paces the polls)
+            initial_delay: Delay before the second poll of a reference
+            backoff: Factor the delay grows by after each poll
+            max_delay: Largest delay between polls
+            timeout: Seconds after which a reference resolves to None
+            max_workers: Polls in flight at once
+        """
+        self.dealing_client = dealing_client
+        self.initial_delay = initial_delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="deal-confirmation"
+        )
+        self._queue: List[_Tracked] = []
+        self._futures: Dict[str, Future] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="deal-confirmation-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def track(
+        self,
+        deal_reference: str,
+        callback: Optional[ConfirmationCallback] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Start polling a deal reference (the first poll is immediate)
+
+        Args:
+            deal_reference: Reference returned by a dealing call
+            callback: Called with (deal_reference, confirmation or None)
+                when the reference resolves
+            timeout: Override the poller's timeout for this reference
+
+        Returns:
+            Future resolving to the DealConfirmation, or None on timeout.
+            Tracking a reference again returns the same future.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("DealConfirmationPoller is closed")
+            future = self._futures.get(deal_reference)
+            if future is None:
+                future = Future()
+                self._futures[deal_reference] = future
+                now = time.monotonic()
+                tracked = _Tracked(
+                    due=now,
+                    seq=next(self._seq),
+                    deal_reference=deal_reference,
+                    deadline=now + (self.timeout if timeout is None else timeout),
+                    delays=confirmation_delays(
+                        self.initial_delay, self.backoff, self.max_delay
+                    ),
+                    future=future,
+                )
+                heapq.heappush(self._queue, tracked)
+                self._cond.notify()
+                # A caller cancelling the future stops the polling too
+                future.add_done_callback(lambda _: self._forget(tracked))
+
+        if callback is not None:
+            future.add_done_callback(
+                lambda done: callback(
+                    deal_reference, None if done.cancelled() else done.result()
+                )
+            )
+        return future
+
+    def wait_all(
+        self, deal_references: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, Optional[DealConfirmation]]:
+        """
+        Track several references and wait for all of them
+
+        Returns:
+            Deal reference -> DealConfirmation (None if it timed out)
+        """
+        futures = {ref: self.track(ref, timeout=timeout) for ref in deal_references}
+        return {ref: future.result() for ref, future in futures.items()}
+
+    @property
+    def pending(self) -> int:
+        """Number of references still being polled"""
+        with self._cond:
+            return len(self._futures)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    now = time.monotonic()
+                    if self._queue and self._queue[0].due <= now:
+                        break
+                    wait = self._queue[0].due - now if self._queue else None
+                    self._cond.wait(timeout=wait)
+                if self._closed:
+                    return
+                due = []
+                while self._queue and self._queue[0].due <= now:
+                    due.append(heapq.heappop(self._queue))
+            for tracked in due:
+                self._executor.submit(self._poll, tracked)
+
+    def _forget(self, tracked: _Tracked) -> None:
+        """Stop counting a reference (unless it is tracked again already)"""
+        with self._cond:
+            if self._futures.get(tracked.deal_reference) is tracked.future:
+                del self._futures[tracked.deal_reference]
+
+    def _poll(self, tracked: _Tracked) -> None:
+        if tracked.future.done():
+            # Cancelled by the caller
+            self._forget(tracked)
+            return
+        tracked.attempts += 1
+        confirmation = check_deal_confirmation(
+            self.dealing_client, tracked.deal_reference
+        )
+        now = time.monotonic()
+        if confirmation is not None:
+            logger.info(
+                f"Deal confirmation found for {tracked.deal_reference} after "
+                f"{tracked.attempts} polls: {confirmation.dealStatus}"
+            )
+            self._resolve(tracked, confirmation)
+        elif now >= tracked.deadline:
+            logger.warning(
+                f"Deal confirmation timeout for {tracked.deal_reference} after "
+                f"{tracked.attempts} polls"
+            )
+            self._resolve(tracked, None)
+        else:
+            with self._cond:
+                if self._closed:
+                    return
+                tracked.due = min(now + next(tracked.delays), tracked.deadline)
+                tracked.seq = next(self._seq)
+                heapq.heappush(self._queue, tracked)
+                self._cond.notify()
+
+    def _resolve(
+        self, tracked: _Tracked, confirmation: Optional[DealConfirmation]
+    ) -> None:
+        self._forget(tracked)
+        if tracked.future.set_running_or_notify_cancel():
+            tracked.future.set_result(confirmation)
+
+    def close(self) -> None:
+        """Stop polling; unresolved futures are cancelled"""
+        with self._cond:
+            self._closed = True
+            pending = list(self._futures.values())
+            self._futures.clear()
+            self._queue.clear()
+            self._cond.notify()
+        for future in pending:
+            future.cancel()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "DealConfirmationPoller":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -13,10 +13,18 @@ from api_gateway.ig_client.clients.dealing import DealingClient
 from api_gateway.ig_client.core.models.dealing.ig_responses import (
     DealConfirmation,
 )
+from api_gateway.ig_client.utils.confirmations import (
+    CONFIRMATION_BACKOFF,
+    CONFIRMATION_INITIAL_DELAY,
+    check_deal_confirmation,
+    confirmation_delays,
+)
 
 logger = logging.getLogger(__name__)
 
-DEAL_CONFIRMATION_ATTEMPTS = 10
+# Polls spaced CONFIRMATION_INITIAL_DELAY, doubling up to DEAL_CONFIRMATION_DELAY
+# (about nine seconds in total)
+DEAL_CONFIRMATION_ATTEMPTS = 15
 DEAL_CONFIRMATION_DELAY = 1
 
 
@@ -24,42 +32,42 @@ def wait_for_deal_confirmation(
     dealing_client: DealingClient,
     deal_reference: str,
     max_attempts: int = DEAL_CONFIRMATION_ATTEMPTS,
-    delay: int = DEAL_CONFIRMATION_DELAY,
+    delay: float = DEAL_CONFIRMATION_DELAY,
+    initial_delay: float = CONFIRMATION_INITIAL_DELAY,
+    backoff: float = CONFIRMATION_BACKOFF,
 ) -> Optional[DealConfirmation]:
     """
     Poll for deal confirmation until it's available or max attempts reached.
 
+    The first poll is immediate; the delay between polls starts at
+    initial_delay and grows by backoff up to delay.
+
     Args:
         dealing_client: The dealing client instance
         deal_reference: The deal reference to check
-        max_attempts: Maximum number of polling attempts (default: 10)
-        delay: Delay between attempts in seconds (default: 1)
+        max_attempts: Maximum number of polling attempts (default: 15)
+        delay: Largest delay between attempts in seconds (default: 1)
+        initial_delay: First delay between attempts in seconds
+        backoff: Factor the delay grows by after each attempt
 
     Returns:
         DealConfirmation if found, None if max attempts reached
     """
     logger.info(f"Starting deal confirmation polling for {deal_reference}")
 
+    delays = confirmation_delays(initial_delay, backoff, delay)
     for attempt in range(max_attempts):
-        try:
-            logger.debug(
-                f"Attempt {attempt + 1}/{max_attempts} for deal {deal_reference}"
-            )
-            deal_confirmation = dealing_client.get_deal_confirmation(deal_reference)
-
-            if deal_confirmation:
-                logger.info(
-                    f"Deal confirmation found for {deal_reference}: {deal_confirmation.status}"
-                )
-                return deal_confirmation
+        logger.debug(f"Attempt {attempt + 1}/{max_attempts} for deal {deal_reference}")
+        deal_confirmation = check_deal_confirmation(dealing_client, deal_reference)
 
-        except Exception as e:
-            logger.warning(
-                f"Error checking deal confirmation (attempt {attempt + 1}): {str(e)}"
+        if deal_confirmation:
+            logger.info(
+                f"Deal confirmation found for {deal_reference}: {deal_confirmation.status}"
             )
+            return deal_confirmation
 
         if attempt < max_attempts - 1:
-            time.sleep(delay)
+            time.sleep(next(delays))
 
     logger.warning(
         f"Deal confirmation timeout for {deal_reference} after {max_attempts} attempts"
@@ -71,7 +79,7 @@ def create_position_and_wait_for_confirmation(
     dealing_client: DealingClient,
     body_data: Dict[str, Any],
     max_attempts: int = DEAL_CONFIRMATION_ATTEMPTS,
-    delay: int = DEAL_CONFIRMATION_DELAY,
+    delay: float = DEAL_CONFIRMATION_DELAY,
 ) -> Optional[DealConfirmation]:
     """
     Create a position and wait for deal confirmation.
@@ -83,7 +91,7 @@ def create_position_and_wait_for_confirmation(
         dealing_client: The dealing client instance
         body_data: Position creation data
         max_attempts: Maximum number of confirmation polling attempts
-        delay: Delay between confirmation attempts in seconds
+        delay: Largest delay between confirmation attempts in seconds
 
     Returns:
         DealConfirmation or None
@@ -108,7 +116,7 @@ def close_position_and_wait_for_confirmation(
     dealing_client: DealingClient,
     body_data: Dict[str, Any],
     max_attempts: int = DEAL_CONFIRMATION_ATTEMPTS,
-    delay: int = DEAL_CONFIRMATION_DELAY,
+    delay: float = DEAL_CONFIRMATION_DELAY,
 ) -> Optional[DealConfirmation]:
     logger.info("Close position and waiting for confirmation")
 
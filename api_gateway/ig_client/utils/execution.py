@@ -0,0 +1,458 @@
+"""
+Bulk order execution.
+
+OrderExecutionEngine submits a batch of validated position requests
+concurrently, paced by IG's per-account trading limit, tracks every deal
+reference with a DealConfirmationPoller and returns one report row per order
+with its outcome and latencies.
+
+Every order carries an idempotency key. A key the engine has already
+executed (or is executing) is not submitted again. Opening requests send a
+deal reference derived from their key, so when a submission fails without a
+usable response (timeout, network error, 5xx) the engine looks the reference
+up on /confirms before retrying and a deal IG did receive is not placed
+twice. Closing requests have no client deal reference; they are retried only
+after rate limiting, where IG guarantees the request was not processed.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+import pandas as pd
+
+from api_gateway.ig_client.clients.dealing import DealingClient
+from api_gateway.ig_client.core.exceptions import (
+    IGNetworkError,
+    IGRateLimitError,
+    IGServerError,
+    IGTimeoutError,
+)
+from api_gateway.ig_client.core.models.dealing.ig_responses import (
+    DealConfirmation,
+)
+from api_gateway.ig_client.core.models.dealing.request_bodies import (
+    CloseOtcPositionRequest,
+    CreateOtcPositionRequest,
+)
+from api_gateway.ig_client.utils.confirmations import (
+    CONFIRMATION_TIMEOUT,
+    DealConfirmationPoller,
+    check_deal_confirmation,
+)
+from common.resilience import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# IG's per-account limit on trading requests
+TRADING_RATE_LIMIT_CALLS = 100
+TRADING_RATE_LIMIT_PERIOD = 60
+
+SUBMIT_RETRIES = 2
+SUBMIT_RETRY_DELAY = 0.5
+
+# Errors after which IG may or may not have processed the request
+AMBIGUOUS_ERRORS = (IGTimeoutError, IGNetworkError, IGServerError)
+
+OrderRequest = Union[CreateOtcPositionRequest, CloseOtcPositionRequest]
+
+REPORT_COLUMNS = [
+    "idempotency_key",
+    "kind",
+    "epic",
+    "direction",
+    "size",
+    "deal_reference",
+    "status",
+    "reason",
+    "deal_id",
+    "level",
+    "attempts",
+    "queue_wait",
+    "submit_latency",
+    "confirm_latency",
+    "total_latency",
+    "duplicate",
+    "error",
+]
+
+_DEAL_REFERENCE = re.compile(r"[A-Za-z0-9_\-]{1,30}")
+
+
+def deal_reference_for(idempotency_key: str) -> str:
+    """
+    Deal reference sent for an idempotency key: the key itself if IG
+    accepts it as a reference, otherwise a 30-character digest of it
+    """
+    if _DEAL_REFERENCE.fullmatch(idempotency_key):
+        return idempotency_key
+    return hashlib.blake2b(idempotency_key.encode(), digest_size=15).hexdigest()
+
+
+@dataclass(frozen=True)
+class Order:
+    """
+    A request with its idempotency key
+
+    The key defaults to the request's dealReference, or a random key (which
+    only deduplicates resubmissions of this Order object).
+    """
+
+    request: OrderRequest
+    idempotency_key: Optional[str] = None
+
+    def __post_init__(self):
+        if self.idempotency_key is None:
+            key = getattr(self.request, "dealReference", None) or uuid.uuid4().hex
+            object.__setattr__(self, "idempotency_key", key)
+
+    @property
+    def kind(self) -> str:
+        """OPEN or CLOSE"""
+        return "OPEN" if isinstance(self.request, CreateOtcPositionRequest) else "CLOSE"
+
+    @property
+    def deal_reference(self) -> Optional[str]:
+        """Client deal reference sent with an opening request"""
+        if self.kind != "OPEN":
+            return None
+        return self.request.dealReference or deal_reference_for(self.idempotency_key)
+
+    def body(self) -> Dict[str, Any]:
+        """Request body for the dealing client"""
+        body = self.request.model_dump(exclude_none=True)
+        if self.kind == "OPEN":
+            body["dealReference"] = self.deal_reference
+        return body
+
+
+@dataclass
+class OrderReport:
+    """Outcome and latencies (seconds) of one order"""
+
+    idempotency_key: str
+    kind: str
+    epic: Optional[str]
+    direction: str
+    size: float
+    deal_reference: Optional[str] = None
+    # ACCEPTED/REJECTED from the confirmation, UNCONFIRMED if none arrived,
+    # FAILED if the order was not submitted
+    status: str = "FAILED"
+    reason: Optional[str] = None
+    deal_id: Optional[str] = None
+    level: Optional[float] = None
+    attempts: int = 0
+    queue_wait: float = float("nan")
+    submit_latency: float = float("nan")
+    confirm_latency: float = float("nan")
+    total_latency: float = float("nan")
+    duplicate: bool = False
+    error: Optional[str] = None
+    confirmation: Optional[DealConfirmation] = field(default=None, repr=False)
+
+
+@dataclass
+class ExecutionReport:
+    """Reports of a batch, in the order the orders were given"""
+
+    orders: List[OrderReport]
+
+    def __iter__(self) -> Iterator[OrderReport]:
+        return iter(self.orders)
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def __getitem__(self, index: int) -> OrderReport:
+        return self.orders[index]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of orders per status"""
+        counts: Dict[str, int] = {}
+        for report in self.orders:
+            counts[report.status] = counts.get(report.status, 0) + 1
+        return counts
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per order with REPORT_COLUMNS"""
+        return pd.DataFrame(
+            [
+                {column: getattr(report, column) for column in REPORT_COLUMNS}
+                for report in self.orders
+            ],
+            columns=REPORT_COLUMNS,
+        )
+
+
+def _paced_by_client(dealing_client: DealingClient) -> bool:
+    rest = getattr(dealing_client, "rest", None)
+    return getattr(rest, "rate_limits", None) is not None
+
+
+@dataclass
+class _Submission:
+    deal_reference: Optional[str]
+    attempts: int
+    queued_at: float
+    started_at: float
+    submitted_at: float
+    error: Optional[Exception] = None
+
+
+class OrderExecutionEngine:
+    """Submits batches of orders concurrently and tracks their confirmations"""
+
+    def __init__(
+        self,
+        dealing_client: DealingClient,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_workers: int = 8,
+        retries: int = SUBMIT_RETRIES,
+        retry_delay: float = SUBMIT_RETRY_DELAY,
+        confirmation_timeout: float = CONFIRMATION_TIMEOUT,
+        poller: Optional[DealConfirmationPoller] = None,
+    ):
+        """
+        Initialize the engine
+
+        Args:
+            dealing_client: Dealing client
+            rate_limiter: Limiter for trading requests (default: IG's
+                per-account trading limit, unless the client's IGRest already
+                limits trading requests)
+            max_workers: Submissions in flight at once
+            retries: Resubmissions after retryable errors
+            retry_delay: Delay before the first resubmission (doubles)
+            confirmation_timeout: Seconds to wait for each confirmation
+            poller: Confirmation poller (created and owned if not given)
+        """
+        self.dealing_client = dealing_client
+        if rate_limiter is None and not _paced_by_client(dealing_client):
+            rate_limiter = RateLimiter(
+                max_calls=TRADING_RATE_LIMIT_CALLS,
+                period_seconds=TRADING_RATE_LIMIT_PERIOD,
+            )
+        self.rate_limiter = rate_limiter
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.confirmation_timeout = confirmation_timeout
+        self._owns_poller = poller is None
+        self._poller = poller or DealConfirmationPoller(
+            dealing_client, timeout=confirmation_timeout
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="order-execution"
+        )
+        self._limiter_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._reports: Dict[str, OrderReport] = {}
+        self._in_flight: Dict[str, Future] = {}
+        # Keys with a failed submission IG may have received
+        self._uncertain: Set[str] = set()
+
+    def execute(self, orders: Iterable[Union[Order, OrderRequest]]) -> ExecutionReport:
+        """
+        Execute a batch of orders and wait for their outcomes
+
+        Orders whose key was already executed (in this or an earlier batch)
+        are not submitted; their report is the original one, flagged
+        duplicate. Keys of failed orders can be executed again, except
+        closing orders that failed with an ambiguous error.
+
+        Args:
+            orders: Orders, or requests (keyed by their dealReference if set)
+
+        Returns:
+            ExecutionReport with one row per given order
+        """
+        batch = [o if isinstance(o, Order) else Order(o) for o in orders]
+        queued_at = time.monotonic()
+        futures = []
+        with self._lock:
+            for order in batch:
+                key = order.idempotency_key
+                future = self._in_flight.get(key)
+                if future is None and key in self._reports:
+                    future = Future()
+                    future.set_result(self._reports[key])
+                if future is not None:
+                    logger.info(f"Order {key} already executed; not resubmitting")
+                    futures.append((future, True))
+                    continue
+                future = Future()
+                self._in_flight[key] = future
+                self._executor.submit(self._submit, order, queued_at).add_done_callback(
+                    lambda done, order=order, future=future: self._submitted(
+                        order, done, future
+                    )
+                )
+                futures.append((future, False))
+
+        reports = []
+        for future, duplicate in futures:
+            report = future.result()
+            reports.append(replace(report, duplicate=True) if duplicate else report)
+        return ExecutionReport(reports)
+
+    def _acquire(self) -> None:
+        if self.rate_limiter is None:
+            return
+        # RateLimiter is not thread-safe
+        with self._limiter_lock:
+            self.rate_limiter.acquire()
+
+    def _submit(self, order: Order, queued_at: float) -> _Submission:
+        key = order.idempotency_key
+        deal_reference = order.deal_reference
+        submit = (
+            self.dealing_client.create_position_otc
+            if order.kind == "OPEN"
+            else self.dealing_client.close_position_otc
+        )
+        body = order.body()
+        with self._lock:
+            reconcile = key in self._uncertain
+
+        attempts = 0
+        started_at = None
+        error: Optional[Exception] = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            if reconcile and deal_reference is not None:
+                if check_deal_confirmation(self.dealing_client, deal_reference):
+                    logger.info(
+                        f"Order {key} was received by IG as {deal_reference}; "
+                        f"not resubmitting"
+                    )
+                    error = None
+                    break
+            self._acquire()
+            attempts += 1
+            if started_at is None:
+                started_at = time.monotonic()
+            try:
+                pending = submit(body)
+            except IGRateLimitError as e:
+                error = e
+                logger.warning(f"Order {key} rate limited (attempt {attempts})")
+                continue
+            except AMBIGUOUS_ERRORS as e:
+                error = e
+                logger.warning(f"Order {key} failed (attempt {attempts}): {e}")
+                if deal_reference is None:
+                    break
+                reconcile = True
+                continue
+            except Exception as e:
+                error = e
+                logger.error(f"Order {key} failed: {e}")
+                break
+            deal_reference, error = pending.dealReference, None
+            break
+
+        # After an ambiguous error the confirmation of the reference decides
+        # whether IG received the order
+        if error is not None and not isinstance(error, AMBIGUOUS_ERRORS):
+            deal_reference = None
+        now = time.monotonic()
+        return _Submission(
+            deal_reference=deal_reference,
+            attempts=attempts,
+            queued_at=queued_at,
+            started_at=now if started_at is None else started_at,
+            submitted_at=now,
+            error=error,
+        )
+
+    def _submitted(self, order: Order, done: Future, result: Future) -> None:
+        try:
+            submission = done.result()
+        except Exception as e:  # _submit does not raise; guard anyway
+            now = time.monotonic()
+            submission = _Submission(None, 0, now, now, now, error=e)
+        if submission.deal_reference is None:
+            self._finish(order, submission, None, result)
+            return
+        try:
+            tracked = self._poller.track(
+                submission.deal_reference, timeout=self.confirmation_timeout
+            )
+        except RuntimeError as e:
+            submission.error = submission.error or e
+            self._finish(order, submission, None, result)
+            return
+        tracked.add_done_callback(
+            lambda confirmed: self._finish(
+                order,
+                submission,
+                None if confirmed.cancelled() else confirmed.result(),
+                result,
+            )
+        )
+
+    def _finish(
+        self,
+        order: Order,
+        submission: _Submission,
+        confirmation: Optional[DealConfirmation],
+        result: Future,
+    ) -> None:
+        now = time.monotonic()
+        request = order.request
+        report = OrderReport(
+            idempotency_key=order.idempotency_key,
+            kind=order.kind,
+            epic=request.epic,
+            direction=request.direction,
+            size=float(request.size),
+            deal_reference=submission.deal_reference,
+            attempts=submission.attempts,
+            queue_wait=submission.started_at - submission.queued_at,
+            submit_latency=submission.submitted_at - submission.started_at,
+            total_latency=now - submission.queued_at,
+            confirmation=confirmation,
+        )
+        if confirmation is not None:
+            report.status = confirmation.dealStatus
+            report.reason = confirmation.reason
+            report.deal_id = confirmation.dealId
+            if confirmation.level is not None:
+                report.level = float(confirmation.level)
+            report.confirm_latency = now - submission.submitted_at
+        elif submission.error is not None:
+            report.error = str(submission.error)
+        elif submission.deal_reference is not None:
+            report.status = "UNCONFIRMED"
+
+        key = order.idempotency_key
+        with self._lock:
+            self._in_flight.pop(key, None)
+            ambiguous = isinstance(submission.error, AMBIGUOUS_ERRORS)
+            if report.status != "FAILED" or (ambiguous and order.kind == "CLOSE"):
+                # Placed, or possibly placed without a way to tell
+                self._reports[key] = report
+                self._uncertain.discard(key)
+            elif ambiguous:
+                # Reconciled on /confirms before it is submitted again
+                self._uncertain.add(key)
+        result.set_result(report)
+
+    def close(self) -> None:
+        """Wait for submissions in flight and stop the engine"""
+        self._executor.shutdown(wait=True)
+        if self._owns_poller:
+            self._poller.close()
+
+    def __enter__(self) -> "OrderExecutionEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
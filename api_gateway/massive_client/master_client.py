@@ -6,6 +6,7 @@ Main client interface for Massive API, similar to IGClient.
 
 from typing import Optional
 
+from common.cassette import Cassette
 from common.resilience import CircuitBreaker, RateLimiter, RetryConfig
 from .rest import MassiveRest
 
@@ -23,6 +24,7 @@ class MassiveClient:
         rate_limiter: Optional[RateLimiter] = None,
         circuit_breaker: Optional[CircuitBreaker] = None,
         retry_config: Optional[RetryConfig] = None,
+        cassette: Optional[Cassette] = None,
     ):
         """
         Initialize Massive client.
@@ -32,10 +34,12 @@ class MassiveClient:
             rate_limiter: Optional rate limiter instance
             circuit_breaker: Optional circuit breaker instance
             retry_config: Optional retry configuration
+            cassette: Optional record/replay store of call results
         """
         self.rest = MassiveRest(
             api_key=api_key,
             rate_limiter=rate_limiter,
             circuit_breaker=circuit_breaker,
             retry_config=retry_config,
+            cassette=cassette,
         )
@@ -5,9 +5,11 @@ Thin wrapper around polygon.RESTClient with resilience features.
 """
 
 import logging
+from collections.abc import Iterator
 from typing import Optional, Callable, Any
 from polygon import RESTClient
 
+from common.cassette import Cassette, CassetteMissError
 from common.resilience import (
     CircuitBreaker,
     RateLimiter,
@@ -42,6 +44,7 @@ class MassiveRest:
         rate_limiter: Optional[RateLimiter] = None,
         circuit_breaker: Optional[CircuitBreaker] = None,
         retry_config: Optional[RetryConfig] = None,
+        cassette: Optional[Cassette] = None,
     ):
         """
         Initialize Massive REST client wrapper.
@@ -51,16 +54,21 @@ class MassiveRest:
             rate_limiter: Optional rate limiter instance
             circuit_breaker: Optional circuit breaker instance
             retry_config: Optional retry configuration
+            cassette: Optional record/replay store of call results
         """
         self._client = RESTClient(api_key=api_key)
         self.rate_limiter = rate_limiter
         self.circuit_breaker = circuit_breaker
         self.retry_config = retry_config
+        self.cassette = cassette
 
     def _with_resilience(self, func: Callable, *args, **kwargs) -> Any:
         """
         Execute function with resilience features (rate limiting, circuit breaker, retries).
 
+        With a cassette, results are replayed from or recorded to it; paginated
+        iterators are read in full first.
+
         Args:
             func: Function to execute
             *args: Function arguments
@@ -69,6 +77,19 @@ class MassiveRest:
         Returns:
             Function result
         """
+        if self.cassette is None:
+            return self._call(func, *args, **kwargs)
+
+        def _fetch():
+            result = self._call(func, *args, **kwargs)
+            return list(result) if isinstance(result, Iterator) else result
+
+        key = Cassette.key(
+            "massive", func.__name__, args, tuple(sorted(kwargs.items()))
+        )
+        return self.cassette.play(key, _fetch, f"massive {func.__name__}{args}")
+
+    def _call(self, func: Callable, *args, **kwargs) -> Any:
         logger.debug(
             f"API call: {func.__name__}",
             extra={"args_count": len(args), "kwargs_keys": list(kwargs.keys())},
@@ -99,6 +120,9 @@ class MassiveRest:
         Raises:
             Appropriate MassiveAPIError subclass
         """
+        if isinstance(e, CassetteMissError):
+            return
+
         error_str = str(e).lower()
 
         if (
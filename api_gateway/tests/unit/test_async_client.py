@@ -0,0 +1,179 @@
+"""
+Unit tests for the asyncio IG client and the async rate limiter.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from api_gateway.ig_client.aio import AsyncIGClient
+from api_gateway.ig_client.core.exceptions import (
+    IGNetworkError,
+    IGNotFoundError,
+    IGValidationError,
+)
+from common.resilience import AsyncRateLimiter
+
+BASE_URL = "https://demo-api.ig.com/gateway/deal"
+
+
+def _prices_response(epic):
+    return {
+        "allowance": {
+            "allowanceExpiry": 600,
+            "remainingAllowance": 9999,
+            "totalAllowance": 10000,
+        },
+        "instrumentType": "INDICES",
+        "prices": [
+            {
+                "snapshotTime": "2024/01/02 00:00:00",
+                "closePrice": {"bid": 100.0, "ask": 101.0},
+            }
+        ],
+    }
+
+
+class FakeIG:
+    """MockTransport handler serving /session and /prices with a delay."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.requests = []
+        self.logins = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("/session"):
+            self.logins += 1
+            await asyncio.sleep(self.delay)
+            return httpx.Response(
+                200, headers={"CST": "cst", "X-SECURITY-TOKEN": "xst"}, json={}
+            )
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        epic = request.url.path.split("/prices/")[-1].split("/")[0]
+        if epic == "CS.D.MISSING.CFD.IP":
+            return httpx.Response(404, json={"errorCode": "error.epic.not-found"})
+        if epic == "CS.D.BROKEN.CFD.IP":
+            return httpx.Response(200, json={"prices": "not a list"})
+        return httpx.Response(200, json=_prices_response(epic))
+
+
+def _client(handler, **kwargs):
+    return AsyncIGClient(
+        BASE_URL,
+        "api-key",
+        "user",
+        "password",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestAsyncIGClient:
+    """Async clients share models, validators and error mapping."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_price_pulls(self, valid_epics):
+        """Requests run concurrently after a single login."""
+        fake = FakeIG()
+        async with _client(fake) as ig:
+            results = await asyncio.gather(
+                *(ig.markets.get_prices_by_points(e, "DAY", 1) for e in valid_epics)
+            )
+
+        assert fake.logins == 1
+        assert fake.max_in_flight == len(valid_epics)
+        assert [len(r.prices) for r in results] == [1] * len(valid_epics)
+        price_requests = [r for r in fake.requests if "/prices/" in r.url.path]
+        assert {r.headers["CST"] for r in price_requests} == {"cst"}
+        assert {r.headers["VERSION"] for r in price_requests} == {"2"}
+        assert ig.auth_session.tokens.get("VERSION") is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_error_mapping(self):
+        """HTTP errors, invalid inputs and bad responses map to IG errors."""
+        fake = FakeIG(delay=0)
+        async with _client(fake) as ig:
+            with pytest.raises(IGNotFoundError):
+                await ig.markets.get_prices_by_points("CS.D.MISSING.CFD.IP", "DAY", 1)
+            with pytest.raises(IGValidationError):
+                await ig.markets.get_prices_by_points("CS.D.BROKEN.CFD.IP", "DAY", 1)
+
+            sent = len(fake.requests)
+            with pytest.raises(IGValidationError):
+                await ig.markets.get_prices_by_points("invalid@epic", "DAY", 1)
+            assert len(fake.requests) == sent
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_network_error(self):
+        """Transport failures raise IGNetworkError."""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with _client(handler) as ig:
+            with pytest.raises(IGNetworkError):
+                await ig.dealing.get_positions()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_requests(self, valid_epics):
+        """A shared AsyncRateLimiter bounds the requests per period."""
+        fake = FakeIG(delay=0)
+        limiter = AsyncRateLimiter(max_calls=2, period_seconds=0.1)
+        async with _client(fake, rate_limiter=limiter) as ig:
+            start = time.monotonic()
+            await asyncio.gather(
+                *(ig.markets.get_prices_by_points(e, "DAY", 1) for e in valid_epics)
+            )
+            elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.1
+
+
+class TestAsyncRateLimiter:
+    """Sliding-window limiter for coroutines."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_waits_for_window(self):
+        """Calls beyond max_calls wait until the oldest call leaves the window."""
+        limiter = AsyncRateLimiter(max_calls=2, period_seconds=0.1)
+        acquired = []
+
+        async def call(i):
+            await limiter.acquire()
+            acquired.append((i, time.monotonic()))
+
+        start = time.monotonic()
+        await asyncio.gather(*(call(i) for i in range(5)))
+
+        assert [i for i, _ in acquired] == [0, 1, 2, 3, 4]
+        offsets = [t - start for _, t in acquired]
+        assert offsets[1] < 0.05
+        assert offsets[2] >= 0.09
+        assert offsets[4] >= 0.19
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_try_acquire(self):
+        """try_acquire never waits."""
+        limiter = AsyncRateLimiter(max_calls=1, period_seconds=60)
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.get_remaining_calls() == 0
@@ -0,0 +1,196 @@
+"""
+Unit tests for recording and replaying IG requests with a cassette.
+"""
+
+import gzip
+import pickle
+
+import httpx
+import pytest
+
+from api_gateway.ig_client.aio import AsyncIGClient
+from api_gateway.ig_client.cassette import CassetteTransport
+from api_gateway.ig_client.core.exceptions import IGAPIError, IGRateLimitError
+from api_gateway.ig_client.master_client import IGClient
+from api_gateway.ig_client.testing import FakeIG, FakeIGConfig, FakeIGServer
+from api_gateway.ig_client.testing.fake_server import BASE_PATH
+from common.cassette import (
+    RECORD,
+    RECORD_MISSING,
+    REPLAY,
+    Cassette,
+    CassetteMissError,
+)
+
+EPIC = "CS.D.GBPUSD.TODAY.IP"
+
+
+class TestCassette:
+    """Modes decide what is replayed, fetched and recorded."""
+
+    @pytest.mark.unit
+    def test_modes(self, tmp_path):
+        """record_missing fetches once, replay never, record always."""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        key = Cassette.key("GET", "/markets", ())
+        with pytest.raises(CassetteMissError):
+            Cassette(tmp_path, REPLAY).play(key, fetch)
+
+        cassette = Cassette(tmp_path, RECORD_MISSING)
+        assert cassette.play(key, fetch) == {"n": 1}
+        assert cassette.play(key, fetch) == {"n": 1}
+        assert Cassette(tmp_path, REPLAY).play(key, fetch) == {"n": 1}
+        assert Cassette(tmp_path, RECORD).play(key, fetch) == {"n": 2}
+        assert Cassette(tmp_path, REPLAY).play(key, fetch) == {"n": 2}
+        assert len(calls) == 2
+        assert cassette.stats() == {
+            "hits": 1,
+            "misses": 0,
+            "fetched": 1,
+            "recorded": 1,
+        }
+        with pytest.raises(ValueError):
+            Cassette(tmp_path, "offline")
+
+    @pytest.mark.unit
+    def test_to_record(self, tmp_path):
+        """Responses mapped to None are returned but not recorded."""
+        cassette = Cassette(tmp_path, RECORD_MISSING)
+        key = Cassette.key("x")
+        assert cassette.play(key, lambda: 503, to_record=lambda r: None) == 503
+        assert list(tmp_path.iterdir()) == []
+        assert cassette.play(key, lambda: 200, to_record=str) == 200
+        assert cassette.play(key, lambda: 0) == "200"
+
+
+class TestCassetteTransport:
+    """IG clients replay recorded sessions offline."""
+
+    @pytest.mark.unit
+    def test_record_then_replay(self, tmp_path):
+        """A replay-only client needs no server, password or session."""
+        with FakeIGServer(FakeIG(FakeIGConfig(seed=3))) as server:
+            base_url = server.base_url
+            with CassetteTransport(Cassette(tmp_path, RECORD_MISSING)) as transport:
+                client = IGClient(
+                    base_url, "key", "user", "secret", transport=transport
+                )
+                recorded = client.markets.get_prices_by_points(EPIC, "DAY", 10)
+                accounts = client.accounts.get_accounts()
+            requests = sum(server.fake.stats.values())
+
+        cassette = Cassette(tmp_path, REPLAY)
+        client = IGClient(
+            base_url, "key", "user", "other", transport=CassetteTransport(cassette)
+        )
+        assert client.markets.get_prices_by_points(EPIC, "DAY", 10) == recorded
+        assert client.accounts.get_accounts() == accounts
+        assert cassette.stats()["hits"] == requests == 3
+        with pytest.raises(IGAPIError, match="No recording"):
+            client.markets.get_market(EPIC)
+
+        # Session tokens and the password are not written
+        for path in tmp_path.iterdir():
+            entry = gzip.decompress(path.read_bytes())
+            assert b"secret" not in entry
+            for name, value in pickle.loads(entry)["response"][1]:
+                if name.upper() in ("CST", "X-SECURITY-TOKEN"):
+                    assert value == "recorded"
+
+    @pytest.mark.unit
+    def test_record_missing_logs_in_live(self, tmp_path):
+        """Later runs get a live session for requests not yet recorded."""
+        fake = FakeIG()
+        base_url = f"https://fake-ig{BASE_PATH}"
+
+        def client():
+            transport = CassetteTransport(
+                Cassette(tmp_path, RECORD_MISSING),
+                transport=httpx.MockTransport(fake.handler),
+            )
+            return IGClient(base_url, "key", "user", "secret", transport=transport)
+
+        accounts = client().accounts.get_accounts()
+        second = client()
+        assert second.accounts.get_accounts() == accounts
+        assert second.markets.get_market(EPIC).instrument.epic == EPIC
+        assert fake.stats[("session", 200)] == 2
+        assert fake.stats[("accounts", 200)] == 1
+
+    @pytest.mark.unit
+    def test_writes_and_relative_windows(self, tmp_path):
+        """Dealing is never replayed; latest-N prices are refetched."""
+        fake = FakeIG()
+        base_url = f"https://fake-ig{BASE_PATH}"
+
+        def client(mode):
+            transport = CassetteTransport(
+                Cassette(tmp_path, mode), transport=httpx.MockTransport(fake.handler)
+            )
+            return IGClient(base_url, "key", "user", "secret", transport=transport)
+
+        ig = client(RECORD_MISSING)
+        order = {
+            "currencyCode": "GBP",
+            "direction": "BUY",
+            "epic": EPIC,
+            "expiry": "DFB",
+            "forceOpen": True,
+            "guaranteedStop": False,
+            "orderType": "MARKET",
+            "size": 1,
+        }
+        first = ig.dealing.create_position_otc(order).dealReference
+        assert ig.dealing.create_position_otc(order).dealReference != first
+        for _ in range(2):
+            ig.markets.get_prices_by_points(EPIC, "DAY", 5)
+            ig.markets.get_prices_by_date_range(EPIC, "DAY", "01-01-2024", "05-01-2024")
+        assert fake.stats[("prices", 200)] == 3
+
+        client(REPLAY).markets.get_prices_by_points(EPIC, "DAY", 5)
+        assert fake.stats[("prices", 200)] == 3
+
+    @pytest.mark.unit
+    def test_errors_not_recorded(self, tmp_path):
+        """Rate-limit responses pass through and are fetched again."""
+        config = FakeIGConfig(non_trading_limit=(1, 60))
+        cassette = Cassette(tmp_path, RECORD_MISSING)
+        with FakeIGServer(FakeIG(config)) as server:
+            client = IGClient(
+                server.base_url,
+                "key",
+                "user",
+                "secret",
+                transport=CassetteTransport(cassette),
+            )
+            client.accounts.get_accounts()
+            with pytest.raises(IGRateLimitError):
+                client.markets.get_market(EPIC)
+        assert cassette.stats()["fetched"] == 3
+        assert cassette.stats()["recorded"] == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_client(self, tmp_path):
+        """Async clients record and replay through the same transport."""
+        fake = FakeIG()
+        base_url = f"https://fake-ig{BASE_PATH}"
+        transport = CassetteTransport(
+            Cassette(tmp_path, RECORD_MISSING),
+            async_transport=httpx.MockTransport(fake.async_handler),
+        )
+        async with AsyncIGClient(
+            base_url, "key", "user", "secret", transport=transport
+        ) as client:
+            market = await client.markets.get_market(EPIC)
+
+        replay = CassetteTransport(Cassette(tmp_path, REPLAY))
+        async with AsyncIGClient(
+            base_url, "key", "user", "secret", transport=replay
+        ) as client:
+            assert await client.markets.get_market(EPIC) == market
@@ -0,0 +1,148 @@
+"""
+Unit tests for adaptive and concurrent deal-confirmation polling.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from api_gateway.ig_client.core.exceptions import IGNotFoundError, IGServerError
+from api_gateway.ig_client.utils import (
+    DealConfirmationPoller,
+    confirmation_delays,
+    wait_for_deal_confirmation,
+)
+
+
+class FakeDealing:
+    """Dealing client whose confirmations land a set time after tracking."""
+
+    def __init__(self, ready_after):
+        self.ready_at = {
+            ref: time.monotonic() + delay for ref, delay in ready_after.items()
+        }
+        self.polls = {ref: 0 for ref in ready_after}
+        self.lock = threading.Lock()
+
+    def get_deal_confirmation(self, deal_reference):
+        with self.lock:
+            self.polls[deal_reference] += 1
+        if time.monotonic() < self.ready_at[deal_reference]:
+            raise IGNotFoundError("Requested resource not found", status_code=404)
+        return Mock(dealReference=deal_reference, dealStatus="ACCEPTED")
+
+
+class TestWaitForDealConfirmation:
+    """Single-reference polling backs off geometrically."""
+
+    @pytest.mark.unit
+    def test_delays(self):
+        """Delays double from the initial delay up to the cap."""
+        delays = confirmation_delays(initial_delay=0.01, backoff=2.0, max_delay=0.05)
+        assert [next(delays) for _ in range(5)] == [0.01, 0.02, 0.04, 0.05, 0.05]
+
+    @pytest.mark.unit
+    def test_backoff_until_found(self):
+        """Errors and missing confirmations are retried with growing delays."""
+        confirmation = Mock(status="OPEN")
+        dealing = Mock()
+        dealing.get_deal_confirmation.side_effect = [
+            IGNotFoundError("not found", status_code=404),
+            IGServerError("busy", status_code=503),
+            confirmation,
+        ]
+
+        with patch("api_gateway.ig_client.utils.deal_helpers.time.sleep") as sleep:
+            result = wait_for_deal_confirmation(
+                dealing, "REF1", initial_delay=0.01, backoff=3.0
+            )
+
+        assert result is confirmation
+        assert [c.args[0] for c in sleep.call_args_list] == [0.01, 0.03]
+
+    @pytest.mark.unit
+    def test_gives_up_after_max_attempts(self):
+        """None is returned after max_attempts polls."""
+        dealing = Mock()
+        dealing.get_deal_confirmation.side_effect = IGNotFoundError("not found")
+
+        with patch("api_gateway.ig_client.utils.deal_helpers.time.sleep") as sleep:
+            result = wait_for_deal_confirmation(dealing, "REF1", max_attempts=4)
+
+        assert result is None
+        assert dealing.get_deal_confirmation.call_count == 4
+        assert sleep.call_count == 3
+
+
+class TestDealConfirmationPoller:
+    """Many references resolve concurrently through futures and callbacks."""
+
+    @pytest.mark.unit
+    def test_concurrent_references(self):
+        """Twenty references resolve quickly with few polls each."""
+        refs = [f"REF{i}" for i in range(20)]
+        dealing = FakeDealing({ref: 0.05 + 0.005 * i for i, ref in enumerate(refs)})
+        resolved = []
+
+        start = time.monotonic()
+        with DealConfirmationPoller(dealing, initial_delay=0.005) as poller:
+            futures = [
+                poller.track(ref, callback=lambda r, c: resolved.append(r))
+                for ref in refs
+            ]
+            results = [future.result(timeout=5) for future in futures]
+            elapsed = time.monotonic() - start
+            assert poller.pending == 0
+
+        assert [result.dealReference for result in results] == refs
+        assert sorted(resolved) == sorted(refs)
+        assert elapsed < 1.0
+        assert max(dealing.polls.values()) <= 8
+
+    @pytest.mark.unit
+    def test_timeout_resolves_none(self):
+        """References that never confirm resolve to None after the timeout."""
+        dealing = FakeDealing({"SLOW": 60, "FAST": 0})
+
+        with DealConfirmationPoller(dealing, initial_delay=0.01, timeout=0.1) as poller:
+            results = poller.wait_all(["SLOW", "FAST"])
+
+        assert results["SLOW"] is None
+        assert results["FAST"].dealReference == "FAST"
+
+    @pytest.mark.unit
+    def test_duplicate_track_and_close(self):
+        """Tracking twice shares a future; closing cancels pending ones."""
+        dealing = FakeDealing({"REF": 60})
+        poller = DealConfirmationPoller(dealing, initial_delay=0.01)
+
+        future = poller.track("REF")
+        assert poller.track("REF") is future
+
+        poller.close()
+
+        assert future.cancelled()
+        with pytest.raises(RuntimeError):
+            poller.track("OTHER")
+
+    @pytest.mark.unit
+    def test_cancelled_reference(self):
+        """A cancelled future stops polling and is not handed out again."""
+        dealing = FakeDealing({"REF": 60})
+
+        with DealConfirmationPoller(dealing, initial_delay=0.01) as poller:
+            future = poller.track("REF")
+            time.sleep(0.05)
+            assert future.cancel()
+            assert poller.pending == 0
+            time.sleep(0.05)
+            polls = dealing.polls["REF"]
+            time.sleep(0.05)
+            assert dealing.polls["REF"] == polls
+
+            again = poller.track("REF")
+            assert again is not future
+            assert not again.done()
+            assert poller.pending == 1
@@ -0,0 +1,212 @@
+"""
+Unit tests for bulk order execution.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from api_gateway.ig_client.core.exceptions import (
+    IGNotFoundError,
+    IGRateLimitError,
+    IGServerError,
+    IGTimeoutError,
+    IGValidationError,
+)
+from api_gateway.ig_client.core.models.dealing.request_bodies import (
+    CloseOtcPositionRequest,
+    CreateOtcPositionRequest,
+)
+from api_gateway.ig_client.utils import Order, OrderExecutionEngine
+from api_gateway.ig_client.utils.execution import REPORT_COLUMNS, deal_reference_for
+
+
+def _open(epic="CS.D.GBPUSD.TODAY.IP", **kwargs):
+    return CreateOtcPositionRequest(
+        currencyCode="GBP",
+        direction="BUY",
+        epic=epic,
+        expiry="DFB",
+        forceOpen=True,
+        guaranteedStop=False,
+        orderType="MARKET",
+        size=1,
+        **kwargs,
+    )
+
+
+def _close(deal_id="DIAAAAB"):
+    return CloseOtcPositionRequest(
+        dealId=deal_id, direction="SELL", orderType="MARKET", size=1
+    )
+
+
+class FakeDealing:
+    """Dealing client that accepts every deal and fails as scripted."""
+
+    def __init__(self, failures=None, latency=0.01):
+        # Exceptions raised by the next submissions (after IG received the
+        # deal if the entry is a (exception, True) pair)
+        self.failures = list(failures or [])
+        self.latency = latency
+        self.submitted = []
+        self.received = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def _submit(self, body, kind):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            failure = self.failures.pop(0) if self.failures else None
+            self.submitted.append(body)
+            reference = body.get("dealReference") or f"{kind}{len(self.submitted)}"
+        try:
+            time.sleep(self.latency)
+            if isinstance(failure, tuple):
+                failure, received = failure
+                if received:
+                    self.received[reference] = body
+            if failure is not None:
+                raise failure
+            self.received[reference] = body
+            return Mock(dealReference=reference)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def create_position_otc(self, body):
+        return self._submit(body, "OPEN")
+
+    def close_position_otc(self, body):
+        return self._submit(body, "CLOSE")
+
+    def get_deal_confirmation(self, deal_reference):
+        if deal_reference not in self.received:
+            raise IGNotFoundError("Requested resource not found", status_code=404)
+        return Mock(
+            dealReference=deal_reference,
+            dealStatus="ACCEPTED",
+            reason="SUCCESS",
+            dealId=f"DI{deal_reference}"[:30],
+            level=None,
+        )
+
+
+def _engine(dealing, **kwargs):
+    kwargs.setdefault("retry_delay", 0.01)
+    kwargs.setdefault("confirmation_timeout", 1.0)
+    return OrderExecutionEngine(dealing, **kwargs)
+
+
+class TestOrder:
+    """Idempotency keys and the deal references derived from them."""
+
+    @pytest.mark.unit
+    def test_keys_and_references(self):
+        """Keys default to the request's reference; invalid keys are hashed."""
+        assert Order(_open(dealReference="REF-1")).idempotency_key == "REF-1"
+        assert Order(_open(), "batch-1/order-2").deal_reference == deal_reference_for(
+            "batch-1/order-2"
+        )
+        assert len(deal_reference_for("x" * 100)) == 30
+        assert Order(_open(), "abc_1").body()["dealReference"] == "abc_1"
+        close = Order(_close())
+        assert close.kind == "CLOSE"
+        assert close.deal_reference is None
+        assert "dealReference" not in close.body()
+
+
+class TestOrderExecutionEngine:
+    """Batches are submitted concurrently and reported per order."""
+
+    @pytest.mark.unit
+    def test_batch(self):
+        """Orders run concurrently, paced by the limiter, and are confirmed."""
+        dealing = FakeDealing(latency=0.05)
+        limiter = Mock()
+        orders = [Order(_open(), f"open-{i}") for i in range(6)] + [_close()]
+
+        with _engine(dealing, rate_limiter=limiter, max_workers=4) as engine:
+            report = engine.execute(orders)
+
+        assert len(report) == 7
+        assert report.counts() == {"ACCEPTED": 7}
+        assert limiter.acquire.call_count == 7
+        assert dealing.max_active > 1
+        assert [r.idempotency_key for r in report][:2] == ["open-0", "open-1"]
+        assert report[0].deal_reference == "open-0"
+        assert report[0].deal_id == "DIopen-0"
+        assert report[6].kind == "CLOSE"
+
+        frame = report.to_frame()
+        assert list(frame.columns) == REPORT_COLUMNS
+        assert (frame["submit_latency"] >= 0.05).all()
+        assert (frame["total_latency"] >= frame["submit_latency"]).all()
+        assert frame["confirm_latency"].notna().all()
+
+    @pytest.mark.unit
+    def test_duplicate_keys(self):
+        """A key is submitted once, within a batch and across batches."""
+        dealing = FakeDealing()
+        with _engine(dealing, rate_limiter=Mock()) as engine:
+            first = engine.execute([Order(_open(), "k1"), Order(_open(), "k1")])
+            again = engine.execute([Order(_open(), "k1")])
+
+        assert len(dealing.submitted) == 1
+        assert [r.duplicate for r in first] == [False, True]
+        assert again[0].duplicate
+        assert again[0].deal_reference == "k1"
+
+    @pytest.mark.unit
+    def test_ambiguous_failure_is_reconciled(self):
+        """After a timeout the order is looked up, not submitted again."""
+        dealing = FakeDealing(failures=[(IGTimeoutError("timed out"), True)])
+        with _engine(dealing, rate_limiter=Mock()) as engine:
+            report = engine.execute([Order(_open(), "k1")])
+
+        assert len(dealing.submitted) == 1
+        assert report[0].status == "ACCEPTED"
+        assert report[0].attempts == 1
+        assert report[0].error is None
+
+    @pytest.mark.unit
+    def test_retries(self):
+        """Rate-limited and lost submissions are retried."""
+        dealing = FakeDealing(
+            failures=[
+                IGRateLimitError("slow down", status_code=429),
+                (IGServerError("unavailable", status_code=503), False),
+            ]
+        )
+        with _engine(dealing, rate_limiter=Mock(), max_workers=1) as engine:
+            report = engine.execute([Order(_open(), "k1")])
+
+        assert len(dealing.submitted) == 3
+        assert report[0].status == "ACCEPTED"
+        assert report[0].attempts == 3
+
+    @pytest.mark.unit
+    def test_failed_orders(self):
+        """Failed opens can be retried; ambiguous closes are not resubmitted."""
+        dealing = FakeDealing(
+            failures=[
+                IGValidationError("bad request", status_code=400),
+                IGServerError("unavailable", status_code=503),
+            ]
+        )
+        with _engine(dealing, rate_limiter=Mock(), max_workers=1) as engine:
+            failed = engine.execute([Order(_open(), "k1"), Order(_close(), "c1")])
+            retried = engine.execute([Order(_open(), "k1"), Order(_close(), "c1")])
+
+        assert [r.status for r in failed] == ["FAILED", "FAILED"]
+        assert failed[0].deal_reference is None
+        assert "bad request" in failed[0].error
+        assert failed[1].attempts == 1
+        assert retried[0].status == "ACCEPTED"
+        assert not retried[0].duplicate
+        assert retried[1].duplicate
+        assert len(dealing.submitted) == 3
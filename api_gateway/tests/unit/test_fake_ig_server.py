@@ -0,0 +1,186 @@
+"""
+Unit tests for the local IG REST API stand-in.
+"""
+
+import random
+import statistics
+import time
+
+import httpx
+import pytest
+
+from api_gateway.ig_client.aio import AsyncIGClient
+from api_gateway.ig_client.core.exceptions import (
+    IGAuthorizationError,
+    IGRateLimitError,
+    IGServerError,
+)
+from api_gateway.ig_client.master_client import IGClient
+from api_gateway.ig_client.testing import FakeIG, FakeIGConfig, FakeIGServer, Latency
+from api_gateway.ig_client.testing.fake_server import BASE_PATH
+
+EPIC = "CS.D.GBPUSD.TODAY.IP"
+OPEN = {
+    "currencyCode": "GBP",
+    "direction": "BUY",
+    "epic": EPIC,
+    "expiry": "DFB",
+    "forceOpen": True,
+    "guaranteedStop": False,
+    "orderType": "MARKET",
+    "size": 2,
+}
+
+
+@pytest.fixture
+def server():
+    with FakeIGServer(FakeIG(FakeIGConfig(seed=1))) as server:
+        yield server
+
+
+def _client(server):
+    return IGClient(server.base_url, "api-key", "user", "password")
+
+
+class TestFakeIGServer:
+    """IGClient works against the fake over HTTP."""
+
+    @pytest.mark.unit
+    def test_reference_and_price_data(self, server):
+        """Accounts, markets and prices pass the client's models."""
+        client = _client(server)
+
+        assert client.accounts.get_accounts().accounts[0].status == "ENABLED"
+        markets = client.markets.get_markets(f"{EPIC},IX.D.FTSE.DAILY.IP")
+        assert [m.instrument.epic for m in markets.marketDetails] == [
+            EPIC,
+            "IX.D.FTSE.DAILY.IP",
+        ]
+        assert client.markets.get_market(EPIC).snapshot.marketStatus == "TRADEABLE"
+
+        prices = client.markets.get_prices_by_points(EPIC, "HOUR", 5)
+        assert len(prices.prices) == 5
+        assert prices.allowance.remainingAllowance == 9995
+        columns = client.markets.get_prices_by_points(EPIC, "HOUR", 5, raw=True)
+        assert columns.to_frame()["closePrice.bid"].tolist() == [
+            float(p.closePrice.bid) for p in prices.prices
+        ]
+        january = client.markets.get_prices_by_date_range(
+            EPIC, "DAY", "01-01-2024", "31-01-2024"
+        )
+        assert len(january.prices) == 31
+        page = client.markets.get_prices(EPIC, {"max": 30, "pageSize": 10})
+        assert page.metadata.pageData.totalPages == 3
+
+    @pytest.mark.unit
+    def test_dealing(self, server):
+        """Positions open, confirm and close; working orders list and delete."""
+        dealing = _client(server).dealing
+
+        pending = dealing.create_position_otc({**OPEN, "dealReference": "ref-1"})
+        assert pending.dealReference == "ref-1"
+        opened = dealing.get_deal_confirmation("ref-1")
+        assert opened.dealStatus == "ACCEPTED"
+        assert dealing.get_positions().positions[0].position.size == 2
+        # A repeated reference is not dealt again
+        dealing.create_position_otc({**OPEN, "dealReference": "ref-1"})
+        assert len(dealing.get_positions().positions) == 1
+
+        closed = dealing.close_position_otc(
+            {
+                "dealId": opened.dealId,
+                "direction": "SELL",
+                "orderType": "MARKET",
+                "size": 2,
+            }
+        )
+        confirmation = dealing.get_deal_confirmation(closed.dealReference)
+        assert confirmation.affectedDeals[0].status == "FULLY_CLOSED"
+        assert dealing.get_positions().positions == []
+
+        dealing.create_working_order_otc(
+            {
+                "currencyCode": "GBP",
+                "direction": "BUY",
+                "epic": EPIC,
+                "expiry": "DFB",
+                "guaranteedStop": False,
+                "level": 1.2,
+                "size": 1,
+                "type": "LIMIT",
+                "timeInForce": "GOOD_TILL_CANCELLED",
+            }
+        )
+        orders = dealing.get_working_orders().workingOrders
+        assert float(orders[0].workingOrderData.orderLevel) == 1.2
+        dealing.delete_working_order_otc(orders[0].workingOrderData.dealId)
+        assert dealing.get_working_orders().workingOrders == []
+
+    @pytest.mark.unit
+    def test_limits_and_allowance(self):
+        """Request limits answer 429; an exhausted allowance answers 403."""
+        config = FakeIGConfig(non_trading_limit=(3, 60), historical_allowance=15)
+        with FakeIGServer(FakeIG(config)) as server:
+            markets = _client(server).markets
+            prices = markets.get_prices_by_points(EPIC, "DAY", 10)
+            assert prices.allowance.remainingAllowance == 5
+            with pytest.raises(IGAuthorizationError):
+                markets.get_prices_by_points(EPIC, "DAY", 10)
+            markets.get_market(EPIC)
+            with pytest.raises(IGRateLimitError):
+                markets.get_market(EPIC)
+
+    @pytest.mark.unit
+    def test_injected_errors(self):
+        """Injected 5xx responses surface as server errors."""
+        config = FakeIGConfig(server_error_rate=1.0)
+        with FakeIGServer(FakeIG(config)) as server:
+            with pytest.raises(IGServerError):
+                _client(server).accounts.get_accounts()
+            assert server.fake.stats[("session", 200)] == 1
+
+    @pytest.mark.unit
+    def test_rejects_unknown_sessions(self, server):
+        """Requests without a session token are refused."""
+        response = httpx.get(
+            f"{server.base_url}/accounts", headers={"X-IG-API-KEY": "api-key"}
+        )
+        assert response.status_code == 401
+        assert response.json()["errorCode"] == "error.security.client-token-invalid"
+
+
+class TestFakeIGInProcess:
+    """The fake also serves httpx clients through MockTransport."""
+
+    @pytest.mark.unit
+    def test_latency_distributions(self):
+        """Samples follow the configured distribution."""
+        rng = random.Random(0)
+        assert Latency(0.05).sample(rng) == 0.05
+        uniform = [Latency(0.05, 0.01, "uniform").sample(rng) for _ in range(1000)]
+        assert 0.04 <= min(uniform) and max(uniform) <= 0.06
+        lognormal = [Latency(0.02, 0.5, "lognormal").sample(rng) for _ in range(2000)]
+        assert statistics.median(lognormal) == pytest.approx(0.02, rel=0.1)
+        with pytest.raises(ValueError):
+            Latency(0.1, distribution="pareto").sample(rng)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_client(self):
+        """Async clients run against the handler, delayed per resource."""
+        fake = FakeIG(FakeIGConfig(endpoint_latency={"markets": Latency(0.05)}))
+        transport = httpx.MockTransport(fake.async_handler)
+        base_url = f"https://fake-ig{BASE_PATH}"
+
+        async with AsyncIGClient(
+            base_url, "api-key", "user", "password", transport=transport
+        ) as client:
+            start = time.perf_counter()
+            accounts = await client.accounts.get_accounts()
+            fast = time.perf_counter() - start
+            start = time.perf_counter()
+            await client.markets.get_market(EPIC)
+            slow = time.perf_counter() - start
+
+        assert accounts.accounts[0].accountId == "FAKE01"
+        assert fast < 0.05 <= slow
@@ -0,0 +1,206 @@
+"""
+Unit tests for bulk market snapshots over GET /markets.
+"""
+
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+
+from api_gateway.ig_client.aio import (
+    MAX_EPICS_PER_REQUEST,
+    AsyncIGClient,
+    MarketSnapshotPoller,
+)
+from api_gateway.ig_client.core.exceptions import IGValidationError
+from api_gateway.ig_client.core.snapshot_columns import parse_snapshot_columns
+
+BASE_URL = "https://demo-api.ig.com/gateway/deal"
+
+
+def _epic(i):
+    return f"CS.D.EP{i:03d}.CFD.IP"
+
+
+def _market(epic):
+    number = int(epic[7:10])
+    return {
+        "instrument": {"epic": epic, "name": f"Market {number}"},
+        "snapshot": {
+            "marketStatus": "TRADEABLE",
+            "bid": float(number),
+            "offer": number + 0.5,
+            "high": number + 1.0,
+            "low": number - 1.0,
+            "netChange": 0.25,
+            "percentageChange": None,
+            "updateTime": "12:00:00",
+        },
+    }
+
+
+class FakeMarkets:
+    """MockTransport handler for /session, /markets and /watchlists."""
+
+    def __init__(self, unknown=()):
+        self.unknown = set(unknown)
+        self.market_requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/session"):
+            return httpx.Response(
+                200, headers={"CST": "cst", "X-SECURITY-TOKEN": "xst"}, json={}
+            )
+        if path.endswith("/watchlists"):
+            return httpx.Response(
+                200,
+                json={
+                    "watchlists": [
+                        {
+                            "id": wid,
+                            "name": wid,
+                            "defaultSystemWatchlist": False,
+                            "deleteable": True,
+                            "editable": True,
+                        }
+                        for wid in ("w1", "w2")
+                    ]
+                },
+            )
+        if "/watchlists/" in path:
+            numbers = range(0, 3) if path.endswith("w1") else range(2, 5)
+            return httpx.Response(
+                200,
+                json={
+                    "markets": [
+                        {
+                            "epic": _epic(i),
+                            "instrumentName": f"Market {i}",
+                            "instrumentType": "CURRENCIES",
+                        }
+                        for i in numbers
+                    ]
+                },
+            )
+
+        epics = request.url.params["epics"].split(",")
+        self.market_requests.append(epics)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        markets = [_market(epic) for epic in epics if epic not in self.unknown]
+        # IG does not promise the request order
+        return httpx.Response(200, json={"marketDetails": markets[::-1]})
+
+
+def _client(fake):
+    return AsyncIGClient(
+        BASE_URL, "api-key", "user", "password", transport=httpx.MockTransport(fake)
+    )
+
+
+class TestMarketSnapshotPoller:
+    """Epic sets are chunked, fetched concurrently and stacked in order."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chunked_concurrent_fetch(self):
+        """120 epics take three concurrent requests of at most 50 epics."""
+        fake = FakeMarkets(unknown={_epic(7)})
+        epics = [_epic(i) for i in range(120)] + [_epic(3)]
+
+        async with _client(fake) as ig:
+            table = await MarketSnapshotPoller(ig).fetch(epics)
+
+        assert sorted(len(chunk) for chunk in fake.market_requests) == [20, 50, 50]
+        assert max(len(chunk) for chunk in fake.market_requests) <= (
+            MAX_EPICS_PER_REQUEST
+        )
+        assert fake.max_in_flight == 3
+        expected = [_epic(i) for i in range(120) if i != 7]
+        assert table.epics.tolist() == expected
+        np.testing.assert_array_equal(
+            table["bid"], [float(i) for i in range(120) if i != 7]
+        )
+        assert np.isnan(table["percentageChange"]).all()
+
+        frame = table.to_frame()
+        assert frame.index.name == "epic"
+        assert frame.loc[_epic(5), "offer"] == 5.5
+        assert frame.loc[_epic(5), "marketStatus"] == "TRADEABLE"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrency_bound(self):
+        """No more than max_concurrency chunks are in flight."""
+        fake = FakeMarkets()
+        async with _client(fake) as ig:
+            poller = MarketSnapshotPoller(ig, chunk_size=10, max_concurrency=2)
+            table = await poller.fetch(_epic(i) for i in range(55))
+
+        assert len(fake.market_requests) == 6
+        assert fake.max_in_flight == 2
+        assert len(table) == 55
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_watchlist_epics(self):
+        """Epics come from the given or all watchlists, without duplicates."""
+        fake = FakeMarkets()
+        async with _client(fake) as ig:
+            poller = MarketSnapshotPoller(ig)
+            assert await poller.watchlist_epics(["w1"]) == [_epic(i) for i in range(3)]
+            table = await poller.fetch_watchlists()
+
+        assert table.epics.tolist() == [_epic(i) for i in range(5)]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_poll_rounds(self):
+        """poll yields one table per round."""
+        fake = FakeMarkets()
+        async with _client(fake) as ig:
+            poller = MarketSnapshotPoller(ig)
+            tables = [t async for t in poller.poll([_epic(1)], interval=0, rounds=3)]
+
+        assert len(tables) == 3
+        assert len(fake.market_requests) == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalid_input(self):
+        """Malformed epics fail before any request; bad sizes are rejected."""
+        fake = FakeMarkets()
+        async with _client(fake) as ig:
+            with pytest.raises(IGValidationError):
+                await MarketSnapshotPoller(ig).fetch([_epic(1), "bad epic"])
+            with pytest.raises(ValueError):
+                MarketSnapshotPoller(ig, chunk_size=MAX_EPICS_PER_REQUEST + 1)
+
+        assert fake.market_requests == []
+
+
+class TestParseSnapshotColumns:
+    """Raw GET /markets bodies parse into columns."""
+
+    @pytest.mark.unit
+    def test_malformed_body(self):
+        """Missing marketDetails or snapshots raise IGValidationError."""
+        with pytest.raises(IGValidationError):
+            parse_snapshot_columns({"markets": []})
+        with pytest.raises(IGValidationError):
+            parse_snapshot_columns({"marketDetails": [{"instrument": {"epic": "x"}}]})
+
+    @pytest.mark.unit
+    def test_empty(self):
+        """An empty response gives an empty table."""
+        table = parse_snapshot_columns({"marketDetails": []})
+        assert len(table) == 0
+        assert table.to_frame().empty
@@ -0,0 +1,154 @@
+"""
+Unit tests for the raw (columnar) mode of the IG price endpoints.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from api_gateway.ig_client.clients.markets import MarketsClient
+from api_gateway.ig_client.core.exceptions import IGValidationError
+from api_gateway.ig_client.core.models.markets.ig_responses import (
+    SimpleHistoricalPrices,
+)
+from api_gateway.ig_client.core.price_columns import (
+    PRICE_FIELDS,
+    PriceColumns,
+    parse_price_columns,
+)
+
+
+@pytest.fixture
+def prices_response():
+    """Two daily bars; the second lacks a closing ask and a volume."""
+
+    def price(bid, ask):
+        return {"bid": bid, "ask": ask, "lastTraded": None}
+
+    return {
+        "allowance": {
+            "allowanceExpiry": 600,
+            "remainingAllowance": 9998,
+            "totalAllowance": 10000,
+        },
+        "instrumentType": "INDICES",
+        "prices": [
+            {
+                "snapshotTime": "2024/01/02 00:00:00",
+                "openPrice": price(100.0, 101.0),
+                "highPrice": price(110.5, 111.5),
+                "lowPrice": price(95.25, 96.25),
+                "closePrice": price(105.0, 106.0),
+                "lastTradedVolume": 1200,
+            },
+            {
+                "snapshotTime": "2024/01/03 00:00:00",
+                "openPrice": price(105.0, 106.0),
+                "highPrice": price(107.0, 108.0),
+                "lowPrice": price(104.0, 105.0),
+                "closePrice": {"bid": 106.5},
+            },
+        ],
+    }
+
+
+class TestParsePriceColumns:
+    """JSON bodies become one float array per field and side."""
+
+    @pytest.mark.unit
+    def test_matches_validated_model(self, prices_response):
+        """Every value equals the one in the pydantic model."""
+        columns = parse_price_columns(prices_response)
+        model = SimpleHistoricalPrices(**prices_response).model_dump()
+
+        assert len(columns) == 2
+        for i, bar in enumerate(model["prices"]):
+            for name in PRICE_FIELDS:
+                for side in ("bid", "ask", "lastTraded"):
+                    expected = (bar[name] or {}).get(side)
+                    value = columns.price(name, side)[i]
+                    assert np.isnan(value) if expected is None else value == expected, (
+                        i,
+                        name,
+                        side,
+                    )
+        assert columns.volume[0] == 1200 and np.isnan(columns.volume[1])
+        assert (
+            columns.timestamps.tolist()
+            == np.array(["2024-01-02", "2024-01-03"], dtype="datetime64[ns]").tolist()
+        )
+        assert columns.instrument_type == "INDICES"
+        assert columns.allowance["remainingAllowance"] == 9998
+        np.testing.assert_allclose(columns.mid("openPrice"), [100.5, 105.5])
+
+    @pytest.mark.unit
+    def test_to_frame(self, prices_response):
+        """The frame has one column per field/side plus volume."""
+        frame = parse_price_columns(prices_response).to_frame()
+
+        assert len(frame) == 2
+        assert frame.columns[0] == "timestamp"
+        assert "closePrice.ask" in frame.columns
+        assert frame["lastTradedVolume"].iloc[0] == 1200
+
+    @pytest.mark.unit
+    def test_invalid_timestamp_is_nat(self, prices_response):
+        """Unparseable snapshot times give NaT instead of failing the batch."""
+        prices_response["prices"][1]["snapshotTime"] = "yesterday"
+
+        columns = parse_price_columns(prices_response)
+
+        assert np.isnat(columns.timestamps[1])
+        assert columns.snapshot_time[1] == "yesterday"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {},
+            {"prices": "none"},
+            {"prices": [{"snapshotTime": "2024/01/02 00:00:00", "openPrice": 1}]},
+            {"prices": [{"openPrice": {"bid": "abc"}}]},
+        ],
+    )
+    def test_malformed_body(self, body):
+        """Malformed bodies raise IGValidationError."""
+        with pytest.raises(IGValidationError):
+            parse_price_columns(body)
+
+
+class TestMarketsClientRawMode:
+    """raw=True skips the models; the default mode still validates."""
+
+    @pytest.mark.unit
+    def test_raw_and_validated_modes(self, prices_response):
+        """Both endpoints return PriceColumns when raw."""
+        rest = Mock()
+        rest.get.return_value = prices_response
+        client = MarketsClient(rest=rest)
+
+        by_points = client.get_prices_by_points(
+            "IX.D.NASDAQ.IFE.IP", "DAY", 2, raw=True
+        )
+        by_range = client.get_prices_by_date_range(
+            "IX.D.NASDAQ.IFE.IP", "DAY", "01-01-2024", "04-01-2024", raw=True
+        )
+        validated = client.get_prices_by_points("IX.D.NASDAQ.IFE.IP", "DAY", 2)
+
+        assert isinstance(by_points, PriceColumns)
+        assert isinstance(by_range, PriceColumns)
+        assert isinstance(validated, SimpleHistoricalPrices)
+        rest.get.assert_called_with(
+            endpoint="/prices/IX.D.NASDAQ.IFE.IP/DAY/2", version="2"
+        )
+
+    @pytest.mark.unit
+    def test_raw_mode_validates_inputs(self):
+        """Path parameters are validated before any request."""
+        rest = Mock()
+        client = MarketsClient(rest=rest)
+
+        with pytest.raises(IGValidationError):
+            client.get_prices_by_points("IX.D.NASDAQ.IFE.IP", "YEAR", 2, raw=True)
+        rest.get.assert_not_called()
@@ -0,0 +1,119 @@
+"""
+Unit tests for per-endpoint-class rate limiting with priority lanes.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from api_gateway.ig_client.rate_limits import (
+    DATA_LANE,
+    DEALING_LANE,
+    HISTORICAL,
+    NON_TRADING,
+    TRADING,
+    IGRateLimits,
+    endpoint_class,
+    request_lane,
+)
+from api_gateway.ig_client.rest import IGRest
+from common.resilience import PriorityRateLimiter
+
+BASE_URL = "https://demo-api.ig.com/gateway/deal"
+
+
+class TestEndpointClasses:
+    """Requests map to IG's rate-limit classes and priority lanes."""
+
+    @pytest.mark.unit
+    def test_classes(self):
+        """Dealing writes are trading, prices historical, the rest non-trading."""
+        assert endpoint_class("POST", "/positions/otc") == TRADING
+        assert endpoint_class("DELETE", "/positions/otc") == TRADING
+        assert endpoint_class("PUT", "/workingorders/otc/DI1") == TRADING
+        assert endpoint_class("GET", "/positions") == NON_TRADING
+        assert endpoint_class("GET", "/confirms/REF") == NON_TRADING
+        assert endpoint_class("PUT", "/watchlists/1") == NON_TRADING
+        assert endpoint_class("GET", "/prices/CS.D.GBPUSD.TODAY.IP/DAY/10") == (
+            HISTORICAL
+        )
+
+    @pytest.mark.unit
+    def test_lanes(self):
+        """Positions, working orders and confirmations are in the dealing lane."""
+        assert request_lane("/confirms/REF") == DEALING_LANE
+        assert request_lane("/workingorders") == DEALING_LANE
+        assert request_lane("/markets?epics=A") == DATA_LANE
+        assert request_lane("/prices/X") == DATA_LANE
+
+
+class TestPriorityRateLimiter:
+    """Waiters are served by lane, then by arrival."""
+
+    @pytest.mark.unit
+    def test_dealing_lane_preempts_data(self):
+        """A dealing call queued after data calls gets the next slot."""
+        limiter = PriorityRateLimiter(max_calls=1, period_seconds=0.1)
+        limiter.acquire()
+        order = []
+
+        def call(name, lane):
+            limiter.acquire(lane)
+            order.append(name)
+
+        threads = [
+            threading.Thread(target=call, args=(f"data-{i}", DATA_LANE))
+            for i in range(2)
+        ]
+        threads.append(threading.Thread(target=call, args=("deal", DEALING_LANE)))
+        for thread in threads:
+            thread.start()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+
+        assert order == ["deal", "data-0", "data-1"]
+        metrics = limiter.metrics()
+        assert metrics["acquired"] == 4
+        assert metrics["waiting"] == 0
+        assert metrics["wait_seconds"] >= 0.2
+
+    @pytest.mark.unit
+    def test_try_acquire(self):
+        """try_acquire never blocks and does not jump the queue."""
+        limiter = PriorityRateLimiter(max_calls=2, period_seconds=60)
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.get_remaining_calls() == 0
+        assert limiter.metrics()["used"] == 2
+
+
+class TestIGRestRouting:
+    """IGRest draws each request from the buckets of its class."""
+
+    @pytest.mark.unit
+    def test_buckets_and_metrics(self):
+        """Trading, non-trading and price requests use separate buckets."""
+        auth = Mock()
+        auth.get_headers.return_value = {"CST": "cst", "X-SECURITY-TOKEN": "xst"}
+        rest = IGRest(BASE_URL, auth, rate_limits=IGRateLimits())
+        rest.client = httpx.Client(
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        )
+
+        rest.post("/positions/otc", "2", data={})
+        rest.post("/positions/otc", "1", data={}, override_method="DELETE")
+        rest.get("/confirms/REF", "1")
+        rest.get("/prices/CS.D.GBPUSD.TODAY.IP/DAY/10", "2")
+
+        metrics = rest.rate_limit_metrics()
+        assert metrics[TRADING]["used"] == 2
+        assert metrics[NON_TRADING]["used"] == 2
+        assert metrics[HISTORICAL]["used"] == 1
+        assert metrics[HISTORICAL]["remaining"] == 19
+        assert IGRest(BASE_URL, auth).rate_limit_metrics() == {}
@@ -0,0 +1,176 @@
+"""
+Unit tests for the IG GET response cache.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from api_gateway.ig_client.response_cache import (
+    CachePolicy,
+    IGResponseCache,
+    request_target,
+)
+from api_gateway.ig_client.rest import IGRest
+
+BASE_URL = "https://demo-api.ig.com/gateway/deal"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_fetch(calls):
+    def fetch():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    return fetch
+
+
+class TestResponseCache:
+    """Policies, TTLs, bounds and single-flight."""
+
+    @pytest.mark.unit
+    def test_policies(self):
+        """Reference data is cacheable; prices, dealing and snapshots are not."""
+        cache = IGResponseCache()
+        assert cache.policy_for("/accounts").ttl == 60
+        assert cache.policy_for("/markets/CS.D.GBPUSD.TODAY.IP") is not None
+        assert cache.policy_for(request_target("/markets", {"searchTerm": "FTSE"}))
+        assert cache.policy_for("/watchlists/123") is not None
+        assert cache.policy_for(request_target("/markets", {"epics": "A,B"})) is None
+        assert cache.policy_for("/prices/CS.D.GBPUSD.TODAY.IP/DAY/10") is None
+        assert cache.policy_for("/positions") is None
+        assert cache.policy_for("/confirms/REF") is None
+
+    @pytest.mark.unit
+    def test_ttl_and_stale_while_revalidate(self):
+        """Fresh entries hit, stale ones are served while refreshed once."""
+        clock = FakeClock()
+        cache = IGResponseCache([CachePolicy("/a", ttl=10, stale_ttl=20)], clock=clock)
+        calls = []
+        refreshed = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            if len(calls) > 1:
+                refreshed.wait(1)
+            return {"n": len(calls)}
+
+        assert cache.get("a", "/a", fetch) == {"n": 1}
+        clock.now = 5
+        assert cache.get("a", "/a", fetch) == {"n": 1}
+        clock.now = 15
+        assert cache.get("a", "/a", fetch) == {"n": 1}
+        assert cache.get("a", "/a", fetch) == {"n": 1}
+        refreshed.set()
+        for _ in range(100):
+            if cache.get("a", "/a", fetch) == {"n": 2}:
+                break
+            time.sleep(0.01)
+        assert cache.get("a", "/a", fetch) == {"n": 2}
+        assert len(calls) == 2
+        assert cache.stats.stale_hits >= 2
+        assert cache.stats.refreshes == 1
+
+        clock.now = 100
+        assert cache.get("a", "/a", fetch) == {"n": 3}
+        assert cache.get("b", "/b", fetch) == {"n": 4}
+        assert cache.get("b", "/b", fetch) == {"n": 5}
+
+    @pytest.mark.unit
+    def test_single_flight(self):
+        """Concurrent misses share one fetch; errors are not cached."""
+        cache = IGResponseCache([CachePolicy("/a", ttl=60)])
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return {"markets": [1, 2]}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("a", "/a", fetch)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"markets": [1, 2]}] * 8
+        results[0]["markets"].append(3)
+        assert cache.get("a", "/a", fetch) == {"markets": [1, 2]}
+
+        def fail():
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            cache.get("b", "/a", fail)
+        assert len(cache) == 1
+
+    @pytest.mark.unit
+    def test_bounded_and_invalidated(self):
+        """Least recently used entries are evicted; writes drop their resource."""
+        cache = IGResponseCache(max_entries=2)
+        calls = []
+        fetch = _counting_fetch(calls)
+        cache.get("w1", "/watchlists/1", fetch)
+        cache.get("acc", "/accounts", fetch)
+        cache.get("w1", "/watchlists/1", fetch)
+        cache.get("w2", "/watchlists/2", fetch)
+        assert cache.stats.evictions == 1
+        assert len(calls) == 3
+
+        assert cache.invalidate_for("GET", "/watchlists") == 0
+        assert cache.invalidate_for("PUT", "/watchlists/1") == 2
+        cache.get("acc", "/accounts", fetch)
+        assert cache.invalidate_for("POST", "/positions/otc") == 1
+        assert len(cache) == 0
+
+
+class TestIGRestCache:
+    """IGRest serves cacheable GETs from the cache."""
+
+    @pytest.mark.unit
+    def test_rest_caches_reference_gets(self):
+        """Accounts are fetched once; prices and dealing always go out."""
+        auth = Mock()
+        auth.identifier = "user"
+        auth.get_headers.return_value = {"CST": "cst", "X-SECURITY-TOKEN": "xst"}
+        requests = []
+
+        def handler(request):
+            requests.append(f"{request.method} {request.url.path}")
+            return httpx.Response(200, json={"accounts": []})
+
+        cache = IGResponseCache()
+        rest = IGRest(BASE_URL, auth, response_cache=cache)
+        rest.client = httpx.Client(
+            base_url=BASE_URL, transport=httpx.MockTransport(handler)
+        )
+
+        for _ in range(3):
+            assert rest.get("/accounts", "1") == {"accounts": []}
+            rest.get("/prices/CS.D.GBPUSD.TODAY.IP/DAY/10", "2")
+        rest.post("/positions/otc", "2", data={})
+        rest.get("/accounts", "1")
+
+        assert requests.count("GET /gateway/deal/accounts") == 2
+        assert (
+            requests.count("GET /gateway/deal/prices/CS.D.GBPUSD.TODAY.IP/DAY/10") == 3
+        )
+        assert cache.stats.hits == 2
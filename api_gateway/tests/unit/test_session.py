@@ -0,0 +1,226 @@
+"""
+Unit tests for persistent IG sessions, re-login near expiry and 401 replay.
+"""
+
+import asyncio
+import os
+import stat
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from api_gateway.ig_client.aio import AsyncIGClient
+from api_gateway.ig_client.auth import IGAuthenticator
+from api_gateway.ig_client.core.exceptions import IGAuthenticationError
+from api_gateway.ig_client.rest import IGRest
+from api_gateway.ig_client.session_store import SessionTokenStore
+
+BASE_URL = "https://demo-api.ig.com/gateway/deal"
+
+
+class FakeSessions:
+    """MockTransport handler issuing numbered sessions; rejects revoked ones."""
+
+    def __init__(self):
+        self.logins = 0
+        self.revoked = set()
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/session"):
+            self.logins += 1
+            return httpx.Response(
+                200,
+                headers={"CST": f"cst-{self.logins}", "X-SECURITY-TOKEN": "xst"},
+                json={},
+            )
+        self.requests.append(request)
+        if request.headers.get("CST") in self.revoked:
+            return httpx.Response(
+                401, json={"errorCode": "error.security.client-token-invalid"}
+            )
+        return httpx.Response(200, json={"cst": request.headers.get("CST")})
+
+
+def _authenticator(store=None, **kwargs):
+    return IGAuthenticator(
+        BASE_URL, "api-key", "user", "password", token_store=store, **kwargs
+    )
+
+
+def _login_via(auth, client):
+    """Patch auth.login to post through the mock-transport client"""
+    original_login = IGAuthenticator.login
+    return patch.object(
+        auth, "login", side_effect=lambda client_=None: original_login(auth, client)
+    )
+
+
+def _rest(fake, auth):
+    client = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(fake))
+    auth.login(client=client)
+    rest = IGRest(BASE_URL, auth)
+    rest.client = client
+    return rest
+
+
+class TestSessionTokenStore:
+    """Tokens persist per account with their expiry, privately."""
+
+    @pytest.mark.unit
+    def test_round_trip(self, tmp_path):
+        """Only session tokens are written, readable by the owner only."""
+        store = SessionTokenStore(tmp_path / "sessions")
+        key = SessionTokenStore.account_key(BASE_URL, "user")
+        tokens = {"X-IG-API-KEY": "api-key", "CST": "cst", "X-SECURITY-TOKEN": "xst"}
+
+        store.save(key, tokens, 123.0)
+
+        assert store.load(key) == ({"CST": "cst", "X-SECURITY-TOKEN": "xst"}, 123.0)
+        (path,) = (tmp_path / "sessions").glob("*.json")
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert "api-key" not in path.read_text()
+        assert SessionTokenStore.account_key("https://api.ig.com", "user") != key
+
+    @pytest.mark.unit
+    def test_delete_only_matching(self, tmp_path):
+        """A newer session stored by another process is not deleted."""
+        store = SessionTokenStore(tmp_path)
+        store.save("k", {"CST": "new", "X-SECURITY-TOKEN": "x"}, 1.0)
+
+        store.delete("k", {"CST": "old", "X-SECURITY-TOKEN": "x"})
+        assert store.load("k") is not None
+
+        store.delete("k", {"CST": "new", "X-SECURITY-TOKEN": "x"})
+        assert store.load("k") is None
+
+    @pytest.mark.unit
+    def test_unreadable_file_ignored(self, tmp_path):
+        """A corrupt token file means no stored session."""
+        store = SessionTokenStore(tmp_path)
+        (tmp_path / "k.json").write_text("{not json")
+        assert store.load("k") is None
+
+
+class TestIGAuthenticatorSessions:
+    """Stored sessions are reused and replaced when close to expiry."""
+
+    @pytest.mark.unit
+    def test_stored_session_reused(self, tmp_path):
+        """A second authenticator adopts the stored session without logging in."""
+        fake = FakeSessions()
+        store = SessionTokenStore(tmp_path)
+        client = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(fake))
+        _authenticator(store).login(client=client)
+
+        auth = _authenticator(store)
+        with patch.object(auth, "login") as login:
+            headers = auth.get_headers()
+
+        login.assert_not_called()
+        assert headers["CST"] == "cst-1"
+        assert headers["X-IG-API-KEY"] == "api-key"
+
+    @pytest.mark.unit
+    def test_relogin_near_expiry(self, tmp_path):
+        """The next request within the refresh margin of expiry logs in again."""
+        store = SessionTokenStore(tmp_path)
+        auth = _authenticator(store, session_ttl=600, refresh_margin=60)
+        key = SessionTokenStore.account_key(BASE_URL, "user")
+        store.save(key, {"CST": "old", "X-SECURITY-TOKEN": "x"}, time.time() + 30)
+
+        with patch.object(auth, "login", return_value={"CST": "new"}) as login:
+            assert auth.get_headers() == {"CST": "new"}
+
+        login.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_alogin_uses_transport(self):
+        """alogin without a client posts through the configured transport."""
+        fake = FakeSessions()
+        auth = _authenticator(transport=httpx.MockTransport(fake))
+
+        tokens = await auth.alogin()
+
+        assert fake.logins == 1
+        assert tokens["CST"] == "cst-1"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_alogin_rejects_sync_transport(self):
+        """A sync-only transport cannot back a temporary async client."""
+        auth = _authenticator(transport=httpx.HTTPTransport())
+
+        with pytest.raises(TypeError):
+            await auth.alogin()
+
+    @pytest.mark.unit
+    def test_invalidate_ignores_replaced_session(self):
+        """Invalidating a stale session keeps the newer one."""
+        auth = _authenticator()
+        auth.tokens = {"CST": "new"}
+
+        auth.invalidate({"CST": "old"})
+        assert auth.tokens == {"CST": "new"}
+
+        auth.invalidate({"CST": "new"})
+        assert auth.tokens == {}
+
+
+class TestReloginOn401:
+    """A rejected session is replaced and the request replayed once."""
+
+    @pytest.mark.unit
+    def test_replay_after_relogin(self, tmp_path):
+        """The caller sees the replayed response, not the 401."""
+        fake = FakeSessions()
+        store = SessionTokenStore(tmp_path)
+        auth = _authenticator(store)
+        rest = _rest(fake, auth)
+        fake.revoked.add("cst-1")
+
+        with _login_via(auth, rest.client):
+            result = rest.get("/accounts", "1")
+
+        assert result == {"cst": "cst-2"}
+        assert [r.headers["CST"] for r in fake.requests] == ["cst-1", "cst-2"]
+        stored = store.load(SessionTokenStore.account_key(BASE_URL, "user"))
+        assert stored[0]["CST"] == "cst-2"
+
+    @pytest.mark.unit
+    def test_second_401_raises(self):
+        """A replay rejected again raises IGAuthenticationError."""
+        fake = FakeSessions()
+        auth = _authenticator()
+        rest = _rest(fake, auth)
+        fake.revoked.update({"cst-1", "cst-2"})
+        with _login_via(auth, rest.client):
+            with pytest.raises(IGAuthenticationError):
+                rest.get("/accounts", "1")
+
+        assert len(fake.requests) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_replay(self):
+        """Concurrent async requests rejected together share one new login."""
+        fake = FakeSessions()
+        async with AsyncIGClient(
+            BASE_URL,
+            "api-key",
+            "user",
+            "password",
+            transport=httpx.MockTransport(fake),
+        ) as ig:
+            await ig.rest.get("/accounts", "1")
+            fake.revoked.add("cst-1")
+
+            results = await asyncio.gather(
+                *(ig.rest.get("/accounts", "1") for _ in range(5))
+            )
+
+        assert results == [{"cst": "cst-2"}] * 5
+        assert fake.logins == 2
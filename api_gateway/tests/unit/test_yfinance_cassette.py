@@ -0,0 +1,72 @@
+"""
+Unit tests for recording and replaying YFinance ticker calls with a cassette.
+"""
+
+import pytest
+
+pytest.importorskip("yfinance")
+
+from api_gateway.yfinance_client import rest  # noqa: E402
+from common.cassette import RECORD_MISSING, REPLAY, Cassette  # noqa: E402
+
+SYMBOL = "AAPL"
+
+
+class FakeTicker:
+    """yfinance.Ticker stand-in counting property reads and method calls."""
+
+    def __init__(self, symbol, **kwargs):
+        self.ticker = symbol
+        self.reads = []
+
+    @property
+    def calendar(self):
+        self.reads.append("calendar")
+        return {"earnings": "2024-01-25"}
+
+    @property
+    def dividends(self):
+        self.reads.append("dividends")
+        return [0.24, 0.25]
+
+    def get_news(self, count=10):
+        self.reads.append("get_news")
+        return [f"news {i}" for i in range(count)]
+
+
+@pytest.fixture
+def fake_ticker(monkeypatch):
+    """Make YFinanceRest.Ticker wrap FakeTicker instances."""
+    monkeypatch.setattr(rest.yf, "Ticker", FakeTicker)
+
+
+class TestYFinanceCassette:
+    """Ticker properties and methods are recorded under their own names."""
+
+    @pytest.mark.unit
+    def test_properties_recorded_by_name(self, tmp_path, fake_ticker):
+        """Each property gets its own entry and is only read when fetched."""
+        client = rest.YFinanceRest(cassette=Cassette(tmp_path, RECORD_MISSING))
+        ticker = client.Ticker(SYMBOL)
+
+        assert ticker.calendar == {"earnings": "2024-01-25"}
+        assert ticker.dividends == [0.24, 0.25]
+        assert ticker.get_news(count=2) == ["news 0", "news 1"]
+        assert ticker.calendar == {"earnings": "2024-01-25"}
+        assert ticker._ticker.reads == ["calendar", "dividends", "get_news"]
+
+        replay = rest.YFinanceRest(cassette=Cassette(tmp_path, REPLAY))
+        ticker = replay.Ticker(SYMBOL)
+        assert ticker.dividends == [0.24, 0.25]
+        assert ticker.calendar == {"earnings": "2024-01-25"}
+        assert ticker.get_news(count=2) == ["news 0", "news 1"]
+        assert ticker._ticker.reads == []
+
+    @pytest.mark.unit
+    def test_missing_attribute(self, fake_ticker):
+        """Unknown attributes raise AttributeError without a ticker call."""
+        ticker = rest.YFinanceRest().Ticker(SYMBOL)
+
+        with pytest.raises(AttributeError):
+            ticker.no_such_attribute
+        assert ticker._ticker.reads == []
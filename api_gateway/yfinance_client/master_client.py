@@ -7,6 +7,7 @@ Main client interface for YFinance API.
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from common.cassette import Cassette
     from common.resilience import RateLimiter, CircuitBreaker, RetryConfig
 
 from .rest import YFinanceRest
@@ -24,6 +25,7 @@ class YFinanceClient:
         rate_limiter: Optional["RateLimiter"] = None,
         circuit_breaker: Optional["CircuitBreaker"] = None,
         retry_config: Optional["RetryConfig"] = None,
+        cassette: Optional["Cassette"] = None,
     ):
         """
         Initialize YFinance client.
@@ -32,9 +34,11 @@ class YFinanceClient:
             rate_limiter: Optional rate limiter instance
             circuit_breaker: Optional circuit breaker instance
             retry_config: Optional retry configuration
+            cassette: Optional record/replay store of ticker call results
         """
         self.rest = YFinanceRest(
             rate_limiter=rate_limiter,
             circuit_breaker=circuit_breaker,
             retry_config=retry_config,
+            cassette=cassette,
         )
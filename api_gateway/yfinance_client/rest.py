@@ -4,11 +4,14 @@ YFinance REST API Client
 Thin wrapper around yfinance library with resilience features.
 """
 
+import inspect
 import logging
+from functools import partial
 from typing import Optional, Callable, Any, TYPE_CHECKING
 
 import yfinance as yf
 
+from common.cassette import Cassette, CassetteMissError
 from common.resilience import (
     CircuitBreaker,
     RateLimiter,
@@ -29,6 +32,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for attributes the ticker does not have
+_MISSING = object()
+
 
 class YFinanceRest:
     """
@@ -42,6 +48,7 @@ class YFinanceRest:
         rate_limiter: Optional["RateLimiter"] = None,
         circuit_breaker: Optional[CircuitBreaker] = None,
         retry_config: Optional[RetryConfig] = None,
+        cassette: Optional[Cassette] = None,
     ):
         """
         Initialize YFinance REST client wrapper.
@@ -50,10 +57,12 @@ class YFinanceRest:
             rate_limiter: Optional rate limiter instance
             circuit_breaker: Optional circuit breaker instance
             retry_config: Optional retry configuration
+            cassette: Optional record/replay store of ticker call results
         """
         self.rate_limiter = rate_limiter
         self.circuit_breaker = circuit_breaker
         self.retry_config = retry_config
+        self.cassette = cassette
 
     def _with_resilience(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -82,6 +91,36 @@ class YFinanceRest:
         else:
             return _execute()
 
+    def _recorded(self, symbol: str, name: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        _with_resilience, replayed from or recorded to the cassette if set.
+
+        History relative to now (a period, or no end date) is fetched again
+        unless the cassette is replay-only.
+
+        Args:
+            symbol: Ticker symbol the call is for
+            name: Ticker method or property name (part of the cassette key)
+            func: Callable performing the ticker call
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Function result
+        """
+        if self.cassette is None:
+            return self._with_resilience(func, *args, **kwargs)
+        key = Cassette.key(
+            "yfinance", symbol, name, args, tuple(sorted(kwargs.items()))
+        )
+        relative = name == "history" and not ("start" in kwargs and "end" in kwargs)
+        return self.cassette.play(
+            key,
+            lambda: self._with_resilience(func, *args, **kwargs),
+            f"yfinance {symbol} {name}",
+            refresh=relative,
+        )
+
     def _handle_exception(self, e: Exception) -> None:
         """
         Convert library exceptions to custom exceptions.
@@ -92,6 +131,9 @@ class YFinanceRest:
         Raises:
             Appropriate YFinanceAPIError subclass
         """
+        if isinstance(e, CassetteMissError):
+            return
+
         error_str = str(e).lower()
 
         if "404" in error_str or "not found" in error_str:
@@ -123,7 +165,9 @@ class YFinanceRest:
             Ticker object with wrapped methods
         """
         ticker = yf.Ticker(symbol, **kwargs)
-        return _ResilientTicker(ticker, self._with_resilience, self._handle_exception)
+        return _ResilientTicker(
+            ticker, partial(self._recorded, symbol), self._handle_exception
+        )
 
 
 class _ResilientTicker:
@@ -139,7 +183,9 @@ class _ResilientTicker:
     def history(self, *args, **kwargs):
         """Get historical data with resilience"""
         try:
-            return self._with_resilience(self._ticker.history, *args, **kwargs)
+            return self._with_resilience(
+                "history", self._ticker.history, *args, **kwargs
+            )
         except Exception as e:
             self._handle_exception(e)
             raise
@@ -153,7 +199,7 @@ class _ResilientTicker:
             def _get_info():
                 return self._ticker.info
 
-            return self._with_resilience(_get_info)
+            return self._with_resilience("info", _get_info)
         except Exception as e:
             self._handle_exception(e)
             raise
@@ -161,30 +207,33 @@ class _ResilientTicker:
     def __getattr__(self, name: str):
         """
         Delegate any other methods/attributes to the underlying ticker.
+
+        Properties are looked up without reading them, so that they are
+        only fetched (or replayed) through _with_resilience.
         """
-        if hasattr(self._ticker, name):
-            attr = getattr(self._ticker, name)
-            if callable(attr):
-
-                def wrapper(*args, **kwargs):
-                    try:
-                        return self._with_resilience(attr, *args, **kwargs)
-                    except Exception as e:
-                        self._handle_exception(e)
-                        raise
-
-                return wrapper
-            # For properties, wrap access in a lambda
-            else:
-
-                def _get_property():
-                    return attr
-
-                try:
-                    return self._with_resilience(_get_property)
-                except Exception as e:
-                    self._handle_exception(e)
-                    raise
-        raise AttributeError(
-            f"'{self.__class__.__name__}' object has no attribute '{name}'"
-        )
+        static = inspect.getattr_static(self._ticker, name, _MISSING)
+        if static is _MISSING:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        if isinstance(static, property) or not callable(static):
+            # For properties, read the attribute inside the wrapped call
+            def _get_property():
+                return getattr(self._ticker, name)
+
+            try:
+                return self._with_resilience(name, _get_property)
+            except Exception as e:
+                self._handle_exception(e)
+                raise
+
+        attr = getattr(self._ticker, name)
+
+        def wrapper(*args, **kwargs):
+            try:
+                return self._with_resilience(name, attr, *args, **kwargs)
+            except Exception as e:
+                self._handle_exception(e)
+                raise
+
+        return wrapper
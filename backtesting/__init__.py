@@ -1,3 +1,4 @@
 """
-Backtesting utilities using backtrader.
+Backtesting utilities using backtrader, plus a vectorized engine for
+signal-driven strategies and multi-instrument portfolio backtests.
 """
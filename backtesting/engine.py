@@ -5,7 +5,8 @@ Backtesting engine wiring project strategies into backtrader.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Type, Protocol
+from typing import List, Dict, Any, Optional, Tuple, Type, Protocol
+import numpy as np
 import pandas as pd
 import backtrader as bt
 
@@ -34,6 +35,54 @@ class BacktestResult:
     starting_cash: float
     ending_cash: float
     return_pct: float
+    # Portfolio value per bar (filled by the vectorized engine)
+    equity_curve: Optional[pd.Series] = None
+    # Position held during each bar (filled by the vectorized engine)
+    positions: Optional[pd.Series] = None
+    # Executed orders: timestamp, size (signed units), price, commission
+    fills: Optional[pd.DataFrame] = None
+
+
+# Signal actions as compiled for per-bar dispatch
+_ACTIONS = {"BUY": 1, "SELL": -1}
+
+
+def _timestamps_ns(values: Any) -> np.ndarray:
+    """Timestamps (datetime-likes or ISO strings) as int64 nanoseconds"""
+    return pd.DatetimeIndex(pd.to_datetime(values)).as_unit("ns").asi8
+
+
+def compile_signals(
+    signals: Optional[pd.DataFrame], bar_timestamps: Any
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Map signals onto bar positions
+
+    Args:
+        signals: DataFrame with timestamp and signal_type columns
+        bar_timestamps: Timestamps of the bars, in feed order
+
+    Returns:
+        (bar positions, actions) int arrays ordered by bar; actions are +1
+        for BUY, -1 for SELL and 0 otherwise. Signals whose timestamp matches
+        no bar are dropped.
+    """
+    if signals is None or signals.empty:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)
+
+    bars = _timestamps_ns(bar_timestamps)
+    times = _timestamps_ns(signals["timestamp"])
+    actions = signals["signal_type"].map(_ACTIONS).fillna(0).to_numpy(dtype=np.int8)
+
+    order = np.argsort(bars, kind="stable")
+    sorted_bars = bars[order]
+    slots = np.searchsorted(sorted_bars, times)
+    matched = slots < len(bars)
+    matched[matched] = sorted_bars[slots[matched]] == times[matched]
+
+    positions = order[slots[matched]]
+    sequence = np.argsort(positions, kind="stable")
+    return positions[sequence], actions[matched][sequence]
 
 
 class SignalExecutionStrategy(bt.Strategy):
@@ -46,28 +95,39 @@ class SignalExecutionStrategy(bt.Strategy):
     def __init__(self):
         # signals_df expected sorted by timestamp (datetime64[ns])
         self.signals_df: pd.DataFrame = self.p.signals
+        # Compiled once so per-bar dispatch is an integer comparison
+        bars, actions = compile_signals(self.signals_df, self._bar_timestamps())
+        self._signal_bars: List[int] = bars.tolist()
+        self._signal_actions: List[int] = actions.tolist()
+        self._signal_count = len(self._signal_bars)
         self._signal_idx = 0
 
+    def _bar_timestamps(self) -> Any:
+        frame = self.data.p.dataname
+        column = self.data.p.datetime
+        if isinstance(column, str):
+            return frame[column]
+        return frame.index
+
     def next(self):
-        if self.signals_df is None or self.signals_df.empty:
+        if self._signal_idx >= self._signal_count:
             return
 
-        dt = self.data.datetime.datetime(0)
+        bar = len(self) - 1
 
-        # Process all signals matching current bar datetime
+        # Process all signals on the current bar
         while (
-            self._signal_idx < len(self.signals_df)
-            and pd.Timestamp(self.signals_df.iloc[self._signal_idx]["timestamp"]) == dt
+            self._signal_idx < self._signal_count
+            and self._signal_bars[self._signal_idx] == bar
         ):
-            signal = self.signals_df.iloc[self._signal_idx]
-            sig_type = signal["signal_type"]
+            action = self._signal_actions[self._signal_idx]
 
-            if sig_type == "BUY":
+            if action > 0:
                 if self.position.size <= 0:
                     if self.position.size < 0:
                         self.close()  # flatten shorts
                     self.buy(size=self.p.stake)
-            elif sig_type == "SELL":
+            elif action < 0:
                 if self.position.size >= 0:
                     if self.position.size > 0:
                         self.close()  # flatten longs
@@ -0,0 +1,302 @@
+"""
+Performance metrics of backtest results.
+
+Everything is computed with array operations on the equity curve, the
+per-bar positions and the fills recorded by the vectorized engine. Metrics
+needing data a result does not carry (e.g. fills from the backtrader engine)
+are NaN.
+
+Ratios are per bar unless periods_per_year is given (252 for daily bars).
+"""
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import BacktestResult
+
+Metric = Callable[[BacktestResult], float]
+
+TRADE_COLUMNS = [
+    "entry_time",
+    "exit_time",
+    "direction",
+    "size",
+    "entry_price",
+    "exit_price",
+    "pnl",
+    "return_pct",
+    "is_open",
+]
+
+
+def _equity(result: BacktestResult) -> Optional[np.ndarray]:
+    if result.equity_curve is None or result.equity_curve.empty:
+        return None
+    return result.equity_curve.to_numpy(dtype=np.float64)
+
+
+def _returns(result: BacktestResult) -> Optional[np.ndarray]:
+    equity = _equity(result)
+    if equity is None or len(equity) < 2:
+        return None
+    return np.diff(equity) / equity[:-1]
+
+
+def _annualize(ratio: float, periods_per_year: Optional[float]) -> float:
+    return ratio * np.sqrt(periods_per_year) if periods_per_year else ratio
+
+
+def sharpe_ratio(
+    result: BacktestResult, periods_per_year: Optional[float] = None
+) -> float:
+    """Mean over standard deviation of the bar returns"""
+    returns = _returns(result)
+    if returns is None:
+        return float("nan")
+    std = returns.std()
+    if std == 0:
+        return float("nan")
+    return float(_annualize(returns.mean() / std, periods_per_year))
+
+
+def sortino_ratio(
+    result: BacktestResult, periods_per_year: Optional[float] = None
+) -> float:
+    """Mean bar return over the downside deviation (root mean square of losses)"""
+    returns = _returns(result)
+    if returns is None:
+        return float("nan")
+    downside = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+    if downside == 0:
+        return float("nan")
+    return float(_annualize(returns.mean() / downside, periods_per_year))
+
+
+def drawdowns(result: BacktestResult) -> Tuple[float, int]:
+    """
+    Deepest drawdown and longest time under water
+
+    Returns:
+        (maximum drawdown as a fraction of the running peak, longest number
+        of bars spent below a previous peak)
+    """
+    equity = _equity(result)
+    if equity is None:
+        return float("nan"), 0
+    peaks = np.maximum.accumulate(equity)
+    bars = np.arange(len(equity))
+    # Bar of the running peak each bar is measured against
+    peak_bars = np.maximum.accumulate(np.where(equity >= peaks, bars, 0))
+    return float(((peaks - equity) / peaks).max()), int((bars - peak_bars).max())
+
+
+def trade_list(result: BacktestResult) -> pd.DataFrame:
+    """
+    Round-trip trades reconstructed from the fills
+
+    A trade runs from the fill that opens a position (from flat or by
+    reversing) to the fill that flattens or reverses it; fills in between
+    scale it. A position still held at the end is marked at the last close
+    and flagged is_open. A position held before the first fill (carried in)
+    has no known entry and is not listed.
+
+    Returns:
+        DataFrame with TRADE_COLUMNS, one row per trade
+    """
+    fills = result.fills
+    if fills is None or fills.empty:
+        return pd.DataFrame(columns=TRADE_COLUMNS)
+
+    size = fills["size"].to_numpy(dtype=np.float64)
+    price = fills["price"].to_numpy(dtype=np.float64)
+    fee = fills["commission"].to_numpy(dtype=np.float64)
+    times = pd.DatetimeIndex(fills["timestamp"]).as_unit("ns")
+
+    final = float(result.positions.iloc[-1]) if result.positions is not None else 0.0
+    initial = final - size.sum()
+    after = initial + np.cumsum(size)
+    before = after - size
+
+    # Split every fill into the part closing the current position and the
+    # part opening (or adding to) the next one
+    crosses = np.sign(after) != np.sign(before)
+    reduces = np.abs(after) < np.abs(before)
+    closing = np.where(crosses, -before, np.where(reduces, size, 0.0))
+    opening = size - closing
+    starts = (after != 0) & crosses
+
+    # Trade ids: 0 is the carried-in position, then one per opening fill
+    trade_after = np.cumsum(starts)
+    trade_before = np.concatenate(([0], trade_after[:-1]))
+    n_trades = int(trade_after[-1]) + 1
+
+    def per_trade(values: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        return np.bincount(ids, weights=values, minlength=n_trades)
+
+    fee_share = np.divide(fee, np.abs(size), out=np.zeros_like(fee), where=size != 0)
+    opened = np.abs(opening)
+    closed = np.abs(closing)
+    flows = per_trade(-opening * price - opened * fee_share, trade_after) + per_trade(
+        -closing * price - closed * fee_share, trade_before
+    )
+    opened_units = per_trade(opened, trade_after)
+    closed_units = per_trade(closed, trade_before)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        entry_price = per_trade(opened * price, trade_after) / opened_units
+        exit_price = per_trade(closed * price, trade_before) / closed_units
+
+    # Latest closing fill per trade (int64 min is NaT: no exit yet)
+    exit_ns = np.full(n_trades, np.iinfo(np.int64).min)
+    has_exit = closing != 0
+    np.maximum.at(exit_ns, trade_before[has_exit], times.asi8[has_exit])
+    exit_time = pd.DatetimeIndex(exit_ns.view("M8[ns]"))
+    if times.tz is not None:
+        exit_time = exit_time.tz_localize("UTC").tz_convert(times.tz)
+
+    is_open = np.zeros(n_trades, dtype=bool)
+    if after[-1] != 0:
+        # Mark the open trade at the last close, implied by the final value
+        # and the cash left after all fills (unknown when a position was
+        # carried in: the starting value then includes it)
+        cash = result.starting_cash - (size * price).sum() - fee.sum()
+        last_close = (result.ending_cash - cash) / after[-1] if initial == 0 else np.nan
+        flows[-1] += after[-1] * last_close
+        exit_price[-1] = last_close
+        is_open[-1] = True
+
+    ids = np.arange(1, n_trades)
+    direction = np.sign(after[starts]).astype(int)
+    notional = entry_price[ids] * opened_units[ids]
+    return pd.DataFrame(
+        {
+            "entry_time": times[starts],
+            "exit_time": exit_time[ids],
+            "direction": direction,
+            "size": opened_units[ids],
+            "entry_price": entry_price[ids],
+            "exit_price": exit_price[ids],
+            "pnl": flows[ids],
+            "return_pct": np.divide(
+                flows[ids],
+                notional,
+                out=np.full(len(ids), np.nan),
+                where=notional != 0,
+            ),
+            "is_open": is_open[ids],
+        },
+        columns=TRADE_COLUMNS,
+    )
+
+
+def exposure(result: BacktestResult) -> float:
+    """Fraction of bars with an open position"""
+    if result.positions is None or result.positions.empty:
+        return float("nan")
+    return float(np.mean(result.positions.to_numpy() != 0))
+
+
+def turnover(result: BacktestResult) -> float:
+    """Traded value over the mean portfolio value"""
+    equity = _equity(result)
+    if equity is None or result.fills is None:
+        return float("nan")
+    traded = np.abs(result.fills["size"].to_numpy() * result.fills["price"].to_numpy())
+    return float(traded.sum() / equity.mean())
+
+
+def hit_rate(result: BacktestResult) -> float:
+    """Fraction of closed trades with a positive P&L"""
+    trades = trade_list(result)
+    closed = trades.loc[~trades["is_open"].astype(bool), "pnl"]
+    if result.fills is None or closed.empty:
+        return float("nan")
+    return float((closed > 0).mean())
+
+
+def _return_pct(result: BacktestResult) -> float:
+    return result.return_pct
+
+
+def _ending_cash(result: BacktestResult) -> float:
+    return result.ending_cash
+
+
+def _num_signals(result: BacktestResult) -> float:
+    return float(len(result.signals))
+
+
+def _num_trades(result: BacktestResult) -> float:
+    if result.fills is None:
+        return float("nan")
+    return float(len(trade_list(result)))
+
+
+def _max_drawdown(result: BacktestResult) -> float:
+    return drawdowns(result)[0]
+
+
+def _max_drawdown_duration(result: BacktestResult) -> float:
+    if _equity(result) is None:
+        return float("nan")
+    return float(drawdowns(result)[1])
+
+
+def _sharpe(result: BacktestResult) -> float:
+    return sharpe_ratio(result)
+
+
+def _sortino(result: BacktestResult) -> float:
+    return sortino_ratio(result)
+
+
+# Built-in metrics selectable by name (top-level functions, so they can be
+# sent to sweep workers)
+METRICS: Dict[str, Metric] = {
+    "return_pct": _return_pct,
+    "ending_cash": _ending_cash,
+    "num_signals": _num_signals,
+    "num_trades": _num_trades,
+    "max_drawdown": _max_drawdown,
+    "max_drawdown_duration": _max_drawdown_duration,
+    "sharpe": _sharpe,
+    "sortino": _sortino,
+    "exposure": exposure,
+    "turnover": turnover,
+    "hit_rate": hit_rate,
+}
+
+
+def compute_metrics(
+    result: BacktestResult,
+    names: Optional[Sequence[str]] = None,
+    periods_per_year: Optional[float] = None,
+) -> Dict[str, float]:
+    """
+    Compute several metrics of one result
+
+    Args:
+        result: Backtest result
+        names: Metric names (default: all of METRICS)
+        periods_per_year: Annualize the Sharpe and Sortino ratios
+
+    Returns:
+        Dictionary mapping metric names to values
+
+    Raises:
+        ValueError: If a metric name is unknown
+    """
+    names = list(METRICS) if names is None else list(names)
+    unknown = [name for name in names if name not in METRICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown metrics {unknown}. Available metrics: {list(METRICS)}"
+        )
+    values = {name: float(METRICS[name](result)) for name in names}
+    if periods_per_year:
+        if "sharpe" in values:
+            values["sharpe"] = sharpe_ratio(result, periods_per_year)
+        if "sortino" in values:
+            values["sortino"] = sortino_ratio(result, periods_per_year)
+    return values
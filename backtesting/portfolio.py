@@ -0,0 +1,423 @@
+"""
+Multi-instrument portfolio backtests with shared capital.
+
+Every (instrument, timeframe, strategy) combination is a sleeve holding its
+own position; all sleeves trade against one cash balance. Instruments keep
+their own bar arrays and are mapped onto a common clock (the union of their
+timestamps) by position, so memory grows with the total number of bars
+rather than with instruments times clock length.
+
+Fills follow the vectorized engine (next-bar open, commission on traded
+value). Fills are processed in clock order and an order that would take the
+shared cash below zero is rejected, as the backtrader broker does.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import (
+    SignalGenerator,
+    _compute_signals,
+    _timestamps_ns,
+    compile_signals,
+)
+from backtesting.vectorized import (
+    CLOSE_COLUMN,
+    OPEN_COLUMN,
+    TIMESTAMP_COLUMN,
+    target_positions,
+)
+
+if TYPE_CHECKING:
+    from config import TradingConfig
+    from data_collection.interfaces.storage import StorageInterface
+
+# (symbol, timeframe) key of an instrument's bars
+FrameKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class Sleeve:
+    """One strategy trading one instrument on one timeframe"""
+
+    symbol: str
+    timeframe: str
+    strategy_cls: Type[SignalGenerator]
+    config: Dict[str, Any] = field(default_factory=dict, hash=False)
+    stake: float = 1.0
+
+    @property
+    def strategy(self) -> str:
+        return getattr(self.strategy_cls, "str_name", "") or self.strategy_cls.__name__
+
+    @property
+    def key(self) -> FrameKey:
+        return (self.symbol, self.timeframe)
+
+
+def _load_strategy_class(class_path: str) -> Type[SignalGenerator]:
+    module_path, class_name = class_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def sleeves_from_config(
+    config: "TradingConfig",
+    timeframes: Optional[Sequence[str]] = None,
+    stake: float = 1.0,
+) -> List[Sleeve]:
+    """
+    Build sleeves for the enabled instrument/strategy pairs of a TOML config
+
+    Strategy configurations are resolved like the trading orchestrator: the
+    last parameter set defined for the timeframe plus name, timeframe and
+    instrument.
+
+    Args:
+        config: Loaded trading configuration (see config.load_config)
+        timeframes: Optional timeframes to keep (default: all configured)
+        stake: Units per position for every sleeve
+
+    Returns:
+        Sleeves in configuration order
+
+    Raises:
+        ValueError: If a strategy name is not registered
+    """
+    from config import get_available_strategies
+
+    available = get_available_strategies()
+    sleeves = []
+    for instrument in config.instruments:
+        if not instrument.enabled:
+            continue
+        for strategy in instrument.strategies:
+            if not strategy.enabled:
+                continue
+            if strategy.name not in available:
+                raise ValueError(
+                    f"Unknown strategy '{strategy.name}'. "
+                    f"Available strategies: {list(available)}"
+                )
+            strategy_cls = _load_strategy_class(available[strategy.name])
+            for timeframe in strategy.timeframes:
+                if timeframes is not None and timeframe not in timeframes:
+                    continue
+                param_list = strategy.parameters.get(timeframe, [])
+                params = dict(param_list[-1]) if param_list else {}
+                params.update(
+                    {
+                        "name": strategy.name,
+                        "timeframe": timeframe,
+                        "instrument": instrument.symbol,
+                    }
+                )
+                sleeves.append(
+                    Sleeve(
+                        symbol=instrument.symbol,
+                        timeframe=timeframe,
+                        strategy_cls=strategy_cls,
+                        config=params,
+                        stake=stake,
+                    )
+                )
+    return sleeves
+
+
+def load_frames(
+    storage: "StorageInterface",
+    sleeves: Sequence[Sleeve],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    source: Optional[str] = None,
+) -> Dict[FrameKey, pd.DataFrame]:
+    """
+    Load the bars every sleeve trades, one multi-symbol load per timeframe
+
+    Args:
+        storage: Storage backend
+        sleeves: Sleeves to load data for
+        start_date: Start date filter
+        end_date: End date filter
+        source: Optional source filter
+
+    Returns:
+        Dictionary mapping (symbol, timeframe) to DataFrames (instruments
+        without data are omitted)
+    """
+    symbols_by_timeframe: Dict[str, List[str]] = {}
+    for sleeve in sleeves:
+        symbols = symbols_by_timeframe.setdefault(sleeve.timeframe, [])
+        if sleeve.symbol not in symbols:
+            symbols.append(sleeve.symbol)
+
+    frames = {}
+    for timeframe, symbols in symbols_by_timeframe.items():
+        loaded = storage.load_multiple_historical_data(
+            symbols, timeframe, start_date, end_date, source
+        )
+        for symbol, df in loaded.items():
+            frames[(symbol, timeframe)] = df
+    return frames
+
+
+@dataclass
+class SleeveResult:
+    """Trading outcome of one sleeve"""
+
+    sleeve: Sleeve
+    signals: pd.DataFrame
+    trades: int
+    rejected: int
+    commission: float
+    # Cumulative profit and loss at each of the instrument's bar closes
+    pnl_curve: pd.Series
+
+    @property
+    def pnl(self) -> float:
+        return float(self.pnl_curve.iloc[-1]) if len(self.pnl_curve) else 0.0
+
+
+@dataclass
+class PortfolioResult:
+    """Per-sleeve results and the aggregate portfolio on the common clock"""
+
+    sleeves: List[SleeveResult]
+    starting_cash: float
+    ending_cash: float
+    return_pct: float
+    equity_curve: pd.Series
+    cash_curve: pd.Series
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per sleeve"""
+        return pd.DataFrame(
+            [
+                {
+                    "symbol": result.sleeve.symbol,
+                    "timeframe": result.sleeve.timeframe,
+                    "strategy": result.sleeve.strategy,
+                    "signals": len(result.signals),
+                    "trades": result.trades,
+                    "rejected": result.rejected,
+                    "commission": result.commission,
+                    "pnl": result.pnl,
+                }
+                for result in self.sleeves
+            ],
+            columns=[
+                "symbol",
+                "timeframe",
+                "strategy",
+                "signals",
+                "trades",
+                "rejected",
+                "commission",
+                "pnl",
+            ],
+        )
+
+    def by_instrument(self) -> pd.DataFrame:
+        """Sleeve results summed per symbol"""
+        frame = self.to_frame().drop(columns=["timeframe", "strategy"])
+        return frame.groupby("symbol", sort=False).sum()
+
+
+@dataclass
+class _Book:
+    """Bars, desired fills and realized fills of one sleeve"""
+
+    opens: np.ndarray
+    closes: np.ndarray
+    timestamps: np.ndarray
+    clock: np.ndarray
+    signals: pd.DataFrame
+    # Bars whose open fills a change of the targeted position, and targets
+    fill_bars: np.ndarray
+    fill_targets: np.ndarray
+    # Units traded at each bar's open (after cash checks)
+    traded: Optional[np.ndarray] = None
+    rejected: int = 0
+
+
+def _sleeve_signals(
+    strategy_cls: Type[SignalGenerator], data: pd.DataFrame, config: Dict[str, Any]
+) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    signals_df = _compute_signals(strategy_cls, data, config)
+    return (signals_df, *compile_signals(signals_df, data[TIMESTAMP_COLUMN]))
+
+
+def _map_signals(
+    tasks: List[Tuple[Type[SignalGenerator], pd.DataFrame, Dict[str, Any]]],
+    workers: int,
+) -> List[Tuple[pd.DataFrame, np.ndarray, np.ndarray]]:
+    if workers == 1:
+        return [_sleeve_signals(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_sleeve_signals, *zip(*tasks)))
+
+
+def run_portfolio_backtest(
+    frames: Mapping[FrameKey, pd.DataFrame],
+    sleeves: Sequence[Sleeve],
+    starting_cash: float = 100_000.0,
+    commission: float = 0.0,
+    check_cash: bool = True,
+    workers: Optional[int] = 1,
+) -> PortfolioResult:
+    """
+    Backtest several sleeves against one cash balance
+
+    Args:
+        frames: Mapping of (symbol, timeframe) to OHLCV DataFrames in the
+            project schema, sorted by timestamp
+        sleeves: Sleeves to run (sleeves without data are skipped)
+        starting_cash: initial cash shared by all sleeves
+        commission: commission (fractional, e.g., 0.001 for 0.1%)
+        check_cash: Reject fills that would take the cash below zero
+        workers: Processes generating signals (None: CPU count)
+
+    Returns:
+        PortfolioResult with per-sleeve and aggregate results
+
+    Raises:
+        ValueError: If no sleeve has data
+    """
+    sleeves = [sleeve for sleeve in sleeves if sleeve.key in frames]
+    if not sleeves:
+        raise ValueError("No data for any sleeve")
+
+    workers = min(workers or os.cpu_count() or 1, len(sleeves))
+    compiled = _map_signals(
+        [
+            (sleeve.strategy_cls, frames[sleeve.key], sleeve.config)
+            for sleeve in sleeves
+        ],
+        workers,
+    )
+
+    # Common clock: union of all bar timestamps
+    timestamps = {
+        sleeve.key: _timestamps_ns(frames[sleeve.key][TIMESTAMP_COLUMN])
+        for sleeve in sleeves
+    }
+    clock = np.unique(np.concatenate(list(timestamps.values())))
+
+    books = []
+    for sleeve, (signals_df, bars, actions) in zip(sleeves, compiled):
+        data = frames[sleeve.key]
+        n_bars = len(data)
+        targets = target_positions(n_bars, bars, actions, sleeve.stake)
+        desired = np.zeros(n_bars)
+        desired[1:] = targets[:-1]
+        fill_bars = np.flatnonzero(np.diff(desired, prepend=0.0))
+        books.append(
+            _Book(
+                opens=data[OPEN_COLUMN].to_numpy(dtype=np.float64),
+                closes=data[CLOSE_COLUMN].to_numpy(dtype=np.float64),
+                timestamps=timestamps[sleeve.key],
+                clock=np.searchsorted(clock, timestamps[sleeve.key]),
+                signals=signals_df,
+                fill_bars=fill_bars,
+                fill_targets=desired[fill_bars],
+            )
+        )
+
+    _fill(books, starting_cash, commission, check_cash)
+
+    # Aggregate value on the clock: cash flows and changes of each sleeve's
+    # marked position, scattered onto clock positions and accumulated
+    n_clock = len(clock)
+    cash_flows = np.zeros(n_clock)
+    value_changes = np.zeros(n_clock)
+    results = []
+    for sleeve, book in zip(sleeves, books):
+        position = np.cumsum(book.traded)
+        flows = book.traded * book.opens + commission * np.abs(book.traded) * book.opens
+        marked = position * book.closes
+        cash_flows += np.bincount(book.clock, weights=flows, minlength=n_clock)
+        value_changes += np.bincount(
+            book.clock, weights=np.diff(marked, prepend=0.0), minlength=n_clock
+        )
+        results.append(
+            SleeveResult(
+                sleeve=sleeve,
+                signals=book.signals,
+                trades=int(np.count_nonzero(book.traded)),
+                rejected=book.rejected,
+                commission=float(commission * np.abs(book.traded) @ book.opens),
+                pnl_curve=pd.Series(
+                    marked - np.cumsum(flows),
+                    index=pd.DatetimeIndex(book.timestamps),
+                    name="pnl",
+                ),
+            )
+        )
+
+    cash = starting_cash - np.cumsum(cash_flows)
+    equity = cash + np.cumsum(value_changes)
+    index = pd.DatetimeIndex(clock)
+    ending_cash = float(equity[-1])
+    return PortfolioResult(
+        sleeves=results,
+        starting_cash=starting_cash,
+        ending_cash=ending_cash,
+        return_pct=(
+            (ending_cash - starting_cash) / starting_cash if starting_cash else 0.0
+        ),
+        equity_curve=pd.Series(equity, index=index, name="equity"),
+        cash_curve=pd.Series(cash, index=index, name="cash"),
+    )
+
+
+def _fill(
+    books: List[_Book], starting_cash: float, commission: float, check_cash: bool
+) -> None:
+    """
+    Realize the desired fills of all sleeves in clock order
+
+    Only bars where a target changes are visited, so the loop is over
+    trades, not bars. Fills on the same clock position are processed in
+    sleeve order.
+    """
+    for book in books:
+        book.traded = np.zeros(len(book.opens))
+
+    events = sorted(
+        (int(book.clock[bar]), i, int(bar), float(target))
+        for i, book in enumerate(books)
+        for bar, target in zip(book.fill_bars, book.fill_targets)
+    )
+    positions = [0.0] * len(books)
+    cash = starting_cash
+    for _, i, bar, target in events:
+        book = books[i]
+        size = target - positions[i]
+        if size == 0.0:
+            continue
+        price = book.opens[bar]
+        flow = size * price + commission * abs(size) * price
+        if check_cash and flow > 0 and flow > cash:
+            book.rejected += 1
+            continue
+        cash -= flow
+        positions[i] = target
+        book.traded[bar] = size
@@ -0,0 +1,155 @@
+"""
+DataFrames shared with worker processes through shared memory.
+
+Numeric, boolean and datetime columns are copied once into shared memory
+blocks; workers map them without unpickling the data. Constant object
+columns (symbol, timeframe, source) travel as a single value.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class _SharedColumn:
+    name: Any
+    dtype: str
+    shm_name: Optional[str] = None
+    tz: Optional[str] = None
+    # Fallback for object columns: constant value or pickled values
+    constant: Any = None
+    values: Optional[np.ndarray] = None
+
+
+@dataclass
+class SharedFrameSpec:
+    """Picklable description of a shared frame (what workers receive)"""
+
+    length: int
+    columns: List[_SharedColumn]
+    index: pd.Index
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block owned by another SharedFrame"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Pool workers share the owner's resource tracker, so registering the
+    # block again does not hand its lifetime to the worker
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedFrame:
+    """
+    Owner of a DataFrame copied into shared memory
+
+    Use as a context manager (or call close()) to release the blocks.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Copy a DataFrame into shared memory
+
+        Args:
+            df: Frame to share
+        """
+        self._blocks: List[shared_memory.SharedMemory] = []
+        columns = []
+        try:
+            for name in df.columns:
+                columns.append(self._share_column(name, df[name]))
+        except BaseException:
+            self.close()
+            raise
+        self.spec = SharedFrameSpec(length=len(df), columns=columns, index=df.index)
+
+    def _share_column(self, name: Any, series: pd.Series) -> _SharedColumn:
+        dtype = series.dtype
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            values = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+            return self._share_array(name, values, tz=str(dtype.tz))
+        if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+            if isinstance(dtype, np.dtype):
+                return self._share_array(name, series.to_numpy())
+        if pd.api.types.is_datetime64_dtype(dtype):
+            return self._share_array(name, series.to_numpy())
+
+        values = series.to_numpy()
+        if len(values) and (values == values[0]).all():
+            return _SharedColumn(name, str(dtype), constant=values[0])
+        return _SharedColumn(name, str(dtype), values=values)
+
+    def _share_array(
+        self, name: Any, values: np.ndarray, tz: Optional[str] = None
+    ) -> _SharedColumn:
+        values = np.ascontiguousarray(values)
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        self._blocks.append(shm)
+        np.ndarray(values.shape, values.dtype, buffer=shm.buf)[:] = values
+        return _SharedColumn(name, values.dtype.str, shm_name=shm.name, tz=tz)
+
+    @property
+    def nbytes(self) -> int:
+        """Shared memory held by the frame"""
+        return sum(block.size for block in self._blocks)
+
+    def close(self) -> None:
+        """Release the shared memory blocks"""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# Blocks attached by this process, kept open while frames use them
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def attach_frame(spec: SharedFrameSpec) -> pd.DataFrame:
+    """
+    Rebuild a shared DataFrame in a worker process
+
+    Numeric columns are read-only views of the shared blocks.
+
+    Args:
+        spec: SharedFrame.spec from the owning process
+
+    Returns:
+        DataFrame equal to the shared one
+    """
+    data: Dict[Any, Any] = {}
+    for column in spec.columns:
+        if column.shm_name is not None:
+            shm = _attached.get(column.shm_name)
+            if shm is None:
+                shm = _attached[column.shm_name] = _attach(column.shm_name)
+            values = np.ndarray((spec.length,), np.dtype(column.dtype), shm.buf)
+            values.flags.writeable = False
+            if column.tz is not None:
+                data[column.name] = (
+                    pd.Series(values).dt.tz_localize("UTC").dt.tz_convert(column.tz)
+                )
+            else:
+                data[column.name] = values
+        elif column.values is not None:
+            data[column.name] = column.values
+        else:
+            data[column.name] = pd.Series(
+                column.constant, index=range(spec.length), dtype=column.dtype
+            )
+    frame = pd.DataFrame(data, copy=False)
+    frame.index = spec.index
+    return frame
@@ -0,0 +1,312 @@
+"""
+Columnar store of backtest results.
+
+Metrics are keyed by (strategy, parameters, data fingerprint). New rows are
+buffered and written as one .npz segment per flush (one array per column,
+written to a temporary file and renamed), so a sweep adds a single file and
+readers never see partial writes. Loading concatenates the segments into one
+table that can be queried by strategy, fingerprint and parameter values
+across thousands of runs; compact() merges the segments.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import _timestamps_ns
+from technical_analysis.cache import fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Text columns of a segment; the other arrays hold metric values and
+# whether a row has the metric (NaN is a valid metric value)
+_KEY_COLUMNS = ["key", "strategy", "fingerprint", "params"]
+_METRIC_PREFIX = "metric:"
+_PRESENT_PREFIX = "present:"
+
+
+def data_fingerprint(data: pd.DataFrame) -> str:
+    """
+    Hash the numeric and datetime columns of a market data frame
+
+    Args:
+        data: OHLCV DataFrame
+
+    Returns:
+        Hex digest identifying the data
+    """
+    arrays = []
+    for name in sorted(data.columns):
+        column = data[name]
+        if pd.api.types.is_datetime64_any_dtype(column):
+            arrays.append((name, _timestamps_ns(column)))
+        elif pd.api.types.is_numeric_dtype(column):
+            arrays.append((name, column.to_numpy(dtype=np.float64)))
+    return fingerprint(arrays)
+
+
+def _canonical(params: Mapping[str, Any]) -> str:
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def result_key(strategy: str, params: Mapping[str, Any], data_fp: str) -> str:
+    """
+    Key of one result
+
+    Args:
+        strategy: Strategy name
+        params: Full configuration (and run settings) of the run
+        data_fp: Data fingerprint (see data_fingerprint)
+
+    Returns:
+        Hex digest
+    """
+    payload = f"{strategy}\0{_canonical(params)}\0{data_fp}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class ResultStore:
+    """
+    Persistent table of backtest metrics
+
+    Not safe for concurrent writers to the same key; concurrent flushes of
+    different processes write separate segments.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) a store
+
+        Args:
+            path: Directory holding the segment files
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._rows: Optional[Dict[str, Dict[str, Any]]] = None
+        self._pending: List[str] = []
+
+    # -- reading -----------------------------------------------------------
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.path.glob("*.npz"))
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._rows is not None:
+            return self._rows
+        rows: Dict[str, Dict[str, Any]] = {}
+        for path in self._segments():
+            try:
+                with np.load(path, allow_pickle=False) as segment:
+                    columns = {name: segment[name] for name in segment.files}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable result segment {path}: {e}")
+                continue
+            metrics = {
+                name[len(_METRIC_PREFIX) :]: values
+                for name, values in columns.items()
+                if name.startswith(_METRIC_PREFIX)
+            }
+            present = {name: columns[f"{_PRESENT_PREFIX}{name}"] for name in metrics}
+            for i, key in enumerate(columns["key"].tolist()):
+                row = rows.setdefault(
+                    key,
+                    {
+                        "strategy": str(columns["strategy"][i]),
+                        "fingerprint": str(columns["fingerprint"][i]),
+                        "params": str(columns["params"][i]),
+                        "metrics": {},
+                    },
+                )
+                row["metrics"].update(
+                    {
+                        name: float(values[i])
+                        for name, values in metrics.items()
+                        if present[name][i]
+                    }
+                )
+        self._rows = rows
+        return rows
+
+    def get(
+        self, strategy: str, params: Mapping[str, Any], data_fp: str
+    ) -> Optional[Dict[str, float]]:
+        """
+        Stored metrics of a run
+
+        Args:
+            strategy: Strategy name
+            params: Full configuration of the run
+            data_fp: Data fingerprint
+
+        Returns:
+            Metric name -> value, or None if the run is not stored
+        """
+        row = self._load().get(result_key(strategy, params, data_fp))
+        return dict(row["metrics"]) if row is not None else None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load()
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def to_frame(
+        self,
+        strategy: Optional[str] = None,
+        data_fp: Optional[str] = None,
+        **params: Any,
+    ) -> pd.DataFrame:
+        """
+        Query stored results
+
+        Args:
+            strategy: Keep only this strategy
+            data_fp: Keep only results on this data fingerprint
+            **params: Keep only results with these parameter values
+
+        Returns:
+            DataFrame indexed by key with strategy, fingerprint, one column
+            per parameter and one per stored metric (NaN where not stored)
+        """
+        all_rows = self._load()
+        metric_names = sorted({m for row in all_rows.values() for m in row["metrics"]})
+        rows = [
+            (key, row)
+            for key, row in all_rows.items()
+            if (strategy is None or row["strategy"] == strategy)
+            and (data_fp is None or row["fingerprint"] == data_fp)
+        ]
+        records = []
+        for key, row in rows:
+            row_params = json.loads(row["params"])
+            if any(row_params.get(name) != value for name, value in params.items()):
+                continue
+            records.append(
+                {
+                    "key": key,
+                    "strategy": row["strategy"],
+                    "fingerprint": row["fingerprint"],
+                    **row_params,
+                    **row["metrics"],
+                }
+            )
+        frame = (
+            pd.DataFrame(records)
+            if records
+            else pd.DataFrame(columns=["key", "strategy", "fingerprint"])
+        )
+        missing = [name for name in metric_names if name not in frame.columns]
+        frame = frame.reindex(columns=[*frame.columns, *missing])
+        return frame.set_index("key")
+
+    # -- writing -----------------------------------------------------------
+
+    def put(
+        self,
+        strategy: str,
+        params: Mapping[str, Any],
+        data_fp: str,
+        metrics: Mapping[str, float],
+    ) -> str:
+        """
+        Add (or extend) the metrics of a run; written on the next flush
+
+        Args:
+            strategy: Strategy name
+            params: Full configuration of the run (JSON-serializable)
+            data_fp: Data fingerprint
+            metrics: Metric name -> value
+
+        Returns:
+            Result key
+        """
+        key = result_key(strategy, params, data_fp)
+        row = self._load().setdefault(
+            key,
+            {
+                "strategy": strategy,
+                "fingerprint": data_fp,
+                "params": _canonical(params),
+                "metrics": {},
+            },
+        )
+        row["metrics"].update({name: float(value) for name, value in metrics.items()})
+        self._pending.append(key)
+        return key
+
+    def flush(self) -> Optional[Path]:
+        """
+        Write pending rows as a new segment
+
+        Returns:
+            Path of the segment, or None if nothing was pending
+        """
+        if not self._pending:
+            return None
+        keys = list(dict.fromkeys(self._pending))
+        path = self._write(keys, f"{time.time_ns():020d}-{os.getpid()}")
+        self._pending.clear()
+        return path
+
+    def compact(self) -> Optional[Path]:
+        """
+        Merge all segments (and pending rows) into one
+
+        Returns:
+            Path of the merged segment, or None if the store is empty
+        """
+        rows = self._load()
+        old = self._segments()
+        path = self._write(list(rows), f"{time.time_ns():020d}-{os.getpid()}")
+        for segment in old:
+            if segment != path:
+                segment.unlink(missing_ok=True)
+        self._pending.clear()
+        return path
+
+    def _write(self, keys: List[str], name: str) -> Optional[Path]:
+        if not keys:
+            return None
+        rows = self._load()
+        metric_names = sorted({m for key in keys for m in rows[key]["metrics"]})
+        arrays = {
+            column: np.array(
+                [key if column == "key" else rows[key][column] for key in keys],
+                dtype=str,
+            )
+            for column in _KEY_COLUMNS
+        }
+        for metric in metric_names:
+            arrays[f"{_METRIC_PREFIX}{metric}"] = np.array(
+                [rows[key]["metrics"].get(metric, np.nan) for key in keys],
+                dtype=np.float64,
+            )
+            arrays[f"{_PRESENT_PREFIX}{metric}"] = np.array(
+                [metric in rows[key]["metrics"] for key in keys], dtype=bool
+            )
+
+        path = self.path / f"{name}.npz"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        return path
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(path={str(self.path)!r}, "
+            f"results={len(self)}, segments={len(self._segments())})"
+        )
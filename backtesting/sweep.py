@@ -0,0 +1,430 @@
+"""
+Parallel parameter sweeps (grid search) over signal-driven backtests.
+
+The market data is copied once into shared memory and mapped by every
+worker. Combinations are handed out in chunks ordered by their parameters,
+so runs sharing indicator settings land on the same worker and reuse its
+indicator cache. Results stream back as they complete into a SweepTable
+ranked by the chosen metric.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import pandas as pd
+
+from backtesting.engine import (
+    BacktestResult,
+    SignalGenerator,
+    _compute_signals,
+    run_golden_death_cross_backtest,
+)
+from backtesting.metrics import METRICS, Metric
+from backtesting.shared import SharedFrame, SharedFrameSpec, attach_frame
+from backtesting.store import ResultStore, data_fingerprint
+from backtesting.vectorized import run_vectorized_backtest
+from strategies.config.strategy_config import (
+    DEFAULT_CONFIGS,
+    get_strategy_config,
+    validate_strategy_config,
+)
+
+ParamGrid = Mapping[str, Sequence[Any]]
+
+ENGINES = ("vectorized", "backtrader")
+
+
+def _resolve_metrics(
+    metrics: Union[Sequence[str], Mapping[str, Metric]],
+) -> Dict[str, Metric]:
+    if isinstance(metrics, Mapping):
+        return dict(metrics)
+    unknown = [name for name in metrics if name not in METRICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown metrics {unknown}. Available metrics: {list(METRICS)}"
+        )
+    return {name: METRICS[name] for name in metrics}
+
+
+def expand_grid(
+    strategy_name: str,
+    grid: ParamGrid,
+    base_config: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Expand a parameter grid into validated strategy configurations
+
+    Args:
+        strategy_name: Key of DEFAULT_CONFIGS
+        grid: Mapping of config key to candidate values
+        base_config: Overrides applied to the defaults before the grid
+
+    Returns:
+        (configs, skipped): one full config per valid combination, ordered by
+        the grid values, and the number of combinations rejected by
+        validate_strategy_config (e.g. short_ma_period >= long_ma_period)
+
+    Raises:
+        ValueError: If the strategy or a grid key is unknown, or a grid
+            entry has no values
+    """
+    if strategy_name not in DEFAULT_CONFIGS:
+        raise ValueError(
+            f"Strategy '{strategy_name}' not found. "
+            f"Available strategies: {list(DEFAULT_CONFIGS)}"
+        )
+    known = set(DEFAULT_CONFIGS[strategy_name])
+    unknown = [key for key in grid if key not in known]
+    if unknown:
+        raise ValueError(
+            f"Unknown parameters {unknown} for '{strategy_name}'. "
+            f"Available parameters: {sorted(known)}"
+        )
+    empty = [key for key, values in grid.items() if len(values) == 0]
+    if empty:
+        raise ValueError(f"No values given for parameters {empty}")
+
+    keys = list(grid)
+    configs: List[Dict[str, Any]] = []
+    skipped = 0
+    for values in itertools.product(*(grid[key] for key in keys)):
+        overrides = {**(base_config or {}), **dict(zip(keys, values))}
+        config = get_strategy_config(strategy_name, overrides)
+        try:
+            validate_strategy_config(strategy_name, config)
+        except ValueError:
+            skipped += 1
+            continue
+        configs.append(config)
+    return configs, skipped
+
+
+@dataclass
+class SweepRow:
+    """Metrics of one parameter combination"""
+
+    params: Dict[str, Any]
+    metrics: Dict[str, float]
+
+
+@dataclass
+class SweepTable:
+    """
+    Sweep results kept ranked by one metric as they arrive
+
+    NaN scores rank last.
+    """
+
+    rank_by: str
+    ascending: bool = False
+    rows: List[SweepRow] = field(default_factory=list)
+    _keys: List[Tuple[bool, float]] = field(default_factory=list, repr=False)
+
+    def add(self, row: SweepRow) -> int:
+        """
+        Insert a result
+
+        Args:
+            row: Sweep result
+
+        Returns:
+            Rank of the row (0 is best)
+        """
+        score = row.metrics[self.rank_by]
+        missing = score is None or math.isnan(score)
+        key = (missing, 0.0 if missing else (score if self.ascending else -score))
+        position = bisect.bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self.rows.insert(position, row)
+        return position
+
+    def top(self, n: int = 10) -> List[SweepRow]:
+        """Best n rows"""
+        return self.rows[:n]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Ranked table: one row per combination, parameters then metrics"""
+        return pd.DataFrame(
+            [{**row.params, **row.metrics} for row in self.rows],
+            index=pd.RangeIndex(1, len(self.rows) + 1, name="rank"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+# -- worker side --------------------------------------------------------------
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(
+    spec: SharedFrameSpec,
+    strategy_cls: Type[SignalGenerator],
+    metrics: Dict[str, Metric],
+    run_kwargs: Dict[str, Any],
+) -> None:
+    _worker.update(
+        data=attach_frame(spec),
+        strategy_cls=strategy_cls,
+        metrics=metrics,
+        run_kwargs=run_kwargs,
+    )
+
+
+def run_backtest(
+    data: pd.DataFrame,
+    strategy_cls: Type[SignalGenerator],
+    config: Dict[str, Any],
+    engine: str = "vectorized",
+    **kwargs: Any,
+) -> BacktestResult:
+    """
+    Run one configuration on the chosen engine
+
+    Args:
+        data: OHLCV DataFrame in the project schema
+        strategy_cls: strategy class implementing generate_signals
+        config: strategy configuration
+        engine: "vectorized" or "backtrader"
+        **kwargs: starting_cash, stake, commission
+    """
+    if engine == "backtrader":
+        return run_golden_death_cross_backtest(
+            data, config, strategy_cls=strategy_cls, **kwargs
+        )
+    signals_df = _compute_signals(strategy_cls, data, config)
+    return run_vectorized_backtest(data, signals_df, **kwargs)
+
+
+def _run_chunk(
+    params: List[Dict[str, Any]], configs: List[Dict[str, Any]]
+) -> List[SweepRow]:
+    rows = []
+    for row_params, config in zip(params, configs):
+        result = run_backtest(
+            _worker["data"], _worker["strategy_cls"], config, **_worker["run_kwargs"]
+        )
+        rows.append(
+            SweepRow(
+                params=row_params,
+                metrics={
+                    name: float(metric(result))
+                    for name, metric in _worker["metrics"].items()
+                },
+            )
+        )
+    return rows
+
+
+# -- driver -------------------------------------------------------------------
+
+
+def iter_sweep(
+    data: pd.DataFrame,
+    strategy_cls: Type[SignalGenerator],
+    grid: ParamGrid,
+    metrics: Union[Sequence[str], Mapping[str, Metric]] = ("return_pct",),
+    base_config: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    engine: str = "vectorized",
+    starting_cash: float = 100_000.0,
+    stake: float = 1.0,
+    commission: float = 0.0,
+    store: Optional[ResultStore] = None,
+) -> Iterator[SweepRow]:
+    """
+    Run a parameter sweep, yielding results as they complete
+
+    Args:
+        data: OHLCV DataFrame in the project schema
+        strategy_cls: strategy class with a str_name key in DEFAULT_CONFIGS
+        grid: Mapping of config key to candidate values
+        metrics: Metric names (see METRICS) or a name -> callable mapping
+            (callables must be picklable for workers > 1)
+        base_config: Overrides applied to the defaults before the grid
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        chunk_size: Combinations per task (default: about four tasks per
+            worker)
+        engine: "vectorized" or "backtrader"
+        starting_cash: initial cash
+        stake: order size per signal (units)
+        commission: commission (fractional, e.g., 0.001 for 0.1%)
+        store: Optional ResultStore; combinations whose requested metrics
+            are stored for this data are not run again (stored rows are
+            yielded first) and new results are added to it
+
+    Yields:
+        SweepRow per valid combination, in completion order
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r} (expected one of {ENGINES})")
+    metric_fns = _resolve_metrics(metrics)
+    configs, _ = expand_grid(strategy_cls.str_name, grid, base_config)
+    if not configs:
+        return
+    params = [{key: config[key] for key in grid} for config in configs]
+    run_kwargs = dict(
+        engine=engine,
+        starting_cash=starting_cash,
+        stake=stake,
+        commission=commission,
+    )
+
+    if store is not None:
+        data_fp = data_fingerprint(data)
+        # Run settings are part of the stored parameters
+        stored_params = [{**config, **run_kwargs} for config in configs]
+        todo = []
+        for i, config_params in enumerate(stored_params):
+            stored = store.get(strategy_cls.str_name, config_params, data_fp)
+            if stored is not None and all(name in stored for name in metric_fns):
+                yield SweepRow(
+                    params=params[i],
+                    metrics={name: stored[name] for name in metric_fns},
+                )
+            else:
+                todo.append(i)
+        if not todo:
+            return
+        params = [params[i] for i in todo]
+        configs = [configs[i] for i in todo]
+        stored_params = [stored_params[i] for i in todo]
+
+    rows = _run_rows(
+        data,
+        strategy_cls,
+        params,
+        configs,
+        metric_fns,
+        run_kwargs,
+        workers,
+        chunk_size,
+    )
+    try:
+        for position, row in rows:
+            if store is not None:
+                store.put(
+                    strategy_cls.str_name, stored_params[position], data_fp, row.metrics
+                )
+            yield row
+    finally:
+        if store is not None:
+            store.flush()
+
+
+def _run_rows(
+    data: pd.DataFrame,
+    strategy_cls: Type[SignalGenerator],
+    params: List[Dict[str, Any]],
+    configs: List[Dict[str, Any]],
+    metric_fns: Dict[str, Metric],
+    run_kwargs: Dict[str, Any],
+    workers: Optional[int],
+    chunk_size: Optional[int],
+) -> Iterator[Tuple[int, SweepRow]]:
+    """Run configurations, yielding (position in configs, row) as they complete"""
+    workers = min(workers or os.cpu_count() or 1, len(configs))
+    chunk_size = chunk_size or max(1, math.ceil(len(configs) / (workers * 4)))
+    # Combinations are ordered by grid values, so neighbouring runs (same
+    # worker) share indicator periods and hit that worker's indicator cache
+    starts = range(0, len(configs), chunk_size)
+    chunks = [(params[i : i + chunk_size], configs[i : i + chunk_size]) for i in starts]
+
+    if workers == 1:
+        _worker.update(
+            data=data,
+            strategy_cls=strategy_cls,
+            metrics=metric_fns,
+            run_kwargs=run_kwargs,
+        )
+        try:
+            for start, chunk in zip(starts, chunks):
+                yield from enumerate(_run_chunk(*chunk), start)
+        finally:
+            _worker.clear()
+        return
+
+    with (
+        SharedFrame(data) as shared,
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shared.spec, strategy_cls, metric_fns, run_kwargs),
+        ) as executor,
+    ):
+        pending = {
+            executor.submit(_run_chunk, *chunk): start
+            for start, chunk in zip(starts, chunks)
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start = pending.pop(future)
+                    yield from enumerate(future.result(), start)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def run_sweep(
+    data: pd.DataFrame,
+    strategy_cls: Type[SignalGenerator],
+    grid: ParamGrid,
+    metrics: Union[Sequence[str], Mapping[str, Metric]] = ("return_pct",),
+    rank_by: Optional[str] = None,
+    ascending: bool = False,
+    on_result: Optional[Callable[[SweepRow, SweepTable], None]] = None,
+    **kwargs: Any,
+) -> SweepTable:
+    """
+    Run a parameter sweep and rank the results
+
+    Args:
+        data: OHLCV DataFrame in the project schema
+        strategy_cls: strategy class with a str_name key in DEFAULT_CONFIGS
+        grid: Mapping of config key to candidate values
+        metrics: Metric names (see METRICS) or a name -> callable mapping
+        rank_by: Metric to rank by (default: the first metric)
+        ascending: Rank lower values first (e.g. for max_drawdown)
+        on_result: Optional callback invoked with each row and the table so
+            far, as results arrive
+        **kwargs: Further iter_sweep arguments (workers, engine, commission,
+            ...)
+
+    Returns:
+        SweepTable ranked by rank_by
+    """
+    metric_names = list(metrics)
+    rank_by = rank_by or metric_names[0]
+    if rank_by not in metric_names:
+        raise ValueError(f"rank_by {rank_by!r} is not one of the metrics")
+
+    table = SweepTable(rank_by=rank_by, ascending=ascending)
+    for row in iter_sweep(data, strategy_cls, grid, metrics=metrics, **kwargs):
+        table.add(row)
+        if on_result is not None:
+            on_result(row, table)
+    return table
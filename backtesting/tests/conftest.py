@@ -0,0 +1,62 @@
+"""
+Pytest configuration and shared fixtures for backtesting tests.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies.base.signal import Signal, SignalStrength, SignalType
+
+
+@pytest.fixture
+def market_df():
+    """Synthetic daily bars in the project OHLCV schema."""
+    rng = np.random.default_rng(7)
+    n = 300
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.002, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.003, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.003, n)))
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2020-01-01", periods=n, freq="D"),
+            "openPrice": open_,
+            "highPrice": high,
+            "lowPrice": low,
+            "closePrice": close,
+            "lastTradedVolume": rng.integers(1_000, 5_000, n).astype(float),
+            "symbol": "TEST",
+            "timeframe": "1D",
+            "source": "YFinance",
+        }
+    )
+
+
+@pytest.fixture
+def scripted_strategy():
+    """Factory of strategy classes emitting (bar position, BUY/SELL) signals."""
+    return _scripted_strategy
+
+
+def _scripted_strategy(actions: List[Tuple[int, str]]):
+    class ScriptedStrategy:
+        def __init__(self, config: Dict):
+            self.config = config
+
+        def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
+            return [
+                Signal(
+                    instrument="TEST",
+                    signal_type=SignalType(action),
+                    strength=SignalStrength.MEDIUM,
+                    timestamp=data["timestamp"].iloc[bar].to_pydatetime(),
+                    price=float(data["closePrice"].iloc[bar]),
+                    confidence=0.5,
+                )
+                for bar, action in actions
+            ]
+
+    return ScriptedStrategy
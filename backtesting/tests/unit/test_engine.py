@@ -0,0 +1,83 @@
+"""
+Tests for the backtrader signal execution engine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting.engine import compile_signals, run_golden_death_cross_backtest
+
+
+class TestCompileSignals:
+    """Signals are mapped onto bar positions once, before the run."""
+
+    @pytest.mark.unit
+    def test_iso_timestamps_map_to_bars(self, market_df):
+        """ISO timestamps (as produced by Signal.to_dict) match their bars."""
+        timestamps = market_df["timestamp"]
+        signals = pd.DataFrame(
+            {
+                "timestamp": [timestamps[3].isoformat(), timestamps[10].isoformat()],
+                "signal_type": ["BUY", "SELL"],
+            }
+        )
+
+        bars, actions = compile_signals(signals, timestamps)
+
+        assert bars.tolist() == [3, 10]
+        assert actions.tolist() == [1, -1]
+
+    @pytest.mark.unit
+    def test_unmatched_and_unknown_signals(self, market_df):
+        """Signals off the bar grid are dropped; unknown types are no-ops."""
+        timestamps = market_df["timestamp"]
+        signals = pd.DataFrame(
+            {
+                "timestamp": [
+                    timestamps[5] + pd.Timedelta(hours=1),
+                    timestamps[7],
+                    timestamps[2],
+                ],
+                "signal_type": ["BUY", "HOLD", "SELL"],
+            }
+        )
+
+        bars, actions = compile_signals(signals, timestamps)
+
+        assert bars.tolist() == [2, 7]
+        assert actions.tolist() == [-1, 0]
+
+    @pytest.mark.unit
+    def test_empty_signals(self, market_df):
+        """No signals compile to empty arrays."""
+        bars, actions = compile_signals(pd.DataFrame(), market_df["timestamp"])
+        assert len(bars) == 0 and len(actions) == 0
+
+
+class TestSignalExecution:
+    """Compiled signals are executed on the matching bars."""
+
+    @pytest.mark.unit
+    def test_orders_fill_on_next_open(self, market_df, scripted_strategy):
+        """BUY then SELL (flatten and reverse) fill at the next bar's open."""
+        strategy_cls = scripted_strategy([(10, "BUY"), (20, "SELL")])
+
+        result = run_golden_death_cross_backtest(
+            market_df, starting_cash=10_000, strategy_cls=strategy_cls
+        )
+
+        opens = market_df["openPrice"].to_numpy()
+        last_close = market_df["closePrice"].iloc[-1]
+        expected = 10_000 + (opens[21] - opens[11]) + (opens[21] - last_close)
+        assert result.ending_cash == pytest.approx(expected)
+        assert len(result.signals) == 2
+
+    @pytest.mark.unit
+    def test_no_signals(self, market_df, scripted_strategy):
+        """Without signals the portfolio value is unchanged."""
+        result = run_golden_death_cross_backtest(
+            market_df, starting_cash=10_000, strategy_cls=scripted_strategy([])
+        )
+        assert result.ending_cash == pytest.approx(10_000)
+        assert np.isclose(result.return_pct, 0.0)
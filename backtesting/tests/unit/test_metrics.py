@@ -0,0 +1,156 @@
+"""
+Tests for backtest performance metrics.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting.engine import BacktestResult, run_golden_death_cross_backtest
+from backtesting.metrics import (
+    compute_metrics,
+    drawdowns,
+    sharpe_ratio,
+    sortino_ratio,
+    trade_list,
+)
+from backtesting.vectorized import run_golden_death_cross_backtest_vectorized
+
+
+def _equity_result(values):
+    equity = pd.Series(
+        values, index=pd.date_range("2020-01-01", periods=len(values), freq="D")
+    )
+    return BacktestResult(
+        signals=pd.DataFrame(),
+        starting_cash=float(values[0]),
+        ending_cash=float(values[-1]),
+        return_pct=values[-1] / values[0] - 1,
+        equity_curve=equity,
+    )
+
+
+class TestEquityMetrics:
+    """Ratios and drawdowns computed from the equity curve."""
+
+    @pytest.mark.unit
+    def test_drawdowns(self):
+        """Deepest drop from a peak and longest stretch below it."""
+        result = _equity_result([100.0, 110.0, 105.0, 99.0, 111.0, 108.0])
+
+        max_drawdown, duration = drawdowns(result)
+
+        assert max_drawdown == pytest.approx(11 / 110)
+        assert duration == 2
+
+    @pytest.mark.unit
+    def test_ratios(self):
+        """Sharpe and Sortino match their definitions; annualizing scales."""
+        values = [100.0, 101.0, 100.5, 102.0, 101.0, 103.0]
+        result = _equity_result(values)
+        returns = pd.Series(values).pct_change().dropna()
+
+        assert sharpe_ratio(result) == pytest.approx(
+            returns.mean() / returns.std(ddof=0)
+        )
+        downside = np.sqrt((returns.clip(upper=0) ** 2).mean())
+        assert sortino_ratio(result) == pytest.approx(returns.mean() / downside)
+        assert sharpe_ratio(result, periods_per_year=252) == pytest.approx(
+            sharpe_ratio(result) * np.sqrt(252)
+        )
+
+    @pytest.mark.unit
+    def test_flat_equity(self):
+        """Ratios without variation are NaN."""
+        result = _equity_result([100.0] * 5)
+        assert np.isnan(sharpe_ratio(result))
+        assert np.isnan(sortino_ratio(result))
+        assert drawdowns(result) == (0.0, 0)
+
+
+class TestTradeList:
+    """Round trips are rebuilt from the vectorized engine's fills."""
+
+    @pytest.mark.unit
+    def test_reversals_and_open_trade(self, market_df, scripted_strategy):
+        """A reversal closes one trade and opens the next at the same fill."""
+        result = run_golden_death_cross_backtest_vectorized(
+            market_df,
+            strategy_cls=scripted_strategy([(0, "BUY"), (40, "SELL"), (60, "BUY")]),
+            stake=2.0,
+            commission=0.001,
+        )
+        opens = market_df["openPrice"].to_numpy()
+        timestamps = market_df["timestamp"]
+
+        trades = trade_list(result)
+
+        assert trades["direction"].tolist() == [1, -1, 1]
+        assert trades["is_open"].tolist() == [False, False, True]
+        assert trades["size"].tolist() == [2.0, 2.0, 2.0]
+        assert trades["entry_time"].tolist() == timestamps.iloc[[1, 41, 61]].tolist()
+        assert (
+            trades["exit_time"].iloc[:2].tolist() == timestamps.iloc[[41, 61]].tolist()
+        )
+        assert pd.isna(trades["exit_time"].iloc[2])
+        np.testing.assert_allclose(trades["entry_price"], opens[[1, 41, 61]])
+        np.testing.assert_allclose(
+            trades["exit_price"],
+            [opens[41], opens[61], market_df["closePrice"].iloc[-1]],
+        )
+        first = 2.0 * (opens[41] - opens[1]) - 0.001 * 2.0 * (opens[1] + opens[41])
+        assert trades["pnl"].iloc[0] == pytest.approx(first)
+        assert trades["pnl"].sum() == pytest.approx(
+            result.ending_cash - result.starting_cash
+        )
+
+    @pytest.mark.unit
+    def test_no_fills(self, market_df, scripted_strategy):
+        """Without signals the trade list is empty."""
+        result = run_golden_death_cross_backtest_vectorized(
+            market_df, strategy_cls=scripted_strategy([])
+        )
+        assert trade_list(result).empty
+
+
+class TestComputeMetrics:
+    """All metrics of one result by name."""
+
+    @pytest.mark.unit
+    def test_position_metrics(self, market_df, scripted_strategy):
+        """Exposure, turnover, trade count and hit rate from fills/positions."""
+        result = run_golden_death_cross_backtest_vectorized(
+            market_df,
+            strategy_cls=scripted_strategy([(99, "BUY"), (199, "SELL")]),
+            starting_cash=1_000,
+        )
+        opens = market_df["openPrice"].to_numpy()
+
+        metrics = compute_metrics(
+            result, ["exposure", "turnover", "num_trades", "hit_rate"]
+        )
+
+        assert metrics["exposure"] == pytest.approx(200 / 300)
+        traded = opens[100] + 2 * opens[200]
+        assert metrics["turnover"] == pytest.approx(traded / result.equity_curve.mean())
+        assert metrics["num_trades"] == 2
+        assert metrics["hit_rate"] == float(opens[200] > opens[100])
+
+    @pytest.mark.unit
+    def test_backtrader_results(self, market_df, scripted_strategy):
+        """Results without an equity curve or fills give NaN metrics."""
+        result = run_golden_death_cross_backtest(
+            market_df, strategy_cls=scripted_strategy([(10, "BUY")])
+        )
+
+        metrics = compute_metrics(result)
+
+        assert metrics["return_pct"] == result.return_pct
+        for name in ("sharpe", "max_drawdown", "exposure", "num_trades", "hit_rate"):
+            assert np.isnan(metrics[name])
+
+    @pytest.mark.unit
+    def test_unknown_metric(self, market_df):
+        """Unknown names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown metrics"):
+            compute_metrics(_equity_result([1.0, 2.0]), ["alpha"])
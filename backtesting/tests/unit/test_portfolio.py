@@ -0,0 +1,176 @@
+"""
+Tests for multi-instrument portfolio backtests.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting.portfolio import Sleeve, run_portfolio_backtest, sleeves_from_config
+from backtesting.vectorized import run_golden_death_cross_backtest_vectorized
+from config import TradingConfig
+from strategies import GoldenDeathCrossStrategy
+
+GOLDEN_CROSS_CONFIG = {"name": "test", "short_ma_period": 5, "long_ma_period": 15}
+
+
+def _second_instrument(market_df):
+    """Same bars shifted by half a day and starting later (disjoint clock)"""
+    other = market_df.iloc[50:].reset_index(drop=True)
+    return other.assign(
+        timestamp=other["timestamp"] + pd.Timedelta(hours=12), symbol="OTHER"
+    )
+
+
+class TestRunPortfolioBacktest:
+    """Sleeves trade against shared cash on a common clock."""
+
+    @pytest.mark.unit
+    def test_single_sleeve_matches_vectorized_engine(self, market_df):
+        """One sleeve reproduces the single-instrument equity curve."""
+        sleeve = Sleeve("TEST", "1D", GoldenDeathCrossStrategy, GOLDEN_CROSS_CONFIG)
+        result = run_portfolio_backtest(
+            {("TEST", "1D"): market_df}, [sleeve], commission=0.001
+        )
+        expected = run_golden_death_cross_backtest_vectorized(
+            market_df, GOLDEN_CROSS_CONFIG, commission=0.001
+        )
+
+        assert result.equity_curve.index.equals(expected.equity_curve.index)
+        np.testing.assert_allclose(
+            result.equity_curve.to_numpy(), expected.equity_curve.to_numpy()
+        )
+        assert result.ending_cash == pytest.approx(expected.ending_cash)
+        assert result.sleeves[0].pnl == pytest.approx(
+            expected.ending_cash - expected.starting_cash
+        )
+
+    @pytest.mark.unit
+    def test_union_clock(self, market_df):
+        """Instruments are aligned on the union of their timestamps."""
+        frames = {
+            ("TEST", "1D"): market_df,
+            ("OTHER", "1D"): _second_instrument(market_df),
+        }
+        sleeves = [
+            Sleeve(symbol, "1D", GoldenDeathCrossStrategy, GOLDEN_CROSS_CONFIG)
+            for symbol, _ in frames
+        ]
+        result = run_portfolio_backtest(frames, sleeves, commission=0.001)
+
+        assert len(result.equity_curve) == 300 + 250
+        assert result.equity_curve.index.is_monotonic_increasing
+        assert result.ending_cash - result.starting_cash == pytest.approx(
+            sum(sleeve.pnl for sleeve in result.sleeves)
+        )
+        # Each sleeve alone earns what it earns in the portfolio
+        for sleeve, (key, data) in zip(result.sleeves, frames.items()):
+            alone = run_golden_death_cross_backtest_vectorized(
+                data, GOLDEN_CROSS_CONFIG, commission=0.001
+            )
+            assert sleeve.pnl == pytest.approx(alone.ending_cash - alone.starting_cash)
+
+    @pytest.mark.unit
+    def test_shared_cash_rejects_unaffordable_orders(
+        self, market_df, scripted_strategy
+    ):
+        """Orders the shared cash cannot cover are rejected, not filled."""
+        strategy_cls = scripted_strategy([(0, "BUY"), (100, "SELL")])
+        frames = {
+            ("TEST", "1D"): market_df,
+            ("OTHER", "1D"): _second_instrument(market_df),
+        }
+        sleeves = [Sleeve(symbol, "1D", strategy_cls) for symbol, _ in frames]
+        starting_cash = 1.5 * market_df["openPrice"].max()
+
+        result = run_portfolio_backtest(frames, sleeves, starting_cash=starting_cash)
+        frame = result.to_frame()
+
+        # TEST buys first and leaves too little cash for OTHER's buy; OTHER's
+        # short sale is then filled from flat
+        assert frame["rejected"].tolist() == [0, 1]
+        assert frame["trades"].tolist() == [2, 1]
+        assert (result.cash_curve >= 0).all()
+
+        unchecked = run_portfolio_backtest(
+            frames, sleeves, starting_cash=starting_cash, check_cash=False
+        )
+        assert unchecked.to_frame()["rejected"].tolist() == [0, 0]
+        assert unchecked.cash_curve.min() < 0
+
+    @pytest.mark.unit
+    def test_by_instrument(self, market_df, scripted_strategy):
+        """Several strategies on one instrument are summed per symbol."""
+        sleeves = [
+            Sleeve("TEST", "1D", scripted_strategy([(0, "BUY")])),
+            Sleeve("TEST", "1D", scripted_strategy([(10, "SELL")]), stake=2.0),
+        ]
+        result = run_portfolio_backtest({("TEST", "1D"): market_df}, sleeves)
+
+        summary = result.by_instrument()
+        assert summary.index.tolist() == ["TEST"]
+        assert summary.loc["TEST", "trades"] == 2
+        assert summary.loc["TEST", "pnl"] == pytest.approx(
+            result.ending_cash - result.starting_cash
+        )
+
+    @pytest.mark.unit
+    def test_no_data(self, market_df):
+        """Sleeves without frames are skipped; none left raises ValueError."""
+        sleeve = Sleeve("MISSING", "1D", GoldenDeathCrossStrategy)
+        with pytest.raises(ValueError, match="No data"):
+            run_portfolio_backtest({("TEST", "1D"): market_df}, [sleeve])
+
+
+class TestSleevesFromConfig:
+    """TOML universes map to one sleeve per instrument/strategy/timeframe."""
+
+    @pytest.mark.unit
+    def test_parameters_resolved_like_orchestrator(self):
+        """The last parameter set per timeframe is used; disabled entries skipped."""
+        config = TradingConfig(
+            instruments=[
+                {
+                    "symbol": "NDX",
+                    "name": "NASDAQ 100",
+                    "data_sources": ["yfinance"],
+                    "strategies": [
+                        {
+                            "name": "golden_death_cross",
+                            "timeframes": ["1D", "4H"],
+                            "parameters": {
+                                "1D": [
+                                    {"short_ma_period": 10},
+                                    {"short_ma_period": 20},
+                                ]
+                            },
+                        },
+                        {
+                            "name": "dummy_strategy_1",
+                            "timeframes": ["1D"],
+                            "enabled": False,
+                        },
+                    ],
+                },
+                {
+                    "symbol": "^GSPC",
+                    "name": "SP500",
+                    "enabled": False,
+                    "data_sources": ["yfinance"],
+                },
+            ]
+        )
+
+        sleeves = sleeves_from_config(config, timeframes=["1D"], stake=2.0)
+
+        assert len(sleeves) == 1
+        sleeve = sleeves[0]
+        assert sleeve.strategy_cls is GoldenDeathCrossStrategy
+        assert sleeve.key == ("NDX", "1D")
+        assert sleeve.stake == 2.0
+        assert sleeve.config == {
+            "short_ma_period": 20,
+            "name": "golden_death_cross",
+            "timeframe": "1D",
+            "instrument": "NDX",
+        }
@@ -0,0 +1,140 @@
+"""
+Tests for the backtest result store.
+"""
+
+import pandas as pd
+import pytest
+
+from backtesting.store import ResultStore, data_fingerprint
+from backtesting.sweep import run_sweep
+from strategies import GoldenDeathCrossStrategy
+
+GRID = {"short_ma_period": [5, 10], "long_ma_period": [10, 20]}
+BASE_CONFIG = {"volume_filter": False, "rsi_filter": False}
+
+
+class TestResultStore:
+    """Rows round-trip through npz segments and can be queried."""
+
+    @pytest.mark.unit
+    def test_round_trip_and_query(self, tmp_path):
+        """Flushed rows are visible to a new store and filterable by params."""
+        store = ResultStore(tmp_path)
+        store.put("gdc", {"short": 5, "long": 10}, "fp1", {"sharpe": 0.5})
+        store.put("gdc", {"short": 5, "long": 20}, "fp1", {"sharpe": 0.7})
+        store.put("other", {"short": 5}, "fp2", {"return_pct": float("nan")})
+        store.flush()
+        store.put("gdc", {"short": 5, "long": 10}, "fp1", {"return_pct": 0.2})
+        store.flush()
+
+        reopened = ResultStore(tmp_path)
+        assert len(reopened) == 3
+        assert reopened.get("gdc", {"long": 10, "short": 5}, "fp1") == {
+            "sharpe": 0.5,
+            "return_pct": 0.2,
+        }
+        assert reopened.get("gdc", {"short": 5, "long": 10}, "fp2") is None
+        # NaN results are stored results
+        assert list(reopened.get("other", {"short": 5}, "fp2")) == ["return_pct"]
+
+        frame = reopened.to_frame(strategy="gdc", long=20)
+        assert len(frame) == 1
+        assert frame["sharpe"].iloc[0] == 0.7
+        assert pd.isna(frame["return_pct"].iloc[0])
+
+    @pytest.mark.unit
+    def test_compact(self, tmp_path):
+        """Compaction leaves one segment with every row."""
+        with ResultStore(tmp_path) as store:
+            for i in range(3):
+                store.put("gdc", {"short": i}, "fp", {"sharpe": float(i)})
+                store.flush()
+        assert len(list(tmp_path.glob("*.npz"))) == 3
+
+        ResultStore(tmp_path).compact()
+
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+        frame = ResultStore(tmp_path).to_frame()
+        assert sorted(frame["sharpe"].tolist()) == [0.0, 1.0, 2.0]
+
+    @pytest.mark.unit
+    def test_data_fingerprint(self, market_df):
+        """Any change of the bars changes the fingerprint."""
+        changed = market_df.copy()
+        changed.loc[10, "closePrice"] += 0.01
+
+        assert data_fingerprint(market_df) == data_fingerprint(market_df.copy())
+        assert data_fingerprint(market_df) != data_fingerprint(changed)
+        assert data_fingerprint(market_df) != data_fingerprint(market_df.iloc[:-1])
+
+
+class TestSweepWithStore:
+    """Sweeps skip combinations already in the store."""
+
+    @pytest.mark.unit
+    def test_repeated_sweep_reads_store(self, market_df, tmp_path):
+        """A repeated sweep yields the stored rows and writes nothing."""
+        kwargs = dict(
+            metrics=("return_pct", "sharpe"),
+            base_config=BASE_CONFIG,
+            workers=1,
+            store=ResultStore(tmp_path),
+        )
+        expected = run_sweep(market_df, GoldenDeathCrossStrategy, GRID, **kwargs)
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+
+        kwargs["store"] = ResultStore(tmp_path)
+        result = run_sweep(market_df, GoldenDeathCrossStrategy, GRID, **kwargs)
+
+        pd.testing.assert_frame_equal(result.to_frame(), expected.to_frame())
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    @pytest.mark.unit
+    def test_only_missing_runs_execute(self, market_df, tmp_path):
+        """New combinations, metrics or run settings are run and stored."""
+        store = ResultStore(tmp_path)
+        run_sweep(
+            market_df,
+            GoldenDeathCrossStrategy,
+            GRID,
+            base_config=BASE_CONFIG,
+            workers=1,
+            store=store,
+        )
+        assert len(store) == 3
+
+        grid = {**GRID, "long_ma_period": [10, 20, 30]}
+        run_sweep(
+            market_df,
+            GoldenDeathCrossStrategy,
+            grid,
+            base_config=BASE_CONFIG,
+            workers=1,
+            store=store,
+        )
+        assert len(store) == 5
+
+        run_sweep(
+            market_df,
+            GoldenDeathCrossStrategy,
+            GRID,
+            base_config=BASE_CONFIG,
+            workers=1,
+            commission=0.001,
+            store=store,
+        )
+        assert len(store) == 8
+
+        table = run_sweep(
+            market_df,
+            GoldenDeathCrossStrategy,
+            GRID,
+            metrics=("return_pct", "hit_rate"),
+            base_config=BASE_CONFIG,
+            workers=1,
+            store=store,
+        )
+        assert len(store) == 8
+        stored = ResultStore(tmp_path).to_frame(commission=0.0, long_ma_period=20)
+        assert stored["hit_rate"].notna().all()
+        assert len(table) == 3
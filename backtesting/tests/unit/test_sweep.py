@@ -0,0 +1,144 @@
+"""
+Tests for parameter sweeps and shared-memory frames.
+"""
+
+import pandas as pd
+import pytest
+
+from backtesting.shared import SharedFrame, attach_frame
+from backtesting.sweep import (
+    SweepRow,
+    SweepTable,
+    expand_grid,
+    run_backtest,
+    run_sweep,
+)
+from strategies import GoldenDeathCrossStrategy
+
+GRID = {"short_ma_period": [5, 10], "long_ma_period": [10, 20]}
+BASE_CONFIG = {"volume_filter": False, "rsi_filter": False}
+
+
+class TestExpandGrid:
+    """Grids are validated against the strategy's DEFAULT_CONFIGS."""
+
+    @pytest.mark.unit
+    def test_invalid_combinations_skipped(self):
+        """short >= long combinations are rejected, the rest kept in order."""
+        configs, skipped = expand_grid("golden_death_cross", GRID)
+
+        assert skipped == 1
+        assert [(c["short_ma_period"], c["long_ma_period"]) for c in configs] == [
+            (5, 10),
+            (5, 20),
+            (10, 20),
+        ]
+        assert configs[0]["rsi_period"] == 14
+
+    @pytest.mark.unit
+    def test_unknown_parameter(self):
+        """Keys outside DEFAULT_CONFIGS raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown parameters"):
+            expand_grid("golden_death_cross", {"fast_period": [5]})
+
+    @pytest.mark.unit
+    def test_unknown_strategy(self):
+        """Unknown strategy names raise ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            expand_grid("mean_reversion", GRID)
+
+
+class TestSweepTable:
+    """Rows are kept ranked as they are added."""
+
+    @pytest.mark.unit
+    def test_ranking(self):
+        """Best first, NaN scores last; ascending flips the order."""
+        table = SweepTable(rank_by="score")
+        for i, score in enumerate([0.1, float("nan"), 0.3, -0.2]):
+            table.add(SweepRow(params={"i": i}, metrics={"score": score}))
+
+        assert [row.params["i"] for row in table.rows] == [2, 0, 3, 1]
+        frame = table.to_frame()
+        assert frame.index.tolist() == [1, 2, 3, 4]
+        assert frame["i"].tolist() == [2, 0, 3, 1]
+
+        table = SweepTable(rank_by="score", ascending=True)
+        for i, score in enumerate([0.1, 0.3, -0.2]):
+            table.add(SweepRow(params={"i": i}, metrics={"score": score}))
+        assert [row.params["i"] for row in table.top(2)] == [2, 0]
+
+
+class TestRunSweep:
+    """Sweeps reproduce individual backtests, in-process or in a pool."""
+
+    @pytest.mark.unit
+    def test_matches_individual_runs(self, market_df):
+        """Every row carries the metrics of a direct backtest."""
+        seen = []
+        table = run_sweep(
+            market_df,
+            GoldenDeathCrossStrategy,
+            GRID,
+            metrics=("return_pct", "num_signals", "max_drawdown"),
+            base_config=BASE_CONFIG,
+            workers=1,
+            on_result=lambda row, table: seen.append(len(table)),
+        )
+
+        assert len(table) == 3
+        assert seen == [1, 2, 3]
+        returns = [row.metrics["return_pct"] for row in table.rows]
+        assert returns == sorted(returns, reverse=True)
+        for row in table.rows:
+            config, _ = expand_grid(
+                "golden_death_cross",
+                {key: [value] for key, value in row.params.items()},
+                BASE_CONFIG,
+            )
+            result = run_backtest(market_df, GoldenDeathCrossStrategy, config[0])
+            assert row.metrics["return_pct"] == pytest.approx(result.return_pct)
+            assert row.metrics["num_signals"] == len(result.signals)
+
+    @pytest.mark.unit
+    def test_process_pool_matches_in_process(self, market_df):
+        """Workers reading shared memory produce the same table."""
+        kwargs = dict(
+            metrics=("return_pct", "sharpe"),
+            base_config=BASE_CONFIG,
+            commission=0.001,
+        )
+        expected = run_sweep(
+            market_df, GoldenDeathCrossStrategy, GRID, workers=1, **kwargs
+        )
+        result = run_sweep(
+            market_df,
+            GoldenDeathCrossStrategy,
+            GRID,
+            workers=2,
+            chunk_size=1,
+            **kwargs,
+        )
+
+        pd.testing.assert_frame_equal(result.to_frame(), expected.to_frame())
+
+    @pytest.mark.unit
+    def test_unknown_metric(self, market_df):
+        """Unknown metric names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown metrics"):
+            run_sweep(market_df, GoldenDeathCrossStrategy, GRID, metrics=("alpha",))
+
+
+class TestSharedFrame:
+    """Frames round-trip through shared memory."""
+
+    @pytest.mark.unit
+    def test_round_trip(self, market_df):
+        """Numeric, datetime and constant string columns are restored."""
+        df = market_df.assign(
+            local_time=market_df["timestamp"].dt.tz_localize("US/Eastern")
+        )
+        with SharedFrame(df) as shared:
+            restored = attach_frame(shared.spec)
+            pd.testing.assert_frame_equal(restored, df)
+            assert not restored["closePrice"].to_numpy().flags.writeable
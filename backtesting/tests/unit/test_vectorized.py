@@ -0,0 +1,86 @@
+"""
+Cross-validation of the vectorized engine against the backtrader engine.
+"""
+
+import numpy as np
+import pytest
+
+from backtesting.engine import run_golden_death_cross_backtest
+from backtesting.vectorized import (
+    run_golden_death_cross_backtest_vectorized,
+    target_positions,
+)
+
+GOLDEN_CROSS_CONFIG = {"name": "test", "short_ma_period": 5, "long_ma_period": 15}
+
+
+def _run_both(data, **kwargs):
+    expected = run_golden_death_cross_backtest(data, **kwargs)
+    result = run_golden_death_cross_backtest_vectorized(data, **kwargs)
+    return expected, result
+
+
+class TestCrossValidation:
+    """Both engines produce the same portfolio value."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("commission", [0.0, 0.001])
+    @pytest.mark.parametrize("stake", [1.0, 3.0])
+    def test_golden_death_cross(self, market_df, commission, stake):
+        """Golden/death cross runs agree with and without commission."""
+        expected, result = _run_both(
+            market_df,
+            strategy_config=GOLDEN_CROSS_CONFIG,
+            commission=commission,
+            stake=stake,
+        )
+
+        assert len(expected.signals) > 2
+        assert result.ending_cash == pytest.approx(expected.ending_cash, abs=1e-6)
+        assert result.return_pct == pytest.approx(expected.return_pct, abs=1e-10)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "actions",
+        [
+            [(0, "BUY"), (40, "SELL"), (41, "BUY")],
+            [(10, "BUY"), (12, "BUY"), (30, "SELL"), (31, "SELL")],
+            [(5, "SELL"), (299, "BUY")],
+            [],
+        ],
+    )
+    def test_scripted_signals(self, market_df, scripted_strategy, actions):
+        """Repeated, first-bar and last-bar signals are handled alike."""
+        expected, result = _run_both(
+            market_df, strategy_cls=scripted_strategy(actions), commission=0.002
+        )
+        assert result.ending_cash == pytest.approx(expected.ending_cash, abs=1e-6)
+
+
+class TestEquityCurve:
+    """The vectorized engine reports the per-bar portfolio value."""
+
+    @pytest.mark.unit
+    def test_equity_curve(self, market_df, scripted_strategy):
+        """Value is flat before the first fill and ends at ending_cash."""
+        result = run_golden_death_cross_backtest_vectorized(
+            market_df,
+            starting_cash=10_000,
+            strategy_cls=scripted_strategy([(10, "BUY")]),
+        )
+
+        curve = result.equity_curve
+        assert len(curve) == len(market_df)
+        assert (curve.iloc[:11] == 10_000).all()
+        assert curve.iloc[-1] == pytest.approx(result.ending_cash)
+        closes = market_df["closePrice"].to_numpy()
+        opens = market_df["openPrice"].to_numpy()
+        np.testing.assert_allclose(curve.iloc[11:], 10_000 - opens[11] + closes[11:])
+
+    @pytest.mark.unit
+    def test_target_positions(self):
+        """Targets follow the last signal and ignore no-op actions."""
+        targets = target_positions(
+            6, np.array([1, 3, 3, 4]), np.array([1, 0, -1, 0]), stake=2.0
+        )
+        assert targets.tolist() == [0.0, 2.0, 2.0, -2.0, -2.0, -2.0]
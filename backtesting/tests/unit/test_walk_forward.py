@@ -0,0 +1,146 @@
+"""
+Tests for walk-forward optimization.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting.sweep import expand_grid, run_backtest
+from backtesting.walk_forward import (
+    WalkForwardWindow,
+    run_walk_forward,
+    walk_forward_windows,
+)
+from strategies import GoldenDeathCrossStrategy
+
+GRID = {"short_ma_period": [5, 10], "long_ma_period": [10, 20]}
+BASE_CONFIG = {"volume_filter": False, "rsi_filter": False}
+
+
+class TestWalkForwardWindows:
+    """Windows tile the series after the first training period."""
+
+    @pytest.mark.unit
+    def test_rolling_bars(self):
+        """Rolling windows advance by the test size; the last one is short."""
+        timestamps = pd.date_range("2020-01-01", periods=10, freq="D")
+
+        assert walk_forward_windows(timestamps, 4, 3) == [
+            WalkForwardWindow(0, 4, 4, 7),
+            WalkForwardWindow(3, 7, 7, 10),
+        ]
+
+    @pytest.mark.unit
+    def test_anchored_durations(self):
+        """Durations are resolved to bar positions; anchored starts at 0."""
+        timestamps = pd.date_range("2020-01-01", periods=10, freq="D")
+
+        windows = walk_forward_windows(timestamps, "4D", "3D", anchored=True)
+
+        assert windows == [
+            WalkForwardWindow(0, 4, 4, 7),
+            WalkForwardWindow(0, 7, 7, 10),
+        ]
+
+    @pytest.mark.unit
+    def test_mixed_sizes(self):
+        """Bar counts and durations cannot be combined."""
+        timestamps = pd.date_range("2020-01-01", periods=10, freq="D")
+        with pytest.raises(ValueError, match="both"):
+            walk_forward_windows(timestamps, 4, "3D")
+
+
+class TestRunWalkForward:
+    """Out-of-sample windows are stitched into one equity curve."""
+
+    @pytest.mark.unit
+    def test_single_combination_matches_continuous_run(self, market_df):
+        """With one candidate, daily P&L equals one backtest over the series."""
+        grid = {"short_ma_period": [5], "long_ma_period": [20]}
+        result = run_walk_forward(
+            market_df,
+            GoldenDeathCrossStrategy,
+            grid,
+            train=100,
+            test=50,
+            base_config=BASE_CONFIG,
+            workers=1,
+            commission=0.001,
+        )
+        config, _ = expand_grid("golden_death_cross", grid, BASE_CONFIG)
+        full = run_backtest(
+            market_df, GoldenDeathCrossStrategy, config[0], commission=0.001
+        )
+
+        assert len(result.windows) == 4
+        pd.testing.assert_index_equal(
+            result.equity_curve.index, full.equity_curve.index[100:]
+        )
+        # The first test bar enters at its open; from then on both runs
+        # hold the same position
+        np.testing.assert_allclose(
+            np.diff(result.equity_curve.to_numpy())[1:],
+            np.diff(full.equity_curve.to_numpy()[100:])[1:],
+            atol=1e-9,
+        )
+        assert result.ending_cash == pytest.approx(result.equity_curve.iloc[-1])
+
+    @pytest.mark.unit
+    def test_windows_pick_best_training_parameters(self, market_df):
+        """Each window trades the combination ranked first on its train span."""
+        kwargs = dict(
+            train=120, test=60, metrics=("return_pct",), base_config=BASE_CONFIG
+        )
+        result = run_walk_forward(
+            market_df, GoldenDeathCrossStrategy, GRID, workers=1, **kwargs
+        )
+        configs, _ = expand_grid("golden_death_cross", GRID, BASE_CONFIG)
+        candidates = [
+            run_walk_forward(
+                market_df,
+                GoldenDeathCrossStrategy,
+                {key: [config[key]] for key in GRID},
+                workers=1,
+                **kwargs,
+            )
+            for config in configs
+        ]
+
+        frame = result.to_frame()
+        assert frame["test_start"].tolist() == [
+            market_df["timestamp"].iloc[i] for i in (120, 180, 240)
+        ]
+        for i, window in enumerate(result.windows):
+            scores = [c.windows[i].train_metrics["return_pct"] for c in candidates]
+            best = candidates[int(np.argmax(scores))].windows[i]
+            assert window.params == best.params
+            assert window.train_metrics == best.train_metrics
+
+    @pytest.mark.unit
+    def test_process_pool_matches_in_process(self, market_df):
+        """Workers reading shared memory produce the same result."""
+        kwargs = dict(
+            train=100,
+            test=50,
+            metrics=("sharpe", "return_pct"),
+            base_config=BASE_CONFIG,
+            commission=0.001,
+        )
+        expected = run_walk_forward(
+            market_df, GoldenDeathCrossStrategy, GRID, workers=1, **kwargs
+        )
+        result = run_walk_forward(
+            market_df, GoldenDeathCrossStrategy, GRID, workers=2, **kwargs
+        )
+
+        pd.testing.assert_frame_equal(result.to_frame(), expected.to_frame())
+        pd.testing.assert_series_equal(result.equity_curve, expected.equity_curve)
+
+    @pytest.mark.unit
+    def test_too_short(self, market_df):
+        """A series shorter than one training window raises ValueError."""
+        with pytest.raises(ValueError, match="too short"):
+            run_walk_forward(
+                market_df, GoldenDeathCrossStrategy, GRID, train=300, test=50
+            )
@@ -0,0 +1,202 @@
+"""
+Vectorized backtesting engine for signal-driven strategies.
+
+Reproduces the fills of SignalExecutionStrategy on backtrader with array
+operations over the whole series instead of a per-bar event loop:
+
+- a BUY signal targets a long position of stake units, a SELL signal a
+  short position of stake units (flattening the opposite side first)
+- market orders placed on a bar fill at the next bar's open; orders placed
+  on the last bar never fill
+- commission is commission * |units traded| * fill price
+- portfolio value is cash plus position marked at the bar close
+
+Unlike the broker, cash is not checked before filling orders, and several
+signals on one bar resolve to the last one.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import (
+    BacktestResult,
+    SignalGenerator,
+    _compute_signals,
+    compile_signals,
+)
+from strategies.implementations.golden_death_cross import GoldenDeathCrossStrategy
+
+# Project OHLCV schema (as mapped by MarketDataFeed)
+TIMESTAMP_COLUMN = "timestamp"
+OPEN_COLUMN = "openPrice"
+CLOSE_COLUMN = "closePrice"
+
+
+def target_positions(
+    n_bars: int,
+    bars: np.ndarray,
+    actions: np.ndarray,
+    stake: float,
+    initial: float = 0.0,
+) -> np.ndarray:
+    """
+    Position targeted after each bar's signals
+
+    Args:
+        n_bars: Number of bars
+        bars: Signal bar positions (ascending)
+        actions: Signal actions (+1 BUY, -1 SELL, 0 no-op)
+        stake: Units per position
+        initial: Target before the first signal
+
+    Returns:
+        Array of n_bars targets
+    """
+    active = actions != 0
+    bars, actions = bars[active], actions[active]
+    # Index of the last signal on or before every bar (-1: none yet)
+    last_signal = np.full(n_bars, -1)
+    last_signal[bars] = np.arange(len(bars))
+    np.maximum.accumulate(last_signal, out=last_signal)
+
+    targets = np.full(n_bars, float(initial))
+    seen = last_signal >= 0
+    targets[seen] = stake * actions[last_signal[seen]]
+    return targets
+
+
+def simulate(
+    opens: np.ndarray,
+    closes: np.ndarray,
+    targets: np.ndarray,
+    starting_cash: float,
+    commission: float = 0.0,
+    entry: float = 0.0,
+    initial_position: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fill target positions and value the portfolio bar by bar
+
+    Orders from bar t fill at the open of bar t + 1; the first bar's open
+    fills the order from before the series (initial_position -> entry).
+
+    Args:
+        opens: Open prices
+        closes: Close prices
+        targets: Position targeted after each bar
+        starting_cash: Cash before the first bar
+        commission: commission (fractional)
+        entry: Position held from the first bar's open
+        initial_position: Position held before the first bar
+
+    Returns:
+        (positions held during each bar, portfolio value at each close)
+    """
+    position = np.empty(len(targets))
+    position[:1] = entry
+    position[1:] = targets[:-1]
+    traded = np.diff(position, prepend=initial_position)
+    cash_flow = traded * opens + commission * np.abs(traded) * opens
+    cash = starting_cash - np.cumsum(cash_flow)
+    return position, cash + position * closes
+
+
+def fill_frame(
+    timestamps: pd.DatetimeIndex,
+    traded: np.ndarray,
+    prices: np.ndarray,
+    commission: float = 0.0,
+) -> pd.DataFrame:
+    """
+    Executed orders of a simulation
+
+    Args:
+        timestamps: Bar timestamps
+        traded: Units traded at each bar (signed)
+        prices: Fill price at each bar
+        commission: commission (fractional)
+
+    Returns:
+        DataFrame with timestamp, size, price and commission per fill
+    """
+    filled = np.flatnonzero(traded)
+    size, price = traded[filled], prices[filled]
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps[filled],
+            "size": size,
+            "price": price,
+            "commission": commission * np.abs(size) * price,
+        }
+    )
+
+
+def run_vectorized_backtest(
+    data: pd.DataFrame,
+    signals_df: pd.DataFrame,
+    starting_cash: float = 100_000.0,
+    stake: float = 1.0,
+    commission: float = 0.0,
+) -> BacktestResult:
+    """
+    Execute precomputed signals on OHLCV data without an event loop.
+
+    Args:
+        data: OHLCV DataFrame with columns timestamp, openPrice and closePrice
+        signals_df: Signals with timestamp and signal_type columns
+        starting_cash: initial cash
+        stake: order size per signal (units)
+        commission: commission (fractional, e.g., 0.001 for 0.1%)
+    """
+    opens = data[OPEN_COLUMN].to_numpy(dtype=np.float64)
+    closes = data[CLOSE_COLUMN].to_numpy(dtype=np.float64)
+    n_bars = len(data)
+
+    bars, actions = compile_signals(signals_df, data[TIMESTAMP_COLUMN])
+    targets = target_positions(n_bars, bars, actions, stake)
+    position, equity = simulate(opens, closes, targets, starting_cash, commission)
+    index = pd.DatetimeIndex(data[TIMESTAMP_COLUMN])
+
+    ending_cash = float(equity[-1]) if n_bars else starting_cash
+    return_pct = (ending_cash - starting_cash) / starting_cash if starting_cash else 0.0
+
+    return BacktestResult(
+        signals=signals_df,
+        starting_cash=starting_cash,
+        ending_cash=ending_cash,
+        return_pct=return_pct,
+        equity_curve=pd.Series(equity, index=index, name="equity"),
+        positions=pd.Series(position, index=index, name="position"),
+        fills=fill_frame(index, np.diff(position, prepend=0.0), opens, commission),
+    )
+
+
+def run_golden_death_cross_backtest_vectorized(
+    data: pd.DataFrame,
+    strategy_config: Optional[Dict[str, Any]] = None,
+    starting_cash: float = 100_000.0,
+    stake: float = 1.0,
+    commission: float = 0.0,
+    strategy_cls: Type[SignalGenerator] = GoldenDeathCrossStrategy,
+) -> BacktestResult:
+    """
+    Vectorized counterpart of run_golden_death_cross_backtest.
+
+    Args:
+        data: OHLCV DataFrame with columns timestamp, openPrice, highPrice, lowPrice, closePrice, lastTradedVolume
+        strategy_config: config for GoldenDeathCrossStrategy
+        starting_cash: initial cash
+        stake: order size per signal (units)
+        commission: commission (fractional, e.g., 0.001 for 0.1%)
+        strategy_cls: strategy class implementing generate_signals
+    """
+    signals_df = _compute_signals(strategy_cls, data, strategy_config or {})
+    return run_vectorized_backtest(
+        data,
+        signals_df,
+        starting_cash=starting_cash,
+        stake=stake,
+        commission=commission,
+    )
@@ -0,0 +1,486 @@
+"""
+Walk-forward optimization on top of the vectorized backtest engine.
+
+The series is split into consecutive test windows, each preceded by a
+training window (rolling or anchored at the first bar). A parameter sweep
+on every training window picks the parameters applied out-of-sample on the
+following test window, and the test windows are stitched into one
+out-of-sample equity curve.
+
+Signals only depend on past bars, so each parameter combination is turned
+into signals once over the whole series and every (overlapping) window
+reuses them: evaluating a window is an array slice plus a vectorized fill
+simulation. Signal generation and the per-window sweeps run in process
+pools sharing the market data through shared memory.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import (
+    BacktestResult,
+    SignalGenerator,
+    _compute_signals,
+    compile_signals,
+)
+from backtesting.shared import SharedFrame, SharedFrameSpec, attach_frame
+from backtesting.metrics import Metric
+from backtesting.sweep import (
+    ParamGrid,
+    SweepRow,
+    SweepTable,
+    _resolve_metrics,
+    expand_grid,
+)
+from backtesting.vectorized import (
+    CLOSE_COLUMN,
+    OPEN_COLUMN,
+    TIMESTAMP_COLUMN,
+    fill_frame,
+    simulate,
+    target_positions,
+)
+
+# Window length: a number of bars or a duration ("365D", pd.Timedelta)
+WindowSize = Union[int, str, pd.Timedelta]
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """Bar positions of one train/test split (end positions exclusive)"""
+
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+def walk_forward_windows(
+    timestamps: Any,
+    train: WindowSize,
+    test: WindowSize,
+    anchored: bool = False,
+) -> List[WalkForwardWindow]:
+    """
+    Split a series into consecutive test windows with preceding train windows
+
+    Args:
+        timestamps: Bar timestamps (ascending)
+        train: Training length (bars or duration)
+        test: Test length (bars or duration); windows advance by this much
+        anchored: Start every training window at the first bar
+
+    Returns:
+        Windows in chronological order; the last test window may be shorter
+
+    Raises:
+        ValueError: If the sizes mix bars and durations or are not positive
+    """
+    index = pd.DatetimeIndex(timestamps)
+    n_bars = len(index)
+    by_bars = isinstance(train, (int, np.integer))
+    if by_bars != isinstance(test, (int, np.integer)):
+        raise ValueError("train and test must both be bar counts or durations")
+
+    if by_bars:
+        if train <= 0 or test <= 0:
+            raise ValueError("train and test must be positive")
+        boundaries = list(range(train, n_bars, test))
+
+        def train_start_of(test_start: int) -> int:
+            return 0 if anchored else test_start - train
+
+    else:
+        train, test = pd.Timedelta(train), pd.Timedelta(test)
+        if train <= pd.Timedelta(0) or test <= pd.Timedelta(0):
+            raise ValueError("train and test must be positive")
+        if n_bars == 0:
+            return []
+        starts = pd.date_range(index[0] + train, index[-1], freq=test)
+        boundaries = sorted(set(index.searchsorted(starts).tolist()))
+
+        def train_start_of(test_start: int) -> int:
+            if anchored:
+                return 0
+            return int(index.searchsorted(index[test_start] - train))
+
+    windows = []
+    for i, test_start in enumerate(boundaries):
+        test_end = boundaries[i + 1] if i + 1 < len(boundaries) else n_bars
+        if test_start >= test_end:
+            continue
+        windows.append(
+            WalkForwardWindow(
+                train_start=train_start_of(test_start),
+                train_end=test_start,
+                test_start=test_start,
+                test_end=test_end,
+            )
+        )
+    return windows
+
+
+@dataclass
+class _CompiledSignals:
+    """Signals of one configuration over the whole series"""
+
+    bars: np.ndarray
+    actions: np.ndarray
+    # Last BUY/SELL action on or before each signal (0 before the first)
+    held: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, bars: np.ndarray, actions: np.ndarray) -> "_CompiledSignals":
+        active = np.flatnonzero(actions != 0)
+        last_active = np.full(len(actions), -1)
+        last_active[active] = active
+        np.maximum.accumulate(last_active, out=last_active)
+        held = np.where(last_active >= 0, actions[np.maximum(last_active, 0)], 0)
+        return cls(bars=bars, actions=actions, held=held.astype(np.int8))
+
+
+@dataclass
+class _Market:
+    opens: np.ndarray
+    closes: np.ndarray
+    timestamps: pd.DatetimeIndex
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "_Market":
+        return cls(
+            opens=data[OPEN_COLUMN].to_numpy(dtype=np.float64),
+            closes=data[CLOSE_COLUMN].to_numpy(dtype=np.float64),
+            timestamps=pd.DatetimeIndex(data[TIMESTAMP_COLUMN]),
+        )
+
+
+def _evaluate(
+    market: _Market,
+    signals: _CompiledSignals,
+    start: int,
+    end: int,
+    starting_cash: float,
+    stake: float,
+    commission: float,
+    initial_position: float = 0.0,
+) -> Tuple[BacktestResult, float]:
+    """
+    Backtest bars [start, end) with signals computed on the whole series
+
+    The portfolio before start is worth starting_cash at the previous close
+    and holds initial_position; at the first bar's open it moves to the
+    position implied by the last signal before start.
+
+    Returns:
+        (result, position held during the last bar)
+    """
+    cash = starting_cash
+    if initial_position:
+        cash -= initial_position * market.closes[start - 1]
+    lo, hi = np.searchsorted(signals.bars, [start, end])
+    entry = stake * signals.held[lo - 1] if lo > 0 else 0.0
+    targets = target_positions(
+        end - start,
+        signals.bars[lo:hi] - start,
+        signals.actions[lo:hi],
+        stake,
+        initial=entry,
+    )
+    position, equity = simulate(
+        market.opens[start:end],
+        market.closes[start:end],
+        targets,
+        cash,
+        commission,
+        entry=entry,
+        initial_position=initial_position,
+    )
+
+    actions = signals.actions[lo:hi]
+    index = market.timestamps[start:end]
+    ending_cash = float(equity[-1])
+    result = BacktestResult(
+        signals=pd.DataFrame(
+            {
+                "timestamp": market.timestamps[signals.bars[lo:hi]],
+                "signal_type": np.where(
+                    actions > 0, "BUY", np.where(actions < 0, "SELL", "HOLD")
+                ),
+            }
+        ),
+        starting_cash=starting_cash,
+        ending_cash=ending_cash,
+        return_pct=(
+            (ending_cash - starting_cash) / starting_cash if starting_cash else 0.0
+        ),
+        equity_curve=pd.Series(equity, index=index, name="equity"),
+        positions=pd.Series(position, index=index, name="position"),
+        fills=fill_frame(
+            index,
+            np.diff(position, prepend=initial_position),
+            market.opens[start:end],
+            commission,
+        ),
+    )
+    return result, float(position[-1])
+
+
+@dataclass
+class WindowResult:
+    """Parameters chosen on one training window and their test performance"""
+
+    window: WalkForwardWindow
+    params: Dict[str, Any]
+    train_metrics: Dict[str, float]
+    test_metrics: Dict[str, float]
+
+
+@dataclass
+class WalkForwardResult:
+    """Stitched out-of-sample walk-forward run"""
+
+    windows: List[WindowResult]
+    equity_curve: pd.Series
+    starting_cash: float
+    ending_cash: float
+    return_pct: float
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per window: test period, chosen parameters and metrics"""
+        timestamps = self.equity_curve.index
+        offset = self.windows[0].window.test_start if self.windows else 0
+        rows = []
+        for result in self.windows:
+            window = result.window
+            rows.append(
+                {
+                    "test_start": timestamps[window.test_start - offset],
+                    "test_end": timestamps[window.test_end - 1 - offset],
+                    **result.params,
+                    **{f"train_{k}": v for k, v in result.train_metrics.items()},
+                    **{f"test_{k}": v for k, v in result.test_metrics.items()},
+                }
+            )
+        return pd.DataFrame(rows)
+
+
+# -- worker side --------------------------------------------------------------
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_signal_worker(
+    spec: SharedFrameSpec, strategy_cls: Type[SignalGenerator]
+) -> None:
+    _worker.update(data=attach_frame(spec), strategy_cls=strategy_cls)
+
+
+def _compile_config(config: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    data = _worker["data"]
+    signals_df = _compute_signals(_worker["strategy_cls"], data, config)
+    return compile_signals(signals_df, data[TIMESTAMP_COLUMN])
+
+
+def _init_window_worker(
+    spec: SharedFrameSpec,
+    compiled: List[Tuple[np.ndarray, np.ndarray]],
+    metrics: Dict[str, Metric],
+    run_kwargs: Dict[str, Any],
+) -> None:
+    _worker.update(
+        market=_Market.from_frame(attach_frame(spec)),
+        signals=[_CompiledSignals.from_arrays(*arrays) for arrays in compiled],
+        metrics=metrics,
+        run_kwargs=run_kwargs,
+    )
+
+
+def _train_window(
+    window: WalkForwardWindow, rank_by: str, ascending: bool
+) -> Tuple[int, Dict[str, float]]:
+    """Index and metrics of the best configuration on a training window"""
+    table = SweepTable(rank_by=rank_by, ascending=ascending)
+    for index, signals in enumerate(_worker["signals"]):
+        result, _ = _evaluate(
+            _worker["market"],
+            signals,
+            window.train_start,
+            window.train_end,
+            **_worker["run_kwargs"],
+        )
+        table.add(
+            SweepRow(
+                params={"index": index},
+                metrics={
+                    name: float(metric(result))
+                    for name, metric in _worker["metrics"].items()
+                },
+            )
+        )
+    best = table.rows[0]
+    return best.params["index"], best.metrics
+
+
+def _map(
+    fn: Callable[..., Any],
+    tasks: Iterable[Tuple[Any, ...]],
+    workers: int,
+    initializer: Callable[..., None],
+    initargs: Tuple[Any, ...],
+) -> Iterator[Any]:
+    """Run fn over tasks in order, in-process (workers == 1) or in a pool"""
+    if workers == 1:
+        initializer(*initargs)
+        try:
+            for task in tasks:
+                yield fn(*task)
+        finally:
+            _worker.clear()
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        yield from executor.map(fn, *zip(*tasks))
+
+
+# -- driver -------------------------------------------------------------------
+
+
+def run_walk_forward(
+    data: pd.DataFrame,
+    strategy_cls: Type[SignalGenerator],
+    grid: ParamGrid,
+    train: WindowSize,
+    test: WindowSize,
+    anchored: bool = False,
+    metrics: Union[Sequence[str], Mapping[str, Metric]] = ("return_pct",),
+    rank_by: Optional[str] = None,
+    ascending: bool = False,
+    base_config: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    starting_cash: float = 100_000.0,
+    stake: float = 1.0,
+    commission: float = 0.0,
+) -> WalkForwardResult:
+    """
+    Optimize on rolling training windows and trade the next window
+
+    Each test window starts from the previous window's portfolio: the held
+    position is carried over and rebalanced at the window's first open to
+    what the newly chosen parameters' signals imply.
+
+    Args:
+        data: OHLCV DataFrame in the project schema, sorted by timestamp
+        strategy_cls: strategy class with a str_name key in DEFAULT_CONFIGS
+        grid: Mapping of config key to candidate values
+        train: Training window length (bars or duration such as "730D")
+        test: Test window length (bars or duration)
+        anchored: Grow training windows from the first bar instead of rolling
+        metrics: Metric names (see backtesting.metrics.METRICS) or a name ->
+            callable mapping, reported for train and test windows
+        rank_by: Metric selecting the parameters (default: the first metric)
+        ascending: Prefer lower values of rank_by
+        base_config: Overrides applied to the defaults before the grid
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        starting_cash: initial cash
+        stake: order size per signal (units)
+        commission: commission (fractional, e.g., 0.001 for 0.1%)
+
+    Returns:
+        WalkForwardResult with the stitched out-of-sample equity curve
+    """
+    metric_fns = _resolve_metrics(metrics)
+    rank_by = rank_by or next(iter(metric_fns))
+    if rank_by not in metric_fns:
+        raise ValueError(f"rank_by {rank_by!r} is not one of the metrics")
+
+    windows = walk_forward_windows(data[TIMESTAMP_COLUMN], train, test, anchored)
+    if not windows:
+        raise ValueError("Data too short for a single train/test window")
+    configs, _ = expand_grid(strategy_cls.str_name, grid, base_config)
+    if not configs:
+        raise ValueError("Parameter grid has no valid combination")
+
+    run_kwargs = dict(stake=stake, commission=commission)
+    workers = workers or os.cpu_count() or 1
+    with SharedFrame(data) as shared:
+        compiled = list(
+            _map(
+                _compile_config,
+                [(config,) for config in configs],
+                min(workers, len(configs)),
+                _init_signal_worker,
+                (shared.spec, strategy_cls),
+            )
+        )
+        chosen = list(
+            _map(
+                _train_window,
+                [(window, rank_by, ascending) for window in windows],
+                min(workers, len(windows)),
+                _init_window_worker,
+                (
+                    shared.spec,
+                    compiled,
+                    metric_fns,
+                    {**run_kwargs, "starting_cash": starting_cash},
+                ),
+            )
+        )
+
+    # Stitch the out-of-sample windows (sequential: each starts from the
+    # previous window's cash and position)
+    market = _Market.from_frame(data)
+    signals = [_CompiledSignals.from_arrays(*arrays) for arrays in compiled]
+    value, position = starting_cash, 0.0
+    curves, results = [], []
+    for window, (index, train_metrics) in zip(windows, chosen):
+        result, position = _evaluate(
+            market,
+            signals[index],
+            window.test_start,
+            window.test_end,
+            starting_cash=value,
+            initial_position=position,
+            **run_kwargs,
+        )
+        value = result.ending_cash
+        curves.append(result.equity_curve)
+        results.append(
+            WindowResult(
+                window=window,
+                params={key: configs[index][key] for key in grid},
+                train_metrics=train_metrics,
+                test_metrics={
+                    name: float(metric(result)) for name, metric in metric_fns.items()
+                },
+            )
+        )
+
+    return WalkForwardResult(
+        windows=results,
+        equity_curve=pd.concat(curves),
+        starting_cash=starting_cash,
+        ending_cash=value,
+        return_pct=(value - starting_cash) / starting_cash if starting_cash else 0.0,
+    )
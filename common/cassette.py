@@ -0,0 +1,217 @@
+"""
+Record/replay store for API responses.
+
+A Cassette maps request keys to recorded responses, one gzip-compressed
+pickle per key in a directory, so development, CI and benchmark runs can
+reuse data downloaded once instead of hitting the network again. Modes:
+
+- record: always fetch and overwrite the recording
+- replay: only replay; a request with no recording raises CassetteMissError
+- record_missing: replay what is recorded, fetch and record the rest
+
+Entries are written via a temporary file and rename, so concurrent
+recorders never leave a truncated entry. Cassettes are unpickled on replay:
+only load directories you recorded yourself.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+RECORD_MISSING = "record_missing"
+MODES = (RECORD, REPLAY, RECORD_MISSING)
+
+_MISSING = object()
+
+
+class CassetteMissError(LookupError):
+    """A request has no recording and the cassette is replay-only"""
+
+
+class Cassette:
+    """Directory of recorded responses keyed by request"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mode: str = RECORD_MISSING,
+        compresslevel: int = 6,
+    ):
+        """
+        Open (or create) a cassette
+
+        Args:
+            path: Directory holding the recordings
+            mode: RECORD, REPLAY or RECORD_MISSING
+            compresslevel: gzip level of new recordings (1-9)
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}, expected one of {MODES}")
+        self.path = Path(path).expanduser()
+        self.mode = mode
+        self.compresslevel = compresslevel
+        if mode != REPLAY:
+            self.path.mkdir(parents=True, exist_ok=True)
+        self._stats: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        Key of a request
+
+        Args:
+            *parts: Values identifying the request (their reprs must be
+                stable across runs, e.g. strings, numbers, dates and tuples)
+
+        Returns:
+            Hex digest used as the recording's file name
+        """
+        return hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.pkl.gz"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _load(self, key: str) -> Any:
+        try:
+            with gzip.open(self._file(key), "rb") as f:
+                return pickle.load(f)["response"]
+        except FileNotFoundError:
+            return _MISSING
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cassette entry {key}: {e}")
+            return _MISSING
+
+    def save(self, key: str, response: Any, request: str = "") -> None:
+        """
+        Record a response
+
+        Args:
+            key: Request key
+            response: Picklable response
+            request: Human-readable description of the request, kept with
+                the entry for inspection
+        """
+        entry = {"request": request, "response": response}
+        data = gzip.compress(
+            pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL),
+            compresslevel=self.compresslevel,
+        )
+        path = self._file(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self._count("recorded")
+        except OSError as e:
+            logger.warning(f"Could not record cassette entry {key}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _replay(self, key: str, request: str, refresh: bool) -> Any:
+        if self.mode == RECORD or (refresh and self.mode != REPLAY):
+            return _MISSING
+        response = self._load(key)
+        if response is not _MISSING:
+            self._count("hits")
+            return response
+        if self.mode == REPLAY:
+            self._count("misses")
+            raise CassetteMissError(f"No recording of {request or key} in {self.path}")
+        return _MISSING
+
+    def _fetched(
+        self,
+        key: str,
+        response: Any,
+        request: str,
+        to_record: Optional[Callable[[Any], Any]],
+    ) -> Any:
+        self._count("fetched")
+        recorded = response if to_record is None else to_record(response)
+        if recorded is not None:
+            self.save(key, recorded, request)
+        return response
+
+    def play(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        request: str = "",
+        to_record: Optional[Callable[[Any], Any]] = None,
+        refresh: bool = False,
+    ) -> Any:
+        """
+        Replay a request, or fetch (and record) it as the mode allows
+
+        Args:
+            key: Request key
+            fetch: Performs the request and returns its response
+            request: Description of the request (for entries and errors)
+            to_record: Maps a fetched response to what is recorded, or to
+                None to not record it (e.g. rate-limit or server errors);
+                the response itself is recorded by default
+            refresh: Fetch and record again unless the cassette is
+                replay-only (for requests whose response changes over time,
+                such as logins and "latest N" windows)
+
+        Returns:
+            The recorded or fetched response
+
+        Raises:
+            CassetteMissError: In REPLAY mode when nothing is recorded
+        """
+        response = self._replay(key, request, refresh)
+        if response is not _MISSING:
+            return response
+        return self._fetched(key, fetch(), request, to_record)
+
+    async def aplay(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        request: str = "",
+        to_record: Optional[Callable[[Any], Any]] = None,
+        refresh: bool = False,
+    ) -> Any:
+        """play() for a coroutine function fetch"""
+        response = self._replay(key, request, refresh)
+        if response is not _MISSING:
+            return response
+        return self._fetched(key, await fetch(), request, to_record)
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of hits, misses, fetched and recorded responses"""
+        with self._lock:
+            return {
+                name: self._stats[name]
+                for name in ("hits", "misses", "fetched", "recorded")
+            }
+
+
+def default_cassette() -> Optional[Cassette]:
+    """
+    Cassette configured by HTTP_CASSETTE_DIR and HTTP_CASSETTE_MODE (see
+    settings.Secrets.http_cassette_dir)
+
+    Returns:
+        A Cassette, or None when no directory is configured
+    """
+    from settings import secrets
+
+    if not secrets.http_cassette_dir:
+        return None
+    return Cassette(secrets.http_cassette_dir, secrets.http_cassette_mode)
@@ -3,12 +3,14 @@ Resilience utilities: circuit breakers, rate limiting, retries
 """
 
 from .circuit_breaker import CircuitBreaker, CircuitState
-from .rate_limiter import RateLimiter
+from .rate_limiter import AsyncRateLimiter, PriorityRateLimiter, RateLimiter
 from .retry import RetryConfig, retry_with_backoff, exponential_backoff_with_jitter
 
 __all__ = [
+    "AsyncRateLimiter",
     "CircuitBreaker",
     "CircuitState",
+    "PriorityRateLimiter",
     "RateLimiter",
     "RetryConfig",
     "retry_with_backoff",
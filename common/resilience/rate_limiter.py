@@ -2,9 +2,14 @@
 Rate limiter using token bucket algorithm
 """
 
+import asyncio
+import heapq
+import itertools
 import logging
+import threading
 import time
 from collections import deque
+from typing import Any, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -76,3 +81,188 @@ class RateLimiter:
             self.calls.popleft()
 
         return max(0, self.max_calls - len(self.calls))
+
+
+class AsyncRateLimiter:
+    """
+    Sliding-window rate limiter for coroutines
+
+    acquire() awaits instead of blocking, so requests from many tasks on one
+    event loop share the allowance. Waiters are served in arrival order.
+    """
+
+    def __init__(self, max_calls: int, period_seconds: float):
+        """
+        Initialize rate limiter
+
+        Args:
+            max_calls: Maximum number of calls allowed in period
+            period_seconds: Time period in seconds
+        """
+        self.max_calls = max_calls
+        self.period = period_seconds
+        self.calls = deque()
+        self._lock = asyncio.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self.calls and self.calls[0] <= now - self.period:
+            self.calls.popleft()
+
+    async def acquire(self) -> None:
+        """
+        Acquire permission to make a call, waiting if necessary
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                if len(self.calls) < self.max_calls:
+                    self.calls.append(now)
+                    return
+                sleep_time = self.period - (now - self.calls[0])
+                logger.debug(f"Rate limit reached, waiting {sleep_time:.2f}s")
+                await asyncio.sleep(sleep_time)
+
+    def try_acquire(self) -> bool:
+        """
+        Try to acquire permission without waiting
+
+        Returns:
+            True if acquired, False if rate limited (or tasks are waiting)
+        """
+        if self._lock.locked():
+            return False
+        now = time.monotonic()
+        self._prune(now)
+        if len(self.calls) >= self.max_calls:
+            return False
+        self.calls.append(now)
+        return True
+
+    def get_remaining_calls(self) -> int:
+        """Get number of remaining calls in current window"""
+        self._prune(time.monotonic())
+        return max(0, self.max_calls - len(self.calls))
+
+
+class PriorityRateLimiter:
+    """
+    Thread-safe sliding-window rate limiter with priority lanes
+
+    Waiting callers are served by priority (lower first), then in arrival
+    order, so urgent calls overtake queued bulk calls without exceeding the
+    limit. Counts of acquired calls and time spent waiting are kept as
+    metrics.
+    """
+
+    def __init__(self, max_calls: int, period_seconds: float, name: str = ""):
+        """
+        Initialize rate limiter
+
+        Args:
+            max_calls: Maximum number of calls allowed in period
+            period_seconds: Time period in seconds
+            name: Name reported in metrics and logs
+        """
+        self.max_calls = max_calls
+        self.period = period_seconds
+        self.name = name
+        self.calls = deque()
+        self.acquired = 0
+        self.wait_seconds = 0.0
+        self._waiters: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def _prune(self, now: float) -> None:
+        while self.calls and self.calls[0] <= now - self.period:
+            self.calls.popleft()
+
+    def acquire(self, priority: int = 0) -> float:
+        """
+        Acquire permission to make a call, blocking if necessary
+
+        Args:
+            priority: Lane of the call; lower values are served first
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        ticket = (priority, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._prune(now)
+                    if len(self.calls) < self.max_calls:
+                        if self._waiters[0] == ticket:
+                            break
+                        # A call of a higher lane (or queued earlier) goes first
+                        self._cond.wait()
+                    else:
+                        sleep_time = self.calls[0] + self.period - now
+                        logger.debug(
+                            f"Rate limit {self.name} reached, waiting "
+                            f"{sleep_time:.2f}s (priority {priority})"
+                        )
+                        self._cond.wait(timeout=sleep_time)
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiters)
+            self.calls.append(now)
+            waited = now - start
+            self.acquired += 1
+            self.wait_seconds += waited
+            self._cond.notify_all()
+        return waited
+
+    def try_acquire(self, priority: int = 0) -> bool:
+        """
+        Try to acquire permission without blocking
+
+        Returns:
+            True if acquired, False if rate limited (or a call of the same
+            or a higher lane is waiting)
+        """
+        with self._cond:
+            if self._waiters and self._waiters[0][0] <= priority:
+                return False
+            now = time.monotonic()
+            self._prune(now)
+            if len(self.calls) >= self.max_calls:
+                return False
+            self.calls.append(now)
+            self.acquired += 1
+            return True
+
+    def get_remaining_calls(self) -> int:
+        """Get number of remaining calls in current window"""
+        with self._cond:
+            self._prune(time.monotonic())
+            return max(0, self.max_calls - len(self.calls))
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Current level of the bucket
+
+        Returns:
+            Dictionary with max_calls, period, used and remaining calls in
+            the current window, waiting callers, acquired calls and total
+            seconds spent waiting
+        """
+        with self._cond:
+            self._prune(time.monotonic())
+            return {
+                "max_calls": self.max_calls,
+                "period": self.period,
+                "used": len(self.calls),
+                "remaining": max(0, self.max_calls - len(self.calls)),
+                "waiting": len(self._waiters),
+                "acquired": self.acquired,
+                "wait_seconds": self.wait_seconds,
+            }
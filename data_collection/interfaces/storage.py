@@ -67,6 +67,37 @@ class StorageInterface(ABC):
         """
         pass
 
+    def load_multiple_historical_data(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        source: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Load historical data for several symbols
+
+        Args:
+            symbols: Symbol identifiers
+            timeframe: Timeframe
+            start_date: Start date filter
+            end_date: End date filter
+            source: Optional source filter
+
+        Returns:
+            Dictionary mapping symbols to their DataFrames (symbols without
+            data are omitted)
+        """
+        frames = {}
+        for symbol in symbols:
+            df = self.load_historical_data(
+                symbol, timeframe, start_date, end_date, source
+            )
+            if df is not None and not df.empty:
+                frames[symbol] = df
+        return frames
+
     @abstractmethod
     def list_available_symbols(
         self, timeframe: str, source: Optional[str] = None
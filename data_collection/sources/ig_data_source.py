@@ -4,9 +4,22 @@ IG API data source implementation
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Optional
 
+import numpy as np
+import pandas as pd
+
+from api_gateway.ig_client.cassette import CassetteTransport
+from api_gateway.ig_client.core.price_columns import PRICE_FIELDS, PriceColumns
 from api_gateway.ig_client.master_client import IGClient
+from api_gateway.ig_client.rate_limits import (
+    HISTORICAL_LIMIT,
+    NON_TRADING_LIMIT,
+    IGRateLimits,
+)
+from api_gateway.ig_client.response_cache import IGResponseCache
+from api_gateway.ig_client.session_store import SessionTokenStore
+from common.cassette import REPLAY, default_cassette
 from settings import secrets
 from ..interfaces.data_source import DataSource
 from ..interfaces.market_data import MarketData, MarketDataPoint, PriceData
@@ -45,8 +58,9 @@ class IGDataSource(DataSource):
         retry_max_delay: float = 30.0,
         circuit_breaker_threshold: int = 5,
         circuit_breaker_timeout: int = 60,
-        rate_limit_calls: int = 40,
+        rate_limit_calls: int = NON_TRADING_LIMIT[0],
         rate_limit_period: int = 60,
+        response_cache: Optional[IGResponseCache] = None,
     ):
         """
         Initialize IG data source
@@ -60,7 +74,8 @@ class IGDataSource(DataSource):
             password: Password (defaults to secrets based on account_type)
             client: Optional IGClient instance (created if not provided)
             circuit_breaker: Optional CircuitBreaker instance (created if not provided)
-            rate_limiter: Optional RateLimiter instance (created if not provided)
+            rate_limiter: Optional RateLimiter shared by all requests (by
+                default requests are limited per endpoint class)
             retry_config: Optional RetryConfig instance (created if not provided)
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
@@ -68,8 +83,13 @@ class IGDataSource(DataSource):
             retry_max_delay: Maximum delay for retries in seconds
             circuit_breaker_threshold: Number of failures before opening circuit
             circuit_breaker_timeout: Time in seconds before attempting recovery
-            rate_limit_calls: Maximum number of calls per period
+            rate_limit_calls: Maximum number of non-trading requests per period
+                (IG allows 30 a minute); price requests are held to the
+                HISTORICAL_LIMIT share of it, leaving headroom for account
+                and confirmation calls
             rate_limit_period: Time period in seconds for rate limiting
+            response_cache: Optional cache of reference-data responses (one is
+                created when IG_RESPONSE_CACHE is set)
         """
         super().__init__(name)
 
@@ -105,10 +125,25 @@ class IGDataSource(DataSource):
             recovery_timeout=circuit_breaker_timeout,
         )
 
-        self.rate_limiter = rate_limiter or RateLimiter(
-            max_calls=rate_limit_calls,
-            period_seconds=rate_limit_period,
+        # Price pulls get their own bucket so they cannot starve dealing
+        # calls; an injected limiter is shared by all requests instead
+        self.rate_limiter = rate_limiter
+        historical_calls = max(
+            1, rate_limit_calls * HISTORICAL_LIMIT[0] // NON_TRADING_LIMIT[0]
         )
+        self.rate_limits = (
+            None
+            if rate_limiter is not None
+            else IGRateLimits(
+                non_trading=(rate_limit_calls, rate_limit_period),
+                historical=(historical_calls, rate_limit_period),
+            )
+        )
+
+        # Reference data is cached across reconnects (and their account checks)
+        if response_cache is None and secrets.ig_response_cache:
+            response_cache = IGResponseCache()
+        self.response_cache = response_cache
 
         self.retry_config = retry_config or RetryConfig(
             max_attempts=max_retries,
@@ -127,12 +162,24 @@ class IGDataSource(DataSource):
         try:
             # Use retry mechanism for connection
             def _connect():
+                cassette = default_cassette()
+                # Replayed logins carry placeholder tokens: keep them out of
+                # the shared session store
+                replaying = cassette is not None and cassette.mode == REPLAY
                 client = IGClient(
                     base_url=self.base_url,
                     api_key=self.api_key,
                     identifier=self.identifier,
                     password=self.password,
                     rate_limiter=self.rate_limiter,
+                    rate_limits=self.rate_limits,
+                    token_store=(
+                        SessionTokenStore(secrets.ig_session_cache_dir)
+                        if secrets.ig_session_cache_dir and not replaying
+                        else None
+                    ),
+                    transport=CassetteTransport(cassette) if cassette else None,
+                    response_cache=self.response_cache,
                 )
 
                 # Test connection by getting account info
@@ -229,7 +276,10 @@ class IGDataSource(DataSource):
 
                 # Fetch data from IG API (using symbol as epic for IG)
                 response = self._client.markets.get_prices_by_points(
-                    epic=symbol, resolution=config["resolution"], num_points=points
+                    epic=symbol,
+                    resolution=config["resolution"],
+                    num_points=points,
+                    raw=True,
                 )
 
                 return response
@@ -271,54 +321,51 @@ class IGDataSource(DataSource):
         return self.fetch_historical_data(symbol, timeframe, limit=1)
 
     def _convert_ig_response_to_market_data(
-        self, response: Any, symbol: str, timeframe: str
+        self, response: PriceColumns, symbol: str, timeframe: str
     ) -> MarketData:
-        """Convert IG API response to unified MarketData format"""
-        data_dict = response.model_dump()
-        prices = data_dict.get("prices", [])
+        """Convert IG price columns (raw mode) to unified MarketData format"""
+        bids = [response.price(name, "bid") for name in PRICE_FIELDS]
+        asks = [response.price(name, "ask") for name in PRICE_FIELDS]
+        # Bars with bid and ask for every OHLC field (the mid is the OHLC price)
+        complete = np.logical_and.reduce([~np.isnan(values) for values in bids + asks])
+        volumes = response.volume
 
         data_points = []
 
-        for price_data in prices:
-            snapshot_time = price_data.get("snapshotTime")
+        for i, snapshot_time in enumerate(response.snapshot_time):
             if not snapshot_time:
                 logger.warning(f"Skipping price entry without timestamp for {symbol}")
                 continue
 
-            try:
-                timestamp = datetime.strptime(snapshot_time, "%Y/%m/%d %H:%M:%S")
-            except (ValueError, TypeError) as e:
+            if np.isnat(response.timestamps[i]):
                 logger.warning(
-                    f"Invalid timestamp format for {symbol}: {snapshot_time}, error: {e}"
+                    f"Invalid timestamp format for {symbol}: {snapshot_time}"
                 )
                 continue
 
-            open_price = self._extract_price_data(price_data.get("openPrice", {}))
-            high_price = self._extract_price_data(price_data.get("highPrice", {}))
-            low_price = self._extract_price_data(price_data.get("lowPrice", {}))
-            close_price = self._extract_price_data(price_data.get("closePrice", {}))
-
-            if not all(
+            prices = (
                 [
-                    open_price.ohlc_price,
-                    high_price.ohlc_price,
-                    low_price.ohlc_price,
-                    close_price.ohlc_price,
+                    PriceData(bid=float(bid[i]), ask=float(ask[i]))
+                    for bid, ask in zip(bids, asks)
                 ]
-            ):
+                if complete[i]
+                else []
+            )
+            if not prices or not all(price.ohlc_price for price in prices):
                 logger.warning(
                     f"Skipping price entry with missing OHLC data for {symbol}"
                 )
                 continue
 
+            open_price, high_price, low_price, close_price = prices
             data_point = MarketDataPoint(
-                timestamp=timestamp,
+                timestamp=pd.Timestamp(response.timestamps[i]).to_pydatetime(),
                 open_price=open_price,
                 high_price=high_price,
                 low_price=low_price,
                 close_price=close_price,
-                volume=price_data.get("lastTradedVolume"),
-                metadata={"ig_snapshot_time": price_data.get("snapshotTime")},
+                volume=None if np.isnan(volumes[i]) else float(volumes[i]),
+                metadata={"ig_snapshot_time": snapshot_time},
             )
 
             data_points.append(data_point)
@@ -329,28 +376,13 @@ class IGDataSource(DataSource):
             data_points=data_points,
             source="IG",
             collected_at=datetime.now(),
-            metadata={"ig_response": data_dict, "account_type": self.account_type},
-        )
-
-    def _extract_price_data(self, price_dict: Dict[str, Any]) -> PriceData:
-        """Extract price data from IG price dictionary"""
-        if not isinstance(price_dict, dict):
-            return PriceData()
-
-        bid = price_dict.get("bid")
-        ask = price_dict.get("ask")
-
-        # Calculate mid price from bid/ask average
-        mid = None
-        if bid is not None and ask is not None:
-            mid = round((bid + ask) / 2, 1)
-        elif price_dict.get("mid") is not None:
-            mid = round(price_dict.get("mid"), 1)
-
-        return PriceData(
-            bid=round(bid, 1) if bid is not None else None,
-            ask=round(ask, 1) if ask is not None else None,
-            mid=mid,
+            metadata={
+                "ig_response": {
+                    "instrumentType": response.instrument_type,
+                    "allowance": response.allowance,
+                },
+                "account_type": self.account_type,
+            },
         )
 
     def is_connected(self) -> bool:
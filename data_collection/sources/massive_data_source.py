@@ -10,6 +10,7 @@ from polygon.rest.models import Agg
 from ..interfaces.data_source import DataSource
 from ..interfaces.market_data import MarketData, MarketDataPoint, PriceData
 from api_gateway.massive_client import MassiveClient
+from common.cassette import default_cassette
 from common.resilience import CircuitBreaker, RateLimiter, RetryConfig
 from common.alerting import escalate_error, AlertSeverity
 
@@ -108,6 +109,7 @@ class MassiveDataSource(DataSource):
                 rate_limiter=rate_limiter,
                 circuit_breaker=circuit_breaker,
                 retry_config=retry_config,
+                cassette=default_cassette(),
             )
 
         self._connected = False
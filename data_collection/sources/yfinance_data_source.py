@@ -10,6 +10,7 @@ import pandas as pd
 from ..interfaces.data_source import DataSource
 from ..interfaces.market_data import MarketData, MarketDataPoint, PriceData
 from api_gateway.yfinance_client import YFinanceClient
+from common.cassette import default_cassette
 from common.resilience import CircuitBreaker, RateLimiter, RetryConfig
 from common.alerting import escalate_error, AlertSeverity
 
@@ -122,6 +123,7 @@ class YFinanceDataSource(DataSource):
                 rate_limiter=rate_limiter,
                 circuit_breaker=circuit_breaker,
                 retry_config=retry_config,
+                cassette=default_cassette(),
             )
 
         self._connected = False
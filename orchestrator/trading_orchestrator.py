@@ -210,8 +210,8 @@ class TradingOrchestrator:
             # Initialize strategy
             strategy = strategy_class(base_config)
 
-            # Generate signals
-            signals = strategy.generate_signals(data)
+            # Only the newest bar matters live; evaluate it on the warmup window
+            signals = strategy.evaluate_latest(data)
 
             logger.info(
                 f"Strategy {strategy_name} generated {len(signals)} signals for {instrument}"
@@ -352,23 +352,14 @@ class TradingOrchestrator:
 
                     results["strategy_executions"] += 1
 
-                    # Filter to only signals from the latest bar (most recent timestamp)
                     if signals:
-                        # Get the most recent timestamp from the data
                         latest_timestamp = data["timestamp"].max()
-
-                        # Filter signals to only those from the latest bar
-                        latest_signals = [
-                            s for s in signals if s.timestamp == latest_timestamp
-                        ]
-
                         logger.info(
-                            f"Strategy {strategy_name} generated {len(signals)} total signals, "
-                            f"{len(latest_signals)} from latest bar ({latest_timestamp.date()})"
+                            f"Strategy {strategy_name} generated {len(signals)} signals "
+                            f"on latest bar ({latest_timestamp.date()})"
                         )
 
-                        # Process only latest signals
-                        for signal in latest_signals:
+                        for signal in signals:
                             results["signals_generated"] += 1
 
                             # Send alert
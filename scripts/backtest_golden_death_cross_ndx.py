@@ -1,9 +1,13 @@
 """
 Run Golden/Death Cross backtest on NDX 1D data using the shared backtesting engine.
+
+The same run is repeated with the vectorized engine to cross-check results
+and compare timings.
 """
 
 from pathlib import Path
 import sys
+import time
 import pandas as pd
 
 # Ensure project root on path
@@ -13,6 +17,9 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from common.logging import setup_logging  # noqa: E402
 from backtesting.engine import run_golden_death_cross_backtest  # noqa: E402
+from backtesting.vectorized import (  # noqa: E402
+    run_golden_death_cross_backtest_vectorized,
+)
 
 
 def main() -> None:
@@ -22,7 +29,7 @@ def main() -> None:
         raise FileNotFoundError(f"Data file not found: {data_path}")
 
     df = pd.read_csv(data_path)
-    if df["timestamp"].dtype == object:
+    if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
         df["timestamp"] = pd.to_datetime(df["timestamp"])
 
     config = {
@@ -39,19 +46,32 @@ def main() -> None:
         "rsi_overbought": 70,
     }
 
-    result = run_golden_death_cross_backtest(
-        df,
-        config,
-        starting_cash=100_000,
-        stake=1.0,
-        commission=0.0,
-    )
+    run_kwargs = dict(starting_cash=100_000, stake=1.0, commission=0.0)
+    started = time.perf_counter()
+    result = run_golden_death_cross_backtest(df, config, **run_kwargs)
+    backtrader_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    vectorized = run_golden_death_cross_backtest_vectorized(df, config, **run_kwargs)
+    vectorized_seconds = time.perf_counter() - started
 
     print("=== Backtest Result ===")
     print(f"Starting cash: {result.starting_cash:,.2f}")
     print(f"Ending cash:   {result.ending_cash:,.2f}")
     print(f"Return %:      {result.return_pct * 100:.2f}%")
 
+    print("=== Vectorized Engine ===")
+    print(f"Ending cash:   {vectorized.ending_cash:,.2f}")
+    print(f"Return %:      {vectorized.return_pct * 100:.2f}%")
+    difference = abs(vectorized.ending_cash - result.ending_cash)
+    print(
+        f"Difference:    {difference:.6f} ({'OK' if difference < 1e-6 else 'MISMATCH'})"
+    )
+    print(
+        f"Time:          backtrader {backtrader_seconds:.3f}s, vectorized "
+        f"{vectorized_seconds:.4f}s ({backtrader_seconds / vectorized_seconds:.0f}x)"
+    )
+
     signals_df = result.signals
     print("=== Signals ===")
     if signals_df.empty:
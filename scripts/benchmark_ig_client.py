@@ -0,0 +1,169 @@
+"""
+Benchmark IGClient throughput against the local fake IG API.
+
+Starts a FakeIGServer on localhost with a lognormal response latency and
+without IG's request limits, then reports requests per second and latency
+percentiles of price pulls from the sync client (thread pool) and the async
+client at several concurrencies, and of a batch of orders through
+OrderExecutionEngine.
+
+The in-process server shares the GIL with the clients; for client-only
+numbers run the server separately and pass its URL:
+
+    python -m api_gateway.ig_client.testing --no-limits \\
+        --historical-allowance 1000000000 --latency lognormal \\
+        --latency-mean 0.02 --latency-spread 0.5
+    python scripts/benchmark_ig_client.py --url http://127.0.0.1:8765/gateway/deal
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+
+# Ensure project root on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from api_gateway.ig_client.aio import AsyncIGClient  # noqa: E402
+from api_gateway.ig_client.core.models.dealing.request_bodies import (  # noqa: E402
+    CreateOtcPositionRequest,
+)
+from api_gateway.ig_client.master_client import IGClient  # noqa: E402
+from api_gateway.ig_client.testing import (  # noqa: E402
+    FakeIG,
+    FakeIGConfig,
+    FakeIGServer,
+    Latency,
+)
+from api_gateway.ig_client.utils import Order, OrderExecutionEngine  # noqa: E402
+
+EPIC = "CS.D.GBPUSD.TODAY.IP"
+CONCURRENCY = [1, 4, 16, 64]
+CREDENTIALS = ("api-key", "user", "password")
+
+
+def report(label: str, concurrency: int, elapsed: float, latencies: List[float]):
+    ms = np.asarray(latencies) * 1e3
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    print(
+        f"{label:<16} {concurrency:>5} {len(ms) / elapsed:>9.1f}"
+        f" {p50:>8.1f} {p95:>8.1f} {p99:>8.1f}"
+    )
+
+
+def timed(call: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start
+
+
+def bench_sync(base_url: str, requests: int, points: int) -> None:
+    client = IGClient(base_url, *CREDENTIALS)
+    for concurrency in CONCURRENCY:
+        pull = lambda _: timed(  # noqa: E731
+            lambda: client.markets.get_prices_by_points(
+                EPIC, "MINUTE", points, raw=True
+            )
+        )
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(pull, range(requests)))
+        report("sync prices", concurrency, time.perf_counter() - start, latencies)
+
+
+async def bench_async(base_url: str, requests: int, points: int) -> None:
+    async with AsyncIGClient(base_url, *CREDENTIALS) as client:
+        for concurrency in CONCURRENCY:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def pull() -> float:
+                async with semaphore:
+                    start = time.perf_counter()
+                    await client.markets.get_prices_by_points(
+                        EPIC, "MINUTE", points, raw=True
+                    )
+                    return time.perf_counter() - start
+
+            start = time.perf_counter()
+            latencies = await asyncio.gather(*(pull() for _ in range(requests)))
+            report("async prices", concurrency, time.perf_counter() - start, latencies)
+
+
+def bench_orders(base_url: str, orders: int) -> None:
+    client = IGClient(base_url, *CREDENTIALS)
+    request = CreateOtcPositionRequest(
+        currencyCode="GBP",
+        direction="BUY",
+        epic=EPIC,
+        expiry="DFB",
+        forceOpen=True,
+        guaranteedStop=False,
+        orderType="MARKET",
+        size=1,
+    )
+    for concurrency in CONCURRENCY[:-1]:
+        with OrderExecutionEngine(client.dealing, max_workers=concurrency) as engine:
+            start = time.perf_counter()
+            result = engine.execute(
+                [Order(request, f"bench-{concurrency}-{i}") for i in range(orders)]
+            )
+            elapsed = time.perf_counter() - start
+        frame = result.to_frame()
+        assert result.counts() == {"ACCEPTED": orders}, result.counts()
+        report("orders", concurrency, elapsed, frame["total_latency"].tolist())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--url", default=None, help="Base URL of a running fake (default: in-process)"
+    )
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--points", type=int, default=100, help="Bars per request")
+    parser.add_argument("--orders", type=int, default=100)
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Median latency (s)"
+    )
+    parser.add_argument(
+        "--sigma", type=float, default=0.5, help="Log standard deviation of latency"
+    )
+    args = parser.parse_args()
+
+    if args.url:
+        server = nullcontext()
+        base_url = args.url
+        print(f"Fake IG at {base_url}")
+    else:
+        config = FakeIGConfig(
+            latency=Latency(args.latency, args.sigma, "lognormal"),
+            trading_limit=None,
+            non_trading_limit=None,
+            historical_allowance=10**9,
+            seed=0,
+        )
+        server = FakeIGServer(FakeIG(config))
+        base_url = server.base_url
+        print(
+            f"Fake IG at {base_url}: lognormal latency, median "
+            f"{args.latency * 1e3:.0f}ms, sigma {args.sigma}"
+        )
+    with server:
+        print(
+            f"{'scenario':<16} {'conc.':>5} {'req/s':>9}"
+            f" {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        bench_sync(base_url, args.requests, args.points)
+        asyncio.run(bench_async(base_url, args.requests, args.points))
+        bench_orders(base_url, args.orders)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark the pandas_ta and numpy indicator backends.
+
+Reports the per-call latency of SMA, EMA, RSI and ATR on 1k and 1M bars of
+synthetic OHLC data, and the largest difference between the two backends.
+"""
+
+from pathlib import Path
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+# Ensure project root on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from technical_analysis.indicators import ATR, EMA, RSI, SMA  # noqa: E402
+
+SIZES = [1_000, 1_000_000]
+INDICATORS = [
+    (SMA, {"period": 20}),
+    (SMA, {"period": 200}),
+    (EMA, {"period": 20}),
+    (RSI, {"period": 14}),
+    (ATR, {"period": 14}),
+]
+
+
+def make_bars(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    spread = rng.uniform(0.1, 1.0, n)
+    return pd.DataFrame(
+        {"high": close + spread, "low": close - spread, "close": close},
+        index=pd.date_range("2000-01-01", periods=n, freq="min"),
+    )
+
+
+def time_call(indicator, bars: pd.DataFrame) -> float:
+    """Best per-call time in milliseconds"""
+    timer = timeit.Timer(lambda: indicator.compute(bars))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e3
+
+
+def main() -> None:
+    print(
+        f"{'bars':>9}  {'indicator':<10} {'pandas_ta ms':>13} {'numpy ms':>10}"
+        f" {'speedup':>8} {'max abs diff':>13}"
+    )
+    for n in SIZES:
+        bars = make_bars(n)
+        for indicator_cls, params in INDICATORS:
+            reference = indicator_cls(**params, backend="pandas_ta")
+            fast = indicator_cls(**params, backend="numpy")
+            (expected,) = reference.compute(bars).values()
+            (result,) = fast.compute(bars).values()
+            diff = np.nanmax(np.abs(result.to_numpy() - expected.to_numpy()))
+
+            reference_ms = time_call(reference, bars)
+            fast_ms = time_call(fast, bars)
+            label = f"{indicator_cls.__name__}({params['period']})"
+            print(
+                f"{n:>9}  {label:<10} {reference_ms:>13.3f} {fast_ms:>10.3f}"
+                f" {reference_ms / fast_ms:>7.1f}x {diff:>13.2e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Grid-search Golden/Death Cross parameters on NDX 1D data.
+
+Runs every combination of the grid below across a process pool and prints
+the best configurations as results arrive.
+"""
+
+from pathlib import Path
+import sys
+import time
+import pandas as pd
+
+# Ensure project root on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from common.logging import setup_logging  # noqa: E402
+from backtesting.sweep import run_sweep  # noqa: E402
+from strategies import GoldenDeathCrossStrategy  # noqa: E402
+
+GRID = {
+    "short_ma_period": [10, 20, 30, 50],
+    "long_ma_period": [50, 100, 150, 200],
+    "confirmation_periods": [1, 2],
+    "volume_filter": [False, True],
+    "rsi_filter": [False, True],
+}
+METRICS = ("return_pct", "max_drawdown", "sharpe", "num_signals")
+
+
+def main() -> None:
+    setup_logging()
+    data_path = PROJECT_ROOT / "data_collection" / "data" / "1D" / "NDX_YFinance.csv"
+    if not data_path.exists():
+        raise FileNotFoundError(f"Data file not found: {data_path}")
+
+    df = pd.read_csv(data_path)
+    if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+    def report(row, table) -> None:
+        print(
+            f"[{len(table):>4}] {row.params} "
+            f"return {row.metrics['return_pct'] * 100:.2f}%"
+        )
+
+    started = time.perf_counter()
+    table = run_sweep(
+        df,
+        GoldenDeathCrossStrategy,
+        GRID,
+        metrics=METRICS,
+        starting_cash=100_000,
+        stake=1.0,
+        commission=0.0,
+        on_result=report,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"=== Top 10 of {len(table)} configurations ({elapsed:.2f}s) ===")
+    with pd.option_context("display.width", 200, "display.max_columns", 20):
+        print(table.to_frame().head(10))
+
+
+if __name__ == "__main__":
+    main()
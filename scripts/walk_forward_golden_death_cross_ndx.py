@@ -0,0 +1,66 @@
+"""
+Walk-forward optimize Golden/Death Cross parameters on NDX 1D data.
+
+Every year is traded with the parameters that ranked best (by Sharpe ratio)
+over the preceding four years, and the yearly out-of-sample runs are
+stitched into one equity curve.
+"""
+
+from pathlib import Path
+import sys
+import time
+import pandas as pd
+
+# Ensure project root on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from common.logging import setup_logging  # noqa: E402
+from backtesting.walk_forward import run_walk_forward  # noqa: E402
+from strategies import GoldenDeathCrossStrategy  # noqa: E402
+
+GRID = {
+    "short_ma_period": [10, 20, 30, 50],
+    "long_ma_period": [50, 100, 150, 200],
+    "confirmation_periods": [1, 2],
+    "volume_filter": [False, True],
+    "rsi_filter": [False, True],
+}
+METRICS = ("sharpe", "return_pct", "max_drawdown")
+
+
+def main() -> None:
+    setup_logging()
+    data_path = PROJECT_ROOT / "data_collection" / "data" / "1D" / "NDX_YFinance.csv"
+    if not data_path.exists():
+        raise FileNotFoundError(f"Data file not found: {data_path}")
+
+    df = pd.read_csv(data_path)
+    if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+    started = time.perf_counter()
+    result = run_walk_forward(
+        df,
+        GoldenDeathCrossStrategy,
+        GRID,
+        train="1461D",
+        test="365D",
+        metrics=METRICS,
+        starting_cash=100_000,
+        stake=1.0,
+        commission=0.0,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"=== Walk-forward: {len(result.windows)} windows ({elapsed:.2f}s) ===")
+    with pd.option_context("display.width", 200, "display.max_columns", 20):
+        print(result.to_frame())
+    print(f"Starting Value: {result.starting_cash:.2f}")
+    print(f"Ending Value: {result.ending_cash:.2f}")
+    print(f"Out-of-sample Return: {result.return_pct * 100:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,6 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-
 # Load environment variables from .env file if present
 env_path = Path(os.getenv("ENV_PATH", "/etc/dev/ig_trading/.env"))
 trading_toml_path = Path(
@@ -47,6 +46,28 @@ class Secrets:
     # Data storage configuration
     data_storage_path: str = os.getenv("DATA_STORAGE_PATH", "data")
 
+    # Indicator cache on-disk tier (disabled when empty)
+    indicator_cache_dir: str = os.getenv("INDICATOR_CACHE_DIR", "")
+
+    # IG session token cache shared across processes and runs (disabled when empty)
+    ig_session_cache_dir: str = os.getenv("IG_SESSION_CACHE_DIR", "")
+
+    # Record/replay store of IG, YFinance and Massive responses (disabled when
+    # empty); mode is record, replay or record_missing
+    http_cassette_dir: str = os.getenv("HTTP_CASSETTE_DIR", "")
+    http_cassette_mode: str = os.getenv("HTTP_CASSETTE_MODE", "record_missing")
+
+    # Cache of slowly changing IG reference responses (1, true, yes or on)
+    ig_response_cache: bool = os.getenv("IG_RESPONSE_CACHE", "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+        "on",
+    )
+
+    # Default indicator backend (pandas_ta or numpy)
+    indicator_backend: str = os.getenv("INDICATOR_BACKEND", "pandas_ta")
+
     # Legacy support for POLYGON_API_KEY (will be removed in future)
     @property
     def polygon_api_key(self) -> str:
@@ -40,6 +40,46 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def get_warmup_periods(self) -> int:
+        """
+        Number of bars required before the newest bar can be evaluated
+
+        Returns:
+            Minimal history length (in bars) the strategy needs
+        """
+        return 1
+
+    def evaluate_latest(
+        self, data: pd.DataFrame, lookback: Optional[int] = None
+    ) -> List[Signal]:
+        """
+        Generate signals for the newest bar only
+
+        The default implementation slices the minimal warmup window declared
+        by get_warmup_periods() and keeps the signals emitted on the last bar,
+        so the per-tick cost does not grow with the stored history.
+
+        Args:
+            data: Market data DataFrame with OHLCV data, sorted by timestamp
+            lookback: Optional number of trailing bars to evaluate (defaults
+                to the strategy warmup window)
+
+        Returns:
+            List of trading signals for the newest bar
+        """
+        if data.empty:
+            return []
+
+        window = lookback if lookback is not None else self.get_warmup_periods()
+        window_data = data.iloc[-window:] if 0 < window < len(data) else data
+        latest_timestamp = window_data["timestamp"].iloc[-1]
+
+        return [
+            signal
+            for signal in self.generate_signals(window_data)
+            if signal.timestamp == latest_timestamp
+        ]
+
     @abstractmethod
     def should_enter_position(self, signal: Signal) -> bool:
         """
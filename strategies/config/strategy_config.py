@@ -10,6 +10,7 @@ DEFAULT_CONFIGS = {
         "long_ma_period": 200,  # 200-day moving average
         "confirmation_periods": 2,  # Wait 2 periods for confirmation
         "volume_filter": True,  # Use volume confirmation
+        "volume_sma_period": 20,  # Average volume window for the filter
         "rsi_filter": True,  # Use RSI filter
         "rsi_period": 14,
         "rsi_oversold": 30,
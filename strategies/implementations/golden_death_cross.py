@@ -1,11 +1,22 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
-from technical_analysis.indicators import SMA, RSI
+from technical_analysis.cache import get_default_cache
+from technical_analysis.indicators import (
+    SMA,
+    RSI,
+    IndicatorPipeline,
+    OHLCV_COLUMN_MAP,
+)
 from ..base.strategy import BaseStrategy
 from ..base.signal import Signal, SignalType, SignalStrength
 
+# Wilder smoothing (RSI) never fully forgets its seed value; this many periods
+# of history make the truncated value indistinguishable from the full-history one
+RSI_SETTLING_FACTOR = 10
+
 
 class GoldenDeathCrossStrategy(BaseStrategy):
     """Golden Cross / Death Cross strategy implementation"""
@@ -42,77 +53,130 @@ class GoldenDeathCrossStrategy(BaseStrategy):
         self.rsi_indicator = RSI(period=self.rsi_period)
         self.volume_sma_indicator = SMA(period=self.volume_sma_period, column="volume")
 
+        # Indicators computed in one pass over the raw OHLCV frame, memoized
+        # across strategies, charts and repeated runs on the same series
+        self.indicator_pipeline = IndicatorPipeline(
+            [self.short_sma_indicator, self.long_sma_indicator],
+            column_map=OHLCV_COLUMN_MAP,
+            cache=get_default_cache(),
+        )
+        if self.rsi_filter:
+            self.indicator_pipeline.add(self.rsi_indicator)
+        if self.volume_filter:
+            self.indicator_pipeline.add(
+                self.volume_sma_indicator,
+                rename={f"sma_{self.volume_sma_period}": "volume_sma"},
+            )
+
     def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
         """Generate signals across the provided dataset (caller controls window)."""
         if not self.validate_data(data):
             return []
 
-        data = self._add_indicators(data)
-        warmup = max(
+        indicators = self.indicator_pipeline.compute(data)
+        return self._build_signals(data, indicators, self._signal_start_index())
+
+    def evaluate_latest(
+        self, data: pd.DataFrame, lookback: Optional[int] = None
+    ) -> List[Signal]:
+        """Evaluate crossovers on the newest bar using only the warmup window."""
+        if not self.validate_data(data):
+            return []
+
+        window = max(
+            lookback if lookback is not None else self.get_warmup_periods(),
+            self._signal_start_index() + 1,
+        )
+        window_data = data.iloc[-window:]
+        if len(window_data) <= self._signal_start_index():
+            return []
+
+        indicators = self.indicator_pipeline.compute(window_data)
+        return self._build_signals(window_data, indicators, len(window_data) - 1)
+
+    def get_warmup_periods(self) -> int:
+        """Bars needed to evaluate a crossover (and its filters) on the newest bar."""
+        warmup = self._signal_start_index() + 1
+        if self.volume_filter:
+            warmup = max(warmup, self.volume_sma_period)
+        if self.rsi_filter:
+            warmup = max(warmup, self.rsi_period * RSI_SETTLING_FACTOR)
+        return warmup
+
+    def _signal_start_index(self) -> int:
+        """First row index at which both moving averages are available."""
+        return max(
             self.short_ma_period,
             self.long_ma_period,
             self.confirmation_periods,
             1,
         )
-        signals: List[Signal] = []
 
-        for i in range(warmup, len(data)):
-            current_row = data.iloc[i]
-            previous_row = data.iloc[i - 1]
+    def _build_signals(
+        self, data: pd.DataFrame, indicators: pd.DataFrame, start: int
+    ) -> List[Signal]:
+        """
+        Detect crossovers with whole-column operations and build signals.
+
+        Crossover detection, RSI/volume/trend filters and strength scoring are
+        evaluated on full arrays; Signal objects are only created for the rows
+        that actually cross, from index ``start`` onwards.
+        """
+        short_ma = indicators[f"sma_{self.short_ma_period}"].to_numpy(dtype=float)
+        long_ma = indicators[f"sma_{self.long_ma_period}"].to_numpy(dtype=float)
+        close = data["closePrice"].to_numpy(dtype=float)
+        rsi = self._get_rsi_values(indicators)
+        volume_ratio = self._get_volume_ratios(data, indicators)
+
+        prev_short_ma = np.concatenate(([np.nan], short_ma[:-1]))
+        prev_long_ma = np.concatenate(([np.nan], long_ma[:-1]))
 
-            if self._is_golden_cross(previous_row, current_row):
-                signal = self._build_golden_cross_signal(data, i, current_row)
-                if signal:
-                    signals.append(signal)
-            elif self._is_death_cross(previous_row, current_row):
-                signal = self._build_death_cross_signal(data, i, current_row)
-                if signal:
-                    signals.append(signal)
+        # Golden Cross: short MA was below long MA, now above
+        golden = (prev_short_ma <= prev_long_ma) & (short_ma > long_ma)
+        # Death Cross: short MA was above long MA, now below
+        death = ~golden & (prev_short_ma >= prev_long_ma) & (short_ma < long_ma)
+        golden[:start] = False
+        death[:start] = False
 
-        return signals
+        golden &= self._golden_cross_filters(close, long_ma, rsi, volume_ratio)
+        death &= self._death_cross_filters(close, long_ma, rsi, volume_ratio)
 
-    def _build_golden_cross_signal(
-        self, data: pd.DataFrame, index: int, current_row: pd.Series
-    ) -> Optional[Signal]:
-        if not self._validate_golden_cross_signal(data, index):
-            return None
-        metadata = self._build_metadata(data, index, current_row, "golden_cross")
-        return self._create_signal(
-            instrument=self._get_instrument(data, index),
-            signal_type=SignalType.BUY,
-            price=current_row["closePrice"],
-            timestamp=current_row["timestamp"],
-            strength=self._calculate_signal_strength(data, index, "golden"),
-            metadata=metadata,
+        scores = self._calculate_strength_scores(
+            short_ma, long_ma, rsi, volume_ratio, golden, death
         )
 
-    def _build_death_cross_signal(
-        self, data: pd.DataFrame, index: int, current_row: pd.Series
-    ) -> Optional[Signal]:
-        if not self._validate_death_cross_signal(data, index):
-            return None
-        metadata = self._build_metadata(data, index, current_row, "death_cross")
-        return self._create_signal(
-            instrument=self._get_instrument(data, index),
-            signal_type=SignalType.SELL,
-            price=current_row["closePrice"],
-            timestamp=current_row["timestamp"],
-            strength=self._calculate_signal_strength(data, index, "death"),
-            metadata=metadata,
-        )
+        timestamps = data["timestamp"]
+        instruments = self._get_instruments(data)
+        source = self._get_source(data)
+        instrument_type = self._get_instrument_type(data)
 
-    def _build_metadata(
-        self, data: pd.DataFrame, index: int, current_row: pd.Series, strategy_name: str
-    ) -> Dict[str, Any]:
-        return {
-            "strategy": strategy_name,
-            "short_ma": current_row[f"sma_{self.short_ma_period}"],
-            "long_ma": current_row[f"sma_{self.long_ma_period}"],
-            "rsi": self._get_rsi_value(current_row),
-            "volume_ratio": self._get_volume_ratio(data, index),
-            "source": self._get_source(data),
-            "instrument_type": self._get_instrument_type(data),
-        }
+        signals: List[Signal] = []
+        for index in np.flatnonzero(golden | death):
+            is_golden = bool(golden[index])
+            signals.append(
+                self._create_signal(
+                    instrument=(
+                        instruments.iloc[index]
+                        if instruments is not None
+                        else "unknown"
+                    ),
+                    signal_type=SignalType.BUY if is_golden else SignalType.SELL,
+                    price=close[index],
+                    timestamp=timestamps.iloc[index],
+                    strength=self._strength_from_score(scores[index]),
+                    metadata={
+                        "strategy": "golden_cross" if is_golden else "death_cross",
+                        "short_ma": short_ma[index],
+                        "long_ma": long_ma[index],
+                        "rsi": rsi[index] if rsi is not None else None,
+                        "volume_ratio": volume_ratio[index],
+                        "source": source,
+                        "instrument_type": instrument_type,
+                    },
+                )
+            )
+
+        return signals
 
     def _get_source(self, data: pd.DataFrame) -> str:
         if "source" in data.columns and len(data):
@@ -124,160 +188,106 @@ class GoldenDeathCrossStrategy(BaseStrategy):
             return str(data["instrument_type"].iloc[0])
         return "unknown"
 
-    def _add_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Add required technical indicators using the shared TA module."""
-        df = self._prepare_indicator_inputs(data)
-
-        df = self.short_sma_indicator.calculate(df)
-        df = self.long_sma_indicator.calculate(df)
-
-        if self.rsi_filter:
-            df = self.rsi_indicator.calculate(df)
-
-        if self.volume_filter:
-            df = self.volume_sma_indicator.calculate(df)
-            volume_col = f"sma_{self.volume_sma_period}"
-            if volume_col in df.columns:
-                df = df.rename(columns={volume_col: "volume_sma"})
-
-        return df
-
-    def _prepare_indicator_inputs(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Create canonical OHLCV columns expected by indicators."""
-        df = data.copy()
-        column_map = {
-            "openPrice": "open",
-            "highPrice": "high",
-            "lowPrice": "low",
-            "closePrice": "close",
-            "lastTradedVolume": "volume",
-        }
-        for source, target in column_map.items():
-            if source in df.columns:
-                df[target] = df[source]
-        return df
-
-    def _get_instrument(self, data: pd.DataFrame, index: int) -> str:
-        """Return instrument identifier with backward compatibility."""
+    def _get_instruments(self, data: pd.DataFrame) -> Optional[pd.Series]:
+        """Return instrument identifier column with backward compatibility."""
         if "symbol" in data.columns:
-            return data["symbol"].iloc[index]
+            return data["symbol"]
         if "epic" in data.columns:
-            return data["epic"].iloc[index]
-        return "unknown"
-
-    def _get_rsi_value(self, row: pd.Series) -> Any:
-        """Safely retrieve RSI value if present."""
-        return row[self.rsi_column] if self.rsi_column in row else None
-
-    def _is_golden_cross(self, previous_row: pd.Series, current_row: pd.Series) -> bool:
-        """Check if current period shows a Golden Cross"""
-        short_ma_prev = previous_row[f"sma_{self.short_ma_period}"]
-        long_ma_prev = previous_row[f"sma_{self.long_ma_period}"]
-        short_ma_curr = current_row[f"sma_{self.short_ma_period}"]
-        long_ma_curr = current_row[f"sma_{self.long_ma_period}"]
-
-        # Golden Cross: short MA was below long MA, now above
-        return short_ma_prev <= long_ma_prev and short_ma_curr > long_ma_curr
-
-    def _is_death_cross(self, previous_row: pd.Series, current_row: pd.Series) -> bool:
-        """Check if current period shows a Death Cross"""
-        short_ma_prev = previous_row[f"sma_{self.short_ma_period}"]
-        long_ma_prev = previous_row[f"sma_{self.long_ma_period}"]
-        short_ma_curr = current_row[f"sma_{self.short_ma_period}"]
-        long_ma_curr = current_row[f"sma_{self.long_ma_period}"]
-
-        # Death Cross: short MA was above long MA, now below
-        return short_ma_prev >= long_ma_prev and short_ma_curr < long_ma_curr
-
-    def _validate_golden_cross_signal(self, data: pd.DataFrame, index: int) -> bool:
-        """Validate Golden Cross signal with additional filters"""
-        current_row = data.iloc[index]
+            return data["epic"]
+        return None
+
+    def _get_rsi_values(self, indicators: pd.DataFrame) -> Optional[np.ndarray]:
+        """Return the RSI column as an array, or None if it was not computed."""
+        if self.rsi_column not in indicators.columns:
+            if self.rsi_filter:
+                self.logger.warning("RSI values missing; skipping RSI filter.")
+            return None
+        return indicators[self.rsi_column].to_numpy(dtype=float)
+
+    def _get_volume_ratios(
+        self, data: pd.DataFrame, indicators: pd.DataFrame
+    ) -> np.ndarray:
+        """Calculate current volume vs average volume for every row"""
+        if "volume_sma" not in indicators.columns:
+            return np.ones(len(data))
+        volume = data["lastTradedVolume"].to_numpy(dtype=float)
+        avg_volume = indicators["volume_sma"].to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(avg_volume > 0, volume / avg_volume, 1.0)
+
+    def _golden_cross_filters(
+        self,
+        close: np.ndarray,
+        long_ma: np.ndarray,
+        rsi: Optional[np.ndarray],
+        volume_ratio: np.ndarray,
+    ) -> np.ndarray:
+        """Row mask of Golden Cross candidates passing the additional filters"""
+        # Trend confirmation: Price should be above long-term MA
+        passed = ~(close < long_ma)
 
         # RSI filter: Don't buy if overbought
-        if self.rsi_filter:
-            rsi_value = self._get_rsi_value(current_row)
-            if rsi_value is None:
-                self.logger.warning("RSI value missing; skipping RSI filter for row.")
-            elif rsi_value > self.rsi_overbought:
-                return False
+        if self.rsi_filter and rsi is not None:
+            passed &= ~(rsi > self.rsi_overbought)
 
-        # Volume filter: Require above-average volume
+        # Volume filter: Require 20% above average volume
         if self.volume_filter:
-            volume_ratio = self._get_volume_ratio(data, index)
-            if volume_ratio < 1.2:  # Require 20% above average volume
-                return False
-
-        # Trend confirmation: Price should be above long-term MA
-        if current_row["closePrice"] < current_row[f"sma_{self.long_ma_period}"]:
-            return False
+            passed &= ~(volume_ratio < 1.2)
 
-        return True
+        return passed
 
-    def _validate_death_cross_signal(self, data: pd.DataFrame, index: int) -> bool:
-        """Validate Death Cross signal with additional filters"""
-        current_row = data.iloc[index]
+    def _death_cross_filters(
+        self,
+        close: np.ndarray,
+        long_ma: np.ndarray,
+        rsi: Optional[np.ndarray],
+        volume_ratio: np.ndarray,
+    ) -> np.ndarray:
+        """Row mask of Death Cross candidates passing the additional filters"""
+        # Trend confirmation: Price should be below long-term MA
+        passed = ~(close > long_ma)
 
         # RSI filter: Don't sell if oversold
-        if self.rsi_filter:
-            rsi_value = self._get_rsi_value(current_row)
-            if rsi_value is None:
-                self.logger.warning("RSI value missing; skipping RSI filter for row.")
-            elif rsi_value < self.rsi_oversold:
-                return False
+        if self.rsi_filter and rsi is not None:
+            passed &= ~(rsi < self.rsi_oversold)
 
-        # Volume filter: Require above-average volume
+        # Volume filter: Require 20% above average volume
         if self.volume_filter:
-            volume_ratio = self._get_volume_ratio(data, index)
-            if volume_ratio < 1.2:  # Require 20% above average volume
-                return False
-
-        # Trend confirmation: Price should be below long-term MA
-        if current_row["closePrice"] > current_row[f"sma_{self.long_ma_period}"]:
-            return False
-
-        return True
+            passed &= ~(volume_ratio < 1.2)
 
-    def _calculate_signal_strength(
-        self, data: pd.DataFrame, index: int, cross_type: str
-    ) -> SignalStrength:
-        """Calculate signal strength based on multiple factors"""
-        current_row = data.iloc[index]
+        return passed
 
+    def _calculate_strength_scores(
+        self,
+        short_ma: np.ndarray,
+        long_ma: np.ndarray,
+        rsi: Optional[np.ndarray],
+        volume_ratio: np.ndarray,
+        golden: np.ndarray,
+        death: np.ndarray,
+    ) -> np.ndarray:
+        """Calculate signal strength scores based on multiple factors"""
         # Base strength
-        strength_score = 1
+        scores = np.ones(len(short_ma), dtype=int)
 
         # Volume confirmation
         if self.volume_filter:
-            volume_ratio = self._get_volume_ratio(data, index)
-            if volume_ratio > 1.5:
-                strength_score += 1
-            elif volume_ratio > 2.0:
-                strength_score += 2
+            scores += volume_ratio > 1.5
 
-        # RSI confirmation
-        if self.rsi_filter:
-            rsi = self._get_rsi_value(current_row)
-            if pd.notna(rsi):
-                if cross_type == "golden":
-                    if 30 <= rsi <= 50:  # Good RSI for buying
-                        strength_score += 1
-                else:  # death cross
-                    if 50 <= rsi <= 70:  # Good RSI for selling
-                        strength_score += 1
+        # RSI confirmation: good RSI for buying / selling
+        if self.rsi_filter and rsi is not None:
+            scores += golden & (rsi >= 30) & (rsi <= 50)
+            scores += death & (rsi >= 50) & (rsi <= 70)
 
         # MA separation
-        ma_separation = abs(
-            current_row[f"sma_{self.short_ma_period}"]
-            - current_row[f"sma_{self.long_ma_period}"]
-        )
-        ma_separation_pct = (
-            ma_separation / current_row[f"sma_{self.long_ma_period}"] * 100
-        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ma_separation_pct = np.abs(short_ma - long_ma) / long_ma * 100
+        scores += ma_separation_pct > 2  # Strong separation
 
-        if ma_separation_pct > 2:  # Strong separation
-            strength_score += 1
+        return scores
 
-        # Convert to SignalStrength enum
+    def _strength_from_score(self, strength_score: int) -> SignalStrength:
+        """Convert a strength score to the SignalStrength enum"""
         if strength_score >= 4:
             return SignalStrength.STRONG
         elif strength_score >= 2:
@@ -285,15 +295,6 @@ class GoldenDeathCrossStrategy(BaseStrategy):
         else:
             return SignalStrength.WEAK
 
-    def _get_volume_ratio(self, data: pd.DataFrame, index: int) -> float:
-        """Calculate current volume vs average volume"""
-        if "volume_sma" not in data.columns:
-            return 1.0
-        current_row = data.iloc[index]
-        current_volume = current_row.get("lastTradedVolume", 0) or 0
-        avg_volume = current_row.get("volume_sma", 0) or 0
-        return current_volume / avg_volume if avg_volume > 0 else 1.0
-
     def _create_signal(
         self,
         instrument: str,
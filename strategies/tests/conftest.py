@@ -0,0 +1,31 @@
+"""
+Pytest configuration and shared fixtures for strategy tests.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def market_df():
+    """Synthetic daily bars in the project OHLCV schema."""
+    rng = np.random.default_rng(11)
+    n = 400
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+    open_ = close * (1 + rng.normal(0, 0.002, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.003, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.003, n)))
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2020-01-01", periods=n, freq="D"),
+            "openPrice": open_,
+            "highPrice": high,
+            "lowPrice": low,
+            "closePrice": close,
+            "lastTradedVolume": rng.integers(1_000, 5_000, n).astype(float),
+            "symbol": "TEST",
+            "timeframe": "1D",
+            "source": "YFinance",
+        }
+    )
@@ -0,0 +1,175 @@
+"""
+Regression tests for the vectorized GoldenDeathCrossStrategy.
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from strategies import GoldenDeathCrossStrategy, SignalStrength, SignalType
+from technical_analysis.indicators import RSI, SMA
+
+
+def _reference_signals(strategy, data):
+    """The original per-row loop, on indicators computed one by one."""
+    df = data.reset_index(drop=True)
+    short = SMA(strategy.short_ma_period).compute({"close": df["closePrice"]})
+    long = SMA(strategy.long_ma_period).compute({"close": df["closePrice"]})
+    short = next(iter(short.values())).to_numpy()
+    long = next(iter(long.values())).to_numpy()
+    rsi = None
+    if strategy.rsi_filter:
+        rsi = RSI(strategy.rsi_period).compute({"close": df["closePrice"]})
+        rsi = next(iter(rsi.values())).to_numpy()
+    volume_sma = None
+    if strategy.volume_filter:
+        volume_sma = SMA(strategy.volume_sma_period, column="volume").compute(
+            {"volume": df["lastTradedVolume"]}
+        )
+        volume_sma = next(iter(volume_sma.values())).to_numpy()
+
+    signals = []
+    for i in range(strategy._signal_start_index(), len(df)):
+        close = df["closePrice"].iloc[i]
+        ratio = 1.0
+        if volume_sma is not None:
+            average = volume_sma[i] or 0
+            volume = df["lastTradedVolume"].iloc[i] or 0
+            ratio = volume / average if average > 0 else 1.0
+
+        if short[i - 1] <= long[i - 1] and short[i] > long[i]:
+            golden = True
+            if rsi is not None and rsi[i] > strategy.rsi_overbought:
+                continue
+            if close < long[i]:
+                continue
+        elif short[i - 1] >= long[i - 1] and short[i] < long[i]:
+            golden = False
+            if rsi is not None and rsi[i] < strategy.rsi_oversold:
+                continue
+            if close > long[i]:
+                continue
+        else:
+            continue
+        if strategy.volume_filter and ratio < 1.2:
+            continue
+
+        score = 1
+        if strategy.volume_filter and ratio > 1.5:
+            score += 1
+        if rsi is not None and pd.notna(rsi[i]):
+            low, high = (30, 50) if golden else (50, 70)
+            score += low <= rsi[i] <= high
+        score += abs(short[i] - long[i]) / long[i] * 100 > 2
+        strength = (
+            SignalStrength.STRONG
+            if score >= 4
+            else SignalStrength.MEDIUM if score >= 2 else SignalStrength.WEAK
+        )
+        signals.append(
+            (
+                SignalType.BUY if golden else SignalType.SELL,
+                df["timestamp"].iloc[i],
+                close,
+                strength,
+                {
+                    "strategy": "golden_cross" if golden else "death_cross",
+                    "short_ma": short[i],
+                    "long_ma": long[i],
+                    "rsi": rsi[i] if rsi is not None else None,
+                    "volume_ratio": ratio,
+                },
+            )
+        )
+    return signals
+
+
+def _as_tuples(signals):
+    return [
+        (
+            signal.signal_type,
+            signal.timestamp,
+            signal.price,
+            signal.strength,
+            {
+                key: signal.metadata[key]
+                for key in ("strategy", "short_ma", "long_ma", "rsi", "volume_ratio")
+            },
+        )
+        for signal in signals
+    ]
+
+
+def _assert_same(actual, expected, rel=1e-12):
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        signal_type, timestamp, price, strength = want[:4]
+        assert (got[0], got[1], got[3]) == (signal_type, timestamp, strength)
+        assert got[2] == pytest.approx(price, rel=rel)
+        for key, value in want[4].items():
+            if isinstance(value, float) and math.isnan(value):
+                assert math.isnan(got[4][key]), key
+            else:
+                assert got[4][key] == pytest.approx(value, rel=rel), key
+
+
+CONFIGS = [
+    {"short_ma_period": 5, "long_ma_period": 20},
+    {"short_ma_period": 10, "long_ma_period": 30, "volume_filter": True},
+    {"short_ma_period": 5, "long_ma_period": 20, "rsi_filter": True},
+    {
+        "short_ma_period": 8,
+        "long_ma_period": 21,
+        "volume_filter": True,
+        "rsi_filter": True,
+        "volume_sma_period": 8,
+    },
+    {"short_ma_period": 5, "long_ma_period": 20, "confirmation_periods": 60},
+]
+
+
+class TestGoldenDeathCross:
+    """Vectorized signals match the original per-row loop."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("config", CONFIGS)
+    def test_matches_reference_loop(self, market_df, config):
+        """Crossovers, filters, strengths and metadata are unchanged."""
+        strategy = GoldenDeathCrossStrategy({"name": "gdc", **config})
+        expected = _reference_signals(strategy, market_df)
+        result = strategy.generate_signals(market_df)
+
+        assert len(expected) >= 3
+        _assert_same(_as_tuples(result), expected)
+        assert {signal.instrument for signal in result} == {"TEST"}
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("config", CONFIGS)
+    def test_evaluate_latest(self, market_df, config):
+        """Bars evaluated on their warmup window give the full-history signal."""
+        strategy = GoldenDeathCrossStrategy({"name": "gdc", **config})
+        expected = {
+            signal[1]: signal for signal in _reference_signals(strategy, market_df)
+        }
+        timestamps = list(market_df["timestamp"])
+        # Every signal bar, plus a sample of the bars without one
+        ends = {timestamps.index(timestamp) + 1 for timestamp in expected}
+        ends |= set(range(strategy.get_warmup_periods(), len(market_df) + 1, 7))
+
+        for end in sorted(ends):
+            data = market_df.iloc[:end]
+            latest = expected.get(data["timestamp"].iloc[-1])
+            result = _as_tuples(strategy.evaluate_latest(data))
+            # RSI over the warmup window has almost forgotten its seed
+            # (RSI_SETTLING_FACTOR), so it is close to the full-history value
+            _assert_same(result, [latest] if latest else [], rel=1e-3)
+
+    @pytest.mark.unit
+    def test_short_history(self, market_df):
+        """Histories shorter than the moving-average window give no signals."""
+        strategy = GoldenDeathCrossStrategy(
+            {"name": "gdc", "short_ma_period": 5, "long_ma_period": 20}
+        )
+        assert strategy.generate_signals(market_df.iloc[:20]) == []
+        assert strategy.evaluate_latest(market_df.iloc[:20]) == []
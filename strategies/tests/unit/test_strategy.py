@@ -0,0 +1,93 @@
+"""
+Unit tests for the BaseStrategy latest-bar evaluation.
+"""
+
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+
+from strategies.base.signal import Signal, SignalStrength, SignalType
+from strategies.base.strategy import BaseStrategy
+from strategies.implementations.dummy_strategy_1 import DummyStrategy1
+
+
+class MomentumStrategy(BaseStrategy):
+    """Signals every bar whose close differs from the close lag bars earlier."""
+
+    str_name = "momentum"
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.lag = config.get("lag", 3)
+
+    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
+        close = data["closePrice"].reset_index(drop=True)
+        change = close - close.shift(self.lag)
+        return [
+            Signal(
+                instrument="TEST",
+                signal_type=SignalType.BUY if change[i] > 0 else SignalType.SELL,
+                strength=SignalStrength.MEDIUM,
+                timestamp=data["timestamp"].iloc[i],
+                price=float(close[i]),
+                confidence=0.5,
+                metadata={"change": float(change[i])},
+            )
+            for i in range(self.lag, len(data))
+        ]
+
+    def get_warmup_periods(self) -> int:
+        return self.lag + 1
+
+    def should_enter_position(self, signal: Signal) -> bool:
+        return True
+
+    def should_exit_position(
+        self, signal: Signal, current_position: Dict[str, Any]
+    ) -> bool:
+        return False
+
+
+def _last_bar_signals(strategy, data):
+    latest = data["timestamp"].iloc[-1]
+    return [s for s in strategy.generate_signals(data) if s.timestamp == latest]
+
+
+def _as_tuples(signals):
+    return [(s.signal_type, s.timestamp, s.price, s.metadata) for s in signals]
+
+
+class TestEvaluateLatest:
+    """evaluate_latest returns the full-history signals of the newest bar."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("lookback", [None, 4, 10, 1000])
+    @pytest.mark.parametrize("length", [5, 50, 400])
+    def test_matches_full_history(self, market_df, lookback, length):
+        """Signals equal the last-bar signals of generate_signals on all bars."""
+        strategy = MomentumStrategy({"name": "momentum", "lag": 3})
+        data = market_df.iloc[:length]
+
+        expected = _last_bar_signals(strategy, data)
+        result = strategy.evaluate_latest(data, lookback=lookback)
+
+        assert len(expected) == 1
+        assert _as_tuples(result) == _as_tuples(expected)
+
+    @pytest.mark.unit
+    def test_dummy_strategy_uses_default(self, market_df):
+        """Strategies without an override evaluate one bar by default."""
+        strategy = DummyStrategy1({"name": "dummy", "send_signal": True})
+
+        for lookback in (None, 20):
+            result = strategy.evaluate_latest(market_df, lookback=lookback)
+            expected = _last_bar_signals(strategy, market_df)
+            assert _as_tuples(result) == _as_tuples(expected)
+            assert len(result) == 1
+
+    @pytest.mark.unit
+    def test_empty_data(self, market_df):
+        """No bars, no signals."""
+        strategy = MomentumStrategy({"name": "momentum"})
+        assert strategy.evaluate_latest(market_df.iloc[:0]) == []
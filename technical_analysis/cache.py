@@ -0,0 +1,479 @@
+"""
+Indicator result cache
+
+Memoizes indicator outputs keyed by (input fingerprint, indicator class,
+parameters). Results live in a bounded in-memory LRU tier and, optionally, in
+an on-disk tier of one .npz file (one array per output column) per entry.
+
+When a series only grew at the end, a cached result for its prefix is
+extended with the indicator's streaming counterpart instead of recomputing
+the whole series (unless an input has missing values). Results of inputs
+shorter than the indicator's min_length(), or without output columns, are
+returned but not cached.
+
+The disk tier is bounded by max_disk_bytes; the least recently used files
+(by mtime, refreshed on disk hits) are deleted first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from settings import secrets
+from technical_analysis.indicators.base import Indicator, IndicatorInputs
+from technical_analysis.indicators.streaming import StreamingIndicator
+
+logger = logging.getLogger(__name__)
+
+# Prefix candidates inspected per lookup (most recent first)
+_MAX_PREFIX_CANDIDATES = 8
+
+# Fraction of max_disk_bytes the disk tier is pruned down to, so growth by a
+# few files does not rescan the directory on every write
+_DISK_PRUNE_TARGET = 0.9
+
+
+@dataclass
+class _CacheEntry:
+    """Cached indicator output for one input fingerprint"""
+
+    indicator_key: str
+    fingerprint: str
+    length: int
+    columns: Dict[str, np.ndarray]
+    state: Optional[Dict[str, Any]] = None
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self.columns.values())
+
+
+@dataclass
+class CacheStats:
+    """Cache usage counters"""
+
+    hits: int = 0
+    disk_hits: int = 0
+    extensions: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+
+
+def indicator_key(indicator: Indicator) -> str:
+    """
+    Build the cache key part identifying an indicator and its parameters
+
+    Args:
+        indicator: Indicator instance
+
+    Returns:
+        Key string (class path plus sorted parameters)
+    """
+    params = indicator.cache_params()
+    params_str = ",".join(f"{k}={params[k]!r}" for k in sorted(params))
+    cls = type(indicator)
+    return f"{cls.__module__}.{cls.__qualname__}({params_str})"
+
+
+def _input_arrays(
+    indicator: Indicator, inputs: IndicatorInputs
+) -> List[Tuple[str, np.ndarray]]:
+    """Float arrays of the inputs an indicator reads, in a stable order"""
+    names: Iterable[str] = indicator.input_columns or [
+        name
+        for name in (inputs.columns if isinstance(inputs, pd.DataFrame) else inputs)
+        if pd.api.types.is_numeric_dtype(inputs[name])
+    ]
+    return [
+        (name, np.asarray(inputs[name], dtype=np.float64)) for name in sorted(names)
+    ]
+
+
+def fingerprint(
+    arrays: List[Tuple[str, np.ndarray]], length: Optional[int] = None
+) -> str:
+    """
+    Hash input arrays (optionally only their first length rows)
+
+    Args:
+        arrays: (name, values) pairs as returned for an indicator's inputs
+        length: Number of leading rows to hash (default: all)
+
+    Returns:
+        Hex digest identifying the input data
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name, values in arrays:
+        head = values if length is None else values[:length]
+        digest.update(name.encode())
+        digest.update(str(len(head)).encode())
+        digest.update(memoryview(np.ascontiguousarray(head)).cast("B"))
+    return digest.hexdigest()
+
+
+class IndicatorCache:
+    """
+    Two-tier memoization of indicator results
+
+    Thread-safe; values are returned as new Series aligned to the caller's
+    index, so cached arrays are never exposed for mutation.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 256 * 1024 * 1024,
+        disk_dir: Optional[Union[str, Path]] = None,
+        max_extension: int = 1000,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum number of in-memory entries
+            max_bytes: Maximum total size of in-memory arrays
+            disk_dir: Optional directory for the on-disk tier
+            max_extension: Maximum number of appended bars extended
+                incrementally (larger growth is recomputed in one batch)
+            max_disk_bytes: Maximum total size of the on-disk tier's files
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_extension = max_extension
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Tuple[str, str], _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        # Size of the disk tier, scanned on the first write
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def compute(
+        self,
+        indicator: Indicator,
+        inputs: IndicatorInputs,
+        compute: Optional[Callable[[], Dict[str, pd.Series]]] = None,
+    ) -> Dict[str, pd.Series]:
+        """
+        Return indicator.compute(inputs), reusing cached results when possible
+
+        Args:
+            indicator: Indicator instance
+            inputs: DataFrame or mapping of column name to Series
+            compute: Optional callable producing the indicator outputs on a
+                miss (e.g. an IndicatorPlan step); defaults to
+                indicator.compute(inputs)
+
+        Returns:
+            Dictionary mapping output column names to Series
+        """
+        if compute is None:
+
+            def compute() -> Dict[str, pd.Series]:
+                return indicator.compute(inputs)
+
+        arrays = _input_arrays(indicator, inputs)
+        if not arrays:
+            return compute()
+
+        index = inputs[arrays[0][0]].index
+        length = len(arrays[0][1])
+        key = indicator_key(indicator)
+        fp = fingerprint(arrays)
+        min_length = indicator.min_length()
+
+        entry = self._get(key, fp)
+        if entry is not None:
+            return self._as_series(entry, index)
+
+        entry = self._extend(indicator, key, fp, arrays, length, min_length)
+        if entry is None:
+            self.stats.misses += 1
+            values = compute()
+            if length < min_length or not values:
+                # Warmup-only results would be extended wrongly or stay empty
+                return values
+            entry = _CacheEntry(
+                indicator_key=key,
+                fingerprint=fp,
+                length=length,
+                columns={
+                    column: np.asarray(series, dtype=np.float64)
+                    for column, series in values.items()
+                },
+            )
+        self._put(entry)
+        return self._as_series(entry, index)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk tier is kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- lookups -----------------------------------------------------------
+
+    def _get(self, key: str, fp: str) -> Optional[_CacheEntry]:
+        with self._lock:
+            entry = self._entries.get((key, fp))
+            if entry is not None:
+                self._entries.move_to_end((key, fp))
+                self.stats.hits += 1
+                return entry
+
+        path = self._disk_path(key, fp)
+        entry = self._load(path)
+        if entry is not None:
+            self.stats.disk_hits += 1
+            self._touch(path)
+            self._put(entry, persist=False)
+        return entry
+
+    def _prefix_candidates(
+        self, key: str, length: int, min_length: int
+    ) -> List[_CacheEntry]:
+        """Shorter cached results for the same indicator, newest first"""
+
+        def usable(entry: _CacheEntry) -> bool:
+            return max(
+                length - self.max_extension, min_length
+            ) <= entry.length < length and bool(entry.columns)
+
+        with self._lock:
+            candidates = [
+                entry
+                for (entry_key, _), entry in reversed(self._entries.items())
+                if entry_key == key and usable(entry)
+            ][:_MAX_PREFIX_CANDIDATES]
+        if self.disk_dir and not candidates:
+            paths = sorted(
+                self._disk_files(f"{self._key_digest(key)}-*.npz"),
+                key=lambda item: item[1].st_mtime,
+                reverse=True,
+            )[:_MAX_PREFIX_CANDIDATES]
+            for path, _ in paths:
+                entry = self._load(path)
+                if entry and usable(entry):
+                    candidates.append(entry)
+        return candidates
+
+    def _extend(
+        self,
+        indicator: Indicator,
+        key: str,
+        fp: str,
+        arrays: List[Tuple[str, np.ndarray]],
+        length: int,
+        min_length: int,
+    ) -> Optional[_CacheEntry]:
+        """Extend a cached prefix result past the warmup with the streaming indicator"""
+        if any(np.isnan(values).any() for _, values in arrays):
+            # Streaming and batch NaN handling only agree for the built-in
+            # pandas-ta indicators; gappy inputs are recomputed in full
+            return None
+        try:
+            streaming = indicator.to_streaming()
+        except NotImplementedError:
+            return None
+
+        for entry in self._prefix_candidates(key, length, min_length):
+            if fingerprint(arrays, entry.length) != entry.fingerprint:
+                continue
+            if entry.state is not None:
+                streaming = StreamingIndicator.from_state(entry.state)
+            else:
+                # First extension of a batch result: replay the prefix once
+                for bar in _bars(arrays, 0, entry.length):
+                    streaming.update(bar)
+
+            tail = [
+                streaming.update(bar) for bar in _bars(arrays, entry.length, length)
+            ]
+            columns = {
+                column: np.concatenate(
+                    (values, [row.get(column, np.nan) for row in tail])
+                )
+                for column, values in entry.columns.items()
+            }
+            self.stats.extensions += 1
+            return _CacheEntry(
+                indicator_key=key,
+                fingerprint=fp,
+                length=length,
+                columns=columns,
+                state=streaming.get_state(),
+            )
+        return None
+
+    # -- storage -----------------------------------------------------------
+
+    def _put(self, entry: _CacheEntry, persist: bool = True) -> None:
+        for values in entry.columns.values():
+            values.flags.writeable = False
+        cache_key = (entry.indicator_key, entry.fingerprint)
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[cache_key] = entry
+            self._bytes += entry.nbytes
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.stats.evictions += 1
+        if persist:
+            self._save(entry)
+
+    @staticmethod
+    def _key_digest(key: str) -> str:
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+    def _disk_path(self, key: str, fp: str) -> Optional[Path]:
+        if not self.disk_dir:
+            return None
+        return self.disk_dir / f"{self._key_digest(key)}-{fp}.npz"
+
+    def _save(self, entry: _CacheEntry) -> None:
+        path = self._disk_path(entry.indicator_key, entry.fingerprint)
+        if path is None:
+            return
+        meta = {
+            "indicator_key": entry.indicator_key,
+            "fingerprint": entry.fingerprint,
+            "length": entry.length,
+            "columns": list(entry.columns),
+            "state": entry.state,
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    __meta__=np.array(json.dumps(meta)),
+                    **{
+                        f"c{i}": values
+                        for i, values in enumerate(entry.columns.values())
+                    },
+                )
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except OSError as e:
+            logger.warning(f"Failed to write indicator cache file {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._account_disk(size)
+
+    def _disk_files(self, pattern: str = "*.npz") -> List[Tuple[Path, os.stat_result]]:
+        """Disk tier files with their stat results (skipping vanished files)"""
+        files = []
+        for path in self.disk_dir.glob(pattern):
+            try:
+                files.append((path, path.stat()))
+            except FileNotFoundError:
+                pass
+        return files
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark a disk entry as recently used"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _account_disk(self, size: int) -> None:
+        """Add a written file's size, pruning the disk tier when over its bound"""
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(stat.st_size for _, stat in self._disk_files())
+            else:
+                self._disk_bytes += size
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+            files = sorted(self._disk_files(), key=lambda item: item[1].st_mtime)
+            total = sum(stat.st_size for _, stat in files)
+            target = self.max_disk_bytes * _DISK_PRUNE_TARGET
+            for path, stat in files:
+                if total <= target:
+                    break
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+                self.stats.disk_evictions += 1
+            self._disk_bytes = total
+
+    def _load(self, path: Optional[Path]) -> Optional[_CacheEntry]:
+        if path is None or not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                meta = json.loads(str(data["__meta__"]))
+                columns = {
+                    column: data[f"c{i}"] for i, column in enumerate(meta["columns"])
+                }
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable indicator cache file {path}: {e}")
+            return None
+        return _CacheEntry(
+            indicator_key=meta["indicator_key"],
+            fingerprint=meta["fingerprint"],
+            length=meta["length"],
+            columns=columns,
+            state=meta["state"],
+        )
+
+    @staticmethod
+    def _as_series(entry: _CacheEntry, index: pd.Index) -> Dict[str, pd.Series]:
+        return {
+            column: pd.Series(values, index=index, name=column, copy=True)
+            for column, values in entry.columns.items()
+        }
+
+
+def _bars(arrays: List[Tuple[str, np.ndarray]], start: int, stop: int):
+    """Yield rows of the input arrays as bar mappings"""
+    names = [name for name, _ in arrays]
+    columns = [values[start:stop].tolist() for _, values in arrays]
+    for row in zip(*columns):
+        yield dict(zip(names, row))
+
+
+_default_cache: Optional[IndicatorCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> IndicatorCache:
+    """
+    Get the process-wide indicator cache
+
+    The on-disk tier is enabled when INDICATOR_CACHE_DIR is set (see
+    settings.Secrets.indicator_cache_dir).
+
+    Returns:
+        Shared IndicatorCache instance
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = IndicatorCache(
+                disk_dir=secrets.indicator_cache_dir or None
+            )
+        return _default_cache
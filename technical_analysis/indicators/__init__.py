@@ -2,6 +2,7 @@
 Technical indicators for analysis layer
 """
 
+from technical_analysis.indicators.backend import get_backend, set_backend
 from technical_analysis.indicators.base import Indicator
 from technical_analysis.indicators.pandas_ta_wrapper import (
     SMA,
@@ -13,6 +14,18 @@ from technical_analysis.indicators.pandas_ta_wrapper import (
     ATR,
 )
 from technical_analysis.indicators.custom import CustomIndicator
+from technical_analysis.indicators.dag import IndicatorPlan
+from technical_analysis.indicators.pipeline import IndicatorPipeline, OHLCV_COLUMN_MAP
+from technical_analysis.indicators.streaming import (
+    StreamingIndicator,
+    StreamingSMA,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingMACD,
+    StreamingBollingerBands,
+    StreamingStochastic,
+    StreamingATR,
+)
 
 __all__ = [
     "Indicator",
@@ -24,4 +37,17 @@ __all__ = [
     "Stochastic",
     "ATR",
     "CustomIndicator",
+    "IndicatorPlan",
+    "IndicatorPipeline",
+    "OHLCV_COLUMN_MAP",
+    "StreamingIndicator",
+    "StreamingSMA",
+    "StreamingEMA",
+    "StreamingRSI",
+    "StreamingMACD",
+    "StreamingBollingerBands",
+    "StreamingStochastic",
+    "StreamingATR",
+    "get_backend",
+    "set_backend",
 ]
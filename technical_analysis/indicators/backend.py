@@ -0,0 +1,85 @@
+"""
+Indicator computation backends
+
+SMA, EMA, RSI and ATR can be computed either with pandas-ta ("pandas_ta",
+the reference implementation) or with the vectorized numpy kernels in
+technical_analysis.indicators.kernels ("numpy"), which skip the per-call
+pandas-ta overhead and agree with it to floating-point rounding. Inputs with
+missing values are computed with pandas-ta on either backend: the recursive
+kernels do not reproduce its NaN handling.
+
+The backend is chosen per indicator (backend= argument) or globally with
+set_backend(); the global default comes from INDICATOR_BACKEND.
+"""
+
+import threading
+from typing import Optional
+
+from settings import secrets
+
+PANDAS_TA = "pandas_ta"
+NUMPY = "numpy"
+BACKENDS = (PANDAS_TA, NUMPY)
+
+_backend_lock = threading.Lock()
+_backend: Optional[str] = None
+
+
+def validate_backend(name: str) -> str:
+    """
+    Check a backend name
+
+    Args:
+        name: Backend name
+
+    Returns:
+        The backend name
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown indicator backend {name!r} (expected one of {BACKENDS})"
+        )
+    return name
+
+
+def get_backend() -> str:
+    """
+    Get the global indicator backend
+
+    Returns:
+        Backend name
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = validate_backend(secrets.indicator_backend or PANDAS_TA)
+        return _backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Set the global indicator backend
+
+    Args:
+        name: Backend name (pandas_ta or numpy)
+    """
+    global _backend
+    validate_backend(name)
+    with _backend_lock:
+        _backend = name
+
+
+def resolve_backend(name: Optional[str]) -> str:
+    """
+    Resolve an indicator's backend choice
+
+    Args:
+        name: Per-indicator backend, or None to use the global one
+
+    Returns:
+        Backend name
+    """
+    return get_backend() if name is None else name
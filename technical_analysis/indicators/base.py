@@ -2,10 +2,17 @@
 Base indicator interface
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+from abc import ABC
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping, Optional, Union
 import pandas as pd
 
+if TYPE_CHECKING:
+    from technical_analysis.indicators.dag import IndicatorGraph
+    from technical_analysis.indicators.streaming import StreamingIndicator
+
+# Indicator inputs: a DataFrame or any mapping of column name -> Series
+IndicatorInputs = Union[pd.DataFrame, Mapping[str, pd.Series]]
+
 
 class Indicator(ABC):
     """Base class for technical indicators"""
@@ -21,8 +28,9 @@ class Indicator(ABC):
         self.name = name
         self.params = params
         self.columns: Dict[str, str] = {}
+        # Input columns read by compute() (None: any numeric input)
+        self.input_columns: Optional[List[str]] = None
 
-    @abstractmethod
     def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate indicator values
@@ -33,7 +41,118 @@ class Indicator(ABC):
         Returns:
             DataFrame with indicator columns added
         """
-        raise NotImplementedError
+        result = df.copy()
+        for column, values in self.compute(df).items():
+            result[column] = values
+        return result
+
+    def compute(self, inputs: IndicatorInputs) -> Dict[str, pd.Series]:
+        """
+        Calculate indicator values without copying the input
+
+        Indicators that only implement calculate() fall back to it and
+        return the columns it added.
+
+        Args:
+            inputs: DataFrame or mapping of column name to Series (open, high,
+                low, close, volume)
+
+        Returns:
+            Dictionary mapping new column names to Series
+        """
+        if type(self).calculate is Indicator.calculate:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} must implement compute() or calculate()"
+            )
+        frame = inputs if isinstance(inputs, pd.DataFrame) else pd.DataFrame(inputs)
+        result = self.calculate(frame)
+        return {
+            column: result[column]
+            for column in result.columns
+            if column not in frame.columns
+        }
+
+    def compute_panel(
+        self, panel: Mapping[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Calculate indicator values for every symbol of a wide panel
+
+        This fallback computes one symbol at a time over its active range
+        (first to last valid row, NaN outside); indicators with vectorized
+        kernels override it to compute all symbols at once.
+
+        Args:
+            panel: Mapping of input name (open, high, low, close, volume) to
+                time x symbol DataFrames sharing index and columns
+
+        Returns:
+            Dictionary mapping output column names to time x symbol DataFrames
+        """
+        like = next(iter(panel.values()))
+        results: Dict[str, Dict[Any, pd.Series]] = {}
+        for symbol in like.columns:
+            inputs = {name: frame[symbol] for name, frame in panel.items()}
+            valid = [series for series in inputs.values() if series.notna().any()]
+            if not valid:
+                continue
+            start = min(series.first_valid_index() for series in valid)
+            end = max(series.last_valid_index() for series in valid)
+            inputs = {name: series.loc[start:end] for name, series in inputs.items()}
+            for column, values in self.compute(inputs).items():
+                results.setdefault(column, {})[symbol] = values
+        return {
+            column: pd.DataFrame(by_symbol, index=like.index, columns=like.columns)
+            for column, by_symbol in results.items()
+        }
+
+    def plan(self) -> Optional["IndicatorGraph"]:
+        """
+        Describe the outputs as a graph of intermediate series
+
+        Indicators that return a graph share intermediates (EMAs, rolling
+        windows, true range, ...) with other indicators in an IndicatorPlan.
+
+        Returns:
+            IndicatorGraph, or None to always compute the indicator directly
+        """
+        return None
+
+    def min_length(self) -> int:
+        """
+        Number of bars needed before every output column is defined
+
+        Shorter inputs may produce all-NaN or missing columns; they are not
+        cached or extended incrementally.
+
+        Returns:
+            The plan's minimum input length, or 1 without a plan
+        """
+        graph = self.plan()
+        return graph.min_length if graph is not None else 1
+
+    def cache_params(self) -> Dict[str, Any]:
+        """
+        Parameters that affect the computed values (used as cache key)
+
+        Returns:
+            Dictionary of value-relevant parameters
+        """
+        return dict(self.params)
+
+    def to_streaming(self) -> "StreamingIndicator":
+        """
+        Create the incremental counterpart of this indicator
+
+        Returns:
+            Streaming indicator producing the same columns one bar at a time
+
+        Raises:
+            NotImplementedError: If the indicator has no streaming counterpart
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} has no streaming implementation"
+        )
 
     def get_plot_config(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,310 @@
+"""
+Indicator dependency graph with common-subexpression sharing
+
+Indicators describe their outputs as graphs of intermediate series (EMA,
+SMA, rolling std, rolling max/min, true range, ...). Nodes are hash-consed
+by (operation, parameters, inputs), so an IndicatorPlan built for a set of
+indicators evaluates every distinct intermediate once per input series.
+
+The operations call the same pandas-ta primitives (in the same order) as
+the batch indicators, so planned outputs are identical to compute().
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pandas_ta as ta
+from pandas_ta.utils import non_zero_range
+
+from technical_analysis.indicators.base import Indicator, IndicatorInputs
+
+
+@dataclass(frozen=True)
+class Node:
+    """One intermediate series: an operation applied to input nodes"""
+
+    op: str
+    params: Tuple = ()
+    inputs: Tuple["Node", ...] = ()
+
+    def __str__(self) -> str:
+        params = ", ".join(str(p) for p in self.params)
+        return f"{self.op}({params})"
+
+
+@dataclass
+class IndicatorGraph:
+    """Outputs of one indicator as graph nodes"""
+
+    outputs: Dict[str, Node]
+    # Shorter inputs are delegated to the indicator itself (pandas-ta
+    # returns no values below its minimum length)
+    min_length: int = 1
+
+
+# -- node constructors ------------------------------------------------------
+
+
+def source(name: str) -> Node:
+    """Input column"""
+    return Node("input", (name,))
+
+
+def sma(node: Node, length: int) -> Node:
+    return Node("sma", (length,), (node,))
+
+
+def ema(node: Node, length: int) -> Node:
+    return Node("ema", (length,), (node,))
+
+
+def rma(node: Node, length: int) -> Node:
+    return Node("rma", (length,), (node,))
+
+
+def rsi(node: Node, length: int) -> Node:
+    return Node("rsi", (length,), (node,))
+
+
+def stdev(node: Node, length: int, ddof: int = 1) -> Node:
+    return Node("stdev", (length, ddof), (node,))
+
+
+def rolling_max(node: Node, length: int) -> Node:
+    return Node("rolling_max", (length,), (node,))
+
+
+def rolling_min(node: Node, length: int) -> Node:
+    return Node("rolling_min", (length,), (node,))
+
+
+def true_range(high: Node, low: Node, close: Node) -> Node:
+    return Node("true_range", (), (high, low, close))
+
+
+def presma(node: Node, length: int) -> Node:
+    """Replace the first length values by NaNs and their mean (ATR seed)"""
+    return Node("presma", (length,), (node,))
+
+
+def trim(node: Node) -> Node:
+    """Drop the leading NaNs"""
+    return Node("trim", (), (node,))
+
+
+def sub(left: Node, right: Node) -> Node:
+    return Node("sub", (), (left, right))
+
+
+def band(mid: Node, deviation: Node, multiplier: float) -> Node:
+    """mid + multiplier * deviation"""
+    return Node("band", (multiplier,), (mid, deviation))
+
+
+def bandwidth(upper: Node, lower: Node, mid: Node) -> Node:
+    return Node("bandwidth", (), (upper, lower, mid))
+
+
+def percent_b(close: Node, upper: Node, lower: Node) -> Node:
+    return Node("percent_b", (), (close, upper, lower))
+
+
+def stoch_raw(close: Node, highest: Node, lowest: Node) -> Node:
+    return Node("stoch_raw", (), (close, highest, lowest))
+
+
+# -- node evaluation --------------------------------------------------------
+
+
+def _presma(series: pd.Series, length: int) -> pd.Series:
+    result = series.copy()
+    sma_nth = result[0:length].mean()
+    result[: length - 1] = float("nan")
+    result.iloc[length - 1] = sma_nth
+    return result
+
+
+def _or_nan(values: Optional[pd.Series], like: pd.Series) -> pd.Series:
+    if values is None:
+        return pd.Series(float("nan"), index=like.index, dtype=float)
+    return values
+
+
+_OPS: Dict[str, Callable[..., pd.Series]] = {
+    "sma": lambda s, length: _or_nan(ta.sma(s, length=length), s),
+    "ema": lambda s, length: _or_nan(ta.ema(s, length=length), s),
+    "rma": lambda s, length: _or_nan(ta.rma(s, length=length), s),
+    "rsi": lambda s, length: _or_nan(ta.rsi(s, length=length), s),
+    "stdev": lambda s, length, ddof: _or_nan(ta.stdev(s, length=length, ddof=ddof), s),
+    "rolling_max": lambda s, length: s.rolling(length).max(),
+    "rolling_min": lambda s, length: s.rolling(length).min(),
+    "true_range": lambda h, l, c: _or_nan(ta.true_range(h, l, c), c),
+    "presma": _presma,
+    "trim": lambda s: s.loc[s.first_valid_index() :],
+    "sub": lambda a, b: a - b,
+    "band": lambda mid, dev, multiplier: mid + multiplier * dev,
+    "bandwidth": lambda upper, lower, mid: 100 * non_zero_range(upper, lower) / mid,
+    "percent_b": lambda close, upper, lower: non_zero_range(close, lower)
+    / non_zero_range(upper, lower),
+    "stoch_raw": lambda close, hh, ll: 100 * (close - ll) / non_zero_range(hh, ll),
+}
+
+
+@dataclass
+class _PlanStep:
+    indicator: Indicator
+    graph: Optional[IndicatorGraph]
+    nodes: List[Node] = field(default_factory=list)
+
+
+class IndicatorPlan:
+    """
+    Evaluation plan for a set of indicators sharing intermediate series
+
+    Indicators without a graph (plan() returns None) are computed on their
+    own.
+    """
+
+    def __init__(self, indicators: Sequence[Indicator]):
+        """
+        Build the plan
+
+        Args:
+            indicators: Indicators to plan, in output order
+        """
+        self._steps: List[_PlanStep] = []
+        self._order: List[Node] = []
+        self._users: Dict[Node, List[str]] = {}
+        seen = set()
+
+        def visit(node: Node, step: _PlanStep) -> None:
+            if node not in step.nodes:
+                step.nodes.append(node)
+            for child in node.inputs:
+                visit(child, step)
+            if node not in seen:
+                seen.add(node)
+                self._order.append(node)
+
+        for indicator in indicators:
+            graph = indicator.plan()
+            step = _PlanStep(indicator, graph)
+            if graph is not None:
+                for node in graph.outputs.values():
+                    visit(node, step)
+                for node in step.nodes:
+                    self._users.setdefault(node, []).append(repr(indicator))
+            self._steps.append(step)
+
+    @property
+    def nodes(self) -> List[Node]:
+        """Distinct nodes in evaluation (topological) order"""
+        return list(self._order)
+
+    def compute(
+        self, inputs: IndicatorInputs, memo: Optional[Dict[Node, pd.Series]] = None
+    ) -> List[Dict[str, pd.Series]]:
+        """
+        Evaluate all indicators
+
+        Args:
+            inputs: DataFrame or mapping of column name to Series
+            memo: Optional node -> Series memo shared across calls on the
+                same inputs
+
+        Returns:
+            One output dictionary per indicator, in plan order
+        """
+        memo = {} if memo is None else memo
+        return [self.compute_step(i, inputs, memo) for i in range(len(self._steps))]
+
+    def compute_step(
+        self, step_index: int, inputs: IndicatorInputs, memo: Dict[Node, pd.Series]
+    ) -> Dict[str, pd.Series]:
+        """
+        Evaluate one indicator, reusing nodes already present in memo
+
+        Args:
+            step_index: Position of the indicator in the plan
+            inputs: DataFrame or mapping of column name to Series
+            memo: Node -> Series memo for these inputs (updated in place)
+
+        Returns:
+            Dictionary mapping output column names to Series
+        """
+        step = self._steps[step_index]
+        graph = step.graph
+        if graph is None:
+            return step.indicator.compute(inputs)
+
+        index = self._input_index(graph, inputs)
+        if index is None or len(index) < graph.min_length:
+            return step.indicator.compute(inputs)
+
+        return {
+            column: self._evaluate(node, inputs, memo).reindex(index)
+            for column, node in graph.outputs.items()
+        }
+
+    def _evaluate(
+        self, node: Node, inputs: IndicatorInputs, memo: Dict[Node, pd.Series]
+    ) -> pd.Series:
+        if node in memo:
+            return memo[node]
+        if node.op == "input":
+            value = inputs[node.params[0]]
+        else:
+            args = [self._evaluate(child, inputs, memo) for child in node.inputs]
+            value = _OPS[node.op](*args, *node.params)
+        memo[node] = value
+        return value
+
+    @staticmethod
+    def _input_index(
+        graph: IndicatorGraph, inputs: IndicatorInputs
+    ) -> Optional[pd.Index]:
+        stack = list(graph.outputs.values())
+        while stack:
+            node = stack.pop()
+            if node.op == "input":
+                return inputs[node.params[0]].index
+            stack.extend(node.inputs)
+        return None
+
+    def explain(self) -> str:
+        """
+        Describe the plan: every distinct node, its inputs and which
+        indicators use it
+
+        Returns:
+            Multi-line plan description
+        """
+        ids = {node: f"n{i}" for i, node in enumerate(self._order)}
+        computed = [node for node in self._order if node.op != "input"]
+        shared = [node for node in computed if len(self._users[node]) > 1]
+        requested = sum(
+            sum(1 for node in step.nodes if node.op != "input") for step in self._steps
+        )
+
+        lines = [
+            f"IndicatorPlan: {len(self._steps)} indicators, "
+            f"{len(computed)} computed nodes, {len(shared)} shared "
+            f"({requested - len(computed)} evaluations saved)"
+        ]
+        for node in self._order:
+            args = ", ".join(ids[child] for child in node.inputs)
+            label = f"{ids[node]} = {node}" + (f" <- {args}" if args else "")
+            users = self._users[node]
+            note = f"shared by {', '.join(users)}" if len(users) > 1 else users[0]
+            lines.append(f"  {label:<40} {note}")
+        for step in self._steps:
+            if step.graph is None:
+                lines.append(f"  {step.indicator!r}: computed directly")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(indicators={len(self._steps)}, "
+            f"nodes={len(self._order)})"
+        )
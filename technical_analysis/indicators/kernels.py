@@ -0,0 +1,357 @@
+"""
+Vectorized numpy kernels for moving-average style indicators
+
+The kernels operate along axis 0 of 1-D (time) or 2-D (time x series)
+float arrays and reproduce the batch pandas-ta conventions used by the
+indicator wrappers:
+
+- SMA: mean of the last period values, NaN while fewer are available
+- EMA: seeded with the SMA of the first period values, then
+  y[t] = alpha * x[t] + (1 - alpha) * y[t-1] with alpha = 2 / (period + 1)
+- RSI: Wilder smoothing (alpha = 1 / period) of gains and losses seeded with
+  the first price change
+- ATR: Wilder smoothing of the true range seeded with the mean of the first
+  period true ranges
+
+Leading NaNs are skipped per column, so each column matches the batch
+indicator run on its values from the first valid row on. Interior NaNs
+invalidate the SMA windows containing them and propagate through the
+recursive kernels, whereas pandas-ta carries its averages across them; the
+indicator wrappers therefore use pandas-ta for inputs with missing values.
+
+The *_many variants compute several periods over one 1-D series, sharing
+intermediates (power-of-two window sums for all SMA periods, one set of price
+changes for all RSI periods), and return an array with one column per period.
+"""
+
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# Rows per block of the blocked linear recurrence (one GEMM per block row)
+_RECURRENCE_BLOCK = 64
+
+
+def _as_2d(values) -> Tuple[np.ndarray, bool]:
+    """Return a float64 (n, m) array and whether the input was 1-D"""
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim == 1:
+        return array[:, None], True
+    if array.ndim != 2:
+        raise ValueError(f"Expected a 1-D or 2-D array, got {array.ndim} dimensions")
+    return array, False
+
+
+def _as_1d(values) -> np.ndarray:
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim != 1:
+        raise ValueError(f"Expected a 1-D array, got {array.ndim} dimensions")
+    return array
+
+
+def _first_valid(x: np.ndarray) -> np.ndarray:
+    """Index of the first non-NaN row per column (n when there is none)"""
+    valid = ~np.isnan(x)
+    return np.where(valid.any(axis=0), valid.argmax(axis=0), x.shape[0])
+
+
+def _rolling_means(x: np.ndarray, periods: Sequence[int]) -> List[np.ndarray]:
+    """
+    Rolling means of x (n, m) for several periods
+
+    Window sums are assembled from power-of-two window sums shared by all
+    periods (O(n log period) additions). Unlike differences of one cumulative
+    sum, their rounding error does not grow with the series length, and a NaN
+    only invalidates the windows containing it.
+    """
+    n, m = x.shape
+    for period in periods:
+        if period < 1:
+            raise ValueError(f"Period must be positive, got {period}")
+    longest = max((p for p in periods if p <= n), default=0)
+
+    # powers[k][i] = sum of x[i : i + 2**k]
+    powers = [x]
+    while 2 ** len(powers) <= longest:
+        half = 2 ** (len(powers) - 1)
+        previous = powers[-1]
+        powers.append(previous[:-half] + previous[half:])
+
+    results = []
+    for period in periods:
+        out = np.full((n, m), np.nan)
+        if period <= n:
+            sums = None
+            covered = 0
+            for k in reversed(range(period.bit_length())):
+                if not period >> k & 1:
+                    continue
+                length = n - period + 1
+                part = powers[k][covered : covered + length]
+                sums = part.copy() if sums is None else np.add(sums, part, out=sums)
+                covered += 2**k
+            np.divide(sums, period, out=out[period - 1 :])
+        results.append(out)
+    return results
+
+
+@lru_cache(maxsize=64)
+def _decay_weights(decay: float, block: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Block Toeplitz matrix of decay powers and decay ** (1..block)"""
+    lags = np.arange(block)
+    exponents = lags[None, :] - lags[:, None]
+    weights = np.where(exponents >= 0, decay ** np.maximum(exponents, 0), 0.0)
+    powers = decay ** (lags + 1.0)
+    weights.flags.writeable = False
+    powers.flags.writeable = False
+    return weights, powers
+
+
+def linear_recurrence(x: np.ndarray, decay: float) -> np.ndarray:
+    """
+    Solve y[t] = decay * y[t-1] + x[t] (y[-1] = 0) along axis 0
+
+    Rows are processed in blocks: within a block the recurrence is a lower
+    triangular Toeplitz product (one matrix multiplication for all blocks
+    and columns), and the block boundary values are solved recursively as a
+    recurrence of n / block rows.
+
+    Args:
+        x: Input array of shape (n, m)
+        decay: Recurrence coefficient (0 <= decay < 1)
+
+    Returns:
+        Array of shape (n, m)
+    """
+    n, m = x.shape
+    if n == 0:
+        return x.copy()
+    # A NaN invalidates every later row; zero it for the products, which
+    # would otherwise also spread it to earlier rows of the block (0 * NaN)
+    missing = np.isnan(x)
+    if missing.any():
+        y = linear_recurrence(np.where(missing, 0.0, x), decay)
+        y[np.logical_or.accumulate(missing, axis=0)] = np.nan
+        return y
+
+    block = min(_RECURRENCE_BLOCK, n)
+    n_blocks = -(-n // block)
+    # Series-major layout so every block is a contiguous row of the GEMM
+    series = np.zeros((m, n_blocks * block))
+    series[:, :n] = x.T
+
+    weights, powers = _decay_weights(decay, block)
+    y = (series.reshape(m * n_blocks, block) @ weights).reshape(m, n_blocks, block)
+
+    if n_blocks > 1:
+        # Block boundaries follow the same recurrence with decay ** block
+        carries = linear_recurrence(y[:, :-1, -1].T, decay**block).T
+        y[:, 1:, :] += carries[:, :, None] * powers
+    return y.reshape(m, n_blocks * block)[:, :n].T
+
+
+def _seeded_smoothing(
+    x: np.ndarray, alpha: float, start: np.ndarray, seed: np.ndarray
+) -> np.ndarray:
+    """
+    y[start] = seed, then y[t] = alpha * x[t] + (1 - alpha) * y[t-1]
+
+    Rows before start are NaN. start and seed are per column; columns with
+    start >= n are all NaN.
+    """
+    n, m = x.shape
+    drive = alpha * x
+    # Only the warmup head needs masking
+    head = min(int(start.max()) + 1, n)
+    head_rows = np.arange(head)[:, None]
+    drive[:head] = np.where(head_rows > start, drive[:head], 0.0)
+    columns = np.flatnonzero(start < n)
+    drive[start[columns], columns] = seed[columns]
+    y = linear_recurrence(drive, 1.0 - alpha)
+    y[:head][head_rows < start] = np.nan
+    return y
+
+
+def _ema(x: np.ndarray, period: int) -> np.ndarray:
+    """EMA of x (n, m), seeded with the mean of each column's first period values"""
+    n, m = x.shape
+    first = _first_valid(x)
+    start = first + period - 1
+    seed = np.full(m, np.nan)
+    for column in np.flatnonzero(start < n):
+        seed[column] = x[first[column] : start[column] + 1, column].mean()
+    return _seeded_smoothing(x, 2.0 / (period + 1), start, seed)
+
+
+def _rsi(changes: np.ndarray, period: int, first_price: np.ndarray) -> np.ndarray:
+    """RSI from price changes (first row NaN) of shape (n, m)"""
+    n, m = changes.shape
+    start = first_price + 1
+    gains = np.clip(changes, 0.0, None)
+    losses = np.clip(-changes, 0.0, None)
+    seed = np.full(2 * m, np.nan)
+    columns = np.flatnonzero(start < n)
+    seed[columns] = gains[start[columns], columns]
+    seed[m + columns] = losses[start[columns], columns]
+
+    smoothed = _seeded_smoothing(
+        np.hstack((gains, losses)), 1.0 / period, np.tile(start, 2), seed
+    )
+    avg_gain, avg_loss = smoothed[:, :m], smoothed[:, m:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rsi = 100.0 * avg_gain / (avg_gain + avg_loss)
+    # pandas-ta needs at least period + 1 prices
+    rsi[:, (n - first_price) < period + 1] = np.nan
+    return rsi
+
+
+def _atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int):
+    """ATR from (n, m) high, low and close arrays"""
+    n, m = close.shape
+    prev_close = np.full_like(close, np.nan)
+    prev_close[1:] = close[:-1]
+    first = _first_valid(close)
+    # The first bar of each series has no previous close: range only
+    prev_close[first[first < n], np.flatnonzero(first < n)] = np.nan
+    true_range = high - low
+    with np.errstate(invalid="ignore"):
+        true_range = np.fmax(true_range, np.abs(high - prev_close))
+        true_range = np.fmax(true_range, np.abs(prev_close - low))
+
+    start = first + period - 1
+    seed = np.full(m, np.nan)
+    for column in np.flatnonzero(start < n):
+        seed[column] = true_range[first[column] : start[column] + 1, column].mean()
+    atr = _seeded_smoothing(true_range, 1.0 / period, start, seed)
+    # pandas-ta needs at least period + 1 bars
+    atr[:, (n - first) < period + 1] = np.nan
+    return atr
+
+
+def _price_changes(x: np.ndarray) -> np.ndarray:
+    changes = np.full_like(x, np.nan)
+    changes[1:] = x[1:] - x[:-1]
+    return changes
+
+
+def sma(values, period: int) -> np.ndarray:
+    """
+    Simple moving average along axis 0
+
+    Args:
+        values: 1-D or 2-D (time x series) array-like
+        period: Window length
+
+    Returns:
+        Array with the same shape as values
+    """
+    x, squeeze = _as_2d(values)
+    out = _rolling_means(x, [period])[0]
+    return out[:, 0] if squeeze else out
+
+
+def ema(values, period: int) -> np.ndarray:
+    """
+    Exponential moving average (SMA-seeded) along axis 0
+
+    Args:
+        values: 1-D or 2-D (time x series) array-like
+        period: EMA span
+
+    Returns:
+        Array with the same shape as values
+    """
+    x, squeeze = _as_2d(values)
+    out = _ema(x, period)
+    return out[:, 0] if squeeze else out
+
+
+def rsi(values, period: int) -> np.ndarray:
+    """
+    Relative Strength Index (Wilder smoothing) along axis 0
+
+    Args:
+        values: 1-D or 2-D (time x series) array-like of prices
+        period: RSI period
+
+    Returns:
+        Array with the same shape as values
+    """
+    x, squeeze = _as_2d(values)
+    out = _rsi(_price_changes(x), period, _first_valid(x))
+    return out[:, 0] if squeeze else out
+
+
+def atr(high, low, close, period: int) -> np.ndarray:
+    """
+    Average True Range along axis 0
+
+    Args:
+        high: 1-D or 2-D (time x series) array-like of highs
+        low: Lows, same shape as high
+        close: Closes, same shape as high
+        period: ATR period
+
+    Returns:
+        Array with the same shape as the inputs
+    """
+    (h, squeeze), (lo, _), (c, _) = _as_2d(high), _as_2d(low), _as_2d(close)
+    out = _atr(h, lo, c, period)
+    return out[:, 0] if squeeze else out
+
+
+def sma_many(values, periods: Sequence[int]) -> np.ndarray:
+    """
+    Simple moving averages for several periods from shared window sums
+
+    Args:
+        values: 1-D array-like
+        periods: Window lengths
+
+    Returns:
+        Array of shape (len(values), len(periods))
+    """
+    x = _as_1d(values)[:, None]
+    out = np.empty((x.shape[0], len(periods)), order="F")
+    for i, means in enumerate(_rolling_means(x, periods)):
+        out[:, i] = means[:, 0]
+    return out
+
+
+def ema_many(values, periods: Sequence[int]) -> np.ndarray:
+    """
+    Exponential moving averages for several periods
+
+    Args:
+        values: 1-D array-like
+        periods: EMA spans
+
+    Returns:
+        Array of shape (len(values), len(periods))
+    """
+    x = _as_1d(values)[:, None]
+    out = np.empty((x.shape[0], len(periods)), order="F")
+    for i, period in enumerate(periods):
+        out[:, i] = _ema(x, period)[:, 0]
+    return out
+
+
+def rsi_many(values, periods: Sequence[int]) -> np.ndarray:
+    """
+    Relative Strength Index for several periods from one set of price changes
+
+    Args:
+        values: 1-D array-like of prices
+        periods: RSI periods
+
+    Returns:
+        Array of shape (len(values), len(periods))
+    """
+    x = _as_1d(values)[:, None]
+    changes = _price_changes(x)
+    first_price = _first_valid(x)
+    out = np.empty((x.shape[0], len(periods)), order="F")
+    for i, period in enumerate(periods):
+        out[:, i] = _rsi(changes, period, first_price)[:, 0]
+    return out
@@ -2,18 +2,89 @@
 Wrapper for pandas-ta technical indicators
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional, Sequence
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
-from technical_analysis.indicators.base import Indicator
+from technical_analysis.indicators import dag, kernels
+from technical_analysis.indicators.backend import (
+    NUMPY,
+    resolve_backend,
+    validate_backend,
+)
+from technical_analysis.indicators.base import Indicator, IndicatorInputs
+from technical_analysis.indicators.streaming import (
+    StreamingSMA,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingMACD,
+    StreamingBollingerBands,
+    StreamingStochastic,
+    StreamingATR,
+)
+
+
+def _as_series(values: Optional[pd.Series], index: pd.Index) -> pd.Series:
+    """pandas-ta returns None when the input is shorter than the window"""
+    if values is None:
+        return pd.Series(float("nan"), index=index, dtype=float)
+    return values
+
+
+def _as_panel(values: np.ndarray, like: pd.DataFrame) -> pd.DataFrame:
+    """Wrap a kernel result in the panel's time x symbol frame"""
+    return pd.DataFrame(values, index=like.index, columns=like.columns)
+
+
+def _kernel_series(values: np.ndarray, index: pd.Index, name: str) -> pd.Series:
+    """Wrap a numpy-backend result like the pandas-ta Series it replaces"""
+    return pd.Series(values, index=index, name=name)
+
+
+def _uses_numpy(backend: Optional[str]) -> bool:
+    return resolve_backend(backend) == NUMPY
+
+
+def _has_missing(*inputs: Any) -> bool:
+    """
+    Whether any input has missing values
+
+    The recursive kernels (EMA, RSI, ATR) propagate a NaN to every later
+    row, while pandas-ta carries its averages across it and seeds on the
+    leading rows as they are, so such inputs are computed with pandas-ta
+    whatever the backend.
+    """
+    return any(
+        np.isnan(np.asarray(values, dtype=np.float64)).any() for values in inputs
+    )
+
+
+def _pandas_ta_many(func: Any, source: Any, periods: Sequence[int]) -> np.ndarray:
+    """calculate_many fallback: one pandas-ta call per period"""
+    series = pd.Series(np.asarray(source, dtype=np.float64))
+    out = np.empty((len(series), len(periods)), order="F")
+    for i, period in enumerate(periods):
+        out[:, i] = _as_series(func(series, length=period), series.index)
+    return out
+
+
+def _as_columns(values: Optional[pd.DataFrame]) -> Dict[str, pd.Series]:
+    """Split a multi-column pandas-ta result into named Series"""
+    if values is None:
+        return {}
+    return {column: values[column] for column in values.columns}
 
 
 class SMA(Indicator):
     """Simple Moving Average"""
 
     def __init__(
-        self, period: int = 20, column: str = "close", color: Optional[str] = None
+        self,
+        period: int = 20,
+        column: str = "close",
+        color: Optional[str] = None,
+        backend: Optional[str] = None,
     ):
         """
         Initialize SMA indicator
@@ -22,18 +93,71 @@ class SMA(Indicator):
             period: Period for moving average
             column: Column to calculate SMA on (default: close)
             color: Optional color for the indicator line (default: auto-assigned based on period)
+            backend: pandas_ta or numpy (default: the global backend)
         """
         super().__init__(name="SMA", period=period, column=column, color=color)
         self.period = period
         self.column = column
         self.color = color
+        self.backend = validate_backend(backend) if backend else None
         self.columns = {f"sma_{period}": f"SMA({period})"}
+        self.input_columns = [column]
+
+    @classmethod
+    def calculate_many(cls, source: Any, periods: Sequence[int]) -> np.ndarray:
+        """
+        Calculate SMAs for several periods in one pass
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+        Args:
+            source: 1-D series or array (e.g. close prices)
+            periods: Moving average periods
+
+        Returns:
+            Array of shape (len(source), len(periods)), one column per period
+        """
+        return kernels.sma_many(source, periods)
+
+    def compute(self, inputs: IndicatorInputs) -> Dict[str, pd.Series]:
         """Calculate SMA"""
-        result = df.copy()
-        result[f"sma_{self.period}"] = ta.sma(result[self.column], length=self.period)
-        return result
+        source = inputs[self.column]
+        if _uses_numpy(self.backend):
+            values = kernels.sma(source, self.period)
+            return {
+                f"sma_{self.period}": _kernel_series(
+                    values, source.index, f"SMA_{self.period}"
+                )
+            }
+        return {
+            f"sma_{self.period}": _as_series(
+                ta.sma(source, length=self.period), source.index
+            )
+        }
+
+    def compute_panel(
+        self, panel: Mapping[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Calculate SMA for all symbols at once"""
+        source = panel[self.column]
+        return {
+            f"sma_{self.period}": _as_panel(
+                kernels.sma(source.to_numpy(), self.period), source
+            )
+        }
+
+    def plan(self) -> Optional[dag.IndicatorGraph]:
+        if _uses_numpy(self.backend):
+            return None
+        node = dag.sma(dag.source(self.column), self.period)
+        return dag.IndicatorGraph({f"sma_{self.period}": node}, self.min_length())
+
+    def min_length(self) -> int:
+        return self.period
+
+    def cache_params(self) -> Dict[str, Any]:
+        return {"period": self.period, "column": self.column}
+
+    def to_streaming(self) -> StreamingSMA:
+        return StreamingSMA(period=self.period, column=self.column)
 
     def get_plot_config(self) -> Dict[str, Any]:
         config = super().get_plot_config()
@@ -54,24 +178,78 @@ class SMA(Indicator):
 class EMA(Indicator):
     """Exponential Moving Average"""
 
-    def __init__(self, period: int = 20, column: str = "close"):
+    def __init__(
+        self, period: int = 20, column: str = "close", backend: Optional[str] = None
+    ):
         """
         Initialize EMA indicator
 
         Args:
             period: Period for moving average
             column: Column to calculate EMA on (default: close)
+            backend: pandas_ta or numpy (default: the global backend)
         """
         super().__init__(name="EMA", period=period, column=column)
         self.period = period
         self.column = column
+        self.backend = validate_backend(backend) if backend else None
         self.columns = {f"ema_{period}": f"EMA({period})"}
+        self.input_columns = [column]
+
+    @classmethod
+    def calculate_many(cls, source: Any, periods: Sequence[int]) -> np.ndarray:
+        """
+        Calculate EMAs for several periods in one pass
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+        Args:
+            source: 1-D series or array (e.g. close prices)
+            periods: Moving average periods
+
+        Returns:
+            Array of shape (len(source), len(periods)), one column per period
+        """
+        if _has_missing(source):
+            return _pandas_ta_many(ta.ema, source, periods)
+        return kernels.ema_many(source, periods)
+
+    def compute(self, inputs: IndicatorInputs) -> Dict[str, pd.Series]:
         """Calculate EMA"""
-        result = df.copy()
-        result[f"ema_{self.period}"] = ta.ema(result[self.column], length=self.period)
-        return result
+        source = inputs[self.column]
+        if _uses_numpy(self.backend) and not _has_missing(source):
+            values = kernels.ema(source, self.period)
+            return {
+                f"ema_{self.period}": _kernel_series(
+                    values, source.index, f"EMA_{self.period}"
+                )
+            }
+        return {
+            f"ema_{self.period}": _as_series(
+                ta.ema(source, length=self.period), source.index
+            )
+        }
+
+    def compute_panel(
+        self, panel: Mapping[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Calculate EMA for all symbols at once"""
+        source = panel[self.column]
+        return {
+            f"ema_{self.period}": _as_panel(
+                kernels.ema(source.to_numpy(), self.period), source
+            )
+        }
+
+    def plan(self) -> Optional[dag.IndicatorGraph]:
+        if _uses_numpy(self.backend):
+            return None
+        node = dag.ema(dag.source(self.column), self.period)
+        return dag.IndicatorGraph({f"ema_{self.period}": node}, self.min_length())
+
+    def min_length(self) -> int:
+        return self.period
+
+    def to_streaming(self) -> StreamingEMA:
+        return StreamingEMA(period=self.period, column=self.column)
 
     def get_plot_config(self) -> Dict[str, Any]:
         config = super().get_plot_config()
@@ -82,22 +260,74 @@ class EMA(Indicator):
 class RSI(Indicator):
     """Relative Strength Index"""
 
-    def __init__(self, period: int = 14):
+    def __init__(self, period: int = 14, backend: Optional[str] = None):
         """
         Initialize RSI indicator
 
         Args:
             period: Period for RSI calculation
+            backend: pandas_ta or numpy (default: the global backend)
         """
         super().__init__(name="RSI", period=period)
         self.period = period
+        self.backend = validate_backend(backend) if backend else None
         self.columns = {f"rsi_{period}": f"RSI({period})"}
+        self.input_columns = ["close"]
+
+    @classmethod
+    def calculate_many(cls, source: Any, periods: Sequence[int]) -> np.ndarray:
+        """
+        Calculate RSIs for several periods in one pass
+
+        Args:
+            source: 1-D series or array (close prices)
+            periods: RSI periods
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+        Returns:
+            Array of shape (len(source), len(periods)), one column per period
+        """
+        if _has_missing(source):
+            return _pandas_ta_many(ta.rsi, source, periods)
+        return kernels.rsi_many(source, periods)
+
+    def compute(self, inputs: IndicatorInputs) -> Dict[str, pd.Series]:
         """Calculate RSI"""
-        result = df.copy()
-        result[f"rsi_{self.period}"] = ta.rsi(result["close"], length=self.period)
-        return result
+        close = inputs["close"]
+        if _uses_numpy(self.backend) and not _has_missing(close):
+            values = kernels.rsi(close, self.period)
+            return {
+                f"rsi_{self.period}": _kernel_series(
+                    values, close.index, f"RSI_{self.period}"
+                )
+            }
+        return {
+            f"rsi_{self.period}": _as_series(
+                ta.rsi(close, length=self.period), close.index
+            )
+        }
+
+    def compute_panel(
+        self, panel: Mapping[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Calculate RSI for all symbols at once"""
+        close = panel["close"]
+        return {
+            f"rsi_{self.period}": _as_panel(
+                kernels.rsi(close.to_numpy(), self.period), close
+            )
+        }
+
+    def plan(self) -> Optional[dag.IndicatorGraph]:
+        if _uses_numpy(self.backend):
+            return None
+        node = dag.rsi(dag.source("close"), self.period)
+        return dag.IndicatorGraph({f"rsi_{self.period}": node}, self.min_length())
+
+    def min_length(self) -> int:
+        return self.period + 1
+
+    def to_streaming(self) -> StreamingRSI:
+        return StreamingRSI(period=self.period)
 
     def get_plot_config(self) -> Dict[str, Any]:
         config = super().get_plot_config()
@@ -138,20 +368,50 @@ class MACD(Indicator):
             f"macd_signal_{signal}": f"MACD Signal({signal})",
             f"macd_hist_{fast}_{slow}_{signal}": "MACD Histogram",
         }
+        self.input_columns = ["close"]
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+    def compute(self, inputs: IndicatorInputs) -> Dict[str, pd.Series]:
         """Calculate MACD"""
-        result = df.copy()
         macd_data = ta.macd(
-            result["close"],
+            inputs["close"],
             fast=self.fast,
             slow=self.slow,
             signal=self.signal,
         )
-        if macd_data is not None:
-            for col in macd_data.columns:
-                result[col] = macd_data[col]
-        return result
+        return _as_columns(macd_data)
+
+    def compute_panel(
+        self, panel: Mapping[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Calculate MACD for all symbols at once"""
+        close = panel["close"]
+        fast, slow = sorted((self.fast, self.slow))
+        macd = kernels.ema(close.to_numpy(), fast) - kernels.ema(close.to_numpy(), slow)
+        signal = kernels.ema(macd, self.signal)
+        suffix = f"_{fast}_{slow}_{self.signal}"
+        return {
+            f"MACD{suffix}": _as_panel(macd, close),
+            f"MACDh{suffix}": _as_panel(macd - signal, close),
+            f"MACDs{suffix}": _as_panel(signal, close),
+        }
+
+    def plan(self) -> dag.IndicatorGraph:
+        fast, slow = sorted((self.fast, self.slow))
+        close = dag.source("close")
+        macd = dag.sub(dag.ema(close, fast), dag.ema(close, slow))
+        signal = dag.ema(dag.trim(macd), self.signal)
+        suffix = f"_{fast}_{slow}_{self.signal}"
+        return dag.IndicatorGraph(
+            {
+                f"MACD{suffix}": macd,
+                f"MACDh{suffix}": dag.sub(macd, signal),
+                f"MACDs{suffix}": signal,
+            },
+            slow + self.signal - 1,
+        )
+
+    def to_streaming(self) -> StreamingMACD:
+        return StreamingMACD(fast=self.fast, slow=self.slow, signal=self.signal)
 
     def get_plot_config(self) -> Dict[str, Any]:
         return {
@@ -179,15 +439,59 @@ class BollingerBands(Indicator):
             f"bb_middle_{period}": f"BB Middle({period})",
             f"bb_lower_{period}": f"BB Lower({period},{std})",
         }
+        self.input_columns = ["close"]
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+    def compute(self, inputs: IndicatorInputs) -> Dict[str, pd.Series]:
         """Calculate Bollinger Bands"""
-        result = df.copy()
-        bb_data = ta.bbands(result["close"], length=self.period, std=self.std)
-        if bb_data is not None:
-            for col in bb_data.columns:
-                result[col] = bb_data[col]
-        return result
+        bb_data = ta.bbands(
+            inputs["close"],
+            length=self.period,
+            lower_std=self.std,
+            upper_std=self.std,
+        )
+        return _as_columns(bb_data)
+
+    def compute_panel(
+        self, panel: Mapping[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Calculate Bollinger Bands for all symbols at once"""
+        close = panel["close"]
+        values = close.to_numpy(dtype=float)
+        mid = kernels.sma(values, self.period)
+        deviation = self.std * (
+            pd.DataFrame(values).rolling(self.period).std(ddof=1).to_numpy()
+        )
+        lower = mid - deviation
+        upper = mid + deviation
+        suffix = f"_{self.period}_{self.std}_{self.std}"
+        return {
+            f"BBL{suffix}": _as_panel(lower, close),
+            f"BBM{suffix}": _as_panel(mid, close),
+            f"BBU{suffix}": _as_panel(upper, close),
+            f"BBB{suffix}": _as_panel(100 * (upper - lower) / mid, close),
+            f"BBP{suffix}": _as_panel((values - lower) / (upper - lower), close),
+        }
+
+    def plan(self) -> dag.IndicatorGraph:
+        close = dag.source("close")
+        mid = dag.sma(close, self.period)
+        deviation = dag.stdev(close, self.period)
+        lower = dag.band(mid, deviation, -self.std)
+        upper = dag.band(mid, deviation, self.std)
+        suffix = f"_{self.period}_{self.std}_{self.std}"
+        return dag.IndicatorGraph(
+            {
+                f"BBL{suffix}": lower,
+                f"BBM{suffix}": mid,
+                f"BBU{suffix}": upper,
+                f"BBB{suffix}": dag.bandwidth(upper, lower, mid),
+                f"BBP{suffix}": dag.percent_b(close, upper, lower),
+            },
+            self.period,
+        )
+
+    def to_streaming(self) -> StreamingBollingerBands:
+        return StreamingBollingerBands(period=self.period, std=self.std)
 
     def get_plot_config(self) -> Dict[str, Any]:
         return {
@@ -225,22 +529,61 @@ class Stochastic(Indicator):
             f"stoch_k_{k_period}": f"Stoch %K({k_period})",
             f"stoch_d_{d_period}": f"Stoch %D({d_period})",
         }
+        self.input_columns = ["high", "low", "close"]
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+    def compute(self, inputs: IndicatorInputs) -> Dict[str, pd.Series]:
         """Calculate Stochastic"""
-        result = df.copy()
         stoch_data = ta.stoch(
-            result["high"],
-            result["low"],
-            result["close"],
+            inputs["high"],
+            inputs["low"],
+            inputs["close"],
             k=self.k_period,
             d=self.d_period,
             smooth_k=self.smooth_k,
         )
-        if stoch_data is not None:
-            for col in stoch_data.columns:
-                result[col] = stoch_data[col]
-        return result
+        return _as_columns(stoch_data)
+
+    def compute_panel(
+        self, panel: Mapping[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Calculate Stochastic for all symbols at once"""
+        close = panel["close"]
+        highest = panel["high"].rolling(self.k_period).max().to_numpy(dtype=float)
+        lowest = panel["low"].rolling(self.k_period).min().to_numpy(dtype=float)
+        stoch = 100 * (close.to_numpy(dtype=float) - lowest) / (highest - lowest)
+        stoch_k = kernels.sma(stoch, self.smooth_k)
+        stoch_d = kernels.sma(stoch_k, self.d_period)
+        suffix = f"_{self.k_period}_{self.d_period}_{self.smooth_k}"
+        return {
+            f"STOCHk{suffix}": _as_panel(stoch_k, close),
+            f"STOCHd{suffix}": _as_panel(stoch_d, close),
+            f"STOCHh{suffix}": _as_panel(stoch_k - stoch_d, close),
+        }
+
+    def plan(self) -> dag.IndicatorGraph:
+        stoch = dag.stoch_raw(
+            dag.source("close"),
+            dag.rolling_max(dag.source("high"), self.k_period),
+            dag.rolling_min(dag.source("low"), self.k_period),
+        )
+        stoch_k = stoch
+        if self.smooth_k != 1:
+            stoch_k = dag.sma(dag.trim(stoch), self.smooth_k)
+        stoch_d = dag.sma(dag.trim(stoch_k), self.d_period)
+        suffix = f"_{self.k_period}_{self.d_period}_{self.smooth_k}"
+        return dag.IndicatorGraph(
+            {
+                f"STOCHk{suffix}": stoch_k,
+                f"STOCHd{suffix}": stoch_d,
+                f"STOCHh{suffix}": dag.sub(stoch_k, stoch_d),
+            },
+            self.k_period + self.d_period + self.smooth_k,
+        )
+
+    def to_streaming(self) -> StreamingStochastic:
+        return StreamingStochastic(
+            k_period=self.k_period, d_period=self.d_period, smooth_k=self.smooth_k
+        )
 
     def get_plot_config(self) -> Dict[str, Any]:
         return {
@@ -253,24 +596,65 @@ class Stochastic(Indicator):
 class ATR(Indicator):
     """Average True Range"""
 
-    def __init__(self, period: int = 14):
+    def __init__(self, period: int = 14, backend: Optional[str] = None):
         """
         Initialize ATR indicator
 
         Args:
             period: Period for ATR calculation
+            backend: pandas_ta or numpy (default: the global backend)
         """
         super().__init__(name="ATR", period=period)
         self.period = period
+        self.backend = validate_backend(backend) if backend else None
         self.columns = {f"atr_{period}": f"ATR({period})"}
+        self.input_columns = ["high", "low", "close"]
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+    def compute(self, inputs: IndicatorInputs) -> Dict[str, pd.Series]:
         """Calculate ATR"""
-        result = df.copy()
-        result[f"atr_{self.period}"] = ta.atr(
-            result["high"], result["low"], result["close"], length=self.period
+        close = inputs["close"]
+        high, low = inputs["high"], inputs["low"]
+        if _uses_numpy(self.backend) and not _has_missing(high, low, close):
+            values = kernels.atr(high, low, close, self.period)
+            return {
+                f"atr_{self.period}": _kernel_series(
+                    values, close.index, f"ATRr_{self.period}"
+                )
+            }
+        return {
+            f"atr_{self.period}": _as_series(
+                ta.atr(high, low, close, length=self.period),
+                close.index,
+            )
+        }
+
+    def compute_panel(
+        self, panel: Mapping[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Calculate ATR for all symbols at once"""
+        close = panel["close"]
+        atr = kernels.atr(
+            panel["high"].to_numpy(),
+            panel["low"].to_numpy(),
+            close.to_numpy(),
+            self.period,
+        )
+        return {f"atr_{self.period}": _as_panel(atr, close)}
+
+    def plan(self) -> Optional[dag.IndicatorGraph]:
+        if _uses_numpy(self.backend):
+            return None
+        true_range = dag.true_range(
+            dag.source("high"), dag.source("low"), dag.source("close")
         )
-        return result
+        node = dag.rma(dag.presma(true_range, self.period), self.period)
+        return dag.IndicatorGraph({f"atr_{self.period}": node}, self.min_length())
+
+    def min_length(self) -> int:
+        return self.period + 1
+
+    def to_streaming(self) -> StreamingATR:
+        return StreamingATR(period=self.period)
 
     def get_plot_config(self) -> Dict[str, Any]:
         config = super().get_plot_config()
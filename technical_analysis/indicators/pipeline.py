@@ -0,0 +1,162 @@
+"""
+Single-pass indicator pipeline over a shared input
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+import pandas as pd
+
+from technical_analysis.indicators.backend import get_backend
+from technical_analysis.indicators.base import Indicator
+from technical_analysis.indicators.dag import IndicatorPlan
+
+if TYPE_CHECKING:
+    from technical_analysis.cache import IndicatorCache
+
+# Project OHLCV schema -> canonical indicator input names
+OHLCV_COLUMN_MAP: Dict[str, str] = {
+    "openPrice": "open",
+    "highPrice": "high",
+    "lowPrice": "low",
+    "closePrice": "close",
+    "lastTradedVolume": "volume",
+}
+
+
+class IndicatorPipeline:
+    """
+    Compute several indicators against one shared input
+
+    The input frame is never copied: indicators read Series views of its
+    columns (optionally exposed under canonical names via column_map) and
+    their outputs are written once into a single frame holding only the
+    new columns. Intermediate series common to several indicators (see
+    IndicatorPlan) are computed once per call.
+    """
+
+    def __init__(
+        self,
+        indicators: Optional[Sequence[Indicator]] = None,
+        column_map: Optional[Dict[str, str]] = None,
+        cache: Optional["IndicatorCache"] = None,
+    ):
+        """
+        Initialize pipeline
+
+        Args:
+            indicators: Indicators to compute, in order (later outputs win on
+                name clashes)
+            column_map: Optional mapping of source column -> canonical input
+                name (e.g. OHLCV_COLUMN_MAP for the project schema)
+            cache: Optional IndicatorCache to memoize indicator results
+        """
+        self.column_map = column_map or {}
+        self.cache = cache
+        self._steps: List[Tuple[Indicator, Dict[str, str]]] = []
+        self._plan: Optional[IndicatorPlan] = None
+        self._plan_backend: Optional[str] = None
+        for indicator in indicators or []:
+            self.add(indicator)
+
+    @property
+    def indicators(self) -> List[Indicator]:
+        """Indicators in computation order"""
+        return [indicator for indicator, _ in self._steps]
+
+    def add(
+        self, indicator: Indicator, rename: Optional[Dict[str, str]] = None
+    ) -> "IndicatorPipeline":
+        """
+        Add an indicator to the pipeline
+
+        Args:
+            indicator: Indicator instance
+            rename: Optional mapping to rename this indicator's output columns
+
+        Returns:
+            Self for method chaining
+        """
+        self._steps.append((indicator, rename or {}))
+        self._plan = None
+        return self
+
+    @property
+    def plan(self) -> IndicatorPlan:
+        """Shared-intermediate evaluation plan for the current indicators"""
+        # Indicators on the numpy backend are planned as direct computations,
+        # so a change of the global backend invalidates the plan
+        backend = get_backend()
+        if self._plan is None or self._plan_backend != backend:
+            self._plan = IndicatorPlan(self.indicators)
+            self._plan_backend = backend
+        return self._plan
+
+    def explain(self) -> str:
+        """Describe which intermediate series are shared between indicators"""
+        return self.plan.explain()
+
+    def prepare_inputs(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        Build the shared indicator inputs without copying data
+
+        Args:
+            df: Source DataFrame
+
+        Returns:
+            Mapping of column name to Series view
+        """
+        inputs = {column: df[column] for column in df.columns}
+        for source, target in self.column_map.items():
+            if source in df.columns:
+                inputs[target] = df[source]
+        return inputs
+
+    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute all indicators
+
+        Args:
+            df: DataFrame with OHLCV data
+
+        Returns:
+            DataFrame with only the indicator columns, aligned to df.index
+        """
+        inputs = self.prepare_inputs(df)
+        plan = self.plan
+        # Intermediate series shared between indicators, computed on demand
+        memo: Dict = {}
+        columns: Dict[str, pd.Series] = {}
+        for i, (indicator, rename) in enumerate(self._steps):
+
+            def compute_step(i: int = i) -> Dict[str, pd.Series]:
+                return plan.compute_step(i, inputs, memo)
+
+            if self.cache is not None:
+                values_by_column = self.cache.compute(
+                    indicator, inputs, compute=compute_step
+                )
+            else:
+                values_by_column = compute_step()
+            for column, values in values_by_column.items():
+                columns[rename.get(column, column)] = values
+        return pd.DataFrame(columns, index=df.index)
+
+    def apply(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Compute all indicators and attach them to df
+
+        Args:
+            df: DataFrame with OHLCV data
+            inplace: Write the columns into df itself (for callers that own
+                the frame) instead of returning a new frame
+
+        Returns:
+            DataFrame with indicator columns added
+        """
+        new_columns = self.compute(df)
+        result = df if inplace else df.copy()
+        for column in new_columns.columns:
+            result[column] = new_columns[column]
+        return result
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.indicators})"
@@ -0,0 +1,573 @@
+"""
+Incremental (streaming) indicators
+
+Each streaming indicator keeps the state required to produce the next value
+from one new bar in O(1): rolling sums for moving averages and deviations,
+exponential/Wilder smoothing state for EMA, RSI and ATR, and monotonic deques
+for rolling highs and lows. Values follow the batch pandas-ta conventions
+(same seeding, missing-value handling and output column names as the batch
+indicators' compute()), and the state is JSON-serializable so a live process
+can resume after a restart without replaying history.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Dict, List, Mapping, Optional, Type, Union
+
+NAN = float("nan")
+
+# A bar is a mapping of column -> value or, for single-input indicators, the
+# bare value itself
+Bar = Union[Mapping[str, Any], float]
+
+# Canonical input name -> project OHLCV schema name
+_SCHEMA_ALIASES: Dict[str, str] = {
+    "open": "openPrice",
+    "high": "highPrice",
+    "low": "lowPrice",
+    "close": "closePrice",
+    "volume": "lastTradedVolume",
+}
+
+# Rolling sums are recomputed from the window after this many windows to
+# bound floating point drift (amortized O(1))
+_RESYNC_WINDOWS = 64
+
+_REGISTRY: Dict[str, Type["StreamingIndicator"]] = {}
+
+
+def _bar_value(bar: Bar, column: str) -> float:
+    """Read one input value from a bar (canonical or project schema names)"""
+    if not isinstance(bar, Mapping):
+        return float(bar)
+    if column in bar:
+        value = bar[column]
+    else:
+        value = bar[_SCHEMA_ALIASES.get(column, column)]
+    return NAN if value is None else float(value)
+
+
+def _dump(value: float) -> Optional[float]:
+    """NaN is not valid JSON"""
+    return None if value is None or math.isnan(value) else value
+
+
+def _load(value: Optional[float]) -> float:
+    return NAN if value is None else float(value)
+
+
+class _RollingWindow:
+    """
+    Fixed-size window with running sum and sum of squares
+
+    Missing values are counted rather than summed, so a NaN only affects
+    the windows that contain it (as with the batch rolling functions).
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.values: deque = deque(maxlen=length)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.missing = 0
+        self._pushes = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.length
+
+    @property
+    def ready(self) -> bool:
+        return self.full and not self.missing
+
+    def push(self, value: float) -> None:
+        if self.full:
+            self._remove(self.values[0])
+        self.values.append(value)
+        if math.isnan(value):
+            self.missing += 1
+        else:
+            self.total += value
+            self.total_sq += value * value
+        self._pushes += 1
+        if self._pushes >= self.length * _RESYNC_WINDOWS:
+            self._resync()
+
+    def _remove(self, value: float) -> None:
+        if math.isnan(value):
+            self.missing -= 1
+        else:
+            self.total -= value
+            self.total_sq -= value * value
+
+    def _resync(self) -> None:
+        finite = [v for v in self.values if not math.isnan(v)]
+        self.total = math.fsum(finite)
+        self.total_sq = math.fsum(v * v for v in finite)
+        self.missing = len(self.values) - len(finite)
+        self._pushes = 0
+
+    def mean(self) -> float:
+        return self.total / self.length if self.ready else NAN
+
+    def variance(self, ddof: int = 1) -> float:
+        if not self.ready or self.length <= ddof:
+            return NAN
+        mean = self.total / self.length
+        variance = (self.total_sq - self.length * mean * mean) / (self.length - ddof)
+        return max(variance, 0.0)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"values": [_dump(v) for v in self.values]}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.values = deque((_load(v) for v in state["values"]), maxlen=self.length)
+        self._resync()
+
+
+class _SeededEwm:
+    """
+    Recursive exponential smoothing (pandas ewm adjust=False)
+
+    With seed_length > 1 the output at the seed_length-th input is the mean
+    of the finite seed inputs (pandas-ta "presma"); with seed_length == 1
+    the first finite input is the seed. Missing inputs follow pandas
+    (ignore_na=False): the previous value is carried, and the next finite
+    input is weighted as if the missing bars had decayed the average.
+    """
+
+    def __init__(self, alpha: float, seed_length: int = 1):
+        self.alpha = alpha
+        self.seed_length = seed_length
+        self.value = NAN
+        # Weight of the current value relative to the next input's alpha
+        self._weight = 1.0
+        self._seed_sum = 0.0
+        self._seed_count = 0
+        self._seed_pushes = 0
+
+    @property
+    def started(self) -> bool:
+        """Whether any input was pushed"""
+        return self._seed_pushes > 0
+
+    def push(self, x: float) -> float:
+        if self._seed_pushes < self.seed_length:
+            self._seed_pushes += 1
+            if not math.isnan(x):
+                self._seed_sum += x
+                self._seed_count += 1
+            if self._seed_pushes == self.seed_length and self._seed_count:
+                self.value = self._seed_sum / self._seed_count
+            return self.value
+
+        if math.isnan(self.value):
+            self.value = x
+        else:
+            self._weight *= 1.0 - self.alpha
+            if not math.isnan(x):
+                self.value = (self._weight * self.value + self.alpha * x) / (
+                    self._weight + self.alpha
+                )
+                self._weight = 1.0
+        return self.value
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "value": _dump(self.value),
+            "weight": self._weight,
+            "seed_sum": self._seed_sum,
+            "seed_count": self._seed_count,
+            "seed_pushes": self._seed_pushes,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.value = _load(state["value"])
+        self._weight = state.get("weight", 1.0)
+        self._seed_sum = state["seed_sum"]
+        self._seed_count = state["seed_count"]
+        self._seed_pushes = state.get("seed_pushes", state["seed_count"])
+
+
+class _MonotonicWindow:
+    """
+    Rolling max (or min) over the last length values via a monotonic deque
+
+    Like pandas rolling(length).max(), windows containing a NaN are NaN.
+    """
+
+    def __init__(self, length: int, maximum: bool = True):
+        self.length = length
+        self.maximum = maximum
+        self.items: deque = deque()
+        self.count = 0
+        self.last_missing = -1
+
+    def push(self, value: float) -> float:
+        if math.isnan(value):
+            self.last_missing = self.count
+        elif self.maximum:
+            while self.items and self.items[-1][1] <= value:
+                self.items.pop()
+        else:
+            while self.items and self.items[-1][1] >= value:
+                self.items.pop()
+        if not math.isnan(value):
+            self.items.append((self.count, value))
+        self.count += 1
+        while self.items and self.items[0][0] <= self.count - 1 - self.length:
+            self.items.popleft()
+        if self.count < self.length or self.last_missing > self.count - 1 - self.length:
+            return NAN
+        return self.items[0][1]
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "items": [list(item) for item in self.items],
+            "count": self.count,
+            "last_missing": self.last_missing,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.items = deque((int(i), float(v)) for i, v in state["items"])
+        self.count = state["count"]
+        self.last_missing = state.get("last_missing", -1)
+
+
+class StreamingIndicator(ABC):
+    """Base class for incremental indicators with O(1) updates"""
+
+    def __init__(self, name: str, **params: Any):
+        """
+        Initialize streaming indicator
+
+        Args:
+            name: Indicator name
+            **params: Indicator-specific parameters (must be JSON-serializable)
+        """
+        self.name = name
+        self.params = params
+        self.bars = 0
+        self.latest: Dict[str, float] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        _REGISTRY[cls.__name__] = cls
+
+    def update(self, bar: Bar) -> Dict[str, float]:
+        """
+        Consume one bar and return the newest indicator values
+
+        Args:
+            bar: Mapping with the indicator inputs (open, high, low, close,
+                volume or their project schema names) or a bare value for
+                single-input indicators
+
+        Returns:
+            Dictionary mapping output column names to values (NaN during
+            warmup), using the batch indicator column names
+        """
+        self.latest = self._update(bar)
+        self.bars += 1
+        return self.latest
+
+    @abstractmethod
+    def _update(self, bar: Bar) -> Dict[str, float]:
+        """Update internal state with one bar and return the new values"""
+        pass
+
+    @abstractmethod
+    def _get_state(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        pass
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable snapshot of the indicator
+
+        Returns:
+            Dictionary with indicator type, parameters and internal state
+        """
+        return {
+            "indicator": self.__class__.__name__,
+            "params": dict(self.params),
+            "bars": self.bars,
+            "latest": {key: _dump(value) for key, value in self.latest.items()},
+            "state": self._get_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingIndicator":
+        """
+        Rebuild an indicator from a get_state() snapshot
+
+        Args:
+            state: Snapshot previously returned by get_state()
+
+        Returns:
+            Streaming indicator resuming from the snapshot
+
+        Raises:
+            ValueError: If the snapshot refers to an unknown indicator
+        """
+        indicator_cls = _REGISTRY.get(state.get("indicator", ""))
+        if indicator_cls is None or not issubclass(indicator_cls, cls):
+            raise ValueError(f"Unknown streaming indicator: {state.get('indicator')}")
+        indicator = indicator_cls(**state["params"])
+        indicator.bars = state["bars"]
+        indicator.latest = {key: _load(v) for key, v in state["latest"].items()}
+        indicator._set_state(state["state"])
+        return indicator
+
+    def __repr__(self) -> str:
+        params_str = ", ".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.__class__.__name__}({params_str})"
+
+
+class StreamingSMA(StreamingIndicator):
+    """Streaming Simple Moving Average"""
+
+    def __init__(self, period: int = 20, column: str = "close"):
+        super().__init__(name="SMA", period=period, column=column)
+        self.period = period
+        self.column = column
+        self._window = _RollingWindow(period)
+
+    def _update(self, bar: Bar) -> Dict[str, float]:
+        self._window.push(_bar_value(bar, self.column))
+        return {f"sma_{self.period}": self._window.mean()}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"window": self._window.get_state()}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._window.set_state(state["window"])
+
+
+class StreamingEMA(StreamingIndicator):
+    """Streaming Exponential Moving Average (SMA-seeded)"""
+
+    def __init__(self, period: int = 20, column: str = "close"):
+        super().__init__(name="EMA", period=period, column=column)
+        self.period = period
+        self.column = column
+        self._ema = _SeededEwm(2.0 / (period + 1), seed_length=period)
+
+    def _update(self, bar: Bar) -> Dict[str, float]:
+        return {f"ema_{self.period}": self._ema.push(_bar_value(bar, self.column))}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"ema": self._ema.get_state()}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._ema.set_state(state["ema"])
+
+
+class StreamingRSI(StreamingIndicator):
+    """Streaming Relative Strength Index (Wilder smoothing)"""
+
+    def __init__(self, period: int = 14):
+        super().__init__(name="RSI", period=period)
+        self.period = period
+        self._prev_close = NAN
+        self._gain = _SeededEwm(1.0 / period)
+        self._loss = _SeededEwm(1.0 / period)
+
+    def _update(self, bar: Bar) -> Dict[str, float]:
+        close = _bar_value(bar, "close")
+        change = close - self._prev_close
+        self._prev_close = close
+        # A missing change carries both averages, as in the batch ewm
+        gain = self._gain.push(NAN if math.isnan(change) else max(change, 0.0))
+        loss = self._loss.push(NAN if math.isnan(change) else max(-change, 0.0))
+        total = gain + loss
+        rsi = 100.0 * gain / total if total else NAN
+        return {f"rsi_{self.period}": rsi}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            "prev_close": _dump(self._prev_close),
+            "gain": self._gain.get_state(),
+            "loss": self._loss.get_state(),
+        }
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._prev_close = _load(state["prev_close"])
+        self._gain.set_state(state["gain"])
+        self._loss.set_state(state["loss"])
+
+
+class StreamingATR(StreamingIndicator):
+    """Streaming Average True Range (SMA-seeded Wilder smoothing)"""
+
+    def __init__(self, period: int = 14):
+        super().__init__(name="ATR", period=period)
+        self.period = period
+        self._prev_close = NAN
+        self._atr = _SeededEwm(1.0 / period, seed_length=period)
+
+    def _update(self, bar: Bar) -> Dict[str, float]:
+        high = _bar_value(bar, "high")
+        low = _bar_value(bar, "low")
+        # Largest of the finite ranges (pandas max skips NaN)
+        ranges = [
+            abs(value)
+            for value in (high - low, high - self._prev_close, self._prev_close - low)
+            if not math.isnan(value)
+        ]
+        true_range = max(ranges) if ranges else NAN
+        self._prev_close = _bar_value(bar, "close")
+        return {f"atr_{self.period}": self._atr.push(true_range)}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"prev_close": _dump(self._prev_close), "atr": self._atr.get_state()}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._prev_close = _load(state["prev_close"])
+        self._atr.set_state(state["atr"])
+
+
+class StreamingMACD(StreamingIndicator):
+    """Streaming Moving Average Convergence Divergence"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        super().__init__(name="MACD", fast=fast, slow=slow, signal=signal)
+        if slow < fast:
+            fast, slow = slow, fast
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._fast_ema = _SeededEwm(2.0 / (fast + 1), seed_length=fast)
+        self._slow_ema = _SeededEwm(2.0 / (slow + 1), seed_length=slow)
+        self._signal_ema = _SeededEwm(2.0 / (signal + 1), seed_length=signal)
+        suffix = f"_{fast}_{slow}_{signal}"
+        self._names = (f"MACD{suffix}", f"MACDh{suffix}", f"MACDs{suffix}")
+
+    def _update(self, bar: Bar) -> Dict[str, float]:
+        close = _bar_value(bar, "close")
+        macd = self._fast_ema.push(close) - self._slow_ema.push(close)
+        # The batch signal EMA starts at the first MACD value
+        signal = NAN
+        if self._signal_ema.started or not math.isnan(macd):
+            signal = self._signal_ema.push(macd)
+        macd_name, hist_name, signal_name = self._names
+        return {macd_name: macd, hist_name: macd - signal, signal_name: signal}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            "fast_ema": self._fast_ema.get_state(),
+            "slow_ema": self._slow_ema.get_state(),
+            "signal_ema": self._signal_ema.get_state(),
+        }
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._fast_ema.set_state(state["fast_ema"])
+        self._slow_ema.set_state(state["slow_ema"])
+        self._signal_ema.set_state(state["signal_ema"])
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Streaming Bollinger Bands (sample standard deviation)"""
+
+    def __init__(self, period: int = 20, std: float = 2.0):
+        super().__init__(name="BB", period=period, std=std)
+        self.period = period
+        self.std = std
+        self._window = _RollingWindow(period)
+        suffix = f"_{period}_{std}_{std}"
+        self._names = tuple(
+            f"{prefix}{suffix}" for prefix in ("BBL", "BBM", "BBU", "BBB", "BBP")
+        )
+
+    def _update(self, bar: Bar) -> Dict[str, float]:
+        close = _bar_value(bar, "close")
+        self._window.push(close)
+        mid = self._window.mean()
+        deviation = self.std * math.sqrt(self._window.variance(ddof=1))
+        lower = mid - deviation
+        upper = mid + deviation
+        width = upper - lower
+        bandwidth = 100.0 * width / mid if mid else NAN
+        percent = (close - lower) / width if width else NAN
+        return dict(zip(self._names, (lower, mid, upper, bandwidth, percent)))
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {"window": self._window.get_state()}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._window.set_state(state["window"])
+
+
+class StreamingStochastic(StreamingIndicator):
+    """Streaming Stochastic Oscillator"""
+
+    def __init__(self, k_period: int = 14, d_period: int = 3, smooth_k: int = 3):
+        super().__init__(
+            name="Stochastic", k_period=k_period, d_period=d_period, smooth_k=smooth_k
+        )
+        self.k_period = k_period
+        self.d_period = d_period
+        self.smooth_k = smooth_k
+        self._highest = _MonotonicWindow(k_period, maximum=True)
+        self._lowest = _MonotonicWindow(k_period, maximum=False)
+        self._k = _RollingWindow(smooth_k)
+        self._d = _RollingWindow(d_period)
+        suffix = f"_{k_period}_{d_period}_{smooth_k}"
+        self._names = (f"STOCHk{suffix}", f"STOCHd{suffix}", f"STOCHh{suffix}")
+
+    def _update(self, bar: Bar) -> Dict[str, float]:
+        highest = self._highest.push(_bar_value(bar, "high"))
+        lowest = self._lowest.push(_bar_value(bar, "low"))
+        value_range = highest - lowest
+        raw = (
+            100.0 * (_bar_value(bar, "close") - lowest) / value_range
+            if value_range
+            else NAN
+        )
+        # The batch smoothings start at their input's first value and
+        # include later missing values
+        stoch_k = stoch_d = NAN
+        if self._k.values or not math.isnan(raw):
+            self._k.push(raw)
+            stoch_k = self._k.mean()
+            if self._d.values or not math.isnan(stoch_k):
+                self._d.push(stoch_k)
+                stoch_d = self._d.mean()
+        k_name, d_name, hist_name = self._names
+        return {k_name: stoch_k, d_name: stoch_d, hist_name: stoch_k - stoch_d}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            "highest": self._highest.get_state(),
+            "lowest": self._lowest.get_state(),
+            "k": self._k.get_state(),
+            "d": self._d.get_state(),
+        }
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self._highest.set_state(state["highest"])
+        self._lowest.set_state(state["lowest"])
+        self._k.set_state(state["k"])
+        self._d.set_state(state["d"])
+
+
+def update_all(indicators: List[StreamingIndicator], bar: Bar) -> Dict[str, float]:
+    """
+    Feed one bar to several streaming indicators
+
+    Args:
+        indicators: Streaming indicators to update
+        bar: Newest bar
+
+    Returns:
+        Merged dictionary of the newest values (later indicators win on
+        name clashes)
+    """
+    values: Dict[str, float] = {}
+    for indicator in indicators:
+        values.update(indicator.update(bar))
+    return values
@@ -0,0 +1,179 @@
+"""
+Multi-instrument (panel) indicator computation
+
+A PricePanel holds aligned time x symbol arrays for the OHLCV inputs of a
+whole universe, so each indicator is computed once column-wise across all
+symbols instead of once per symbol frame.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis.indicators.base import Indicator
+from technical_analysis.indicators.pipeline import OHLCV_COLUMN_MAP
+
+if TYPE_CHECKING:
+    from data_collection.interfaces.storage import StorageInterface
+
+# Inputs that are carried forward over missing bars (volume is zero-filled)
+_PRICE_FIELDS = {"open", "high", "low", "close"}
+
+
+class PricePanel:
+    """Aligned time x symbol OHLCV arrays"""
+
+    def __init__(self, fields: Dict[str, pd.DataFrame]):
+        """
+        Initialize panel
+
+        Args:
+            fields: Mapping of canonical input name (open, high, low, close,
+                volume) to time x symbol DataFrames sharing index and columns
+        """
+        if not fields:
+            raise ValueError("Panel requires at least one field")
+        self.fields = fields
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Mapping[str, pd.DataFrame],
+        column_map: Optional[Dict[str, str]] = None,
+        dtype: Any = np.float64,
+    ) -> "PricePanel":
+        """
+        Build a panel from per-symbol OHLCV frames
+
+        Timestamps are aligned on their union. Within each symbol's active
+        range (first to last bar) missing prices are forward-filled and
+        missing volume is zero; outside it values are NaN.
+
+        Args:
+            frames: Mapping of symbol to DataFrame with a timestamp column
+            column_map: Source column -> canonical input name (defaults to
+                the project OHLCV schema)
+            dtype: Storage dtype (np.float32 halves memory)
+
+        Returns:
+            PricePanel instance
+        """
+        column_map = column_map or OHLCV_COLUMN_MAP
+        indexed = {
+            symbol: df.drop_duplicates(subset=["timestamp"], keep="last").set_index(
+                "timestamp"
+            )
+            for symbol, df in frames.items()
+            if not df.empty
+        }
+        if not indexed:
+            raise ValueError("No data to build a panel from")
+
+        fields = {}
+        for source, name in column_map.items():
+            columns = {
+                symbol: df[source] for symbol, df in indexed.items() if source in df
+            }
+            if not columns:
+                continue
+            wide = pd.concat(columns, axis=1).sort_index()
+            fields[name] = wide
+        if not fields:
+            raise ValueError("Frames contain none of the mapped input columns")
+
+        like = next(iter(fields.values()))
+        symbols = list(indexed)
+        # Rows outside each symbol's own range, by position in the sorted
+        # union index (works for tz-aware timestamps too)
+        first = like.index.searchsorted(
+            pd.Index([indexed[s].index.min() for s in symbols])
+        )
+        stop = like.index.searchsorted(
+            pd.Index([indexed[s].index.max() for s in symbols]), side="right"
+        )
+        rows = np.arange(len(like.index))[:, None]
+        inactive = (rows < first[None, :]) | (rows >= stop[None, :])
+
+        for name, wide in fields.items():
+            wide = wide.reindex(index=like.index, columns=symbols)
+            wide = wide.ffill() if name in _PRICE_FIELDS else wide.fillna(0.0)
+            fields[name] = wide.mask(inactive).astype(dtype)
+        return cls(fields)
+
+    @classmethod
+    def from_storage(
+        cls,
+        storage: "StorageInterface",
+        symbols: List[str],
+        timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        source: Optional[str] = None,
+        dtype: Any = np.float64,
+    ) -> "PricePanel":
+        """
+        Build a panel from a storage backend's multi-symbol load
+
+        Args:
+            storage: Storage backend
+            symbols: Symbol identifiers
+            timeframe: Timeframe
+            start_date: Start date filter
+            end_date: End date filter
+            source: Optional source filter
+            dtype: Storage dtype (np.float32 halves memory)
+
+        Returns:
+            PricePanel instance
+        """
+        frames = storage.load_multiple_historical_data(
+            symbols, timeframe, start_date, end_date, source
+        )
+        return cls.from_frames(frames, dtype=dtype)
+
+    @property
+    def index(self) -> pd.Index:
+        """Aligned timestamps"""
+        return next(iter(self.fields.values())).index
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols (panel columns)"""
+        return list(next(iter(self.fields.values())).columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the panel arrays"""
+        return sum(frame.to_numpy().nbytes for frame in self.fields.values())
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        return self.fields[name]
+
+    def compute(
+        self, indicators: Sequence[Indicator], dtype: Any = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Compute indicators column-wise across all symbols
+
+        Args:
+            indicators: Indicators to compute (later outputs win on name
+                clashes)
+            dtype: Optional output dtype (e.g. np.float32)
+
+        Returns:
+            Dictionary mapping indicator column names to time x symbol
+            DataFrames
+        """
+        results: Dict[str, pd.DataFrame] = {}
+        for indicator in indicators:
+            for column, values in indicator.compute_panel(self.fields).items():
+                results[column] = values if dtype is None else values.astype(dtype)
+        return results
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(bars={len(self.index)}, "
+            f"symbols={len(self.symbols)}, fields={list(self.fields)})"
+        )
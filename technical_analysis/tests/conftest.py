@@ -0,0 +1,29 @@
+"""
+Pytest configuration and shared fixtures for technical analysis tests.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def ohlcv_df():
+    """Synthetic random-walk OHLCV data with canonical column names."""
+    rng = np.random.default_rng(42)
+    n = 500
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    open_ = close + rng.normal(0, 0.5, n)
+    high = np.maximum(open_, close) + rng.uniform(0.1, 1.0, n)
+    low = np.minimum(open_, close) - rng.uniform(0.1, 1.0, n)
+    volume = rng.integers(1_000, 10_000, n).astype(float)
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+        },
+        index=pd.date_range("2020-01-01", periods=n, freq="D"),
+    )
@@ -0,0 +1,160 @@
+"""
+Parity tests for the numpy indicator backend against pandas-ta.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from technical_analysis.indicators import (
+    ATR,
+    EMA,
+    RSI,
+    SMA,
+    IndicatorPipeline,
+    MACD,
+    get_backend,
+    set_backend,
+)
+
+BACKEND_INDICATORS = [
+    (SMA, {"period": 20}),
+    (SMA, {"period": 200}),
+    (EMA, {"period": 12}),
+    (EMA, {"period": 50}),
+    (RSI, {"period": 14}),
+    (RSI, {"period": 2}),
+    (ATR, {"period": 14}),
+]
+
+
+@pytest.fixture
+def restore_backend():
+    """Reset the global backend after a test changes it."""
+    previous = get_backend()
+    yield
+    set_backend(previous)
+
+
+def _assert_parity(result, expected):
+    assert list(result) == list(expected)
+    for column, values in expected.items():
+        assert result[column].index.equals(values.index)
+        np.testing.assert_array_equal(result[column].isna(), values.isna())
+        np.testing.assert_allclose(
+            result[column].to_numpy(dtype=float),
+            values.to_numpy(dtype=float),
+            rtol=1e-10,
+            atol=1e-10,
+        )
+
+
+class TestNumpyBackend:
+    """numpy-backend outputs must match pandas-ta."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("indicator_cls,params", BACKEND_INDICATORS)
+    @pytest.mark.parametrize("length", [500, 201, 15, 3])
+    def test_matches_pandas_ta(self, ohlcv_df, indicator_cls, params, length):
+        """Values and NaN positions agree for long and too-short inputs."""
+        inputs = ohlcv_df.iloc[:length]
+        expected = indicator_cls(**params, backend="pandas_ta").compute(inputs)
+        result = indicator_cls(**params, backend="numpy").compute(inputs)
+
+        _assert_parity(result, expected)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("indicator_cls,params", BACKEND_INDICATORS)
+    @pytest.mark.parametrize(
+        "missing",
+        [
+            {"close": [150]},
+            {"high": [200], "low": [300]},
+            {
+                "open": [150, 151],
+                "high": [150, 151],
+                "low": [150, 151],
+                "close": [150, 151],
+            },
+            {"close": [0, 5]},
+            {"close": [499]},
+        ],
+        ids=["close", "high-low", "rows", "leading", "last"],
+    )
+    def test_matches_pandas_ta_with_missing_values(
+        self, ohlcv_df, indicator_cls, params, missing
+    ):
+        """Inputs with missing values give the pandas-ta results too."""
+        inputs = ohlcv_df.copy()
+        for column, rows in missing.items():
+            inputs.loc[inputs.index[rows], column] = np.nan
+        expected = indicator_cls(**params, backend="pandas_ta").compute(inputs)
+        result = indicator_cls(**params, backend="numpy").compute(inputs)
+
+        _assert_parity(result, expected)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("indicator_cls", [SMA, EMA, RSI])
+    def test_calculate_many_with_missing_values(self, ohlcv_df, indicator_cls):
+        """calculate_many matches the per-period indicators across a gap."""
+        inputs = ohlcv_df.copy()
+        inputs.loc[inputs.index[150], "close"] = np.nan
+        result = indicator_cls.calculate_many(inputs["close"], [5, 14])
+        for i, period in enumerate([5, 14]):
+            expected = indicator_cls(period=period, backend="pandas_ta").compute(inputs)
+            np.testing.assert_allclose(
+                result[:, i],
+                next(iter(expected.values())).to_numpy(dtype=float),
+                rtol=1e-10,
+                atol=1e-10,
+            )
+
+    @pytest.mark.unit
+    def test_series_names_match(self, ohlcv_df):
+        """Returned Series carry the pandas-ta names."""
+        for indicator_cls, params in BACKEND_INDICATORS:
+            expected = indicator_cls(**params, backend="pandas_ta").compute(ohlcv_df)
+            result = indicator_cls(**params, backend="numpy").compute(ohlcv_df)
+            for column, values in expected.items():
+                assert result[column].name == values.name
+
+    @pytest.mark.unit
+    def test_unknown_backend_rejected(self):
+        """Unknown backend names raise ValueError."""
+        with pytest.raises(ValueError):
+            SMA(period=20, backend="talib")
+        with pytest.raises(ValueError):
+            set_backend("talib")
+
+
+class TestGlobalBackend:
+    """The global backend applies to indicators without an explicit choice."""
+
+    @pytest.mark.unit
+    def test_set_backend(self, ohlcv_df, restore_backend):
+        """Switching globally changes the implementation, not the values."""
+        indicator = RSI(period=14)
+        expected = indicator.compute(ohlcv_df)
+        assert indicator.plan() is not None
+
+        set_backend("numpy")
+        assert get_backend() == "numpy"
+        assert indicator.plan() is None
+        _assert_parity(indicator.compute(ohlcv_df), expected)
+
+    @pytest.mark.unit
+    def test_explicit_backend_wins(self, ohlcv_df, restore_backend):
+        """A per-indicator backend overrides the global one."""
+        set_backend("numpy")
+        assert SMA(period=20, backend="pandas_ta").plan() is not None
+
+    @pytest.mark.unit
+    def test_pipeline_follows_backend(self, ohlcv_df, restore_backend):
+        """A pipeline re-plans when the global backend changes."""
+        pipeline = IndicatorPipeline([EMA(period=12), MACD(12, 26, 9)])
+        expected = pipeline.compute(ohlcv_df)
+        assert "1 evaluations saved" in pipeline.explain()
+
+        set_backend("numpy")
+        assert "EMA(period=12, column=close): computed directly" in (pipeline.explain())
+        pd.testing.assert_frame_equal(pipeline.compute(ohlcv_df), expected)
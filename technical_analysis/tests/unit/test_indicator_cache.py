@@ -0,0 +1,163 @@
+"""
+Unit tests for the indicator result cache.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from technical_analysis.cache import IndicatorCache
+from technical_analysis.indicators import (
+    ATR,
+    EMA,
+    MACD,
+    RSI,
+    SMA,
+    BollingerBands,
+    IndicatorPipeline,
+)
+
+
+def _assert_same(actual, expected):
+    assert set(actual) == set(expected)
+    for column in expected:
+        np.testing.assert_allclose(
+            actual[column].to_numpy(),
+            expected[column].to_numpy(dtype=float),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+
+class TestIndicatorCache:
+    """Test cases for IndicatorCache."""
+
+    @pytest.mark.unit
+    def test_hit_on_same_data_and_params(self, ohlcv_df):
+        """Equal inputs and parameters are served from memory."""
+        cache = IndicatorCache()
+        first = cache.compute(SMA(period=20), ohlcv_df)
+        second = cache.compute(SMA(period=20, color="red"), ohlcv_df.copy())
+
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+        _assert_same(second, first)
+
+    @pytest.mark.unit
+    def test_params_and_data_are_part_of_key(self, ohlcv_df):
+        """Different parameters or values are computed separately."""
+        cache = IndicatorCache()
+        cache.compute(SMA(period=20), ohlcv_df)
+        cache.compute(SMA(period=50), ohlcv_df)
+        changed = ohlcv_df.assign(close=ohlcv_df["close"] + 1.0)
+        cache.compute(SMA(period=20), changed)
+
+        assert cache.stats.misses == 3
+        assert cache.stats.hits == 0
+
+    @pytest.mark.unit
+    def test_unused_columns_do_not_invalidate(self, ohlcv_df):
+        """Only the indicator's own input columns are fingerprinted."""
+        cache = IndicatorCache()
+        cache.compute(RSI(period=14), ohlcv_df)
+        cache.compute(RSI(period=14), ohlcv_df.assign(volume=0.0))
+
+        assert cache.stats.hits == 1
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("indicator", [SMA(period=20), RSI(14), ATR(14)])
+    def test_prefix_extension(self, indicator, ohlcv_df):
+        """A grown series extends the cached prefix instead of recomputing."""
+        cache = IndicatorCache()
+        cache.compute(indicator, ohlcv_df.iloc[:400])
+        cache.compute(indicator, ohlcv_df.iloc[:450])
+        extended = cache.compute(indicator, ohlcv_df)
+
+        assert cache.stats.misses == 1
+        assert cache.stats.extensions == 2
+        _assert_same(extended, indicator.compute(ohlcv_df))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "indicator", [MACD(), BollingerBands(period=20), RSI(14), SMA(period=20)]
+    )
+    def test_short_then_long(self, indicator, ohlcv_df, tmp_path):
+        """Results shorter than the warmup are not cached or extended."""
+        cache = IndicatorCache(disk_dir=tmp_path)
+        cache.compute(indicator, ohlcv_df.iloc[: indicator.min_length() - 1])
+        assert len(cache) == 0
+        assert list(tmp_path.iterdir()) == []
+
+        longer = ohlcv_df.iloc[: indicator.min_length() + 50]
+        result = cache.compute(indicator, longer)
+        assert cache.stats.extensions == 0
+        _assert_same(result, indicator.compute(longer))
+
+        grown = ohlcv_df.iloc[: len(longer) + 10]
+        extended = cache.compute(indicator, grown)
+        assert cache.stats.extensions == 1
+        _assert_same(extended, indicator.compute(grown))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "indicator",
+        [EMA(period=20), EMA(period=20, backend="numpy"), MACD(), RSI(14), ATR(14)],
+    )
+    def test_interior_nan_is_recomputed(self, indicator, ohlcv_df):
+        """A grown series with a missing input matches the batch result."""
+        df = ohlcv_df.iloc[:250].copy()
+        df.loc[df.index[150], "close"] = np.nan
+        cache = IndicatorCache()
+        cache.compute(indicator, df.iloc[:100])
+        result = cache.compute(indicator, df)
+
+        assert cache.stats.extensions == 0
+        _assert_same(result, indicator.compute(df))
+
+    @pytest.mark.unit
+    def test_memory_tier_is_bounded(self, ohlcv_df):
+        """Least recently used entries are evicted."""
+        cache = IndicatorCache(max_entries=2)
+        for period in (5, 10, 20):
+            cache.compute(SMA(period=period), ohlcv_df)
+
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    @pytest.mark.unit
+    def test_disk_tier(self, ohlcv_df, tmp_path):
+        """Results written to disk are reused by a new cache instance."""
+        IndicatorCache(disk_dir=tmp_path).compute(RSI(period=14), ohlcv_df)
+        cache = IndicatorCache(disk_dir=tmp_path)
+        result = cache.compute(RSI(period=14), ohlcv_df)
+
+        assert cache.stats.disk_hits == 1
+        assert cache.stats.misses == 0
+        _assert_same(result, RSI(period=14).compute(ohlcv_df))
+
+    @pytest.mark.unit
+    def test_disk_tier_is_bounded(self, ohlcv_df, tmp_path):
+        """Least recently used files are deleted beyond max_disk_bytes."""
+        IndicatorCache(disk_dir=tmp_path).compute(SMA(period=5), ohlcv_df)
+        size = next(tmp_path.iterdir()).stat().st_size
+
+        cache = IndicatorCache(disk_dir=tmp_path, max_disk_bytes=int(size * 2.5))
+        indicator = SMA(period=20)
+        for length in range(100, 110):
+            cache.compute(indicator, ohlcv_df.iloc[:length])
+
+        files = list(tmp_path.glob("*.npz"))
+        assert 0 < len(files) <= 2
+        assert cache.stats.disk_evictions > 0
+        assert sum(path.stat().st_size for path in files) <= size * 2.5
+
+    @pytest.mark.unit
+    def test_pipeline_uses_cache(self, ohlcv_df):
+        """IndicatorPipeline routes computations through its cache."""
+        cache = IndicatorCache()
+        pipeline = IndicatorPipeline([SMA(period=20), RSI(period=14)], cache=cache)
+        first = pipeline.compute(ohlcv_df)
+        second = pipeline.compute(ohlcv_df)
+
+        assert cache.stats.hits == 2
+        pd.testing.assert_frame_equal(first, second)
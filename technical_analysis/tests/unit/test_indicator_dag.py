@@ -0,0 +1,93 @@
+"""
+Tests for the indicator dependency graph planner.
+"""
+
+import pandas as pd
+import pytest
+
+from technical_analysis.indicators import (
+    ATR,
+    EMA,
+    MACD,
+    RSI,
+    SMA,
+    BollingerBands,
+    IndicatorPipeline,
+    IndicatorPlan,
+    Stochastic,
+)
+
+INDICATORS = [
+    SMA(period=20),
+    EMA(period=12),
+    EMA(period=26),
+    MACD(fast=12, slow=26, signal=9),
+    BollingerBands(period=20, std=2.0),
+    RSI(period=14),
+    Stochastic(k_period=14, d_period=3, smooth_k=3),
+    ATR(period=14),
+]
+
+
+class TestIndicatorPlan:
+    """Planned evaluation must match each indicator's own compute()."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("length", [500, 30, 5])
+    def test_matches_compute(self, ohlcv_df, length):
+        """Outputs equal compute() for long and too-short inputs."""
+        inputs = ohlcv_df.iloc[:length]
+        results = IndicatorPlan(INDICATORS).compute(inputs)
+
+        for indicator, result in zip(INDICATORS, results):
+            expected = indicator.compute(inputs)
+            assert list(result) == list(expected)
+            for column, values in expected.items():
+                pd.testing.assert_series_equal(
+                    result[column], values, check_names=False, check_freq=False
+                )
+
+    @pytest.mark.unit
+    def test_shares_common_nodes(self):
+        """EMAs reused by MACD and the SMA reused by BBands are planned once."""
+        plan = IndicatorPlan(INDICATORS)
+        ops = [str(node) for node in plan.nodes]
+
+        assert ops.count("ema(12)") == 1
+        assert ops.count("ema(26)") == 1
+        assert ops.count("sma(20)") == 1
+        assert ops.count("input(close)") == 1
+
+    @pytest.mark.unit
+    def test_explain_reports_sharing(self):
+        """The explanation names the indicators sharing a node."""
+        text = IndicatorPipeline([EMA(period=12), MACD(12, 26, 9)]).explain()
+
+        assert text.startswith("IndicatorPlan: 2 indicators")
+        assert "1 evaluations saved" in text
+        ema_line = next(line for line in text.splitlines() if "ema(12)" in line)
+        assert "shared by EMA" in ema_line and "MACD" in ema_line
+
+
+class TestPipelinePlan:
+    """The pipeline evaluates indicators through the shared plan."""
+
+    @pytest.mark.unit
+    def test_pipeline_matches_individual(self, ohlcv_df):
+        """Pipeline columns equal the individually computed outputs."""
+        result = IndicatorPipeline(INDICATORS).compute(ohlcv_df)
+
+        for indicator in INDICATORS:
+            for column, values in indicator.compute(ohlcv_df).items():
+                pd.testing.assert_series_equal(
+                    result[column], values, check_names=False, check_freq=False
+                )
+
+    @pytest.mark.unit
+    def test_add_invalidates_plan(self):
+        """Adding an indicator rebuilds the plan."""
+        pipeline = IndicatorPipeline([SMA(period=20)])
+        assert "1 indicators" in pipeline.explain()
+
+        pipeline.add(BollingerBands(period=20))
+        assert "2 indicators" in pipeline.explain()
@@ -0,0 +1,60 @@
+"""
+Parity tests for the vectorized multi-period indicator kernels.
+"""
+
+import numpy as np
+import pytest
+
+from technical_analysis.indicators import SMA, EMA, RSI
+from technical_analysis.indicators import kernels
+
+PERIODS = [2, 5, 14, 20, 50, 200, 600]
+
+
+class TestCalculateMany:
+    """calculate_many must match the per-period batch indicators."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("indicator_cls", [SMA, EMA, RSI])
+    def test_matches_batch(self, indicator_cls, ohlcv_df):
+        """Each column equals the single-period batch result."""
+        result = indicator_cls.calculate_many(ohlcv_df["close"], PERIODS)
+
+        assert result.shape == (len(ohlcv_df), len(PERIODS))
+        for i, period in enumerate(PERIODS):
+            (expected,) = indicator_cls(period=period).compute(ohlcv_df).values()
+            np.testing.assert_allclose(
+                result[:, i], expected.to_numpy(dtype=float), rtol=1e-9, atol=1e-9
+            )
+
+    @pytest.mark.unit
+    def test_empty_periods(self, ohlcv_df):
+        """No periods yields an empty (n, 0) array."""
+        assert SMA.calculate_many(ohlcv_df["close"], []).shape == (len(ohlcv_df), 0)
+
+
+class TestPanelKernels:
+    """2-D kernels work column-wise and skip leading NaNs."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "kernel, indicator_cls",
+        [(kernels.sma, SMA), (kernels.ema, EMA), (kernels.rsi, RSI)],
+    )
+    def test_columns_match_batch(self, kernel, indicator_cls, ohlcv_df):
+        """Late-starting columns match the batch indicator on their own data."""
+        panel = np.column_stack([ohlcv_df["close"], ohlcv_df["open"]])
+        panel[:120, 1] = np.nan
+        result = kernel(panel, 14)
+
+        for column in range(panel.shape[1]):
+            start = 0 if column == 0 else 120
+            source = ohlcv_df.iloc[start:][["close", "open"][column]]
+            (expected,) = indicator_cls(period=14).compute({"close": source}).values()
+            assert np.isnan(result[:start, column]).all()
+            np.testing.assert_allclose(
+                result[start:, column],
+                expected.to_numpy(dtype=float),
+                rtol=1e-9,
+                atol=1e-9,
+            )
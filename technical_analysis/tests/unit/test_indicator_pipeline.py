@@ -0,0 +1,133 @@
+"""
+Tests for the single-pass indicator pipeline.
+"""
+
+import pandas as pd
+import pytest
+
+from technical_analysis.indicators import (
+    ATR,
+    EMA,
+    MACD,
+    RSI,
+    SMA,
+    BollingerBands,
+    IndicatorPipeline,
+    Stochastic,
+)
+from technical_analysis.indicators.pipeline import OHLCV_COLUMN_MAP
+
+INDICATORS = [
+    SMA(period=20),
+    EMA(period=12),
+    MACD(fast=12, slow=26, signal=9),
+    BollingerBands(period=20, std=2.0),
+    RSI(period=14),
+    Stochastic(k_period=14, d_period=3, smooth_k=3),
+    ATR(period=14),
+]
+
+
+def _calculated_columns(df):
+    """Columns each indicator's calculate() adds to df, in pipeline order."""
+    expected = {}
+    for indicator in INDICATORS:
+        result = indicator.calculate(df)
+        for column in result.columns.difference(df.columns, sort=False):
+            expected[column] = result[column]
+    return expected
+
+
+def _assert_columns(frame, expected):
+    """frame holds every expected column with identical values."""
+    for column, values in expected.items():
+        pd.testing.assert_series_equal(
+            frame[column], values, check_names=False, check_freq=False
+        )
+
+
+class TestIndicatorPipeline:
+    """Pipeline outputs must match each indicator's own calculate()."""
+
+    @pytest.mark.unit
+    def test_compute_matches_calculate(self, ohlcv_df):
+        """compute() returns only the indicator columns, aligned to the input."""
+        result = IndicatorPipeline(INDICATORS).compute(ohlcv_df)
+        expected = _calculated_columns(ohlcv_df)
+
+        assert list(result.columns) == list(expected)
+        assert result.index.equals(ohlcv_df.index)
+        _assert_columns(result, expected)
+
+    @pytest.mark.unit
+    def test_apply_inplace(self, ohlcv_df):
+        """apply(inplace=True) writes the calculate() columns into the input."""
+        expected = _calculated_columns(ohlcv_df)
+        original = ohlcv_df.copy()
+
+        result = IndicatorPipeline(INDICATORS).apply(ohlcv_df, inplace=True)
+
+        assert result is ohlcv_df
+        assert list(result.columns) == list(original.columns) + list(expected)
+        pd.testing.assert_frame_equal(result[original.columns], original)
+        _assert_columns(result, expected)
+
+    @pytest.mark.unit
+    def test_apply_copy_leaves_input_untouched(self, ohlcv_df):
+        """apply() without inplace returns a new frame and keeps the input."""
+        original = ohlcv_df.copy()
+
+        result = IndicatorPipeline(INDICATORS).apply(ohlcv_df)
+
+        assert result is not ohlcv_df
+        pd.testing.assert_frame_equal(ohlcv_df, original)
+        _assert_columns(result, _calculated_columns(original))
+
+    @pytest.mark.unit
+    def test_column_map(self, ohlcv_df):
+        """Project column names are exposed under the canonical input names."""
+        inverse = {target: source for source, target in OHLCV_COLUMN_MAP.items()}
+        project_df = ohlcv_df.rename(columns=inverse)
+
+        result = IndicatorPipeline(INDICATORS, column_map=OHLCV_COLUMN_MAP).compute(
+            project_df
+        )
+
+        assert list(project_df.columns) == list(inverse.values())
+        _assert_columns(result, _calculated_columns(ohlcv_df))
+
+    @pytest.mark.unit
+    def test_same_period_sma_clash(self, ohlcv_df):
+        """A close and a volume SMA of one period share a column name."""
+        close_sma = SMA(period=20)
+        volume_sma = SMA(period=20, column="volume")
+
+        result = IndicatorPipeline([close_sma, volume_sma]).compute(ohlcv_df)
+
+        # Later outputs win on name clashes: the close SMA is lost
+        assert list(result.columns) == ["sma_20"]
+        _assert_columns(result, volume_sma.compute(ohlcv_df))
+
+    @pytest.mark.unit
+    def test_rename_resolves_clash(self, ohlcv_df):
+        """Renaming the volume SMA keeps both moving averages."""
+        close_sma = SMA(period=20)
+        volume_sma = SMA(period=20, column="volume")
+        pipeline = IndicatorPipeline([close_sma])
+        pipeline.add(volume_sma, rename={"sma_20": "volume_sma"})
+
+        result = pipeline.compute(ohlcv_df)
+
+        assert list(result.columns) == ["sma_20", "volume_sma"]
+        pd.testing.assert_series_equal(
+            result["sma_20"],
+            close_sma.compute(ohlcv_df)["sma_20"],
+            check_names=False,
+            check_freq=False,
+        )
+        pd.testing.assert_series_equal(
+            result["volume_sma"],
+            volume_sma.compute(ohlcv_df)["sma_20"],
+            check_names=False,
+            check_freq=False,
+        )
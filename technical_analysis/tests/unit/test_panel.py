@@ -0,0 +1,152 @@
+"""
+Unit tests for panel (multi-instrument) indicator computation.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from technical_analysis.indicators import (
+    SMA,
+    EMA,
+    RSI,
+    MACD,
+    BollingerBands,
+    Stochastic,
+    ATR,
+)
+from technical_analysis.panel import PricePanel
+
+INDICATORS = [
+    SMA(period=20),
+    EMA(period=12),
+    RSI(period=14),
+    MACD(),
+    BollingerBands(period=20, std=2.5),
+    Stochastic(),
+    ATR(period=14),
+]
+
+
+def _project_frame(ohlcv_df, start, stop):
+    """Slice of the canonical fixture in the project storage schema."""
+    df = ohlcv_df.iloc[start:stop]
+    return pd.DataFrame(
+        {
+            "timestamp": df.index,
+            "openPrice": df["open"].to_numpy(),
+            "highPrice": df["high"].to_numpy(),
+            "lowPrice": df["low"].to_numpy(),
+            "closePrice": df["close"].to_numpy(),
+            "lastTradedVolume": df["volume"].to_numpy(),
+        }
+    )
+
+
+@pytest.fixture
+def frames(ohlcv_df):
+    """Three symbols with different active ranges and a gap."""
+    gapped = _project_frame(ohlcv_df, 0, 500).drop(index=[200, 201])
+    return {
+        "AAA": _project_frame(ohlcv_df, 0, 500),
+        "BBB": _project_frame(ohlcv_df, 100, 400),
+        "CCC": gapped,
+    }
+
+
+class TestPricePanel:
+    """Test cases for PricePanel construction."""
+
+    @pytest.mark.unit
+    def test_alignment(self, frames):
+        """Prices are forward-filled inside the active range only."""
+        panel = PricePanel.from_frames(frames)
+
+        assert panel.symbols == ["AAA", "BBB", "CCC"]
+        assert len(panel.index) == 500
+        close = panel["close"]
+        assert close["BBB"].iloc[:100].isna().all()
+        assert close["BBB"].iloc[400:].isna().all()
+        assert close["BBB"].iloc[100:400].notna().all()
+        assert close["CCC"].iloc[200] == close["CCC"].iloc[199]
+        assert panel["volume"]["CCC"].iloc[200] == 0.0
+
+    @pytest.mark.unit
+    def test_tz_aware_timestamps(self, frames):
+        """Timezone-aware timestamps give the same active ranges."""
+        aware = {
+            symbol: df.assign(timestamp=df["timestamp"].dt.tz_localize("UTC"))
+            for symbol, df in frames.items()
+        }
+        panel = PricePanel.from_frames(aware)
+
+        assert str(panel.index.tz) == "UTC"
+        np.testing.assert_array_equal(
+            panel["close"].to_numpy(),
+            PricePanel.from_frames(frames)["close"].to_numpy(),
+        )
+
+    @pytest.mark.unit
+    def test_float32_storage(self, frames):
+        """float32 panels use half the memory."""
+        full = PricePanel.from_frames(frames)
+        half = PricePanel.from_frames(frames, dtype=np.float32)
+
+        assert half.nbytes * 2 == full.nbytes
+
+    @pytest.mark.unit
+    def test_from_storage(self, frames):
+        """Panels are built from the storage multi-symbol load."""
+        storage = Mock()
+        storage.load_multiple_historical_data.return_value = {
+            "AAA": frames["AAA"],
+            "BBB": frames["BBB"],
+        }
+
+        panel = PricePanel.from_storage(
+            storage, ["AAA", "BBB", "MISSING"], "1D", source="test"
+        )
+
+        storage.load_multiple_historical_data.assert_called_once_with(
+            ["AAA", "BBB", "MISSING"], "1D", None, None, "test"
+        )
+        assert panel.symbols == ["AAA", "BBB"]
+        assert len(panel.index) == 500
+
+
+class TestPanelCompute:
+    """Panel results must match per-symbol batch computation."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "indicator", INDICATORS, ids=lambda indicator: indicator.name
+    )
+    def test_matches_per_symbol(self, indicator, frames):
+        """Each symbol column equals the indicator on that symbol alone."""
+        panel = PricePanel.from_frames(frames)
+        result = panel.compute([indicator])
+
+        for symbol in panel.symbols:
+            inputs = {
+                name: frame[symbol].dropna() for name, frame in panel.fields.items()
+            }
+            for column, expected in indicator.compute(inputs).items():
+                actual = result[column][symbol].reindex(expected.index)
+                np.testing.assert_allclose(
+                    actual.to_numpy(),
+                    expected.to_numpy(dtype=float),
+                    rtol=1e-9,
+                    atol=1e-9,
+                    err_msg=f"{symbol} {column}",
+                )
+
+    @pytest.mark.unit
+    def test_float32_output(self, frames):
+        """Outputs can be produced as float32."""
+        result = PricePanel.from_frames(frames).compute(
+            [SMA(period=20)], dtype=np.float32
+        )
+
+        assert (result["sma_20"].dtypes == np.float32).all()
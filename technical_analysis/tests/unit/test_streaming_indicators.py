@@ -0,0 +1,125 @@
+"""
+Parity tests between streaming indicators and their batch counterparts.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from technical_analysis.indicators import (
+    SMA,
+    EMA,
+    RSI,
+    MACD,
+    BollingerBands,
+    Stochastic,
+    ATR,
+    StreamingIndicator,
+    StreamingSMA,
+)
+
+BATCH_INDICATORS = [
+    SMA(period=20),
+    EMA(period=12),
+    RSI(period=14),
+    MACD(fast=12, slow=26, signal=9),
+    BollingerBands(period=20, std=2.5),
+    Stochastic(k_period=14, d_period=3, smooth_k=3),
+    ATR(period=14),
+]
+
+
+@pytest.fixture
+def gappy_df(ohlcv_df):
+    """OHLCV data with missing values in the seed window and mid-series."""
+    df = ohlcv_df.copy()
+    df.loc[df.index[5], "close"] = np.nan
+    df.loc[df.index[150], "close"] = np.nan
+    df.loc[df.index[200], "high"] = np.nan
+    df.loc[df.index[300], "low"] = np.nan
+    df.iloc[350:353] = np.nan
+    return df
+
+
+def _assert_matches(streamed, expected):
+    assert set(expected) <= set(streamed.columns)
+    for column, values in expected.items():
+        np.testing.assert_allclose(
+            streamed[column].to_numpy(),
+            values.to_numpy(dtype=float),
+            rtol=1e-9,
+            atol=1e-9,
+            err_msg=column,
+        )
+
+
+def _stream(indicator, df):
+    """Feed df bar by bar and collect the outputs as a DataFrame."""
+    rows = [indicator.update(bar) for bar in df.to_dict("records")]
+    return pd.DataFrame(rows, index=df.index)
+
+
+class TestStreamingParity:
+    """Streaming outputs must match the batch pandas-ta results."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "batch", BATCH_INDICATORS, ids=lambda indicator: indicator.name
+    )
+    def test_matches_batch(self, batch, ohlcv_df):
+        """Every batch column is reproduced bar by bar."""
+        expected = batch.compute(ohlcv_df)
+        streamed = _stream(batch.to_streaming(), ohlcv_df)
+        _assert_matches(streamed, expected)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "batch", BATCH_INDICATORS, ids=lambda indicator: indicator.name
+    )
+    def test_matches_batch_with_missing_values(self, batch, gappy_df):
+        """Missing inputs are skipped or carried exactly as in the batch."""
+        expected = batch.compute(gappy_df)
+        streamed = _stream(batch.to_streaming(), gappy_df)
+        _assert_matches(streamed, expected)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "batch", BATCH_INDICATORS, ids=lambda indicator: indicator.name
+    )
+    @pytest.mark.parametrize("split", [250, 351])
+    def test_state_round_trip(self, batch, split, gappy_df):
+        """A restored indicator continues exactly where the original stopped."""
+        original = batch.to_streaming()
+        _stream(original, gappy_df.iloc[:split])
+
+        state = json.loads(json.dumps(original.get_state(), allow_nan=False))
+        restored = StreamingIndicator.from_state(state)
+
+        pd.testing.assert_frame_equal(
+            _stream(restored, gappy_df.iloc[split:]),
+            _stream(original, gappy_df.iloc[split:]),
+        )
+        assert restored.bars == original.bars == len(gappy_df)
+
+
+class TestStreamingInputs:
+    """Bar formats accepted by streaming indicators."""
+
+    @pytest.mark.unit
+    def test_project_schema_and_bare_values(self):
+        """Project column names and bare floats are accepted."""
+        by_schema = StreamingSMA(period=2)
+        by_value = StreamingSMA(period=2)
+        for price in (1.0, 2.0, 4.0):
+            schema_value = by_schema.update({"closePrice": price})
+            bare_value = by_value.update(price)
+
+        assert schema_value == bare_value == {"sma_2": 3.0}
+
+    @pytest.mark.unit
+    def test_unknown_state_rejected(self):
+        """Snapshots of unknown indicators raise ValueError."""
+        with pytest.raises(ValueError):
+            StreamingIndicator.from_state({"indicator": "Nope"})
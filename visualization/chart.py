@@ -6,7 +6,8 @@ from typing import List, Optional, Any, Tuple
 import pandas as pd
 import mplfinance as mpf
 
-from technical_analysis.indicators import Indicator
+from technical_analysis.cache import get_default_cache
+from technical_analysis.indicators import Indicator, IndicatorPipeline
 from .utils import prepare_dataframe, validate_ohlcv_data
 
 
@@ -62,9 +63,7 @@ class StaticChart:
         Returns:
             Self for method chaining
         """
-        self.indicators.append(indicator)
-        self.plot_data = indicator.calculate(self.plot_data)
-        return self
+        return self.add_indicators([indicator])
 
     def add_indicators(self, indicators: List[Indicator]) -> "StaticChart":
         """
@@ -76,8 +75,11 @@ class StaticChart:
         Returns:
             Self for method chaining
         """
-        for indicator in indicators:
-            self.add_indicator(indicator)
+        # plot_data is owned by the chart, so indicators are written in place
+        IndicatorPipeline(indicators, cache=get_default_cache()).apply(
+            self.plot_data, inplace=True
+        )
+        self.indicators.extend(indicators)
         return self
 
     def _prepare_plot_data(self) -> pd.DataFrame:
@@ -7,7 +7,8 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from technical_analysis.indicators import Indicator
+from technical_analysis.cache import get_default_cache
+from technical_analysis.indicators import Indicator, IndicatorPipeline
 from .utils import prepare_dataframe, validate_ohlcv_data
 
 
@@ -60,9 +61,7 @@ class InteractiveChart:
         Returns:
             Self for method chaining
         """
-        self.indicators.append(indicator)
-        self.plot_data = indicator.calculate(self.plot_data)
-        return self
+        return self.add_indicators([indicator])
 
     def add_indicators(self, indicators: List[Indicator]) -> "InteractiveChart":
         """
@@ -74,8 +73,11 @@ class InteractiveChart:
         Returns:
             Self for method chaining
         """
-        for indicator in indicators:
-            self.add_indicator(indicator)
+        # plot_data is owned by the chart, so indicators are written in place
+        IndicatorPipeline(indicators, cache=get_default_cache()).apply(
+            self.plot_data, inplace=True
+        )
+        self.indicators.extend(indicators)
         return self
 
     def _prepare_plot_data(self) -> pd.DataFrame: